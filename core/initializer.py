@@ -35,7 +35,7 @@ from ui.components.control_buttons import (
     MuteButton, MenuButton, BookmarkButton, UILockButton,
     MinimizeButton, MaximizeButton, FullscreenButton, CloseButton, TitleLockButton
 )
-from ui.components.media_display import MediaDisplay
+from ui.components.image_viewport import ImageViewport
 # 레이아웃
 from ui.layouts.main_layout import MainLayout
 from ui.layouts.controls_layout import ControlsLayout
@@ -67,17 +67,14 @@ from file import FileBrowser, FileNavigator
 from file.operations import FileOperations
 from file.navigator import FileNavigator
 from file.undo_manager import UndoManager
+from file.folder_index import FolderIndex
 
 from ui.components.dual_action_button import DualActionButton
 from ui.components.custom_tooltip import TooltipManager # TooltipManager import
 from ui.components.loading_indicator import LoadingIndicator # LoadingIndicator 추가
 from ui.components.editable_index import EditableIndexLabel # EditableIndexLabel 추가
 
-# MPV 래퍼
-from mpv_wrapper import mpv
-
-# 디버깅 모듈
-from core.debug import QMovieDebugger, MemoryProfiler
+# MPV 모듈과 디버깅 모듈(core.debug)은 처음 사용할 때 불러옴 (시작 시간 단축)
 # 메모리 관리 모듈
 from core.memory import ResourceCleaner, TimerManager
 # 이벤트 핸들러
@@ -233,6 +230,10 @@ class MediaSorterPAAKInitializer:
         # 변수 초기화
         viewer.base_folder = ""  # 기준 폴더 경로
         viewer.folder_buttons = []  # 폴더 버튼 목록
+        # 기준 폴더의 하위 폴더 색인 (백그라운드 스캔 + 변경 감시 + 빠른 검색)
+        viewer.folder_index = FolderIndex(viewer)
+        viewer.folder_index.folders_changed.connect(viewer.update_folder_buttons)
+        viewer.folder_palette = None  # 폴더 팔레트 (처음 열 때 생성)
 
         # 키보드 핸들러 초기화
         viewer.keyboard_handler = KeyboardHandler(viewer)
@@ -240,9 +241,9 @@ class MediaSorterPAAKInitializer:
         # 북마크 관리자, 회전 관리자 및 UI 잠금 관리자 초기화
         viewer.bookmark_manager = BookmarkManager(viewer)
 
-        # 디버깅 관련 인스턴스 생성
-        viewer.qmovie_debugger = QMovieDebugger(viewer)
-        viewer.memory_profiler = MemoryProfiler()
+        # 디버깅 관련 인스턴스 (디버깅 기능을 처음 사용할 때 생성)
+        viewer.qmovie_debugger = None
+        viewer.memory_profiler = None
 
         # 메모리 관리 인스턴스 생성
         viewer.resource_cleaner = ResourceCleaner(viewer)
@@ -293,6 +294,9 @@ class MediaSorterPAAKInitializer:
 
         # 비동기 이미지 로딩 관련 변수 초기화
         viewer.loader_threads = {}  # 로더 스레드 추적용 딕셔너리 (경로: 스레드)
+        viewer.media_probe_thread = None  # 폴더의 비디오/오디오 정보를 미리 확인하는 스레드
+        viewer.folder_listing_thread = None  # 먼저 연 파일의 폴더 목록을 읽는 스레드
+        viewer.folder_listing_pending = False  # 폴더 목록을 읽는 중이라 인덱스를 아직 모르는지 여부
         viewer.image_loader = ImageLoader()  # 이미지 로더 매니저 초기화
         viewer.loading_label = QLabel("Loading...", viewer)  # 로딩 중 표시용 레이블
         viewer.loading_label.setAlignment(Qt.AlignCenter)  # 중앙 정렬
@@ -317,20 +321,8 @@ class MediaSorterPAAKInitializer:
         # system = platform.system()
         # ... (MPV DLL 경로 설정 코드 제거)
 
-        # MPV 플레이어 초기화
-        try:
-            viewer.player = mpv.MPV(log_handler=print,
-                                 ytdl=True,
-                                 input_default_bindings=True,
-                                 input_vo_keyboard=True,
-                                 hwdec='no')  # 하드웨어 가속 비활성화
-            viewer.player.loop = True
-            viewer.player.keep_open = True
-            viewer.player.terminal = False
-            print("MPV player initialization successful")
-        except Exception as e:
-            print(f"MPV player initialization failed: {e}")
-            viewer.player = None
+        # 공용 MPV 플레이어는 만들지 않음 (비디오/오디오 핸들러가 처음 재생할 때 각자의 플레이어를 만듦)
+        viewer.player = None
 
         # 리소스 관리를 위한 객체 추적
         viewer.timers = []  # 모든 타이머 추적 - 먼저 초기화
@@ -522,7 +514,7 @@ class MediaSorterPAAKInitializer:
         viewer.bookmark_manager.update_bookmark_menu()
 
         # 이미지 표시 레이블
-        viewer.image_label = MediaDisplay()
+        viewer.image_label = ImageViewport()
         viewer.image_label.setMouseTracking(True)
 
         # 이미지 정보 표시 레이블
@@ -857,7 +849,7 @@ class MediaSorterPAAKInitializer:
         # 지속적인 음소거 상태 (세션 동안 유지)
         viewer.persistent_mute_state = False
 
-        # MediaDisplay 이벤트 연결
+        # MediaDisplay(ImageViewport) 이벤트 연결
         viewer.image_label.mouseDoubleClicked.connect(viewer.mouseDoubleClickEvent)
         viewer.image_label.mouseWheelScrolled.connect(viewer.handle_wheel_event)
 
@@ -7,5 +7,6 @@
 
 from .resource_cleaner import ResourceCleaner
 from .timer_manager import TimerManager
+from .disposal_queue import DisposalQueue, get_disposal_queue, freeze_startup_objects
 
-__all__ = ['ResourceCleaner', 'TimerManager'] 
\ No newline at end of file
+__all__ = ['ResourceCleaner', 'TimerManager', 'DisposalQueue', 'get_disposal_queue', 'freeze_startup_objects'] 
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+리소스 폐기 큐 모듈
+
+미디어 리소스(QMovie, 애니메이션 엔진, 픽스맵 등)를 정리 중인 작업 한가운데에서
+바로 해제하지 않고, 이벤트 루프가 한 번 돌 때 모아서 한꺼번에 해제합니다.
+processEvents()로 이벤트 루프에 다시 들어가거나 gc.collect()로 전체 힙을 훑지 않고도
+리소스를 소유한 쪽이 해제 시점을 정확하게 정할 수 있습니다.
+"""
+
+import gc
+
+from PyQt5.QtCore import QObject, QTimer, QCoreApplication
+
+# 시작 후 일반 가비지 컬렉션이 자주 돌지 않도록 하는 0세대 임계값
+GC_GEN0_THRESHOLD = 10000
+
+
+class DisposalQueue(QObject):
+    """
+    리소스 폐기 요청을 모아두었다가 이벤트 루프 한 바퀴마다 한 번 처리하는 클래스
+
+    폐기 방법:
+        dispose() 메서드가 있는 객체 -> dispose() 호출
+        QObject -> deleteLater() 호출
+        그 외 -> 참조만 해제
+    """
+
+    def __init__(self, parent=None):
+        """
+        DisposalQueue 클래스를 초기화합니다.
+
+        Args:
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.pending = []
+        self.draining = False  # 큐를 처리하는 중인지 여부 (재진입 확인용)
+        self.scheduled = False
+
+    def dispose(self, resource):
+        """
+        리소스 폐기를 예약합니다. 이벤트 루프가 없으면 바로 폐기합니다.
+
+        Args:
+            resource: 폐기할 리소스
+        """
+        if resource is None:
+            return
+        self.pending.append(resource)
+        if QCoreApplication.instance() is None:
+            self.drain()
+        elif not self.scheduled:
+            self.scheduled = True
+            QTimer.singleShot(0, self.drain)
+
+    def drain(self):
+        """예약된 리소스를 모두 폐기합니다. 폐기 중에 새로 예약된 리소스는 다음 차례에 처리합니다."""
+        self.scheduled = False
+        if self.draining:
+            return
+        self.draining = True
+        try:
+            pending, self.pending = self.pending, []
+            for resource in pending:
+                self._dispose_now(resource)
+        finally:
+            self.draining = False
+        if not self.pending:
+            return
+        if QCoreApplication.instance() is None:
+            # 이벤트 루프가 없으면 폐기 중에 예약된 리소스도 바로 처리
+            self.drain()
+        elif not self.scheduled:
+            self.scheduled = True
+            QTimer.singleShot(0, self.drain)
+
+    def _dispose_now(self, resource):
+        """리소스 하나를 폐기합니다."""
+        try:
+            if hasattr(resource, 'dispose'):
+                resource.dispose()
+            elif isinstance(resource, QObject):
+                resource.deleteLater()
+        except Exception as e:
+            pass
+
+
+_disposal_queue = None
+
+
+def get_disposal_queue():
+    """
+    애플리케이션 전체에서 함께 사용하는 폐기 큐를 반환합니다.
+
+    Returns:
+        DisposalQueue: 폐기 큐
+    """
+    global _disposal_queue
+    if _disposal_queue is None:
+        _disposal_queue = DisposalQueue()
+    return _disposal_queue
+
+
+def freeze_startup_objects():
+    """
+    시작할 때 만든 객체(모듈, 위젯, 설정 등)를 가비지 컬렉션 대상에서 빼고
+    0세대 임계값을 높여서 이후 가비지 컬렉션이 짧고 드물게 실행되도록 합니다.
+    """
+    gc.collect()
+    if hasattr(gc, 'freeze'):  # Python 3.7 이상
+        gc.freeze()
+    _, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(GC_GEN0_THRESHOLD, gen1, gen2)
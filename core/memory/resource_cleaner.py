@@ -38,9 +38,6 @@ class ResourceCleaner:
         
         # Initialize UI components
         self.cleanup_ui_components()
-        
-        # Perform garbage collection
-        self.viewer.perform_garbage_collection()
             
         print("Media resource cleanup completed")
         
@@ -66,9 +63,6 @@ class ResourceCleaner:
             print("Animation handler cleanup started...")
             self.viewer.animation_handler.cleanup()
             
-            # Execute event processing loop to update UI and finalize cleanup
-            QApplication.processEvents()
-            
     def cleanup_ui_components(self):
         """UI 컴포넌트 초기화"""
         # 이미지 라벨 초기화 - MediaDisplay의 clear_media 메서드 사용
@@ -76,8 +70,6 @@ class ResourceCleaner:
             print("Initializing MediaDisplay...")
             # MediaDisplay의 clear_media 메서드 호출
             self.viewer.image_label.clear_media()
-            # 이벤트 프로세싱
-            QApplication.processEvents()
         
         # 슬라이더 신호 연결 해제 및 초기화
         self.viewer.disconnect_all_slider_signals()
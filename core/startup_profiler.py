@@ -0,0 +1,129 @@
+"""
+시작 시간 측정 모듈
+
+프로그램 시작부터 창이 화면에 보일 때까지 걸린 시간을 측정하고,
+정해진 시작 시간 예산(STARTUP_BUDGET_SECONDS) 안인지 확인합니다.
+
+환경 변수 MEDIASORTER_IMPORT_REPORT=1 또는 실행 인자 --import-report를 주면
+`python -X importtime`과 비슷하게 시작 중에 처음 임포트된 모듈과 걸린 시간,
+창이 보이기까지 걸린 시간과 예산 초과 경고를 출력합니다. (주지 않으면 아무것도 출력하지 않음)
+"""
+
+import os
+import sys
+import time
+import builtins
+
+# 프로그램 시작부터 창이 보일 때까지 허용하는 시간 (초)
+STARTUP_BUDGET_SECONDS = 2.0
+
+# 임포트 시간 보고서를 켜는 환경 변수와 실행 인자
+IMPORT_REPORT_ENV = "MEDIASORTER_IMPORT_REPORT"
+IMPORT_REPORT_ARG = "--import-report"
+
+# 보고서에 출력할 모듈 개수
+IMPORT_REPORT_TOP = 30
+
+
+class StartupProfiler:
+    """
+    시작 시간과 임포트 시간을 측정하는 클래스
+
+    Attributes:
+        start_time: 측정 시작 시각 (main 모듈이 이 모듈을 처음 임포트한 시점)
+        window_visible_time: 창이 보이기까지 걸린 시간 (초, 아직이면 None)
+        import_times: 모듈 이름 -> (누적 시간(초), 중첩 깊이)
+    """
+
+    def __init__(self):
+        """StartupProfiler 초기화"""
+        self.start_time = time.perf_counter()
+        self.window_visible_time = None
+        self.import_times = {}
+        self._original_import = None
+        self._depth = 0
+
+    def is_import_report_enabled(self):
+        """임포트 시간 보고서를 켜야 하는지 확인합니다."""
+        return bool(os.environ.get(IMPORT_REPORT_ENV)) or IMPORT_REPORT_ARG in sys.argv
+
+    def start_import_report(self):
+        """지금부터 새로 임포트되는 모듈의 시간을 기록합니다."""
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop_import_report(self):
+        """임포트 시간 기록을 멈춥니다."""
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """처음 임포트되는 절대 경로 모듈만 시간을 잽니다. (하위 임포트 시간 포함)"""
+        original_import = self._original_import or builtins.__import__
+        if level or name in sys.modules or name in self.import_times:
+            return original_import(name, globals, locals, fromlist, level)
+
+        depth = self._depth
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.import_times[name] = (time.perf_counter() - started, depth)
+
+    def format_import_report(self, top=IMPORT_REPORT_TOP):
+        """
+        오래 걸린 임포트 순서로 보고서를 만듭니다.
+
+        Args:
+            top: 출력할 모듈 개수
+
+        Returns:
+            str: 보고서 문자열
+        """
+        rows = sorted(self.import_times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        lines = ["import time: cumulative (ms) | module"]
+        for name, (seconds, depth) in rows:
+            lines.append(f"import time: {seconds * 1000:12.1f} | {'  ' * depth}{name}")
+        return "\n".join(lines)
+
+    def elapsed(self):
+        """측정 시작부터 지금까지 걸린 시간 (초)"""
+        return time.perf_counter() - self.start_time
+
+    def mark_window_visible(self):
+        """
+        창이 화면에 보인 시점을 기록합니다.
+        보고서가 켜져 있으면 임포트 시간, 시작 시간과 예산 초과 여부를 출력합니다.
+
+        Returns:
+            float: 창이 보이기까지 걸린 시간 (초)
+        """
+        if self.window_visible_time is None:
+            self.window_visible_time = self.elapsed()
+            self.stop_import_report()
+            if not self.is_import_report_enabled():
+                return self.window_visible_time
+            if self.import_times:
+                print(self.format_import_report())
+            if self.window_visible_time > STARTUP_BUDGET_SECONDS:
+                print(f"WARNING: Startup took {self.window_visible_time:.2f}s "
+                      f"(budget {STARTUP_BUDGET_SECONDS:.2f}s)")
+            else:
+                print(f"Startup time: {self.window_visible_time:.2f}s")
+        return self.window_visible_time
+
+    def is_within_budget(self):
+        """창이 보이기까지 걸린 시간이 예산 안인지 여부 (아직 보이지 않았으면 False)"""
+        return self.window_visible_time is not None and self.window_visible_time <= STARTUP_BUDGET_SECONDS
+
+
+# 전역 측정기 (main 모듈이 가장 먼저 임포트해서 시작 시각을 기록)
+startup_profiler = StartupProfiler()
+if startup_profiler.is_import_report_enabled():
+    startup_profiler.start_import_report()
@@ -0,0 +1,157 @@
+"""
+이미지 변환 관련 유틸리티 함수 모음
+
+이 모듈은 화면 표시용 이미지를 변환하는 함수들을 담고 있어요.
+"""
+
+from PyQt5.QtGui import QTransform, QPixmap, QImageReader, QImageIOHandler
+from PyQt5.QtCore import Qt, QSize
+
+# Qt가 알려주는 EXIF 방향 -> (회전 각도, 좌우 반전 여부)
+# 좌우 반전을 먼저 하고 시계 방향으로 회전한다고 보고 정리한 값이에요.
+EXIF_TRANSFORMS = {
+    int(QImageIOHandler.TransformationNone): (0, False),
+    int(QImageIOHandler.TransformationMirror): (0, True),
+    int(QImageIOHandler.TransformationFlip): (180, True),
+    int(QImageIOHandler.TransformationRotate180): (180, False),
+    int(QImageIOHandler.TransformationRotate90): (90, False),
+    int(QImageIOHandler.TransformationMirrorAndRotate90): (90, True),
+    int(QImageIOHandler.TransformationFlipAndRotate90): (270, True),
+    int(QImageIOHandler.TransformationRotate270): (270, False),
+}
+
+
+def read_exif_transform(file_path):
+    """
+    이미지 파일의 EXIF 방향 정보를 읽어요. 픽셀은 디코딩하지 않아요.
+
+    매개변수:
+        file_path (str): 이미지 파일 경로
+
+    반환값:
+        tuple: (회전 각도, 좌우 반전 여부) - 정보가 없으면 (0, False)
+    """
+    try:
+        reader = QImageReader(file_path)
+        reader.setAutoTransform(False)
+        return EXIF_TRANSFORMS.get(int(reader.transformation()), (0, False))
+    except Exception:
+        return (0, False)
+
+
+def rotate_pixmap(pixmap, angle, mirrored=False):
+    """
+    픽스맵을 회전해요. (좌우 반전이 필요하면 회전 전에 반전)
+
+    90도 단위 회전은 보간 없이 픽셀 위치만 옮기기 때문에 빠르고 화질이 그대로예요.
+    그 외의 각도만 부드러운 변환(보간)을 사용해요.
+
+    매개변수:
+        pixmap (QPixmap): 회전할 픽스맵
+        angle (int): 시계 방향 회전 각도
+        mirrored (bool): 회전 전에 좌우로 뒤집을지 여부
+
+    반환값:
+        QPixmap: 회전된 픽스맵 (변환이 없으면 같은 픽스맵)
+    """
+    angle %= 360
+    if pixmap is None or pixmap.isNull() or (angle == 0 and not mirrored):
+        return pixmap
+    if angle % 90:
+        if mirrored:
+            pixmap = QPixmap.fromImage(pixmap.toImage().mirrored(True, False))
+        return pixmap.transformed(QTransform().rotate(angle), Qt.SmoothTransformation)
+
+    image = pixmap.toImage()
+    if mirrored:
+        image = image.mirrored(True, False)
+    if angle == 0:
+        pass
+    elif angle == 180:
+        image = image.mirrored(True, True)  # 가로+세로 뒤집기 = 180도 회전
+    else:
+        # 90/270도 회전 행렬은 정확한 정수 값이라 픽셀 전치만 일어나요
+        image = image.transformed(QTransform().rotate(angle), Qt.FastTransformation)
+    return QPixmap.fromImage(image)
+
+
+# 피라미드 단계를 만들 때 이보다 작은 단계는 만들지 않아요 (짧은 변 기준, 픽셀)
+PYRAMID_MIN_SIZE = 64
+
+
+class ImagePyramid:
+    """
+    한 이미지의 여러 해상도 단계(원본, 1/2, 1/4, ...)를 담는 클래스예요.
+
+    화면 크기가 바뀔 때마다 원본 전체를 다시 줄이지 않고,
+    목표 크기보다 크거나 같은 단계 중 가장 작은 단계에서 줄여요.
+    단계는 처음 필요할 때 바로 위 단계를 절반으로 줄여서 만들고 계속 재사용해요.
+
+    속성:
+        levels (list): 단계별 QPixmap (0번이 원본)
+    """
+
+    def __init__(self, pixmap):
+        self.levels = [pixmap] if pixmap is not None and not pixmap.isNull() else []
+
+    def level_for(self, width, height):
+        """
+        주어진 영역에 비율을 유지해 맞출 때 사용할 단계를 골라요.
+
+        매개변수:
+            width (int): 표시 영역 너비
+            height (int): 표시 영역 높이
+
+        반환값:
+            QPixmap: 목표 크기보다 작지 않은 단계 중 가장 작은 것 (없으면 None)
+        """
+        if not self.levels:
+            return None
+        original = self.levels[0]
+        target = original.size().scaled(QSize(max(1, width), max(1, height)), Qt.KeepAspectRatio)
+
+        index = 0
+        level = original
+        while (level.width() // 2 >= target.width() and level.height() // 2 >= target.height()
+               and min(level.width(), level.height()) // 2 >= PYRAMID_MIN_SIZE):
+            index += 1
+            if index == len(self.levels):
+                # 두 배 축소는 부드러운 변환으로 해도 빠르고 화질 손실이 적어요
+                self.levels.append(level.scaled(level.width() // 2, level.height() // 2,
+                                                Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+            level = self.levels[index]
+        return level
+
+    def scaled(self, width, height, transformation_mode=Qt.SmoothTransformation):
+        """
+        가장 가까운 단계에서 비율을 유지해 영역 크기에 맞게 줄여요.
+
+        매개변수:
+            width (int): 표시 영역 너비
+            height (int): 표시 영역 높이
+            transformation_mode: 크기 조정 방식 (창 크기를 끄는 중에는 빠른 변환)
+
+        반환값:
+            QPixmap: 크기 조정된 이미지 (원본이 없으면 None)
+        """
+        level = self.level_for(width, height)
+        if level is None:
+            return None
+        return level.scaled(width, height, Qt.KeepAspectRatio, transformation_mode)
+
+
+def rotated_size(width, height, angle):
+    """
+    회전한 뒤의 가로/세로 크기를 계산해요. (90도 단위)
+
+    매개변수:
+        width (int): 회전 전 너비
+        height (int): 회전 전 높이
+        angle (int): 회전 각도
+
+    반환값:
+        tuple: (너비, 높이)
+    """
+    if angle % 180 == 90:
+        return height, width
+    return width, height
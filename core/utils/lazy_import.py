@@ -0,0 +1,57 @@
+"""
+지연 임포트 유틸리티
+
+이 모듈은 무거운 라이브러리(코덱, 플레이어 등)를 처음 사용할 때 불러오는 함수를 담고 있어요.
+프로그램 시작 시에는 대신할 모듈 객체만 만들어두고, 속성에 처음 접근하는 순간 실제로 임포트해요.
+실제로 임포트하기 전까지는 sys.modules에도 등록되지 않아요.
+"""
+
+import sys
+import types
+import importlib
+import importlib.util
+
+
+class _LazyModule(types.ModuleType):
+    """처음 속성에 접근할 때 실제 모듈을 임포트해서 그 속성을 돌려주는 대리 모듈이에요."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self):
+        """실제 모듈을 임포트해요. (한 번만)"""
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+
+def lazy_import(name):
+    """
+    모듈을 지연 임포트해요.
+
+    이미 임포트된 모듈이면 그대로 반환하고, 설치되지 않은 모듈이면 None을 반환해요.
+    (선택 라이브러리 확인은 `모듈 is None`으로 할 수 있어요)
+    설치 여부는 모듈을 실행하지 않고 찾기만 해서 확인해요.
+
+    매개변수:
+        name (str): 모듈 이름 (예: 'rawpy', 'numpy')
+
+    반환값:
+        module 또는 None: 처음 속성에 접근할 때 실제로 불러와지는 모듈
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+    return _LazyModule(name)
@@ -299,5 +299,8 @@ class KeyboardHandler:
         if key == self.parent.key_settings.get("delete_file", Qt.Key_Delete):  # 파일 삭제 키
             self.parent.delete_current_image()  # 현재 파일 삭제
             return True
+        elif key == self.parent.key_settings.get("folder_palette", Qt.Key_F):  # 폴더 빠른 검색 키
+            self.parent.show_folder_palette()  # 폴더 팔레트 열기
+            return True
             
         return False  # 키 처리 안됨 
\ No newline at end of file
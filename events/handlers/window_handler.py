@@ -235,7 +235,7 @@ class WindowHandler(QObject):
                             self.parent.image_label.setPixmap(scaled_pixmap)
                 elif file_ext in ['.mp4', '.avi', '.wmv', '.ts', '.m2ts', '.mov', '.qt', '.mkv', '.flv', '.webm', '.3gp', '.m4v', '.mpg', '.mpeg', '.vob', '.wav', '.flac', '.mp3', '.aac', '.m4a', '.ogg']:
                     # Update MPV player's window ID
-                    if hasattr(self.parent, 'player'):
+                    if getattr(self.parent, 'player', None):
                         self.parent.player.wid = int(self.parent.image_label.winId())
             
             # Update image info label
@@ -375,12 +375,34 @@ class WindowHandler(QObject):
         # Removed debug print for program shutdown cleanup start.
         
         # Check initial state for debugging
-        if hasattr(self.parent, 'qmovie_debugger') and self.parent.qmovie_debugger.is_debug_mode():
+        if getattr(self.parent, 'qmovie_debugger', None) and self.parent.qmovie_debugger.is_debug_mode():
             self.parent.qmovie_debugger.debug_qmovie_before_cleanup()
         
         # Clean up current media resources
         self.parent.cleanup_current_media()
         
+        # Stop tile decoding of a huge image shown in the viewport
+        if hasattr(self.parent, 'image_label') and hasattr(self.parent.image_label, 'stop_tiled_image'):
+            self.parent.image_label.stop_tiled_image()
+        
+        # Stop background media probing of the current folder
+        if hasattr(self.parent, 'stop_media_probe'):
+            self.parent.stop_media_probe()
+        
+        # Stop reading the folder listing of a file opened from the command line
+        if hasattr(self.parent, 'stop_folder_listing'):
+            self.parent.stop_folder_listing()
+        
+        # Stop background duplicate checks of large files before copy/move
+        if hasattr(self.parent, 'file_operations') and hasattr(self.parent.file_operations, 'cancel_duplicate_checks'):
+            self.parent.file_operations.cancel_duplicate_checks()
+        
+        # Terminate the long-lived mpv players (they are reused across files until now)
+        for handler_name in ('video_handler', 'audio_handler'):
+            handler = getattr(self.parent, handler_name, None)
+            if handler and hasattr(handler, 'shutdown'):
+                handler.shutdown()
+        
         # Clean up ImageLoader (image loader thread cleanup)
         if hasattr(self.parent, 'image_loader') and self.parent.image_loader:
             # Removed debug print for ImageLoader cleanup start.
@@ -406,21 +428,8 @@ class WindowHandler(QObject):
         # Clean up GIF cache
         if hasattr(self.parent, 'gif_cache') and self.parent.gif_cache:
             # Removed debug print for GIF cache cleanup start.
-            # Simplified QMovie cleanup process
+            # clear() stops QMovie objects and parked animation engines immediately
             try:
-                from PyQt5.QtGui import QMovie
-                from PyQt5.QtWidgets import QApplication
-                
-                # Check and clean up QMovie objects in the cache
-                for key, item in list(self.parent.gif_cache.cache.items()):
-                    if isinstance(item, QMovie):
-                        # Perform basic cleanup steps
-                        item.stop()
-                        item.deleteLater()
-                
-                # Process events once
-                QApplication.processEvents()
-                
                 # Clear cache
                 self.parent.gif_cache.clear()
                 self.parent.gif_cache = None  # Release reference
@@ -454,8 +463,16 @@ class WindowHandler(QObject):
         # Save bookmarks
         self.parent.save_bookmarks()
         
+        # Stop the folder index scan and watcher
+        if hasattr(self.parent, 'folder_index') and self.parent.folder_index:
+            self.parent.folder_index.cleanup()
+        
+        # Flush the undo journal to disk
+        if hasattr(self.parent, 'undo_manager') and self.parent.undo_manager:
+            self.parent.undo_manager.close()
+        
         # Check state after cleanup for debugging
-        if hasattr(self.parent, 'qmovie_debugger') and self.parent.qmovie_debugger.is_debug_mode():
+        if getattr(self.parent, 'qmovie_debugger', None) and self.parent.qmovie_debugger.is_debug_mode():
             self.parent.qmovie_debugger.debug_qmovie_after_cleanup()
             
         # Force event processing after final cleanup to ensure all tasks are completed
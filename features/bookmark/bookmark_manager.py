@@ -190,6 +190,11 @@ class BookmarkManager:
              self.viewer.show_message("Error: Cannot process folder.")
              return
              
+        # 파일 하나를 먼저 연 뒤 진행 중인 폴더 목록 읽기가 있으면 중단
+        # (끝난 목록이 북마크 목록을 덮어쓰거나 인덱스 표시를 계속 숨기지 않도록)
+        if hasattr(self.viewer, 'stop_folder_listing'):
+            self.viewer.stop_folder_listing()
+        
         # FileBrowser의 process_folder를 사용하여 정렬된 파일 목록 가져오기
         # process_folder는 (파일 리스트, 시작 인덱스)를 반환하므로 리스트만 사용
         full_path_files, _ = self.viewer.file_browser.process_folder(folder)
@@ -0,0 +1,150 @@
+"""
+파일별 회전 상태 저장 모듈
+
+사용자가 회전한 각도를 파일별로 기억합니다.
+조회는 메모리의 딕셔너리에서 바로 하고, 변경 사항은 사용자 데이터 폴더의 작은 JSON 표에 저장합니다.
+파일에 기록된 EXIF 방향 정보도 한 번 읽으면 메모리에 기억해둡니다.
+"""
+
+import os
+import json
+
+from core.utils.path_utils import get_user_data_directory
+from core.utils.image_utils import read_exif_transform
+
+# 회전 상태를 저장할 파일 이름 (사용자 데이터 폴더 아래)
+ORIENTATION_FILENAME = "orientations.json"
+
+
+class OrientationStore:
+    """
+    파일별 회전 각도 저장소
+
+    angles: 정규화한 파일 경로 -> 사용자 회전 각도 (0이 아닌 것만 저장)
+    exif_transforms: 정규화한 파일 경로 -> (EXIF 회전 각도, 좌우 반전 여부) (메모리에만 보관)
+    """
+
+    def __init__(self, store_path=None):
+        """
+        OrientationStore 초기화
+
+        Args:
+            store_path: 저장 파일 경로 (없으면 사용자 데이터 폴더 아래 orientations.json)
+        """
+        self.store_path = store_path or os.path.join(get_user_data_directory(), ORIENTATION_FILENAME)
+        self.angles = {}
+        self.exif_transforms = {}
+        self._load()
+
+    @staticmethod
+    def _key(file_path):
+        """저장소 키로 사용할 정규화된 경로"""
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _load(self):
+        """디스크에 저장된 회전 상태를 읽습니다."""
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            self.angles = {key: int(angle) % 360 for key, angle in data.items() if int(angle) % 360}
+        except (OSError, ValueError, TypeError, AttributeError):
+            self.angles = {}
+
+    def save(self):
+        """회전 상태를 디스크에 저장합니다."""
+        try:
+            os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
+            temp_path = self.store_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.angles, file, ensure_ascii=False)
+            os.replace(temp_path, self.store_path)
+        except OSError as e:
+            print(f"Failed to save orientation store: {str(e)}")
+
+    def get(self, file_path):
+        """
+        파일에 저장된 사용자 회전 각도를 반환합니다.
+
+        Args:
+            file_path: 파일 경로
+
+        Returns:
+            int: 회전 각도 (저장된 값이 없으면 0)
+        """
+        if not file_path:
+            return 0
+        return self.angles.get(self._key(file_path), 0)
+
+    def set(self, file_path, angle):
+        """
+        파일의 사용자 회전 각도를 저장합니다. 0이면 기록을 지웁니다.
+
+        Args:
+            file_path: 파일 경로
+            angle: 회전 각도
+        """
+        if not file_path:
+            return
+        key = self._key(file_path)
+        angle %= 360
+        if self.angles.get(key, 0) == angle:
+            return
+        if angle:
+            self.angles[key] = angle
+        else:
+            self.angles.pop(key, None)
+        self.save()
+
+    def move(self, old_path, new_path):
+        """
+        파일이 이동되었을 때 저장된 회전 각도를 새 경로로 옮깁니다.
+
+        Args:
+            old_path: 이동 전 파일 경로
+            new_path: 이동 후 파일 경로
+        """
+        if not old_path or not new_path:
+            return
+        old_key, new_key = self._key(old_path), self._key(new_path)
+        transform = self.exif_transforms.pop(old_key, None)
+        if transform is not None:
+            self.exif_transforms[new_key] = transform
+        angle = self.angles.pop(old_key, None)
+        if angle is None and new_key not in self.angles:
+            return
+        if angle is None:
+            self.angles.pop(new_key, None)  # 새 경로에 남아있던 다른 파일의 기록
+        else:
+            self.angles[new_key] = angle
+        self.save()
+
+    def remove(self, file_path):
+        """
+        파일이 삭제되었을 때 저장된 회전 각도를 지웁니다.
+
+        Args:
+            file_path: 삭제된 파일 경로
+        """
+        if not file_path:
+            return
+        key = self._key(file_path)
+        self.exif_transforms.pop(key, None)
+        if self.angles.pop(key, None) is not None:
+            self.save()
+
+    def get_exif_transform(self, file_path):
+        """
+        파일의 EXIF 방향 정보를 반환합니다. (처음 한 번만 파일 머리를 읽음)
+
+        Args:
+            file_path: 파일 경로
+
+        Returns:
+            tuple: (회전 각도, 좌우 반전 여부)
+        """
+        key = self._key(file_path)
+        transform = self.exif_transforms.get(key)
+        if transform is None:
+            transform = read_exif_transform(file_path)
+            self.exif_transforms[key] = transform
+        return transform
@@ -5,6 +5,9 @@ from PyQt5.QtGui import QTransform, QImage, QPixmap
 from PyQt5.QtCore import QObject, pyqtSignal, Qt
 from PyQt5.QtWidgets import QApplication
 
+from core.utils.image_utils import rotate_pixmap, rotated_size
+from features.rotation.orientation_store import OrientationStore
+
 # 회전 상수 정의
 ROTATE_0 = 0
 ROTATE_90 = 90
@@ -14,6 +17,9 @@ ROTATE_270 = 270
 class RotationManager(QObject):
     """
     이미지 회전 상태를 관리하는 클래스
+    
+    회전 각도는 파일별로 저장소(OrientationStore)에 기억되며,
+    파일을 열 때 load_file_rotation()으로 그 파일의 각도를 불러옵니다.
     """
     # 회전 상태가 변경되었을 때 발생하는 시그널
     rotation_changed = pyqtSignal(int)
@@ -28,6 +34,7 @@ class RotationManager(QObject):
         super().__init__(parent)
         self._rotation_angle = ROTATE_0  # 현재 회전 각도
         self.viewer = parent  # 부모 객체 참조
+        self.orientation_store = OrientationStore()  # 파일별 회전 각도 저장소
     
     @property
     def rotation_angle(self):
@@ -48,8 +55,48 @@ class RotationManager(QObject):
             
         if self._rotation_angle != angle:
             self._rotation_angle = angle
+            # 현재 파일의 회전 각도로 기억
+            current_path = getattr(self.viewer, 'current_image_path', None)
+            if current_path:
+                self.orientation_store.set(current_path, angle)
             self.rotation_changed.emit(angle)
     
+    def load_file_rotation(self, file_path):
+        """
+        파일에 저장된 회전 각도를 불러옵니다. (새 파일을 불러오기 전에 호출)
+        파일을 아직 표시하기 전이므로 rotation_changed 시그널은 보내지 않습니다.
+        
+        Args:
+            file_path: 열려는 파일 경로
+        """
+        angle = self.orientation_store.get(file_path)
+        self._rotation_angle = angle
+        
+        # 뷰어와 애니메이션 핸들러의 회전 각도도 맞춤
+        if self.viewer is not None and hasattr(self.viewer, 'current_rotation'):
+            self.viewer.current_rotation = angle
+        if self.viewer is not None and hasattr(self.viewer, 'animation_handler'):
+            self.viewer.animation_handler.current_rotation = angle
+    
+    def file_moved(self, old_path, new_path):
+        """
+        파일이 이동되었을 때 저장된 회전 각도를 새 경로로 옮깁니다.
+        
+        Args:
+            old_path: 이동 전 파일 경로
+            new_path: 이동 후 파일 경로
+        """
+        self.orientation_store.move(old_path, new_path)
+    
+    def file_removed(self, file_path):
+        """
+        파일이 삭제되었을 때 저장된 회전 각도를 지웁니다.
+        
+        Args:
+            file_path: 삭제된 파일 경로
+        """
+        self.orientation_store.remove(file_path)
+    
     def get_transform(self):
         """현재 회전 각도에 따른 QTransform 객체 반환"""
         transform = QTransform()
@@ -135,23 +182,13 @@ class RotationManager(QObject):
                 pass
             
             # Directly process the image file - the most efficient method
-            if hasattr(self.viewer, 'image_handler') and hasattr(self.viewer.image_handler, 'original_pixmap') and self.viewer.image_handler.original_pixmap:
+            if hasattr(self.viewer, 'image_handler') and getattr(self.viewer.image_handler, '_plain_original_pixmap', None):
                 # Initialize image handler's rotation_applied flag
                 
-                # Apply rotation (directly on the original image)
+                # Apply rotation (the handler rotates only the display-sized image)
                 if hasattr(self.viewer.image_handler, 'rotation_applied'):
-                    # Clone the original image if necessary
-                    if not hasattr(self.viewer.image_handler, '_plain_original_pixmap'):
-                        self.viewer.image_handler._plain_original_pixmap = self.viewer.image_handler.original_pixmap.copy()
-                    
-                    # If original image is saved, use it to apply rotation
                     try:
-                        transform = QTransform().rotate(self._rotation_angle)
-                        rotated_pixmap = self.viewer.image_handler._plain_original_pixmap.transformed(transform, Qt.SmoothTransformation)
-                        
-                        # Save rotated image and set flag
-                        self.viewer.image_handler.original_pixmap = rotated_pixmap
-                        self.viewer.image_handler.rotation_applied = True
+                        self.viewer.image_handler.rotation_applied = self._rotation_angle != 0
                         
                         # Resize and display image
                         self.viewer.image_handler._resize_and_display()
@@ -248,17 +285,17 @@ class RotationManager(QObject):
             image = QImage(self.viewer.current_image_path)
             if not image.isNull():
                 pixmap = QPixmap.fromImage(image)
-                transform = QTransform().rotate(self._rotation_angle)
-                rotated_pixmap = pixmap.transformed(transform, Qt.SmoothTransformation)
                 
-                # Resize rotated image to fit the screen
+                # Scale to the screen first, then transpose only the scaled image
                 label_size = self.viewer.image_label.size()
-                scaled_pixmap = rotated_pixmap.scaled(
-                    label_size,
+                width, height = rotated_size(label_size.width(), label_size.height(), self._rotation_angle)
+                scaled_pixmap = pixmap.scaled(
+                    width,
+                    height,
                     Qt.KeepAspectRatio,
                     Qt.SmoothTransformation
                 )
-                self.viewer.image_label.setPixmap(scaled_pixmap)
+                self.viewer.image_label.setPixmap(rotate_pixmap(scaled_pixmap, self._rotation_angle))
         except Exception as e:
             pass
     
@@ -276,13 +313,18 @@ class RotationManager(QObject):
                 self.viewer.animation_handler.load_webp(self.viewer.current_image_path)
             return
             
+        # 프레임 엔진이 있으면 다시 로드하지 않고 새 각도로 프레임만 다시 만들기
+        if self.viewer.animation_handler.frame_engine:
+            self.viewer.animation_handler.scale_animation()
+            return
+            
         try:
             # 현재 재생 상태 및 프레임 기억
             was_playing = self.viewer.animation_handler.is_playing()
             current_frame = 0
             
-            if self.viewer.animation_handler.current_movie:
-                current_frame = self.viewer.animation_handler.current_movie.currentFrameNumber()
+            if self.viewer.animation_handler.frame_engine:
+                current_frame = self.viewer.animation_handler.current_frame_number()
             
             # 이미지 레이블 초기화 (중요: 깜빡임 방지)
             self.viewer.image_label.clear()
@@ -300,13 +342,13 @@ class RotationManager(QObject):
                 self.viewer.animation_handler.load_webp(self.viewer.current_image_path)
                 
             # 프레임 및 재생 상태 복원
-            if self.viewer.animation_handler.current_movie:
-                if current_frame < self.viewer.animation_handler.current_movie.frameCount():
+            if self.viewer.animation_handler.frame_engine:
+                if current_frame < self.viewer.animation_handler.frame_count():
                     self.viewer.animation_handler.seek_to_frame(current_frame)
                 
                 # Restore playback state
                 if not was_playing:
-                    self.viewer.animation_handler.current_movie.setPaused(True)
+                    self.viewer.animation_handler.set_paused(True)
                     if hasattr(self.viewer, 'play_button'):
                         self.viewer.play_button.setText("▶")  # Play icon
         except Exception as e:
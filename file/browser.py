@@ -6,6 +6,7 @@
 """
 
 import os
+from PyQt5.QtCore import QThread, pyqtSignal
 from PyQt5.QtWidgets import QFileDialog
 from core.utils.sort_utils import natural_keys  # 파일 이름 자연 정렬을 위한 유틸리티 함수 추가
 
@@ -140,6 +141,20 @@ class FileBrowser:
                     if any(f.lower().endswith(ext) for ext in self.valid_extensions)]
         except Exception as e:
             return []
+
+    def is_supported_file(self, file_path):
+        """
+        지원하는 미디어 파일인지 확인합니다. (폴더를 읽지 않고 확장자만 확인)
+        
+        매개변수:
+            file_path (str): 파일 경로
+            
+        반환값:
+            bool: 지원 여부
+        """
+        if not file_path or not os.path.isfile(file_path):
+            return False
+        return file_path.lower().endswith(tuple(self.valid_extensions))
             
     def get_folder_name(self, path):
         """
@@ -157,4 +172,33 @@ class FileBrowser:
         if os.path.isfile(path):
             path = os.path.dirname(path)
             
-        return os.path.basename(path) 
\ No newline at end of file
+        return os.path.basename(path) 
+
+
+class FolderListingThread(QThread):
+    """
+    폴더의 미디어 파일 목록을 백그라운드에서 읽고 정렬하는 스레드
+    
+    파일 하나를 먼저 표시한 뒤 같은 폴더의 목록을 채울 때 사용합니다.
+    """
+    # 목록 완료 시그널 (폴더 경로, 정렬된 파일 목록)
+    listed = pyqtSignal(str, list)
+
+    def __init__(self, file_browser, folder_path, parent=None):
+        """
+        FolderListingThread 초기화
+        
+        매개변수:
+            file_browser (FileBrowser): 확장자 필터와 정렬에 사용할 파일 브라우저
+            folder_path (str): 읽을 폴더 경로
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.file_browser = file_browser
+        self.folder_path = folder_path
+
+    def run(self):
+        """폴더를 읽고 정렬한 목록을 전달합니다."""
+        media_files, _ = self.file_browser.process_folder(self.folder_path)
+        if not self.isInterruptionRequested():
+            self.listed.emit(self.folder_path, media_files)
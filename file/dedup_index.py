@@ -0,0 +1,395 @@
+"""
+중복 파일 색인 모듈
+
+이 모듈은 복사/이동 대상 폴더에 같은 내용의 파일이 이미 있는지 빠르게 확인하는 기능을 담당합니다.
+
+대상 폴더마다 파일 크기별 색인을 만들고, 크기가 같은 파일에 대해서만
+부분 해시(앞/뒤 일부) -> 전체 해시 순서로 필요할 때 계산합니다.
+계산된 해시는 (파일 이름, 크기, 수정 시간) 기준으로 사용자 데이터 폴더에 저장되므로
+파일이 10만 개인 폴더도 다음부터는 다시 읽지 않습니다.
+
+큰 파일의 전체 해시는 GUI 스레드에서 계산하지 않고 DuplicateCheckThread로 미룹니다.
+"""
+
+import os
+import json
+import hashlib
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.utils.path_utils import get_user_data_directory
+
+# 해시 캐시를 저장할 폴더 이름 (사용자 데이터 폴더 아래)
+DEDUP_CACHE_DIRNAME = "dedup_cache"
+
+# 부분 해시에 사용할 앞/뒤 바이트 수
+PARTIAL_HASH_BYTES = 64 * 1024
+
+# 전체 해시 계산 시 읽는 단위
+READ_CHUNK_BYTES = 1024 * 1024
+
+# GUI 스레드에서 전체 해시를 계산해도 되는 최대 파일 크기 (이보다 크면 백그라운드로 미룸)
+QUICK_FULL_HASH_MAX_BYTES = 16 * 1024 * 1024
+
+# 메모리에 보관할 원본 파일 전체 해시 개수
+SOURCE_HASH_CACHE_SIZE = 256
+
+
+class DuplicateCheckDeferred(Exception):
+    """
+    전체 해시가 필요한 큰 파일이 있어 중복 확인을 백그라운드로 미뤄야 함
+
+    paths: 전체 해시를 계산해야 하는 파일 경로 목록
+    """
+
+    def __init__(self, paths):
+        super().__init__(f"Full hash needed for {len(paths)} file(s)")
+        self.paths = paths
+
+
+def _partial_hash(path, size):
+    """파일 앞/뒤 일부와 크기로 부분 해시를 계산합니다."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(size).encode('ascii'))
+    with open(path, 'rb') as file:
+        digest.update(file.read(PARTIAL_HASH_BYTES))
+        if size > PARTIAL_HASH_BYTES * 2:
+            file.seek(-PARTIAL_HASH_BYTES, os.SEEK_END)
+            digest.update(file.read(PARTIAL_HASH_BYTES))
+    return digest.hexdigest()
+
+
+def _full_hash(path, is_cancelled=None):
+    """파일 전체 내용의 해시를 계산합니다. (취소되면 None)"""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(READ_CHUNK_BYTES), b''):
+            if is_cancelled is not None and is_cancelled():
+                return None
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_key(path, size, mtime):
+    """원본 파일 전체 해시 캐시의 키"""
+    return os.path.normcase(os.path.abspath(path)), size, mtime
+
+
+class _FolderIndex:
+    """
+    대상 폴더 하나의 색인
+
+    by_size: 파일 크기 -> 파일 이름 목록
+    hashes : 파일 이름 -> {'size', 'mtime', 'partial', 'full'} (디스크 캐시)
+    """
+
+    def __init__(self, folder_path, cache_path):
+        self.folder_path = folder_path
+        self.cache_path = cache_path
+        self.by_size = {}
+        self.stats = {}  # 파일 이름 -> (크기, 수정 시간)
+        self.hashes = {}
+        self.folder_mtime = None
+        self.dirty = False
+        self._load_cache()
+
+    def _load_cache(self):
+        """디스크에 저장된 해시 캐시를 읽습니다."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                self.hashes = json.load(file)
+        except (OSError, ValueError):
+            self.hashes = {}
+
+    def save_cache(self):
+        """변경된 해시 캐시를 디스크에 저장합니다."""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.hashes, file, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Failed to save dedup cache: {str(e)}")
+
+    def refresh(self):
+        """폴더가 바뀌었으면 (폴더 수정 시간 기준) 크기 색인을 다시 만듭니다."""
+        try:
+            folder_mtime = os.stat(self.folder_path).st_mtime_ns
+        except OSError:
+            self.by_size = {}
+            self.stats = {}
+            return
+        if folder_mtime == self.folder_mtime:
+            return
+
+        by_size = {}
+        stats = {}
+        try:
+            with os.scandir(self.folder_path) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    by_size.setdefault(stat.st_size, []).append(entry.name)
+                    stats[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass
+
+        # 사라진 파일의 해시 캐시 정리
+        stale = [name for name in self.hashes if name not in stats]
+        for name in stale:
+            del self.hashes[name]
+            self.dirty = True
+
+        self.by_size = by_size
+        self.stats = stats
+        self.folder_mtime = folder_mtime
+
+    def _cached(self, name, key, compute=True):
+        """파일이 바뀌지 않았으면 캐시된 해시 값을 반환합니다. (compute=False면 없을 때 None)"""
+        # 폴더 수정 시간은 파일 내용 변경을 반영하지 않으므로 후보 파일은 다시 확인
+        stat = os.stat(os.path.join(self.folder_path, name))
+        size, mtime = stat.st_size, stat.st_mtime_ns
+        self.stats[name] = (size, mtime)
+        entry = self.hashes.get(name)
+        if not entry or entry.get('size') != size or entry.get('mtime') != mtime:
+            entry = {'size': size, 'mtime': mtime}
+            self.hashes[name] = entry
+            self.dirty = True
+        value = entry.get(key)
+        if value is None and compute:
+            path = os.path.join(self.folder_path, name)
+            value = _partial_hash(path, size) if key == 'partial' else _full_hash(path)
+            entry[key] = value
+            self.dirty = True
+        return value
+
+    def find(self, size, partial_fn, full_fn, exclude=None, max_full_hash_bytes=None):
+        """
+        크기 -> 부분 해시 -> 전체 해시 순서로 같은 내용의 파일을 찾습니다.
+
+        Args:
+            size: 원본 파일 크기
+            partial_fn: 원본 부분 해시를 반환하는 함수 (필요할 때만 호출)
+            full_fn: 원본 전체 해시를 반환하는 함수 (필요할 때만 호출, compute=False면 계산하지 않음)
+            exclude: 비교에서 제외할 파일 이름 (원본 자신)
+            max_full_hash_bytes: 이보다 큰 파일은 캐시된 전체 해시만 비교 (None이면 제한 없음)
+
+        Returns:
+            str or None: 같은 내용의 파일 이름
+
+        Raises:
+            DuplicateCheckDeferred: 제한보다 큰 후보의 전체 해시가 없어 비교하지 못한 경우
+        """
+        candidates = self.by_size.get(size)
+        if not candidates:
+            return None
+
+        partial = partial_fn()
+        quick = max_full_hash_bytes is not None and size > max_full_hash_bytes
+        deferred = []
+        needs_source = False
+        for name in candidates:
+            if name == exclude:
+                continue
+            try:
+                if self._cached(name, 'partial') != partial or self.stats[name][0] != size:
+                    continue
+                if quick:
+                    candidate_full = self._cached(name, 'full', compute=False)
+                    source_full = full_fn(compute=False)
+                    if candidate_full is None or source_full is None:
+                        # 큰 파일의 전체 해시는 백그라운드에서 계산하도록 미룸
+                        needs_source = needs_source or source_full is None
+                        if candidate_full is None:
+                            deferred.append(os.path.join(self.folder_path, name))
+                        continue
+                    if candidate_full == source_full:
+                        return name
+                elif self._cached(name, 'full') == full_fn():
+                    return name
+            except OSError:
+                continue
+        if deferred or needs_source:
+            raise DuplicateCheckDeferred(deferred)
+        return None
+
+    def store_full_hash(self, name, size, mtime, value):
+        """백그라운드에서 계산한 전체 해시를 캐시에 저장합니다."""
+        entry = self.hashes.get(name)
+        if not entry or entry.get('size') != size or entry.get('mtime') != mtime:
+            entry = {'size': size, 'mtime': mtime}
+            self.hashes[name] = entry
+        entry['full'] = value
+        self.dirty = True
+
+    def add(self, name):
+        """이 프로그램이 폴더에 추가한 파일을 색인에 반영합니다 (다시 스캔하지 않도록)."""
+        path = os.path.join(self.folder_path, name)
+        try:
+            stat = os.stat(path)
+            self.stats[name] = (stat.st_size, stat.st_mtime_ns)
+            self.by_size.setdefault(stat.st_size, []).append(name)
+            self.folder_mtime = os.stat(self.folder_path).st_mtime_ns
+        except OSError:
+            pass
+
+
+class DedupIndex:
+    """
+    중복 파일 색인 클래스
+
+    대상 폴더별 _FolderIndex를 관리합니다.
+    """
+
+    def __init__(self):
+        """DedupIndex 초기화"""
+        self.cache_dir = os.path.join(get_user_data_directory(), DEDUP_CACHE_DIRNAME)
+        self.folders = {}
+        self.source_hashes = {}  # (경로, 크기, 수정 시간) -> 원본 파일 전체 해시
+
+    def _get_folder_index(self, folder_path):
+        """대상 폴더의 색인을 가져옵니다 (없으면 생성)."""
+        key = os.path.normcase(os.path.abspath(folder_path))
+        index = self.folders.get(key)
+        if index is None:
+            cache_name = hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json"
+            index = _FolderIndex(folder_path, os.path.join(self.cache_dir, cache_name))
+            self.folders[key] = index
+        index.refresh()
+        return index
+
+    def find_duplicate(self, file_path, folder_path, max_full_hash_bytes=None):
+        """
+        대상 폴더에 원본 파일과 같은 내용의 파일이 있는지 확인합니다.
+
+        Args:
+            file_path: 원본 파일 경로
+            folder_path: 대상 폴더 경로
+            max_full_hash_bytes: 이보다 큰 파일은 전체 해시를 계산하지 않음 (None이면 제한 없음)
+
+        Returns:
+            str or None: 같은 내용의 파일 경로 (없으면 None)
+
+        Raises:
+            DuplicateCheckDeferred: 크기와 부분 해시가 같은 큰 파일이 있어
+                                    전체 해시를 백그라운드에서 계산해야 하는 경우
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        size = stat.st_size
+        source_key = _source_key(file_path, size, stat.st_mtime_ns)
+
+        index = self._get_folder_index(folder_path)
+        hashes = {}
+
+        # 같은 폴더로 복사하는 경우 원본 자신은 비교에서 제외
+        exclude = None
+        if os.path.normcase(os.path.abspath(os.path.dirname(file_path))) == \
+                os.path.normcase(os.path.abspath(folder_path)):
+            exclude = os.path.basename(file_path)
+
+        def partial_fn():
+            if 'partial' not in hashes:
+                hashes['partial'] = _partial_hash(file_path, size)
+            return hashes['partial']
+
+        def full_fn(compute=True):
+            if 'full' not in hashes:
+                value = self.source_hashes.get(source_key)
+                if value is None and compute:
+                    value = _full_hash(file_path)
+                if value is None:
+                    return None
+                hashes['full'] = value
+            return hashes['full']
+
+        try:
+            name = index.find(size, partial_fn, full_fn, exclude, max_full_hash_bytes)
+        except DuplicateCheckDeferred as deferred:
+            index.save_cache()
+            paths = list(deferred.paths)
+            if full_fn(compute=False) is None:
+                paths.insert(0, file_path)
+            raise DuplicateCheckDeferred(paths)
+        except OSError:
+            name = None
+        index.save_cache()
+
+        if name is None:
+            return None
+        return os.path.join(folder_path, name)
+
+    def notify_added(self, file_path):
+        """
+        대상 폴더에 파일을 추가했음을 알립니다.
+
+        Args:
+            file_path: 추가된 파일 경로
+        """
+        key = os.path.normcase(os.path.abspath(os.path.dirname(file_path)))
+        index = self.folders.get(key)
+        if index is not None:
+            index.add(os.path.basename(file_path))
+
+    def store_full_hashes(self, hashed):
+        """
+        DuplicateCheckThread가 계산한 전체 해시를 색인에 저장합니다.
+
+        Args:
+            hashed: 파일 경로 -> (크기, 수정 시간, 전체 해시)
+        """
+        if len(self.source_hashes) + len(hashed) > SOURCE_HASH_CACHE_SIZE:
+            self.source_hashes.clear()
+        for path, (size, mtime, value) in hashed.items():
+            self.source_hashes[_source_key(path, size, mtime)] = value
+            key = os.path.normcase(os.path.abspath(os.path.dirname(path)))
+            index = self.folders.get(key)
+            if index is not None:
+                index.store_full_hash(os.path.basename(path), size, mtime, value)
+                index.save_cache()
+
+
+class DuplicateCheckThread(QThread):
+    """
+    크기와 부분 해시가 같은 큰 파일의 전체 해시를 백그라운드에서 계산하는 스레드
+
+    색인은 건드리지 않고 결과만 전달하며, GUI 스레드가 DedupIndex.store_full_hashes로 저장합니다.
+    """
+    # 계산 완료 시그널 (파일 경로 -> (크기, 수정 시간, 전체 해시))
+    hashed = pyqtSignal(dict)
+
+    def __init__(self, paths, parent=None):
+        """
+        DuplicateCheckThread 초기화
+
+        Args:
+            paths: 전체 해시를 계산할 파일 경로 목록
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.paths = list(paths)
+
+    def run(self):
+        """파일마다 전체 해시를 계산해서 전달합니다. (중단 요청 시 전달하지 않음)"""
+        hashed = {}
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                value = _full_hash(path, self.isInterruptionRequested)
+            except OSError:
+                continue
+            if value is None:
+                return
+            hashed[path] = (stat.st_size, stat.st_mtime_ns, value)
+        if not self.isInterruptionRequested():
+            self.hashed.emit(hashed)
@@ -0,0 +1,310 @@
+"""
+대상 폴더 색인 모듈
+
+이 모듈은 기준 폴더(base folder)의 하위 폴더 목록을 백그라운드에서 스캔하고,
+폴더 변경을 감시하며, 빠른 폴더 검색(퍼지 검색)을 위한 색인을 제공합니다.
+
+검색 색인은 이름 앞부분(prefix) 색인과 3글자 조각(trigram) 색인으로 구성되어
+수백~수천 개의 폴더에서도 한 글자 입력마다 바로 결과를 돌려줄 수 있습니다.
+하위 폴더의 하위 폴더는 필요할 때(펼칠 때)만 읽습니다.
+"""
+
+import os
+
+from PyQt5.QtCore import QObject, QThread, QTimer, QFileSystemWatcher, pyqtSignal
+
+from core.utils.sort_utils import natural_keys
+
+# 이름 앞부분 색인에 사용할 최대 글자 수
+PREFIX_INDEX_LENGTH = 3
+
+# 폴더 변경 후 다시 스캔하기까지 기다리는 시간 (밀리초)
+RESCAN_DELAY_MS = 300
+
+
+def list_subfolders(folder_path):
+    """
+    폴더의 하위 폴더 목록을 자연 정렬하여 반환합니다.
+
+    Args:
+        folder_path: 폴더 경로
+
+    Returns:
+        list: 하위 폴더 경로 목록
+    """
+    try:
+        with os.scandir(folder_path) as entries:
+            subfolders = [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+    subfolders.sort(key=lambda path: natural_keys(os.path.basename(path).lower()))
+    return subfolders
+
+
+def _trigrams(text):
+    """문자열의 3글자 조각 집합을 반환합니다."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FolderSearchIndex:
+    """
+    폴더 이름 검색 색인 클래스
+
+    prefix 색인 : 이름 앞 1~3글자 -> 항목 번호 목록
+    trigram 색인: 이름의 3글자 조각 -> 항목 번호 집합
+    """
+
+    def __init__(self, folder_paths=None):
+        """
+        FolderSearchIndex 초기화
+
+        Args:
+            folder_paths: 색인할 폴더 경로 목록
+        """
+        self.paths = []
+        self.names = []  # 소문자 폴더 이름
+        self.path_ids = {}
+        self.prefixes = {}
+        self.trigrams = {}
+        if folder_paths:
+            self.add(folder_paths)
+
+    def add(self, folder_paths):
+        """폴더 경로들을 색인에 추가합니다 (이미 있는 경로는 무시)."""
+        for path in folder_paths:
+            if path in self.path_ids:
+                continue
+            item_id = len(self.paths)
+            name = os.path.basename(path).lower()
+            self.paths.append(path)
+            self.names.append(name)
+            self.path_ids[path] = item_id
+
+            for length in range(1, min(PREFIX_INDEX_LENGTH, len(name)) + 1):
+                self.prefixes.setdefault(name[:length], []).append(item_id)
+            for gram in _trigrams(name):
+                self.trigrams.setdefault(gram, set()).add(item_id)
+
+    def _score(self, name, query):
+        """
+        이름이 검색어와 얼마나 잘 맞는지 점수를 계산합니다 (낮을수록 좋음).
+
+        Returns:
+            int or None: 점수 (맞지 않으면 None)
+        """
+        if name.startswith(query):
+            return len(name) - len(query)
+        position = name.find(query)
+        if position >= 0:
+            # 단어 시작 위치에서 맞으면 우선
+            if not name[position - 1].isalnum():
+                return 1000 + position
+            return 2000 + position
+
+        # 글자 순서만 맞는 경우 (퍼지 검색) - 글자 사이 간격이 작을수록 좋음
+        gaps = 0
+        index = -1
+        for char in query:
+            next_index = name.find(char, index + 1)
+            if next_index < 0:
+                return None
+            if index >= 0:
+                gaps += next_index - index - 1
+            index = next_index
+        return 3000 + gaps
+
+    def search(self, query, limit=50):
+        """
+        검색어와 맞는 폴더 경로 목록을 반환합니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            list: 폴더 경로 목록 (잘 맞는 순서)
+        """
+        query = query.strip().lower()
+        if not query:
+            return self.paths[:limit]
+
+        if len(query) <= PREFIX_INDEX_LENGTH:
+            candidates = list(self.prefixes.get(query, []))
+        else:
+            # 검색어의 모든 trigram을 가진 항목 = 검색어를 포함할 수 있는 항목
+            grams = sorted(_trigrams(query), key=lambda gram: len(self.trigrams.get(gram, ())))
+            candidate_set = set(self.trigrams.get(grams[0], ())) if grams else set()
+            for gram in grams[1:]:
+                if not candidate_set:
+                    break
+                candidate_set &= self.trigrams.get(gram, set())
+            candidates = list(candidate_set)
+
+        # 앞부분/부분 문자열로 충분하지 않으면 전체 퍼지 검색으로 보충
+        if len(candidates) < limit:
+            seen = set(candidates)
+            candidates.extend(item_id for item_id in range(len(self.paths)) if item_id not in seen)
+
+        scored = []
+        for item_id in candidates:
+            score = self._score(self.names[item_id], query)
+            if score is not None:
+                scored.append((score, item_id))
+        scored.sort()
+        return [self.paths[item_id] for _, item_id in scored[:limit]]
+
+
+class FolderScanThread(QThread):
+    """
+    기준 폴더의 하위 폴더 목록을 읽고 검색 색인을 만드는 백그라운드 스레드
+    """
+    # 스캔 완료 시그널 (기준 폴더 경로, 하위 폴더 목록, 검색 색인)
+    scanned = pyqtSignal(str, list, object)
+
+    def __init__(self, base_folder, parent=None):
+        super().__init__(parent)
+        self.base_folder = base_folder
+
+    def run(self):
+        """하위 폴더를 읽고 검색 색인을 만듭니다."""
+        subfolders = list_subfolders(self.base_folder)
+        self.scanned.emit(self.base_folder, subfolders, FolderSearchIndex(subfolders))
+
+
+class FolderIndex(QObject):
+    """
+    대상 폴더 색인 클래스
+
+    기준 폴더를 백그라운드에서 스캔하고, QFileSystemWatcher로 폴더 추가/삭제를 감시합니다.
+    하위 폴더 목록이 바뀌면 folders_changed 시그널이 발생합니다.
+    """
+    folders_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        """
+        FolderIndex 초기화
+
+        Args:
+            parent: 부모 객체 (일반적으로 MediaSorterPAAK)
+        """
+        super().__init__(parent)
+        self.base_folder = ""
+        self.subfolders = []
+        self.search_index = FolderSearchIndex()
+        self.children = {}  # 폴더 경로 -> 하위 폴더 목록 (펼친 폴더만)
+        self._scan_thread = None
+        self._rescan_pending = False
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+
+        # 짧은 시간에 여러 변경이 생겨도 한 번만 다시 스캔
+        self.rescan_timer = QTimer(self)
+        self.rescan_timer.setSingleShot(True)
+        self.rescan_timer.timeout.connect(self.rescan)
+
+    def set_base_folder(self, folder_path):
+        """
+        기준 폴더를 설정하고 백그라운드 스캔을 시작합니다.
+
+        Args:
+            folder_path: 기준 폴더 경로
+        """
+        watched = self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+
+        self.base_folder = folder_path or ""
+        self.subfolders = []
+        self.search_index = FolderSearchIndex()
+        self.children = {}
+
+        if self.base_folder and os.path.isdir(self.base_folder):
+            self.watcher.addPath(self.base_folder)
+            self.rescan()
+        else:
+            self.folders_changed.emit()
+
+    def rescan(self):
+        """기준 폴더를 백그라운드에서 다시 스캔합니다."""
+        if not self.base_folder:
+            return
+        if self._scan_thread is not None and self._scan_thread.isRunning():
+            # 진행 중인 스캔이 끝나면 다시 스캔
+            self._rescan_pending = True
+            return
+
+        self._rescan_pending = False
+        self._scan_thread = FolderScanThread(self.base_folder)
+        self._scan_thread.scanned.connect(self._on_scanned)
+        self._scan_thread.finished.connect(self._on_scan_finished)
+        self._scan_thread.start()
+
+    def _on_scanned(self, base_folder, subfolders, search_index):
+        """스캔 결과를 반영합니다."""
+        if base_folder != self.base_folder:
+            return  # 스캔 도중 기준 폴더가 바뀐 경우
+        self.subfolders = subfolders
+        self.search_index = search_index
+        # 펼쳐두었던 하위 폴더도 검색 색인에 다시 추가
+        for children in self.children.values():
+            self.search_index.add(children)
+        self.folders_changed.emit()
+
+    def _on_scan_finished(self):
+        """스캔 스레드 종료 처리"""
+        thread = self.sender()
+        if thread is not None:
+            thread.deleteLater()
+        if thread is self._scan_thread:
+            self._scan_thread = None
+        if self._rescan_pending:
+            self.rescan()
+
+    def _on_directory_changed(self, path):
+        """감시 중인 폴더가 바뀌면 잠시 후 다시 스캔합니다."""
+        if path == self.base_folder:
+            self.rescan_timer.start(RESCAN_DELAY_MS)
+        elif path in self.children:
+            self.children[path] = list_subfolders(path)
+            self.search_index.add(self.children[path])
+
+    def get_children(self, folder_path):
+        """
+        폴더의 하위 폴더 목록을 반환합니다 (처음 요청할 때만 읽음).
+
+        Args:
+            folder_path: 펼칠 폴더 경로
+
+        Returns:
+            list: 하위 폴더 경로 목록
+        """
+        children = self.children.get(folder_path)
+        if children is None:
+            children = list_subfolders(folder_path)
+            self.children[folder_path] = children
+            self.search_index.add(children)
+            self.watcher.addPath(folder_path)
+        return children
+
+    def search(self, query, limit=50):
+        """
+        폴더 이름으로 검색합니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            list: 폴더 경로 목록
+        """
+        return self.search_index.search(query, limit)
+
+    def cleanup(self):
+        """스캔 스레드와 감시를 정리합니다."""
+        self.rescan_timer.stop()
+        watched = self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+        if self._scan_thread is not None and self._scan_thread.isRunning():
+            self._scan_thread.wait(1000)
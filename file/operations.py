@@ -9,11 +9,16 @@ import re
 import shutil
 import sys
 import time
-import gc
 from pathlib import Path
 from PyQt5.QtWidgets import QMessageBox, QApplication
 from PyQt5.QtGui import QMovie
 
+from core.config_manager import load_settings, save_settings
+from core.memory import get_disposal_queue
+from file.dedup_index import (
+    DedupIndex, DuplicateCheckDeferred, DuplicateCheckThread, QUICK_FULL_HASH_MAX_BYTES
+)
+
 # 디버깅용 로깅 활성화 (프로덕션 환경에서는 False로 설정)
 DEBUG = False
 
@@ -30,6 +35,20 @@ def log_error(message):
     """오류 메시지 로깅"""
     print(f"[ERROR] {message}")
 
+# 중복 파일 처리 모드
+DEDUP_OFF = "off"    # 중복 검사 안 함 (기존 동작: 'name (1).jpg'로 저장)
+DEDUP_SKIP = "skip"  # 대상 폴더에 같은 내용이 있으면 복사하지 않음
+DEDUP_LINK = "link"  # 같은 내용이 있으면 복사 대신 하드 링크 생성 (복사에만 적용)
+
+# 복사/이동 결과
+RESULT_DONE = "done"                            # 복사/이동함 (하드 링크, 중복 원본을 휴지통으로 보낸 경우 포함)
+RESULT_SKIPPED_DUPLICATE = "skipped_duplicate"  # 대상 폴더에 같은 내용이 있어 건너뜀
+RESULT_PENDING = "pending"                      # 큰 파일의 중복 확인을 백그라운드에서 하는 중 (끝나면 다시 실행)
+RESULT_FAILED = "failed"                        # 실패
+
+# 파일 작업 설정 파일 이름
+FILE_SETTINGS_FILENAME = "file_settings.json"
+
 class FileOperations:
     """
     파일 작업 클래스
@@ -46,8 +65,130 @@ class FileOperations:
             viewer: MediaSorterPAAK 인스턴스 (UI 표시 및 파일 내비게이터 제공)
         """
         self.viewer = viewer
+        self.dedup_index = DedupIndex()  # 대상 폴더별 중복 파일 색인
+        settings = load_settings(FILE_SETTINGS_FILENAME)
+        self.dedup_mode = settings.get("dedup_mode", DEDUP_OFF)
+        # 이동할 때 대상 폴더에 같은 내용이 있으면 원본을 휴지통으로 보낼지 여부 (아니면 이동하지 않음)
+        self.trash_moved_duplicates = bool(settings.get("trash_moved_duplicates", False))
+        # 백그라운드 중복 확인 중인 작업: (작업 종류, 원본, 대상 폴더) -> (스레드, 중복 처리 모드, 완료 콜백)
+        self.duplicate_checks = {}
+    
+    def set_dedup_mode(self, mode):
+        """
+        중복 파일 처리 모드를 설정하고 저장합니다.
+        
+        매개변수:
+            mode: DEDUP_OFF, DEDUP_SKIP, DEDUP_LINK 중 하나
+        """
+        if mode not in (DEDUP_OFF, DEDUP_SKIP, DEDUP_LINK):
+            mode = DEDUP_OFF
+        self.dedup_mode = mode
+        settings = load_settings(FILE_SETTINGS_FILENAME)
+        settings["dedup_mode"] = mode
+        save_settings(settings, FILE_SETTINGS_FILENAME)
+    
+    def set_trash_moved_duplicates(self, enabled):
+        """
+        이동할 때 대상 폴더에 같은 내용의 파일이 있으면 원본을 휴지통으로 보낼지 설정하고 저장합니다.
+        
+        매개변수:
+            enabled: True면 원본을 휴지통으로 보내고 (삭제로 실행 취소 가능), False면 이동하지 않음
+        """
+        self.trash_moved_duplicates = bool(enabled)
+        settings = load_settings(FILE_SETTINGS_FILENAME)
+        settings["trash_moved_duplicates"] = self.trash_moved_duplicates
+        save_settings(settings, FILE_SETTINGS_FILENAME)
+    
+    def _find_duplicate(self, file_path, folder_path, dedup_mode):
+        """
+        중복 검사가 켜져 있으면 대상 폴더에서 같은 내용의 파일을 찾습니다.
+        
+        매개변수:
+            file_path: 원본 파일 경로
+            folder_path: 대상 폴더 경로
+            dedup_mode: 중복 파일 처리 모드
+            
+        반환값:
+            같은 내용의 파일 경로 (없거나 검사하지 않으면 None)
+            
+        예외:
+            DuplicateCheckDeferred: 큰 파일이라 전체 해시를 백그라운드에서 계산해야 하는 경우
+        """
+        if dedup_mode == DEDUP_OFF:
+            return None
+        try:
+            return self.dedup_index.find_duplicate(file_path, folder_path, QUICK_FULL_HASH_MAX_BYTES)
+        except DuplicateCheckDeferred:
+            raise
+        except Exception as e:
+            log_error(f"Duplicate check failed: {str(e)}")
+            return None
+    
+    def _start_duplicate_check(self, action, file_path, folder_path, dedup_mode, paths, on_finished):
+        """
+        큰 파일의 전체 해시를 백그라운드에서 계산하고, 끝나면 복사/이동을 다시 실행합니다.
+        
+        매개변수:
+            action: "copy" 또는 "move"
+            file_path: 원본 파일 경로
+            folder_path: 대상 폴더 경로
+            dedup_mode: 중복 파일 처리 모드
+            paths: 전체 해시를 계산할 파일 경로 목록
+            on_finished: 다시 실행한 뒤 호출할 함수 (원본 경로, 결과, 결과 경로)
+        """
+        key = (action, os.path.normcase(os.path.abspath(file_path)), os.path.normcase(os.path.abspath(folder_path)))
+        if key not in self.duplicate_checks:
+            thread = DuplicateCheckThread(paths)
+            thread.hashed.connect(
+                lambda hashed, key=key, file_path=file_path, folder_path=folder_path:
+                    self._on_duplicate_check_done(key, file_path, folder_path, hashed))
+            self.duplicate_checks[key] = (thread, dedup_mode, on_finished)
+            thread.start()
+        self.viewer.show_message(f"Checking for identical files: {os.path.basename(file_path)}")
+    
+    def _on_duplicate_check_done(self, key, file_path, folder_path, hashed):
+        """
+        백그라운드 중복 확인이 끝나면 해시를 저장하고 미뤄둔 복사/이동을 실행합니다.
+        """
+        check = self.duplicate_checks.pop(key, None)
+        if check is None:
+            return
+        thread, dedup_mode, on_finished = check
+        thread.wait()
+        self.dedup_index.store_full_hashes(hashed)
+        
+        if not os.path.exists(file_path):
+            return
+        action = key[0]
+        if action == "move" and getattr(self.viewer, 'current_image_path', None) != file_path:
+            # 이동은 표시 중인 파일을 정리하므로, 확인하는 동안 다른 파일로 넘어갔으면 이동하지 않음
+            self.viewer.show_message(f"{os.path.basename(file_path)} was not moved (another file is shown)")
+            return
+        if action == "copy":
+            result, result_path = self.copy_file_to_folder(file_path, folder_path, dedup_mode)
+        else:
+            result, result_path = self.move_file_to_folder(file_path, folder_path, dedup_mode)
+        if on_finished is not None and result != RESULT_PENDING:
+            on_finished(file_path, result, result_path)
+    
+    def cancel_duplicate_checks(self, file_path=None):
+        """
+        백그라운드 중복 확인을 중단하고 끝날 때까지 기다립니다.
+        
+        매개변수:
+            file_path: 이 파일을 읽는 확인만 중단 (None이면 모두 중단)
+        """
+        target = os.path.normcase(os.path.abspath(file_path)) if file_path else None
+        for key, (thread, _, _) in list(self.duplicate_checks.items()):
+            if target is not None and target not in (
+                    os.path.normcase(os.path.abspath(path)) for path in thread.paths):
+                continue
+            del self.duplicate_checks[key]
+            if thread.isRunning():
+                thread.requestInterruption()
+                thread.wait()
     
-    def copy_file_to_folder(self, file_path, folder_path):
+    def copy_file_to_folder(self, file_path, folder_path, dedup_mode=None, on_finished=None):
         """
         Copies the file to the specified folder.
         파일을 지정된 폴더로 복사합니다.
@@ -57,22 +198,56 @@ class FileOperations:
             file_path: 복사할 파일 경로
             folder_path: the target folder path
             folder_path: 대상 폴더 경로
+            dedup_mode: duplicate handling mode (None uses self.dedup_mode)
+            dedup_mode: 중복 파일 처리 모드 (None이면 self.dedup_mode 사용)
+            on_finished: called as (file_path, result, path) when a deferred duplicate check finishes
+            on_finished: 중복 확인을 백그라운드로 미룬 경우, 끝난 뒤 (원본 경로, 결과, 결과 경로)로 호출할 함수
             
         Return value:
-            A tuple containing a boolean indicating success and the copied file path (string)
-            성공 여부(bool)와 복사된 파일 경로(string)를 포함하는 튜플
+            A tuple of the result (RESULT_*) and the copied file path (the identical file when skipped)
+            결과(RESULT_*)와 복사된 파일 경로(건너뛴 경우 같은 내용의 파일 경로)를 포함하는 튜플
         """
         if not file_path or not folder_path:
-            return False, None
+            return RESULT_FAILED, None
             
+        if dedup_mode is None:
+            dedup_mode = self.dedup_mode
+            
+        op_id = None
         try:
+            # 대상 폴더에 같은 내용의 파일이 있는지 확인
+            try:
+                duplicate_path = self._find_duplicate(file_path, folder_path, dedup_mode)
+            except DuplicateCheckDeferred as deferred:
+                self._start_duplicate_check("copy", file_path, folder_path, dedup_mode, deferred.paths, on_finished)
+                return RESULT_PENDING, None
+            if duplicate_path and dedup_mode == DEDUP_SKIP:
+                self.viewer.show_message(f"Identical file already exists: {os.path.basename(duplicate_path)} (skipped)")
+                return RESULT_SKIPPED_DUPLICATE, duplicate_path
+            
             # Generate a unique file path
             # 고유한 파일 경로 생성
             target_path = self.get_unique_file_path(folder_path, file_path)
             
-            # Copy the file (including metadata)
-            # 파일 복사 (메타데이터 포함)
-            shutil.copy2(file_path, target_path)
+            # 작업 시작을 실행 취소 저널에 기록 (중단 시 복구용)
+            if hasattr(self.viewer, 'undo_manager'):
+                op_id = self.viewer.undo_manager.begin_operation(
+                    self.viewer.undo_manager.ACTION_COPY, original_path=file_path, copied_path=target_path)
+            
+            linked = False
+            if duplicate_path:
+                # 같은 내용이 있으면 데이터를 다시 쓰지 않고 하드 링크 생성
+                try:
+                    os.link(duplicate_path, target_path)
+                    linked = True
+                except OSError:
+                    linked = False
+            
+            if not linked:
+                # Copy the file (including metadata)
+                # 파일 복사 (메타데이터 포함)
+                shutil.copy2(file_path, target_path)
+            self.dedup_index.notify_added(target_path)
             
             # If the full path is too long, shorten the displayed path
             # 전체 경로가 너무 길 경우 표시용 경로 축약
@@ -89,7 +264,8 @@ class FileOperations:
             
             # 복사 작업 추적 (Undo 가능하도록)
             if hasattr(self.viewer, 'undo_manager'):
-                self.viewer.undo_manager.track_copied_file(file_path, target_path, True)
+                self.viewer.undo_manager.track_copied_file(file_path, target_path, True, op_id)
+                op_id = None
             
             # 레이아웃 비율 다시 설정 (UI 깨짐 방지)
             if hasattr(self.viewer, 'ui_state_manager'):
@@ -97,9 +273,12 @@ class FileOperations:
             
             # Display message
             # 메시지 표시
-            self.viewer.show_message(f"Copied file to {path_display}")
+            if linked:
+                self.viewer.show_message(f"Linked identical file to {path_display}")
+            else:
+                self.viewer.show_message(f"Copied file to {path_display}")
             
-            return True, target_path
+            return RESULT_DONE, target_path
             
         except Exception as e:
             # Log error
@@ -113,10 +292,13 @@ class FileOperations:
                 error_msg = error_msg.replace("다른 프로세스가 파일을 사용 중이기 때문에 프로세스가 액세스 할 수 없습니다", 
                                              "The process cannot access the file because it is being used by another process")
             
+            if op_id is not None:
+                self.viewer.undo_manager.abort_operation(op_id)
+            
             self.viewer.show_message(f"File copy failed: {error_msg}")
-            return False, None
+            return RESULT_FAILED, None
     
-    def move_file_to_folder(self, file_path, folder_path):
+    def move_file_to_folder(self, file_path, folder_path, dedup_mode=None, on_finished=None):
         """
         Moves the file to the specified folder.
         파일을 지정된 폴더로 이동합니다.
@@ -126,14 +308,24 @@ class FileOperations:
             file_path: 이동할 파일 경로
             folder_path: the target folder path
             folder_path: 대상 폴더 경로
+            dedup_mode: duplicate handling mode (None uses self.dedup_mode)
+            dedup_mode: 중복 파일 처리 모드 (None이면 self.dedup_mode 사용)
+                        같은 내용이 대상 폴더에 있으면 이동하지 않고 원본을 그대로 둡니다.
+                        trash_moved_duplicates가 켜져 있으면 원본을 휴지통으로 보냅니다 (실행 취소 가능)
+            on_finished: called as (file_path, result, path) when a deferred duplicate check finishes
+            on_finished: 중복 확인을 백그라운드로 미룬 경우, 끝난 뒤 (원본 경로, 결과, 결과 경로)로 호출할 함수
             
         Return value:
-            A tuple containing a boolean indicating success and the moved file path (string)
-            성공 여부(bool)와 이동된 파일 경로(string)를 포함하는 튜플
+            A tuple of the result (RESULT_*) and the moved file path (the identical file when skipped)
+            결과(RESULT_*)와 이동된 파일 경로(건너뛴 경우 같은 내용의 파일 경로)를 포함하는 튜플
         """
         if not file_path or not folder_path:
-            return False, None
+            return RESULT_FAILED, None
+            
+        if dedup_mode is None:
+            dedup_mode = self.dedup_mode
             
+        op_id = None
         try:
             # 디버그 로그만 출력 (DEBUG=True 일 때만 표시됨)
             log_debug(f"Moving file: {file_path} -> {folder_path}")
@@ -143,14 +335,48 @@ class FileOperations:
             if hasattr(self.viewer, 'current_index'):
                 current_index = self.viewer.current_index
             
+            # 대상 폴더에 같은 내용의 파일이 있는지 확인
+            try:
+                duplicate_path = self._find_duplicate(file_path, folder_path, dedup_mode)
+            except DuplicateCheckDeferred as deferred:
+                self._start_duplicate_check("move", file_path, folder_path, dedup_mode, deferred.paths, on_finished)
+                return RESULT_PENDING, None
+            if duplicate_path and not self.trash_moved_duplicates:
+                # 원본을 지우는 것은 사용자가 설정에서 선택한 경우에만 (기본값은 그대로 둠)
+                self.viewer.show_message(
+                    f"Identical file already exists: {os.path.basename(duplicate_path)} (not moved)")
+                return RESULT_SKIPPED_DUPLICATE, duplicate_path
+            
             # First, clean up any resources related to the file
             self._cleanup_resources_for_file(file_path)
             
-            # Generate a unique file path
-            target_path = self.get_unique_file_path(folder_path, file_path)
-            
-            # Move the file (shutil.move preserves metadata)
-            shutil.move(file_path, target_path)
+            if duplicate_path:
+                # 같은 내용이 이미 있으면 이동하지 않고 원본을 휴지통으로 보냄 (삭제로 실행 취소 가능)
+                target_path = duplicate_path
+                if hasattr(self.viewer, 'undo_manager'):
+                    undo_manager = self.viewer.undo_manager
+                    op_id = undo_manager.begin_operation(undo_manager.ACTION_DELETE, path=file_path)
+                    undo_manager.trash_index.send_to_trash(file_path)
+                else:
+                    from send2trash import send2trash
+                    send2trash(file_path)
+                if hasattr(self.viewer, 'rotation_manager'):
+                    self.viewer.rotation_manager.file_removed(file_path)
+            else:
+                # Generate a unique file path
+                target_path = self.get_unique_file_path(folder_path, file_path)
+                
+                # 작업 시작을 실행 취소 저널에 기록 (중단 시 복구용)
+                if hasattr(self.viewer, 'undo_manager'):
+                    op_id = self.viewer.undo_manager.begin_operation(
+                        self.viewer.undo_manager.ACTION_MOVE, original_path=file_path, new_path=target_path)
+                
+                # Move the file (shutil.move preserves metadata)
+                shutil.move(file_path, target_path)
+                self.dedup_index.notify_added(target_path)
+                # 파일별 회전 각도도 새 경로로 옮김
+                if hasattr(self.viewer, 'rotation_manager'):
+                    self.viewer.rotation_manager.file_moved(file_path, target_path)
             
             # If the full path is too long, shorten the displayed path
             path_display = target_path
@@ -164,7 +390,11 @@ class FileOperations:
             
             # 이동 작업 추적 (Undo 가능하도록)
             if hasattr(self.viewer, 'undo_manager'):
-                self.viewer.undo_manager.track_moved_file(file_path, target_path, True)
+                if duplicate_path:
+                    self.viewer.undo_manager.track_deleted_file(file_path, True, op_id)
+                else:
+                    self.viewer.undo_manager.track_moved_file(file_path, target_path, True, op_id)
+                op_id = None
             
             # Remove from bookmarks if exists
             if hasattr(self.viewer, 'bookmark_manager') and file_path in self.viewer.bookmark_manager.bookmarks:
@@ -212,9 +442,12 @@ class FileOperations:
                 self.viewer.ui_state_manager.update_layout_ratios()
             
             # Display message
-            self.viewer.show_message(f"Moved file to {path_display}")
+            if duplicate_path:
+                self.viewer.show_message(f"Identical file already in {path_display}, source moved to trash")
+            else:
+                self.viewer.show_message(f"Moved file to {path_display}")
             
-            return True, target_path
+            return RESULT_DONE, target_path
             
         except Exception as e:
             # Log error
@@ -227,9 +460,12 @@ class FileOperations:
                 error_msg = error_msg.replace("다른 프로세스가 파일을 사용 중이기 때문에 프로세스가 액세스 할 수 없습니다", 
                                               "The process cannot access the file because it is being used by another process")
             
+            if op_id is not None:
+                self.viewer.undo_manager.abort_operation(op_id)
+            
             log_error(f"File move failed: {error_msg}")
             self.viewer.show_message(f"File move failed: {error_msg}")
-            return False, None
+            return RESULT_FAILED, None
     
     def delete_file(self, file_path, confirm=True):
         """
@@ -283,11 +519,21 @@ class FileOperations:
             deleted = False
             next_file = None
             
+            # 작업 시작을 실행 취소 저널에 기록 (중단 시 복구용)
+            op_id = None
+            if hasattr(self.viewer, 'undo_manager'):
+                op_id = self.viewer.undo_manager.begin_operation(
+                    self.viewer.undo_manager.ACTION_DELETE, path=file_path_str)
+            
             try:
                 # Attempt to move to trash  // 휴지통으로 이동 시도 → 영어로 번역됨
-                from send2trash import send2trash
                 # Execute file deletion  // 파일 삭제 실행 → 영어로 번역됨
-                send2trash(file_path_str)
+                if hasattr(self.viewer, 'undo_manager'):
+                    # 휴지통 위치를 색인에 기록 (빠른 복원용)
+                    self.viewer.undo_manager.trash_index.send_to_trash(file_path_str)
+                else:
+                    from send2trash import send2trash
+                    send2trash(file_path_str)
                 deleted = not os.path.exists(file_path_str)
             except Exception as e:
                 # Just handle failure  // 그냥 실패 처리 → 영어로 번역됨
@@ -301,7 +547,11 @@ class FileOperations:
             if deleted:
                 # 삭제 작업 추적 (Undo 가능하도록)
                 if hasattr(self.viewer, 'undo_manager'):
-                    self.viewer.undo_manager.track_deleted_file(file_path_str, deleted)
+                    self.viewer.undo_manager.track_deleted_file(file_path_str, deleted, op_id)
+                
+                # 파일별 회전 각도 기록 삭제
+                if hasattr(self.viewer, 'rotation_manager'):
+                    self.viewer.rotation_manager.file_removed(file_path_str)
                 
                 # Remove from bookmarks (if exists)  // 북마크에서 제거 (있는 경우) → 영어로 번역됨
                 if hasattr(self.viewer, 'bookmark_manager') and file_path in self.viewer.bookmark_manager.bookmarks:
@@ -323,6 +573,8 @@ class FileOperations:
                 
                 self.viewer.show_message("The file has been moved to trash")
             else:
+                if op_id is not None:
+                    self.viewer.undo_manager.abort_operation(op_id)
                 self.viewer.show_message("File deletion failed. It may be in use by another program.")  
                 
             return deleted, next_file
@@ -354,26 +606,11 @@ class FileOperations:
         # Special handling for explicit cleanup related to GIF/animation
         file_ext = os.path.splitext(file_path)[1].lower()
         if file_ext in ['.gif', '.webp']:
-            # 1. Stop and release the QMovie of the animation handler
+            # 1. Stop the frame engine of the animation handler (releases the file and decoded frames)
             if hasattr(self.viewer, 'animation_handler'):
-                if hasattr(self.viewer.animation_handler, 'stop_animation'):
-                    self.viewer.animation_handler.stop_animation()
-                
-                # Clean up the QMovie object of the animation handler
-                if hasattr(self.viewer.animation_handler, 'current_movie') and self.viewer.animation_handler.current_movie:
+                if getattr(self.viewer.animation_handler, 'frame_engine', None):
                     try:
-                        movie = self.viewer.animation_handler.current_movie
-                        movie.stop()
-                        # Disconnect signal connections
-                        try:
-                            movie.frameChanged.disconnect()
-                            movie.stateChanged.disconnect()
-                            movie.finished.disconnect()
-                        except:
-                            pass
-                        movie.setDevice(None)  # Disconnect from file
-                        movie.deleteLater()
-                        self.viewer.animation_handler.current_movie = None
+                        self.viewer.animation_handler.cleanup(park=False)
                     except Exception as e:
                         pass
                         
@@ -382,42 +619,42 @@ class FileOperations:
                 self.viewer.image_label.setMovie(None)
                 self.viewer.image_label.clear()
             
-            # 3. GIF 캐시에서 해당 파일 항목 제거
-            file_path_str = str(Path(file_path).resolve())
+            # 3. GIF 캐시에서 해당 파일 항목 제거 (경로 표기가 달라도 같은 파일이면 제거)
+            file_keys = {os.path.normcase(os.path.abspath(file_path)),
+                         os.path.normcase(str(Path(file_path).resolve()))}
             if hasattr(self.viewer, 'gif_cache') and self.viewer.gif_cache:
                 for key in list(self.viewer.gif_cache.cache.keys()):
-                    if isinstance(key, str) and file_path_str in key:
+                    if isinstance(key, str) and os.path.normcase(os.path.abspath(key)) in file_keys:
                         try:
-                            item = self.viewer.gif_cache.cache[key]
-                            if isinstance(item, QMovie):
-                                item.stop()
-                                item.setDevice(None)
-                                try:
-                                    item.finished.disconnect()
-                                    item.frameChanged.disconnect()
-                                except:
-                                    pass
-                                item.deleteLater()
-                            del self.viewer.gif_cache.cache[key]
+                            # 보관 중인 애니메이션 상태는 디코딩 스레드를 멈춰서 파일을 닫음
+                            self.viewer.gif_cache.remove(key)
                         except Exception as e:
                             pass
         
+        # 비디오 플레이어는 탐색할 때 정지를 미루고 다음 비디오를 미리 열어두므로,
+        # 삭제/이동 전에는 재생 목록까지 바로 닫고 파일을 놓을 때까지 기다림
+        # (백그라운드에서 그 파일의 미리보기를 만드는 중이면 취소하고 끝날 때까지 기다림)
+        # 오디오 플레이어도 정지 후 파일을 닫을 때까지 기다림
+        for handler_name in ('video_handler', 'audio_handler'):
+            handler = getattr(self.viewer, handler_name, None)
+            if handler is not None and hasattr(handler, 'release_file'):
+                handler.release_file(file_path)
+        
         # 미디어 리소스 정리를 위해 MediaSorterPAAK의 cleanup_current_media 메서드 사용
         if hasattr(self.viewer, 'cleanup_current_media'):
             self.viewer.cleanup_current_media()
         
+        # 백그라운드에서 이 파일의 중복 확인 해시를 계산 중이면 중단 (파일을 열고 있으므로)
+        self.cancel_duplicate_checks(file_path)
+        
+        # 정리 중에 폐기 큐로 미뤄둔 리소스도 파일 작업 전에 바로 폐기
+        # (이벤트 루프에 다시 들어가지 않고 큐만 비움)
+        get_disposal_queue().drain()
+        
         # 현재 이미지 경로 초기화
+        # (플레이어와 디코딩 스레드는 위에서 파일을 놓을 때까지 기다렸으므로 바로 삭제/이동할 수 있음)
         if hasattr(self.viewer, 'current_image_path'):
             self.viewer.current_image_path = None
-            
-        # 완전한 정리를 위한 이벤트 처리와 가비지 컬렉션
-        for _ in range(3):
-            QApplication.processEvents()
-            gc.collect()
-            time.sleep(0.1)
-        
-        # 추가 딜레이 - 리소스가 완전히 정리될 시간 제공
-        time.sleep(0.5)
     
     def get_unique_file_path(self, folder_path, file_path):
         """
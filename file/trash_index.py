@@ -0,0 +1,292 @@
+"""
+휴지통 색인 모듈
+
+이 모듈은 파일을 휴지통으로 보낼 때 휴지통 안에서의 실제 위치를 원본 경로 기준으로
+기록해두는 기능을 담당합니다. 복원할 때 휴지통 전체를 검색하지 않고
+기록된 위치에서 원본 위치로 이름만 바꾸면 되므로 빠르게 복원할 수 있습니다.
+
+지원하는 휴지통:
+    freedesktop : Linux 등 (freedesktop.org Trash 규격, send2trash가 사용하는 방식)
+                  홈 휴지통과 다른 볼륨의 $topdir/.Trash/$uid, $topdir/.Trash-$uid 모두 지원
+    windows     : Windows 휴지통 ($Recycle.Bin 의 $I/$R 파일)
+"""
+
+import os
+import sys
+import stat
+import time
+import struct
+from urllib.parse import unquote
+
+from core.config_manager import load_settings, save_settings
+
+# 색인 파일 이름 (사용자 데이터 폴더에 저장)
+TRASH_INDEX_FILENAME = "trash_index.json"
+
+# freedesktop 휴지통 폴더 이름
+FILES_DIR = "files"
+INFO_DIR = "info"
+INFO_SUFFIX = ".trashinfo"
+
+
+def _xdg_data_home():
+    """XDG_DATA_HOME 경로를 반환합니다."""
+    return os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+
+
+def _find_mount_point(path):
+    """경로가 속한 볼륨의 마운트 지점을 찾습니다."""
+    path = os.path.realpath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def _get_freedesktop_trash_dir(path):
+    """
+    파일이 보내질 freedesktop 휴지통 폴더를 결정합니다.
+
+    send2trash와 같은 규칙을 따릅니다. 홈 폴더와 같은 볼륨이면 홈 휴지통,
+    다른 볼륨이면 그 볼륨의 $topdir/.Trash/$uid 또는 $topdir/.Trash-$uid 를 사용합니다.
+
+    Args:
+        path: 휴지통으로 보낼 파일 경로
+
+    Returns:
+        tuple: (휴지통 폴더 경로, 볼륨 최상위 폴더 또는 None)
+    """
+    data_home = _xdg_data_home()
+    home_trash = os.path.join(data_home, 'Trash')
+    try:
+        path_dev = os.lstat(path).st_dev
+        home_dev = os.lstat(data_home).st_dev if os.path.exists(data_home) else None
+    except OSError:
+        return home_trash, None
+
+    if home_dev is None or path_dev == home_dev:
+        return home_trash, None
+
+    uid = str(os.getuid())
+    topdir = _find_mount_point(os.path.dirname(path))
+    shared_trash = os.path.join(topdir, '.Trash')
+    try:
+        mode = os.lstat(shared_trash).st_mode
+        if stat.S_ISDIR(mode) and not stat.S_ISLNK(mode) and mode & stat.S_ISVTX:
+            return os.path.join(shared_trash, uid), topdir
+    except OSError:
+        pass
+    return os.path.join(topdir, '.Trash-' + uid), topdir
+
+
+def _read_trashinfo_path(info_path, topdir=None):
+    """.trashinfo 파일에서 원본 경로(Path=)를 읽습니다."""
+    try:
+        with open(info_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.startswith('Path='):
+                    original = unquote(line[5:].strip())
+                    if topdir and not os.path.isabs(original):
+                        original = os.path.join(topdir, original)
+                    return os.path.normpath(original)
+    except OSError:
+        pass
+    return None
+
+
+def _read_recycle_info(info_path):
+    """Windows 휴지통 $I 파일에서 원본 경로를 읽습니다."""
+    try:
+        with open(info_path, 'rb') as file:
+            data = file.read()
+        version = struct.unpack_from('<q', data, 0)[0]
+        if version == 1:
+            raw = data[24:24 + 520]
+        else:
+            length = struct.unpack_from('<i', data, 24)[0]
+            raw = data[28:28 + length * 2]
+        return os.path.normcase(raw.decode('utf-16-le').split('\x00', 1)[0])
+    except Exception:
+        return None
+
+
+class TrashIndex:
+    """
+    휴지통 색인 클래스
+
+    원본 경로 -> 휴지통 위치 목록 (같은 경로를 여러 번 지운 경우 최신 항목이 마지막)을
+    사용자 데이터 폴더의 trash_index.json에 저장합니다.
+    """
+
+    def __init__(self):
+        """TrashIndex 초기화 - 저장된 색인을 읽고 이미 비워진 항목은 제거합니다."""
+        self.entries = {}
+        saved = load_settings(TRASH_INDEX_FILENAME)
+        for original_path, items in saved.items():
+            items = [item for item in items
+                     if isinstance(item, dict) and os.path.exists(item.get('trashed_path', ''))]
+            if items:
+                self.entries[original_path] = items
+
+    def _key(self, path):
+        """색인 키 (정규화된 절대 경로)"""
+        return os.path.normcase(os.path.abspath(path))
+
+    def save(self):
+        """색인을 디스크에 저장합니다."""
+        save_settings(self.entries, TRASH_INDEX_FILENAME)
+
+    def send_to_trash(self, path):
+        """
+        파일을 휴지통으로 보내고 휴지통 안의 위치를 색인에 기록합니다.
+
+        Args:
+            path: 휴지통으로 보낼 파일 경로
+
+        Raises:
+            send2trash가 발생시키는 예외를 그대로 전달합니다.
+        """
+        from send2trash import send2trash
+
+        path = os.path.abspath(path)
+        expected = None
+        if sys.platform != 'win32':
+            expected = self._predict_freedesktop_entry(path)
+        start_time = time.time()
+
+        send2trash(path)
+
+        entry = None
+        try:
+            if sys.platform == 'win32':
+                entry = self._find_windows_entry(path, start_time)
+            else:
+                entry = self._confirm_freedesktop_entry(path, expected)
+        except Exception as e:
+            print(f"Failed to index trashed file: {str(e)}")
+
+        if entry:
+            entry['time'] = start_time
+            self.entries.setdefault(self._key(path), []).append(entry)
+            self.save()
+
+    def _predict_freedesktop_entry(self, path):
+        """send2trash가 사용할 휴지통 내 파일 이름을 미리 계산합니다."""
+        trash_dir, topdir = _get_freedesktop_trash_dir(path)
+        files_dir = os.path.join(trash_dir, FILES_DIR)
+        info_dir = os.path.join(trash_dir, INFO_DIR)
+
+        filename = os.path.basename(path)
+        base_name, ext = os.path.splitext(filename)
+        counter = 0
+        destname = filename
+        while (os.path.exists(os.path.join(files_dir, destname)) or
+               os.path.exists(os.path.join(info_dir, destname + INFO_SUFFIX))):
+            counter += 1
+            destname = "%s %s%s" % (base_name, counter, ext)
+
+        return {
+            'backend': 'freedesktop',
+            'trash_dir': trash_dir,
+            'topdir': topdir,
+            'name': destname,
+        }
+
+    def _confirm_freedesktop_entry(self, path, expected):
+        """예상한 .trashinfo 가 실제로 만들어졌는지 확인하고 색인 항목을 만듭니다."""
+        trash_dir = expected['trash_dir']
+        topdir = expected['topdir']
+        info_dir = os.path.join(trash_dir, INFO_DIR)
+        original = os.path.normpath(path)
+
+        names = [expected['name']]
+        if not os.path.exists(os.path.join(info_dir, expected['name'] + INFO_SUFFIX)):
+            # 다른 프로그램이 동시에 같은 이름을 쓴 경우 - 같은 기본 이름의 항목만 확인
+            base_name = os.path.splitext(os.path.basename(path))[0]
+            try:
+                names = [entry.name[:-len(INFO_SUFFIX)] for entry in os.scandir(info_dir)
+                         if entry.name.startswith(base_name) and entry.name.endswith(INFO_SUFFIX)]
+            except OSError:
+                return None
+
+        for name in names:
+            info_path = os.path.join(info_dir, name + INFO_SUFFIX)
+            if _read_trashinfo_path(info_path, topdir) == original:
+                return {
+                    'backend': 'freedesktop',
+                    'trashed_path': os.path.join(trash_dir, FILES_DIR, name),
+                    'info_path': info_path,
+                }
+        return None
+
+    def _find_windows_entry(self, path, start_time):
+        """방금 휴지통으로 보낸 파일의 $R/$I 파일 위치를 찾습니다."""
+        drive = os.path.splitdrive(path)[0]
+        recycle_root = os.path.join(drive + os.sep, '$Recycle.Bin')
+        original = os.path.normcase(path)
+
+        try:
+            user_dirs = [entry.path for entry in os.scandir(recycle_root) if entry.is_dir()]
+        except OSError:
+            return None
+
+        for user_dir in user_dirs:
+            try:
+                # 삭제 직후 만들어진 $I 파일만 확인
+                candidates = [entry for entry in os.scandir(user_dir)
+                              if entry.name.startswith('$I') and entry.stat().st_mtime >= start_time - 2]
+            except OSError:
+                continue  # 다른 사용자의 휴지통은 접근할 수 없음
+            for entry in candidates:
+                if _read_recycle_info(entry.path) == original:
+                    return {
+                        'backend': 'windows',
+                        'trashed_path': os.path.join(user_dir, '$R' + entry.name[2:]),
+                        'info_path': entry.path,
+                    }
+        return None
+
+    def has_entry(self, original_path):
+        """원본 경로에 대한 색인 항목이 있는지 확인합니다."""
+        return bool(self.entries.get(self._key(original_path)))
+
+    def restore(self, original_path, save=True):
+        """
+        색인에 기록된 위치에서 원본 위치로 파일을 복원합니다.
+
+        Args:
+            original_path: 복원할 파일의 원본 경로
+            save: 복원 후 색인을 바로 저장할지 여부
+
+        Returns:
+            bool: 복원 성공 여부 (색인 항목이 없으면 False)
+        """
+        key = self._key(original_path)
+        items = self.entries.get(key)
+        if not items:
+            return False
+
+        entry = items[-1]  # 가장 최근에 지운 항목
+        restored = False
+        if os.path.exists(entry.get('trashed_path', '')):
+            try:
+                os.rename(entry['trashed_path'], original_path)
+                restored = True
+                try:
+                    os.remove(entry['info_path'])
+                except OSError:
+                    pass
+            except OSError as e:
+                # 항목은 남겨두어 나중에 다시 복원할 수 있게 함
+                print(f"Failed to restore from trash index: {str(e)}")
+                return False
+
+        # 복원했거나 휴지통에서 이미 사라진 항목은 색인에서 제거
+        items.pop()
+        if not items:
+            del self.entries[key]
+        if save:
+            self.save()
+        return restored
@@ -0,0 +1,300 @@
+"""
+실행 취소 저널 모듈
+
+이 모듈은 실행 취소 기록을 사용자 데이터 폴더의 추가 전용(append-only) 저널 파일에
+저장하는 기능을 담당합니다. 프로그램이 비정상 종료되어도 작업 기록이 남아있고,
+작업 도중 중단된 파일 작업을 다음 실행 시 확인해 정리할 수 있습니다.
+
+저널 파일은 한 줄에 하나의 JSON 레코드를 저장합니다.
+    begin  : 파일 작업 시작 전에 기록 (중단된 작업 복구용, 바로 fsync)
+    commit : 파일 작업 완료 후 기록 (실행 취소 가능한 작업)
+    abort  : 시작했지만 실패한 작업
+    undo   : 실행 취소된 작업
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+from collections import OrderedDict
+
+from core.utils.path_utils import get_user_data_directory
+
+# 저널 파일 이름
+JOURNAL_FILENAME = "undo_journal.jsonl"
+
+# 저널 파일 최대 크기 (이 크기를 넘으면 살아있는 기록만 남기고 다시 씁니다)
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# 보관할 최대 작업 수 (None 이면 무제한)
+DEFAULT_MAX_ENTRIES = 5000
+
+# 배치 쓰기 간격 (초) - 이 시간 동안 모인 레코드를 한 번에 쓰고 fsync 합니다
+FLUSH_INTERVAL = 0.25
+
+# 한 번에 쓰는 최대 레코드 수
+MAX_BATCH_SIZE = 256
+
+
+class UndoJournal:
+    """
+    실행 취소 저널 클래스
+
+    commit/abort/undo 레코드는 백그라운드 스레드에서 배치로 처리되고 fsync 되므로
+    파일 작업(이동, 삭제, 복사)의 실행 경로를 막지 않습니다.
+    begin 레코드는 파일 작업 도중 충돌해도 남아있도록 파일 작업 전에 바로 기록하고 fsync 합니다.
+    """
+
+    def __init__(self, journal_path=None, max_bytes=DEFAULT_MAX_BYTES, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        UndoJournal 초기화
+
+        Args:
+            journal_path: 저널 파일 경로 (기본값: 사용자 데이터 폴더의 undo_journal.jsonl)
+            max_bytes: 저널 파일 최대 크기 (바이트)
+            max_entries: 보관할 최대 작업 수 (None 이면 무제한)
+        """
+        if journal_path is None:
+            journal_path = os.path.join(get_user_data_directory(), JOURNAL_FILENAME)
+        self.journal_path = journal_path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()  # 저널 파일 쓰기 보호 (begin 직접 쓰기와 쓰기 스레드)
+        self._next_id = 1
+        self._live = OrderedDict()  # 작업 id -> 완료된 작업 (오래된 것부터)
+        self._pending = OrderedDict()  # 작업 id -> 시작만 기록된 작업
+        self._size = 0
+
+        self._load()
+
+        self._writer = threading.Thread(target=self._writer_loop, name="UndoJournalWriter", daemon=True)
+        self._writer.start()
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    def _load(self):
+        """저널 파일을 읽어 완료된 작업과 중단된 작업을 복원합니다."""
+        if not os.path.exists(self.journal_path):
+            return
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 충돌로 잘린 마지막 줄은 무시
+                        continue
+                    self._apply_record(record)
+            self._size = os.path.getsize(self.journal_path)
+        except Exception as e:
+            print(f"Failed to read undo journal: {str(e)}")
+            return
+
+        if self.max_entries is not None:
+            while len(self._live) > self.max_entries:
+                self._live.popitem(last=False)
+
+    def _apply_record(self, record):
+        """레코드 하나를 메모리 상태에 반영합니다."""
+        op = record.get('op')
+        op_id = record.get('id')
+        if op_id is None:
+            return
+
+        self._next_id = max(self._next_id, int(op_id) + 1)
+
+        if op == 'begin':
+            self._pending[op_id] = record.get('action', {})
+        elif op == 'commit':
+            self._pending.pop(op_id, None)
+            self._live[op_id] = record.get('action', {})
+        elif op == 'abort':
+            self._pending.pop(op_id, None)
+        elif op == 'undo':
+            self._live.pop(op_id, None)
+
+    def get_actions(self):
+        """
+        저널에 남아있는 실행 취소 가능한 작업 목록을 반환합니다.
+
+        Returns:
+            list: 작업 딕셔너리 목록 (최신 작업이 먼저)
+        """
+        with self._lock:
+            actions = []
+            for op_id, action in reversed(self._live.items()):
+                action = dict(action)
+                action['id'] = op_id
+                actions.append(action)
+            return actions
+
+    def get_pending(self):
+        """
+        시작만 기록되고 완료/실패가 기록되지 않은 (중단된) 작업 목록을 반환합니다.
+
+        Returns:
+            list: 작업 딕셔너리 목록 (오래된 작업이 먼저)
+        """
+        with self._lock:
+            pending = []
+            for op_id, action in self._pending.items():
+                action = dict(action)
+                action['id'] = op_id
+                pending.append(action)
+            return pending
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def begin(self, action):
+        """
+        파일 작업 시작을 기록합니다. 작업 도중 충돌해도 복구할 수 있도록 바로 디스크에 씁니다.
+
+        Args:
+            action: 작업 정보 딕셔너리
+
+        Returns:
+            int: 작업 id
+        """
+        with self._lock:
+            op_id = self._next_id
+            self._next_id += 1
+            self._pending[op_id] = dict(action)
+        self._write_records([{'op': 'begin', 'id': op_id, 'action': action, 'time': time.time()}])
+        return op_id
+
+    def commit(self, action, op_id=None):
+        """
+        파일 작업 완료를 기록합니다.
+
+        Args:
+            action: 작업 정보 딕셔너리
+            op_id: begin()이 반환한 작업 id (없으면 새로 발급)
+
+        Returns:
+            int: 작업 id
+        """
+        action = {key: value for key, value in action.items() if key != 'id'}
+        with self._lock:
+            if op_id is None:
+                op_id = self._next_id
+                self._next_id += 1
+            self._pending.pop(op_id, None)
+            self._live[op_id] = action
+            if self.max_entries is not None:
+                while len(self._live) > self.max_entries:
+                    self._live.popitem(last=False)
+        self._enqueue({'op': 'commit', 'id': op_id, 'action': action})
+        return op_id
+
+    def abort(self, op_id):
+        """시작했지만 실패한 작업을 기록합니다."""
+        if op_id is None:
+            return
+        with self._lock:
+            self._pending.pop(op_id, None)
+        self._enqueue({'op': 'abort', 'id': op_id})
+
+    def mark_undone(self, op_id):
+        """실행 취소된 작업을 기록합니다."""
+        if op_id is None:
+            return
+        with self._lock:
+            self._live.pop(op_id, None)
+        self._enqueue({'op': 'undo', 'id': op_id})
+
+    def _enqueue(self, record):
+        """레코드를 쓰기 대기열에 넣습니다."""
+        record['time'] = time.time()
+        self._queue.put(record)
+
+    def flush(self, timeout=2.0):
+        """
+        대기 중인 레코드가 모두 디스크에 기록될 때까지 기다립니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout=2.0):
+        """남은 레코드를 기록하고 쓰기 스레드를 종료합니다."""
+        if not self._writer.is_alive():
+            return
+        self._queue.put(None)
+        self._writer.join(timeout)
+
+    def _writer_loop(self):
+        """대기열의 레코드를 배치로 모아 쓰고 fsync 하는 백그라운드 루프"""
+        running = True
+        while running:
+            item = self._queue.get()
+            batch = [item]
+
+            # 짧은 시간 동안 들어오는 레코드를 모아 한 번에 기록
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while item is not None and len(batch) < MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            records = [entry for entry in batch if isinstance(entry, dict)]
+            events = [entry for entry in batch if isinstance(entry, threading.Event)]
+            if None in batch:
+                running = False
+
+            if records:
+                self._write_records(records)
+
+            for event in events:
+                event.set()
+
+    def _write_records(self, records):
+        """레코드 목록을 저널 파일에 추가하고 fsync 합니다."""
+        try:
+            data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+            with self._file_lock:
+                os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+                with open(self.journal_path, 'a', encoding='utf-8') as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+                self._size += len(data.encode('utf-8'))
+
+                if self.max_bytes and self._size > self.max_bytes:
+                    self._compact()
+        except Exception as e:
+            print(f"Failed to write undo journal: {str(e)}")
+
+    def _compact(self):
+        """살아있는 작업과 중단된 작업만 남기고 저널 파일을 다시 씁니다. (_file_lock 잠금 상태에서 호출)"""
+        with self._lock:
+            records = [{'op': 'commit', 'id': op_id, 'action': action}
+                       for op_id, action in self._live.items()]
+            records += [{'op': 'begin', 'id': op_id, 'action': action}
+                        for op_id, action in self._pending.items()]
+
+        temp_path = self.journal_path + ".tmp"
+        data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.journal_path)
+        self._size = len(data.encode('utf-8'))
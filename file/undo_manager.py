@@ -15,6 +15,9 @@ from pathlib import Path
 from PyQt5.QtWidgets import QMessageBox, QApplication
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 
+from file.undo_journal import UndoJournal
+from file.trash_index import TrashIndex
+
 # Windows 환경에서 사용할 winshell 패키지
 try:
     import winshell
@@ -47,17 +50,122 @@ class UndoManager(QObject):
         """
         super().__init__()
         self.viewer = viewer
-        # 이제 deleted_files 대신 actions 큐를 사용해 삭제뿐만 아니라 모든 작업 추적
-        self.actions = deque(maxlen=10)  # 최대 10개 작업 추적
+        # 작업 기록은 디스크 저널에 남기고, 메모리의 actions 큐는 저널 내용을 반영
+        self.journal = UndoJournal()
+        # 이제 deleted_files 대신 actions 큐를 사용해 삭제뿐만 아니라 모든 작업 추적 (최신 작업이 앞쪽)
+        self.actions = deque(self.journal.get_actions())
         self.trash_to_original = {}  # 휴지통 경로 -> 원본 경로 매핑
+        self.trash_index = TrashIndex()  # 원본 경로 -> 휴지통 위치 색인 (삭제 시 기록)
+        self._batch_restore = None  # 범위 실행 취소 중 복원된 파일 목록 (일괄 반영용)
+        
+        # 이전 실행에서 중단된 작업 정리
+        self.recover_interrupted_operations()
+    
+    def begin_operation(self, action_type, **paths):
+        """
+        파일 작업 시작을 저널에 기록합니다.
+        
+        작업 도중 프로그램이 종료되면 다음 실행 시 recover_interrupted_operations()가
+        이 기록을 보고 작업 결과를 확인합니다.
+        
+        Args:
+            action_type: 작업 유형 (ACTION_DELETE, ACTION_MOVE, ACTION_COPY)
+            **paths: 작업 경로 (delete: path / move: original_path, new_path / copy: original_path, copied_path)
+            
+        Returns:
+            int: 작업 id (track_*_file 또는 abort_operation에 전달)
+        """
+        action = {'type': action_type, 'time': time.time()}
+        action.update(paths)
+        return self.journal.begin(action)
+    
+    def abort_operation(self, op_id):
+        """
+        실패한 파일 작업을 저널에 기록합니다.
+        
+        Args:
+            op_id: begin_operation()이 반환한 작업 id
+        """
+        self.journal.abort(op_id)
+    
+    def _record_action(self, action, op_id=None):
+        """
+        완료된 작업을 저널과 actions 큐에 추가합니다.
+        
+        Args:
+            action: 작업 정보 딕셔너리
+            op_id: begin_operation()이 반환한 작업 id
+        """
+        action['id'] = self.journal.commit(action, op_id)
+        self.actions.appendleft(action)
+        
+        # 저널 보관 한도를 넘은 오래된 작업은 메모리에서도 제거
+        max_entries = self.journal.max_entries
+        while max_entries is not None and len(self.actions) > max_entries:
+            self.actions.pop()
+        
+        self.undo_status_changed.emit(True)  # Undo 가능 상태로 변경
     
-    def track_deleted_file(self, original_path, deleted_success):
+    def recover_interrupted_operations(self):
+        """
+        이전 실행에서 중단된 파일 작업을 확인하고 정리합니다.
+        
+        시작만 기록된 작업에 대해 실제 파일 상태를 확인하여,
+        완료된 작업은 실행 취소 목록에 추가하고 완료되지 않은 작업은 실패로 기록합니다.
+        
+        Returns:
+            int: 복구된(완료로 확인된) 작업 수
+        """
+        recovered = 0
+        for action in self.journal.get_pending():
+            op_id = action.pop('id')
+            action_type = action.get('type')
+            completed = False
+            
+            try:
+                if action_type == self.ACTION_MOVE:
+                    original_path = action.get('original_path')
+                    new_path = action.get('new_path')
+                    completed = bool(new_path) and os.path.exists(new_path) and not os.path.exists(original_path)
+                elif action_type == self.ACTION_COPY:
+                    original_path = action.get('original_path')
+                    copied_path = action.get('copied_path')
+                    if copied_path and os.path.exists(copied_path):
+                        if os.path.exists(original_path) and os.path.getsize(original_path) == os.path.getsize(copied_path):
+                            completed = True
+                        else:
+                            # 복사 도중 중단된 불완전한 파일 제거
+                            os.remove(copied_path)
+                elif action_type == self.ACTION_DELETE:
+                    path = action.get('path')
+                    completed = bool(path) and not os.path.exists(path)
+            except Exception as e:
+                print(f"Failed to recover interrupted operation: {str(e)}")
+            
+            if completed:
+                action.setdefault('index', -1)
+                action['id'] = self.journal.commit(action, op_id)
+                self.actions.appendleft(action)
+                recovered += 1
+            else:
+                self.journal.abort(op_id)
+        
+        if recovered:
+            print(f"Recovered {recovered} interrupted file operation(s) from the undo journal")
+        return recovered
+    
+    def close(self):
+        """남은 저널 기록을 디스크에 쓰고 저널을 닫습니다."""
+        self.journal.close()
+    
+    def track_deleted_file(self, original_path, deleted_success, op_id=None):
         """
         삭제된 파일 추적하기
         
         Args:
             original_path: 원본 파일 경로
             deleted_success: 삭제 성공 여부
+            op_id: begin_operation()이 반환한 작업 id (선택)
         """
         if deleted_success:
             # 파일의 원래 인덱스를 저장
@@ -66,15 +174,16 @@ class UndoManager(QObject):
                 original_index = self.viewer.file_navigator.get_current_index()
             
             # 파일 경로, 삭제 시간, 원래 인덱스 저장
-            self.actions.appendleft({
+            self._record_action({
                 'type': self.ACTION_DELETE,
                 'path': original_path,
                 'time': time.time(),
                 'index': original_index
-            })
-            self.undo_status_changed.emit(True)  # Undo 가능 상태로 변경
+            }, op_id)
+        else:
+            self.abort_operation(op_id)
     
-    def track_moved_file(self, original_path, new_path, moved_success):
+    def track_moved_file(self, original_path, new_path, moved_success, op_id=None):
         """
         이동된 파일 추적하기
         
@@ -82,6 +191,7 @@ class UndoManager(QObject):
             original_path: 원본 파일 경로
             new_path: 이동된 파일 경로
             moved_success: 이동 성공 여부
+            op_id: begin_operation()이 반환한 작업 id (선택)
         """
         if moved_success:
             # 파일의 원래 인덱스를 저장
@@ -90,16 +200,17 @@ class UndoManager(QObject):
                 original_index = self.viewer.file_navigator.get_current_index()
             
             # 파일 이동 정보 저장
-            self.actions.appendleft({
+            self._record_action({
                 'type': self.ACTION_MOVE,
                 'original_path': original_path,
                 'new_path': new_path,
                 'time': time.time(),
                 'index': original_index
-            })
-            self.undo_status_changed.emit(True)  # Undo 가능 상태로 변경
+            }, op_id)
+        else:
+            self.abort_operation(op_id)
     
-    def track_copied_file(self, original_path, copied_path, copied_success):
+    def track_copied_file(self, original_path, copied_path, copied_success, op_id=None):
         """
         복사된 파일 추적하기
         
@@ -107,6 +218,7 @@ class UndoManager(QObject):
             original_path: 원본 파일 경로
             copied_path: 복사된 파일 경로
             copied_success: 복사 성공 여부
+            op_id: begin_operation()이 반환한 작업 id (선택)
         """
         if copied_success:
             # 파일의 원래 인덱스를 저장
@@ -115,14 +227,15 @@ class UndoManager(QObject):
                 original_index = self.viewer.file_navigator.get_current_index()
             
             # 파일 복사 정보 저장
-            self.actions.appendleft({
+            self._record_action({
                 'type': self.ACTION_COPY,
                 'original_path': original_path,
                 'copied_path': copied_path,
                 'time': time.time(),
                 'index': original_index
-            })
-            self.undo_status_changed.emit(True)  # Undo 가능 상태로 변경
+            }, op_id)
+        else:
+            self.abort_operation(op_id)
     
     def can_undo(self):
         """
@@ -150,14 +263,115 @@ class UndoManager(QObject):
         
         # 작업 유형에 따라 처리
         if action_type == self.ACTION_DELETE:
-            return self._undo_deletion(last_action)
+            result = self._undo_deletion(last_action)
         elif action_type == self.ACTION_MOVE:
-            return self._undo_move(last_action)
+            result = self._undo_move(last_action)
         elif action_type == self.ACTION_COPY:
-            return self._undo_copy(last_action)
+            result = self._undo_copy(last_action)
         else:
             self.viewer.show_message(f"Unknown action type: {action_type}")
-            return False, None
+            result = (False, None)
+        
+        self._finish_undo(last_action, result[0], 0)
+        return result
+    
+    def _finish_undo(self, action, success, position):
+        """
+        작업 취소 결과를 기록에 반영합니다.
+        
+        성공했거나 되돌릴 파일이 없어져 더 이상 취소할 수 없는 작업만 저널에서 지우고,
+        실패한 작업은 다시 시도할 수 있도록 원래 자리에 되돌려 놓습니다. (재시작 후에도 유지)
+        
+        Args:
+            action: 취소를 시도한 작업
+            success: 취소 성공 여부
+            position: 작업이 있던 actions 안의 위치
+        """
+        if success or self._is_obsolete(action):
+            self.journal.mark_undone(action.get('id'))
+            return
+        self.actions.insert(position, action)
+        self.undo_status_changed.emit(True)
+    
+    def _is_obsolete(self, action):
+        """
+        더 이상 취소할 수 없는 작업인지 확인합니다. (이동/복사된 파일이 사라진 경우)
+        
+        Args:
+            action: 작업 정보 딕셔너리
+            
+        Returns:
+            bool: 취소할 대상 파일이 없으면 True
+        """
+        action_type = action.get('type')
+        if action_type == self.ACTION_MOVE:
+            return not os.path.exists(action.get('new_path') or '')
+        if action_type == self.ACTION_COPY:
+            return not os.path.exists(action.get('copied_path') or '')
+        # 삭제 작업은 휴지통에 파일이 남아 있을 수 있으므로 유지 (알 수 없는 작업은 버림)
+        return action_type != self.ACTION_DELETE
+    
+    def undo_actions(self, count):
+        """
+        최근 작업 여러 개를 최신 작업부터 차례로 취소합니다.
+        
+        복원된 파일은 파일 목록에 한 번에 반영하고 마지막으로 복원된 파일만 표시하므로,
+        많은 작업("최근 200개 이동 취소")도 빠르게 되돌릴 수 있습니다.
+        
+        Args:
+            count: 취소할 작업 수
+            
+        Returns:
+            tuple: (성공한 작업 수, 마지막으로 복원된 파일 경로)
+        """
+        if not self.actions:
+            self.viewer.show_message("No actions to undo")
+            return 0, None
+        
+        count = min(count, len(self.actions))
+        succeeded = 0
+        last_restored = None
+        self._batch_restore = []
+        
+        try:
+            for _ in range(count):
+                remaining = len(self.actions)
+                success, restored_path = self.undo_last_action()
+                if success:
+                    succeeded += 1
+                if restored_path:
+                    last_restored = restored_path
+                if len(self.actions) == remaining:
+                    # 실패한 작업이 기록에 남았으면 그 뒤의 작업은 건너뛰지 않고 멈춤
+                    break
+        finally:
+            restored = self._batch_restore
+            self._batch_restore = None
+            # 범위 복원 중 미뤄둔 휴지통 색인 저장
+            self.trash_index.save()
+        
+        # 복원된 파일을 작업 취소 순서대로 원래 위치에 삽입
+        if restored and hasattr(self.viewer, 'file_navigator'):
+            navigator = self.viewer.file_navigator
+            files = list(navigator.get_files())
+            known = set(files)
+            for file_path, original_index in restored:
+                if file_path in known:
+                    continue
+                if 0 <= original_index <= len(files):
+                    files.insert(original_index, file_path)
+                else:
+                    files.append(file_path)
+                known.add(file_path)
+            
+            show_index = files.index(last_restored) if last_restored in known else 0
+            navigator.set_files(files, show_index)
+            self.viewer.image_files = navigator.get_files()
+            if last_restored:
+                self.viewer.show_image(last_restored)
+        
+        self.viewer.show_message(f"Undone {succeeded} of {count} actions")
+        return succeeded, last_restored
     
     def undo_last_deletion(self):
         """
@@ -176,10 +390,13 @@ class UndoManager(QObject):
         # 첫 번째 삭제 작업 처리
         last_delete = delete_actions[0]
         
-        # actions 큐에서 해당 작업 제거
-        self.actions.remove(last_delete)
+        # actions 큐에서 해당 작업 제거 (실패하면 같은 자리에 되돌림)
+        position = self.actions.index(last_delete)
+        del self.actions[position]
         
-        return self._undo_deletion(last_delete)
+        result = self._undo_deletion(last_delete)
+        self._finish_undo(last_delete, result[0], position)
+        return result
     
     def _undo_deletion(self, delete_action):
         """
@@ -284,6 +501,10 @@ class UndoManager(QObject):
             # 파일 이동
             shutil.move(new_path, original_path)
             
+            # 파일별 회전 각도도 원래 경로로 되돌림
+            if hasattr(self.viewer, 'rotation_manager'):
+                self.viewer.rotation_manager.file_moved(new_path, original_path)
+            
             # 파일 목록 업데이트
             list_updated = False
             
@@ -332,11 +553,13 @@ class UndoManager(QObject):
         try:
             # 파일 삭제 (휴지통으로 보내지 않음)
             os.remove(copied_path)
+            if hasattr(self.viewer, 'rotation_manager'):
+                self.viewer.rotation_manager.file_removed(copied_path)
             self.viewer.show_message(f"Copy undone, file deleted: {os.path.basename(copied_path)}")
             
             # --- 추가: 복사 취소 후 이전 이미지로 이동 ---
             # 원래 파일이 여전히 존재하고, viewer에 show_previous_image 메서드가 있는지 확인
-            if original_path and os.path.exists(original_path) and hasattr(self.viewer, 'show_previous_image'):
+            if self._batch_restore is None and original_path and os.path.exists(original_path) and hasattr(self.viewer, 'show_previous_image'):
                  # 현재 표시되는 이미지가 (복사 작업 직후 넘어간) 다음 이미지일 가능성이 높으므로,
                  # show_previous_image를 호출하여 원래 복사했던 이미지로 돌아갑니다.
                  # show_previous_image는 내부적으로 index 등을 업데이트합니다.
@@ -351,8 +574,6 @@ class UndoManager(QObject):
                 
         except Exception as e:
             self.viewer.show_message(f"Failed to delete copied file during undo: {str(e)}")
-            # 실패 시 작업 큐에 다시 넣기 (선택 사항)
-            # self.actions.appendleft(copy_action)
             return False, None
     
     def _restore_from_trash(self, original_path):
@@ -368,6 +589,11 @@ class UndoManager(QObject):
         try:
             file_name = os.path.basename(original_path)
             
+            # 삭제 시 기록된 휴지통 위치가 있으면 이름 변경 한 번으로 복원
+            if self.trash_index.has_entry(original_path):
+                if self.trash_index.restore(original_path, save=self._batch_restore is None):
+                    return True
+            
             # Windows 환경에서 winshell을 사용하여 휴지통 검색
             if platform.system() == 'Windows' and WINSHELL_AVAILABLE:
                 # 휴지통의 모든 항목을 검색
@@ -397,11 +623,11 @@ class UndoManager(QObject):
                 self.viewer.show_message(f"Could not find {file_name} in the recycle bin")
                 return False
                 
-            # 다른 OS 환경에서는 대체 방법 제공
+            # 색인에 없는 파일은 휴지통 전체를 검색할 방법이 없음
+            # (복원하지 못했으므로 실패로 처리해서 작업을 기록에 남김)
             else:
-                # 파일 목록에만 추가 (실제 파일은 복원하지 않음)
-                self.viewer.show_message("Recycle bin restoration is limited on this operating system")
-                return True
+                self.viewer.show_message(f"Could not find {file_name} in the trash index")
+                return False
                 
         except Exception as e:
             self.viewer.show_message(f"Failed to restore from recycle bin: {str(e)}")
@@ -422,6 +648,11 @@ class UndoManager(QObject):
             # 파일이 이미 목록에 있는지 확인
             if hasattr(self.viewer, 'image_files') and file_path in self.viewer.image_files:
                 return True
+            
+            # 범위 실행 취소 중에는 모아두었다가 undo_actions()에서 한 번에 반영
+            if self._batch_restore is not None:
+                self._batch_restore.append((file_path, original_index))
+                return True
                 
             # 파일 목록에 추가
             if hasattr(self.viewer, 'file_navigator'):
@@ -1,4 +1,6 @@
 # 이미지 및 비디오 뷰어 애플리케이션 (PyQt5 기반)
+# 시작 시간 측정기는 가장 먼저 임포트 (시작 시각 기록, 필요하면 임포트 시간 보고서 수집)
+from core.startup_profiler import startup_profiler
 import sys  # 시스템 관련 기능 제공 (프로그램 종료, 경로 관리 등)
 import os  # 운영체제 관련 기능 제공 (파일 경로, 디렉토리 처리 등)
 import platform
@@ -27,9 +29,7 @@ from PyQt5.QtCore import (
 from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFont, QMovie, QCursor, QColor, QPalette, QFontMetrics, QTransform, QKeySequence, QWheelEvent, QDesktopServices  # 그래픽 요소 처리
 from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, QPoint, pyqtSignal, QRect, QMetaObject, QObject, QUrl, QThread, QBuffer  # Qt 코어 기능
 # QDesktopServices 관련 중복 임포트 제거 (PyQt5.QtCore에는 QDesktopServices가 없음)
-import cv2  # OpenCV 라이브러리 - 비디오 처리용 (프레임 추출, 이미지 변환 등)
-from PIL import Image, ImageCms  # Pillow 라이브러리 - 이미지 처리용 (다양한 이미지 포맷 지원)
-from io import BytesIO  # 바이트 데이터 처리용 (메모리 내 파일 스트림)
+# 코덱/플레이어 라이브러리(rawpy, numpy, mpv, pillow_avif 등)는 각 핸들러가 해당 형식을 처음 열 때 불러옴
 import time  # 시간 관련 기능 (시간 측정, 지연 등)
 # ===== 우리가 만든 모듈 =====
 # 경로 관련 기능
@@ -39,6 +39,7 @@ from core.utils.time_utils import format_time
 from core.utils.sort_utils import atoi, natural_keys  # 유틸리티 함수들
 # 캐시 관리 기능
 from media.loaders.cache_manager import LRUCache
+from media.loaders.media_probe import MediaProbeThread
 # 설정 관리
 from core.config_manager import load_settings, save_settings  # 설정 관리 함수들
 # 파일 형식 감지
@@ -90,17 +91,21 @@ from core.state_manager import StateManager
 
 # 파일 브라우저 추가
 from file import FileBrowser, FileNavigator
-from file.operations import FileOperations
+from file.browser import FolderListingThread
+from file.operations import FileOperations, RESULT_DONE, RESULT_SKIPPED_DUPLICATE
 from file.navigator import FileNavigator
 from file.undo_manager import UndoManager
 
 from ui.components.dual_action_button import DualActionButton  # 듀얼 액션 버튼 클래스 import
+from ui.components.folder_palette import FolderPalette  # 폴더 빠른 검색 팔레트
 # from ui.components.tooltip_manager import TooltipManager
 # from ui.components.loading_indicator import LoadingIndicator
 from core.initializer import MediaSorterPAAKInitializer
 
 # Add MPV DLL path to PATH environment variable (required before importing mpv module)
 # 현재 실행 중인 디렉토리를 PATH에 추가 (PyInstaller로 패키징된 경우를 위한 코드)
+# 경로 설정 과정은 시작 보고서(--import-report)를 켠 경우에만 콘솔에 출력
+_report_mpv_path = startup_profiler.is_import_report_enabled()
 if getattr(sys, 'frozen', False):
     # PyInstaller로 패키징된 경우
     application_path = os.path.dirname(sys.executable)
@@ -122,7 +127,8 @@ if getattr(sys, 'frozen', False):
         if os.path.exists(p):
             if p not in os.environ['PATH']:
                 os.environ['PATH'] = p + os.pathsep + os.environ['PATH']
-                print(f"Added {p} to PATH")
+                if _report_mpv_path:
+                    print(f"Added {p} to PATH")
 
     # DLL 파일이 실행 파일과 같은 디렉토리에 있는지 확인
     dll_files = ['libmpv-2.dll', 'mpv-2.dll', 'mpv-1.dll']
@@ -132,7 +138,8 @@ if getattr(sys, 'frozen', False):
         for p in possible_paths:
             dll_path = os.path.join(p, dll)
             if os.path.exists(dll_path):
-                print(f"Found DLL: {dll_path}")
+                if _report_mpv_path:
+                    print(f"Found DLL: {dll_path}")
                 dll_found = True
                 break
         if dll_found:
@@ -149,44 +156,24 @@ else:
     # 경로를 PATH에 추가
     if mpv_path not in os.environ['PATH']:
         os.environ['PATH'] = mpv_path + os.pathsep + os.environ['PATH']
-        print(f"Added {mpv_path} to PATH (dev mode)")
+        if _report_mpv_path:
+            print(f"Added {mpv_path} to PATH (dev mode)")
 
-print(f"Current PATH: {os.environ['PATH']}")
+if _report_mpv_path:
+    print(f"Current PATH: {os.environ['PATH']}")
 
 # 로거 인스턴스 생성 (전역 로거)
 from core.logger import Logger
 logger = Logger("main")
 logger.info(f"Application start - Version: {get_version_string()}")
 
-# MPV 모듈 import (경로 설정 후에 가능)
-try:
-    # 래퍼 모듈을 통해 mpv 가져오기 (DLL 경로 문제 해결)
-    from mpv_wrapper import mpv
-    logger.info("MPV module imported successfully")
-except Exception as e:
-    logger.error(f"Error importing MPV: {str(e)}")
-    print(f"Error importing MPV: {str(e)}")
-    
-    # 더미 MPV 클래스 정의 (비디오 기능 없이도 실행될 수 있도록)
-    class DummyMPV:
-        def __init__(self, *args, **kwargs):
-            print("WARNING: Using dummy MPV implementation")
-            self.dummy = True
-        
-        def __getattr__(self, name):
-            return lambda *args, **kwargs: None
-    
-    # mpv 모듈 객체 생성
-    class DummyMPVModule:
-        def __init__(self):
-            self.MPV = DummyMPV
-    
-    mpv = DummyMPVModule()
-
-# 디버깅 모듈
-from core.debug import QMovieDebugger, MemoryProfiler
+# MPV 모듈은 비디오/오디오 핸들러가 플레이어를 처음 만들 때 불러옴 (위에서 설정한 PATH 사용)
+# 디버깅 모듈(core.debug)은 디버깅 기능을 처음 사용할 때 불러옴
 # 메모리 관리 모듈
-from core.memory import ResourceCleaner, TimerManager
+from core.memory import ResourceCleaner, TimerManager, freeze_startup_objects
+
+# Undo 버튼 오른쪽 클릭 메뉴에서 한 번에 취소할 수 있는 작업 수
+UNDO_MENU_COUNTS = (5, 10, 50, 200)
 
 # 메인 이미지 뷰어 클래스 정의
 class MediaSorterPAAK(QWidget):
@@ -287,10 +274,23 @@ class MediaSorterPAAK(QWidget):
             # if hasattr(self, 'undo_button') and self.undo_button:
             #     self.undo_button.setText("Undo")
             
-            # --- 추가: update_folder_buttons 호출 ---
-            self.update_folder_buttons()
+            # --- 추가: 폴더 색인 갱신 (스캔 완료 시 update_folder_buttons 호출됨) ---
+            self.folder_index.set_base_folder(self.base_folder)
             # --- 추가 끝 ---
 
+    def show_folder_palette(self):
+        """기준 폴더의 하위 폴더를 검색해 복사/이동할 수 있는 팔레트를 엽니다."""
+        if not self.base_folder:
+            self.show_message("Set a base folder first")
+            return
+
+        if self.folder_palette is None:
+            self.folder_palette = FolderPalette(self.folder_index, self)
+            self.folder_palette.copy_requested.connect(self.copy_image_to_folder)
+            self.folder_palette.move_requested.connect(self.move_image_to_folder)
+
+        self.folder_palette.open_palette()
+
     def on_button_click(self):
         """하위 폴더 버튼 클릭 처리 - controls_layout으로 위임"""
         # 이 메서드는 controls_layout으로 이동됨
@@ -304,6 +304,9 @@ class MediaSorterPAAK(QWidget):
         folder_path = self.file_browser.open_folder_dialog()
         
         if folder_path:
+            # 파일 하나를 먼저 연 뒤 진행 중인 폴더 목록 읽기는 더 이상 필요 없음
+            self.stop_folder_listing()
+
             # 파일 브라우저로 폴더 내 이미지 파일 찾기
             self.image_files, self.current_index = self.file_browser.process_folder(folder_path)
             self.state_manager.set_state("current_index", self.current_index)  # 상태 관리자 업데이트
@@ -314,6 +317,130 @@ class MediaSorterPAAK(QWidget):
             if self.image_files:
                 self.show_image(self.image_files[0])  # 첫 번째 이미지 표시
                 self.update_image_info()  # 이미지 정보 업데이트 (인덱스 표시 업데이트)
+                self.probe_folder_media(self.image_files)  # 비디오/오디오 정보는 백그라운드에서 확인
+
+    def open_file(self, file_path):
+        """
+        파일 하나를 먼저 표시하고, 같은 폴더의 파일 목록은 백그라운드에서 읽습니다.
+
+        명령줄 인자나 "연결 프로그램"으로 파일을 열 때 사용합니다.
+        폴더 목록 읽기와 정렬을 기다리지 않으므로 첫 화면은 파일 디코딩 시간만큼만 걸립니다.
+
+        Args:
+            file_path: 열 파일 경로
+
+        Returns:
+            bool: 파일을 열었는지 여부
+        """
+        if not self.file_browser.is_supported_file(file_path):
+            print(f"Unsupported file: {file_path}")
+            return False
+
+        file_path = os.path.abspath(file_path)
+        self.stop_folder_listing()
+
+        # 목록이 준비될 때까지는 이 파일 하나만 탐색 대상으로 사용
+        self.image_files = [file_path]
+        self.current_index = 0
+        self.state_manager.set_state("current_index", self.current_index)
+        self.file_navigator.set_files(self.image_files, self.current_index)
+        # 폴더 안 위치를 알기 전까지는 인덱스(1/1)를 표시하지 않음
+        self.folder_listing_pending = True
+        self.show_image(file_path)
+
+        folder_path = os.path.dirname(file_path)
+        self.file_browser.current_folder = folder_path
+        self.folder_listing_thread = FolderListingThread(self.file_browser, folder_path)
+        self.folder_listing_thread.listed.connect(self.on_folder_listed)
+        self.folder_listing_thread.start()
+        return True
+
+    def on_folder_listed(self, folder_path, files):
+        """
+        백그라운드에서 읽은 폴더 목록을 파일 내비게이터에 연결하고 인덱스 표시를 갱신합니다.
+
+        Args:
+            folder_path: 읽은 폴더 경로
+            files: 정렬된 파일 목록
+        """
+        # 목록을 읽는 동안 다른 파일이나 폴더를 연 경우 (중단된 스레드의 결과) 무시
+        if self.sender() is not self.folder_listing_thread:
+            return
+
+        self.folder_listing_pending = False
+        files = list(files)
+        current_path = getattr(self, 'current_image_path', None)
+        index = -1
+        if current_path:
+            current_key = os.path.normcase(current_path)
+            index = next((i for i, path in enumerate(files) if os.path.normcase(path) == current_key), -1)
+            current_exists = os.path.exists(current_path)
+            if index >= 0 and not current_exists:
+                # 목록을 읽는 동안 옮겨지거나 지워진 파일은 목록에서 뺌
+                del files[index]
+                index = -1
+            elif index < 0 and current_exists:
+                # 목록을 읽은 뒤 폴더에 생긴 파일은 정렬 위치에 넣음
+                index = self._sorted_position(files, current_path)
+                files.insert(index, current_path)
+
+        if not files:
+            self.update_image_info()
+            return
+
+        # 표시 중이던 파일이 없어졌으면 정렬 순서상 가장 가까운 파일(없으면 첫 파일)을 표시
+        show_neighbour = index < 0
+        if show_neighbour:
+            index = min(self._sorted_position(files, current_path), len(files) - 1) if current_path else 0
+
+        self.image_files = files
+        self.current_index = index
+        self.state_manager.set_state("current_index", self.current_index)
+        self.file_navigator.set_files(self.image_files, self.current_index)
+        if show_neighbour:
+            self.show_image(self.image_files[index])
+        self.update_image_info()
+        self.probe_folder_media(self.image_files)
+
+    def _sorted_position(self, files, file_path):
+        """
+        정렬된 파일 목록에서 파일이 들어갈 위치를 찾습니다. (FileBrowser와 같은 자연 정렬)
+
+        Args:
+            files: 정렬된 파일 목록
+            file_path: 위치를 찾을 파일 경로
+
+        Returns:
+            int: 들어갈 위치 (비교할 수 없으면 0)
+        """
+        try:
+            key = natural_keys(file_path)
+            return next((i for i, path in enumerate(files) if natural_keys(path) > key), len(files))
+        except TypeError:
+            return 0
+
+    def stop_folder_listing(self):
+        """진행 중인 폴더 목록 읽기를 중단합니다."""
+        thread = getattr(self, 'folder_listing_thread', None)
+        if thread is not None and thread.isRunning():
+            thread.requestInterruption()
+            thread.wait()
+        self.folder_listing_thread = None
+        self.folder_listing_pending = False
+
+    def probe_folder_media(self, files):
+        """폴더의 비디오/오디오 파일 정보(재생 시간, 화면 크기)를 백그라운드에서 미리 확인합니다."""
+        self.stop_media_probe()
+        self.media_probe_thread = MediaProbeThread(files)
+        self.media_probe_thread.start()
+
+    def stop_media_probe(self):
+        """진행 중인 폴더 정보 확인을 중단합니다."""
+        thread = getattr(self, 'media_probe_thread', None)
+        if thread is not None and thread.isRunning():
+            thread.requestInterruption()
+            thread.wait()
+        self.media_probe_thread = None
 
     def get_image_files(self, folder_path):
         """폴더에서 이미지 파일 목록을 가져옵니다."""
@@ -486,11 +613,7 @@ class MediaSorterPAAK(QWidget):
         except Exception as e:
             pass
 
-        # 전체화면 모드에서 고품질 이미지 로딩 (비동기로 처리)
-        if self.isFullScreen() and image_size_mb > 5:  # 큰 이미지인 경우
-            # 최대한 고품질로 표시 (필요한 작업 추가)
-            QApplication.processEvents()  # UI 응답성 유지
-            
+        # 이벤트 루프에 다시 들어가지 않음 (폐기 큐가 탐색 도중에 실행되지 않도록)
         return image_size_mb  # 이미지 크기 정보 반환
 
     def update_current_media_state(self, image_path):
@@ -498,6 +621,10 @@ class MediaSorterPAAK(QWidget):
         # 현재 이미지 경로 저장
         self.current_image_path = image_path
         
+        # 이 파일에 저장된 회전 각도 불러오기 (파일별 회전)
+        if hasattr(self, 'rotation_manager'):
+            self.rotation_manager.load_file_rotation(image_path)
+        
         # 기존 진행 중인 로딩 스레드 취소
         self.cancel_pending_loaders(image_path)
 
@@ -566,20 +693,6 @@ class MediaSorterPAAK(QWidget):
         # VideoHandler에 비디오 재생 위임
         self.video_handler.play_video(video_path)
 
-    def on_video_end(self, name, value):
-        """비디오 재생이 종료되면 호출되는 핸들러"""
-        # VideoHandler에 이벤트 위임
-        self.video_handler.on_video_end(name, value)
-
-    def stop_video_timer(self):
-        """타이머를 중지하는 메서드입니다."""
-        if self.video_handler:
-            self.video_handler.stop_video_timer()
-        elif hasattr(self, 'video_timer') and self.video_timer.isActive():
-            self.video_timer.stop()
-            if self.video_timer in self.timers:
-                self.timers.remove(self.video_timer)
-
     def slider_clicked(self, value):
         """슬라이더 클릭 이벤트 처리 - controls_layout으로 위임"""
         # 이 메서드는 controls_layout으로 이동됨
@@ -658,7 +771,8 @@ class MediaSorterPAAK(QWidget):
         margin = max(10, min(30, int(window_width * 0.02)))
 
         # 이미지 파일이 있을 때만 정보 표시
-        if self.image_files and hasattr(self, 'current_image_path'):
+        if (self.image_files and hasattr(self, 'current_image_path')
+                and not getattr(self, 'folder_listing_pending', False)):
             # 인덱스 정보 업데이트
             total_files = len(self.image_files)
             self.image_info_label.update_index(self.current_index, total_files)
@@ -865,10 +979,12 @@ class MediaSorterPAAK(QWidget):
         # 현재 이미지 경로가 존재하고, 폴더 경로도 제공되었으면 복사를 시작합니다.
         if self.current_image_path and folder_path:
             # FileOperations 클래스를 사용하여 파일 복사
-            success, _ = self.file_operations.copy_file_to_folder(self.current_image_path, folder_path)
+            result, _ = self.file_operations.copy_file_to_folder(
+                self.current_image_path, folder_path, on_finished=self.on_file_sorted)
             
-            # 복사 성공 시 다음 이미지로 이동
-            if success:
+            # 복사했거나 같은 파일이 이미 있어 건너뛴 경우 다음 이미지로 이동
+            # (중복 확인이 백그라운드로 미뤄진 경우 끝난 뒤 on_file_sorted에서 처리)
+            if result in (RESULT_DONE, RESULT_SKIPPED_DUPLICATE):
                 self.show_next_image()
 
     def keyPressEvent(self, event):
@@ -1194,8 +1310,8 @@ class MediaSorterPAAK(QWidget):
         self.loading_timer.start(10000)  # 10초 타임아웃
         self.timers.append(self.loading_timer)
         
-        # UI 즉시 업데이트
-        QApplication.processEvents()
+        # 로딩 레이블만 즉시 다시 그림 (processEvents로 다른 이벤트까지 처리하지 않음)
+        self.loading_label.repaint()
 
     def hide_loading_indicator(self):
         """Hides the loading indicator."""
@@ -1216,9 +1332,8 @@ class MediaSorterPAAK(QWidget):
         # Hide loading label (simply hide)
         self.loading_label.hide()
         
-        # Force update to refresh display
+        # Force update to refresh display (다음 이벤트 루프에서 그려짐)
         self.image_label.update()
-        QApplication.processEvents()
 
     def cleanup_loader_threads(self):
         """Cleans up loader threads and frees memory."""
@@ -1253,11 +1368,9 @@ class MediaSorterPAAK(QWidget):
         
         # Display only if the current path matches the loaded image path
         if self.current_image_path == path:
-            # Prepare image for display (rotation, scaling)
-            scaled_pixmap = self.prepare_image_for_display(image, size_mb)
-            
-            # Display image
-            self.display_image(scaled_pixmap, path, size_mb)
+            # Display image - the handler keeps this full-resolution pixmap by reference
+            # (shared with the cache entry) and derives display-sized variants from it
+            self.display_image(image, path, size_mb)
         
         # Clean up loader thread
         self.cleanup_image_loader(path)
@@ -1353,7 +1466,8 @@ class MediaSorterPAAK(QWidget):
                 "toggle_mute": Qt.Key_M,
                 "delete_image": Qt.Key_Delete,
                 "toggle_fullscreen": Qt.ControlModifier | Qt.Key_Return,  # Ctrl+Enter로 변경
-                "toggle_maximize_state": Qt.Key_Return  # Enter 키 추가
+                "toggle_maximize_state": Qt.Key_Return,  # Enter 키 추가
+                "folder_palette": Qt.Key_F  # F: 폴더 빠른 검색
             }
             
             # Use the load_settings function from the core.config module to load settings
@@ -1407,6 +1521,11 @@ class MediaSorterPAAK(QWidget):
                 self._update_button_rows(new_button_rows)
             # --- 추가 끝 ---
             
+            # 중복 파일 처리 설정 적용 (file_settings.json에 저장)
+            if hasattr(self, 'file_operations'):
+                self.file_operations.set_dedup_mode(dialog.get_selected_dedup_mode())
+                self.file_operations.set_trash_moved_duplicates(dialog.get_trash_moved_duplicates())
+            
             # Display message
             self.show_message("Settings have been updated.")
 
@@ -1467,17 +1586,31 @@ class MediaSorterPAAK(QWidget):
         """싱글샷 타이머의 타임아웃을 처리합니다."""
         return self.timer_manager._handle_single_shot_timeout(timer, callback)
 
+    def get_qmovie_debugger(self):
+        """QMovie 디버거를 반환합니다. (디버깅 모듈은 처음 사용할 때 불러옴)"""
+        if self.qmovie_debugger is None:
+            from core.debug import QMovieDebugger
+            self.qmovie_debugger = QMovieDebugger(self)
+        return self.qmovie_debugger
+    
+    def get_memory_profiler(self):
+        """메모리 프로파일러를 반환합니다. (디버깅 모듈은 처음 사용할 때 불러옴)"""
+        if self.memory_profiler is None:
+            from core.debug import MemoryProfiler
+            self.memory_profiler = MemoryProfiler()
+        return self.memory_profiler
+    
     def toggle_debug_mode(self):
         """디버깅 모드를 켜고 끕니다."""
-        return self.qmovie_debugger.toggle_debug_mode()
+        return self.get_qmovie_debugger().toggle_debug_mode()
     
     def perform_garbage_collection(self):
         """가비지 컬렉션 명시적 수행"""
-        return self.memory_profiler.perform_garbage_collection()
+        return self.get_memory_profiler().perform_garbage_collection()
     
     def generate_qmovie_reference_graph(self):
         """QMovie 객체의 참조 그래프를 생성합니다."""
-        return self.qmovie_debugger.generate_qmovie_reference_graph()
+        return self.get_qmovie_debugger().generate_qmovie_reference_graph()
     
     # 다른 디버깅 관련 메서드를 제거하고 대체합니다
     
@@ -1715,10 +1848,12 @@ class MediaSorterPAAK(QWidget):
         # 현재 이미지 경로가 존재하고, 폴더 경로도 제공되었으면 복사를 시작합니다.
         if self.current_image_path and folder_path:
             # FileOperations 클래스를 사용하여 파일 복사
-            success, _ = self.file_operations.copy_file_to_folder(self.current_image_path, folder_path)
+            result, _ = self.file_operations.copy_file_to_folder(
+                self.current_image_path, folder_path, on_finished=self.on_file_sorted)
             
-            # 복사 성공 시 다음 이미지로 이동
-            if success:
+            # 복사했거나 같은 파일이 이미 있어 건너뛴 경우 다음 이미지로 이동
+            # (중복 확인이 백그라운드로 미뤄진 경우 끝난 뒤 on_file_sorted에서 처리)
+            if result in (RESULT_DONE, RESULT_SKIPPED_DUPLICATE):
                 self.show_next_image()
 
     def move_image_to_folder(self, folder_path):
@@ -1731,9 +1866,28 @@ class MediaSorterPAAK(QWidget):
         """
         if self.current_image_path and folder_path:
             # Move the file using FileOperations
-            self.file_operations.move_file_to_folder(self.current_image_path, folder_path)
+            result, _ = self.file_operations.move_file_to_folder(
+                self.current_image_path, folder_path, on_finished=self.on_file_sorted)
             
             # 파일 이동 후 추가 로직은 FileOperations 클래스에서 처리됨
+            # 같은 파일이 이미 있어 이동하지 않은 경우에는 다음 이미지로 이동
+            if result == RESULT_SKIPPED_DUPLICATE:
+                self.show_next_image()
+
+    def on_file_sorted(self, file_path, result, result_path):
+        """
+        백그라운드 중복 확인 뒤 미뤄둔 복사/이동이 끝나면 호출됩니다.
+        
+        Args:
+            file_path: 원본 파일 경로
+            result: 복사/이동 결과 (RESULT_*)
+            result_path: 복사/이동된 파일 경로
+        """
+        # 그 사이 다른 파일로 넘어갔으면 그대로 둠 (이동한 경우 목록 갱신은 FileOperations에서 처리)
+        if self.current_image_path != file_path:
+            return
+        if result in (RESULT_DONE, RESULT_SKIPPED_DUPLICATE):
+            self.show_next_image()
 
     def undo_last_deletion(self):
         """
@@ -1782,6 +1936,46 @@ class MediaSorterPAAK(QWidget):
             # 실패 메시지는 UndoManager에서 이미 표시함
             pass
 
+    def undo_actions(self, count):
+        """
+        최근에 수행한 작업 여러 개를 한 번에 취소합니다.
+
+        Args:
+            count (int): 취소할 작업 수
+        """
+        if not hasattr(self, 'undo_manager'):
+            self.show_message("Undo feature is not available.")
+            return
+
+        succeeded, restored_path = self.undo_manager.undo_actions(count)
+
+        if succeeded:
+            # 파일 목록 및 현재 인덱스 업데이트
+            self.image_files = self.file_navigator.get_files()
+            self.current_index = self.file_navigator.get_current_index()
+            self.update_image_info()
+
+    def show_undo_menu(self, pos):
+        """
+        Undo 버튼 위에 여러 작업을 한 번에 취소하는 메뉴를 표시합니다.
+
+        Args:
+            pos (QPoint): 버튼 기준 클릭 위치
+        """
+        if not hasattr(self, 'undo_manager') or not self.undo_button:
+            return
+        available = len(self.undo_manager.actions)
+        if available < 2:
+            return
+
+        menu = QMenu(self)
+        counts = [count for count in UNDO_MENU_COUNTS if count < available] + [available]
+        for count in counts:
+            label = f"Undo all {count} actions" if count == available else f"Undo last {count} actions"
+            action = menu.addAction(label)
+            action.triggered.connect(lambda checked=False, count=count: self.undo_actions(count))
+        menu.exec_(self.undo_button.mapToGlobal(pos))
+
     def update_undo_button_state(self, enabled):
         """
         Undo 버튼의 상태를 업데이트합니다.
@@ -1954,6 +2148,9 @@ class MediaSorterPAAK(QWidget):
                     QPushButton:disabled { background-color: rgba(241, 196, 15, 0.9); } /* 비활성화 시 활성과 동일하게 */
                 """) # 비활성화 스타일 수정
                 undo_button.clicked.connect(self.undo_last_action)
+                # 오른쪽 클릭으로 최근 작업 여러 개를 한 번에 취소
+                undo_button.setContextMenuPolicy(Qt.CustomContextMenu)
+                undo_button.customContextMenuRequested.connect(self.show_undo_menu)
                 self.undo_button = undo_button # 참조 업데이트
                 # UndoManager 시그널 연결 (기존 연결 해제 후 재연결 필요할 수 있음)
                 try:
@@ -2010,12 +2207,10 @@ class MediaSorterPAAK(QWidget):
                         button.setToolTip('')
             return
 
-        # 하위 폴더 목록 가져오기 및 정렬
-        try:
-            subfolders = [f.path for f in os.scandir(self.base_folder) if f.is_dir()]
-            subfolders.sort(key=lambda x: natural_keys(os.path.basename(x).lower()))
-        except OSError:
-            subfolders = [] # 오류 발생 시 빈 리스트
+        # 하위 폴더 목록은 폴더 색인에서 가져옴 (백그라운드에서 스캔되고 자연 정렬됨)
+        if self.folder_index.base_folder != self.base_folder:
+            self.folder_index.set_base_folder(self.base_folder)  # 스캔이 끝나면 다시 호출됨
+        subfolders = self.folder_index.subfolders
 
         # 버튼 너비 계산 (현재 창 너비 기준)
         total_width = self.width()
@@ -2058,20 +2253,14 @@ class MediaSorterPAAK(QWidget):
                     available_width = current_button_width - 16
                     # 현재 버튼의 폰트 메트릭스 가져오기 (변경된 폰트 기준)
                     font_metrics = QFontMetrics(button.font())
-                    text_width = font_metrics.horizontalAdvance(folder_name)
 
-                    # 텍스트 길이 조절 (변경된 폰트 기준)
+                    # 텍스트 길이 조절 (한 번의 측정으로 말줄임 처리)
                     truncated_name = folder_name
-                    if text_width > available_width and available_width > 0:
-                        for k in range(len(folder_name), 0, -1):
-                            truncated = folder_name[:k] + ".."
-                            # font_metrics 를 사용하여 너비 측정
-                            if font_metrics.horizontalAdvance(truncated) <= available_width:
-                                truncated_name = truncated
-                                break
+                    if available_width > 0:
+                        truncated_name = font_metrics.elidedText(folder_name, Qt.ElideRight, available_width)
                         # 그래도 너무 길면 (극단적인 경우) 첫 글자와 .. 만 표시
-                        if font_metrics.horizontalAdvance(truncated_name) > available_width:
-                             truncated_name = folder_name[0] + ".." if folder_name else ".."
+                        if not truncated_name or truncated_name == "\u2026":
+                            truncated_name = folder_name[0] + ".." if folder_name else ".."
 
                     # 버튼 정보 설정 (텍스트 및 툴팁)
                     if hasattr(button, 'set_folder_info'):
@@ -2099,6 +2288,13 @@ class MediaSorterPAAK(QWidget):
              self.undo_button.setText("Undo")
     # --- 추가 끝 ---
 
+def get_startup_file(arguments):
+    """명령줄 인자 중 처음 나오는 파일 경로를 반환합니다. (옵션 인자는 무시)"""
+    for argument in arguments:
+        if not argument.startswith('-') and os.path.isfile(argument):
+            return argument
+    return None
+
 # Main function
 def main():
     # --- 추가: High DPI 스케일링 활성화 ---
@@ -2111,6 +2307,14 @@ def main():
     
     viewer = MediaSorterPAAK()  # Create instance of MediaSorterPAAK class
     viewer.show()  # Display viewer window
+    # 명령줄로 받은 파일이 있으면 바로 표시 (폴더 목록은 백그라운드에서 읽음)
+    startup_file = get_startup_file(app.arguments()[1:])
+    if startup_file:
+        viewer.open_file(startup_file)
+    # 첫 이벤트 처리 후(창이 실제로 그려진 뒤) 시작 시간 기록 및 예산 확인
+    QTimer.singleShot(0, startup_profiler.mark_window_visible)
+    # 시작이 끝나면 시작 시 만든 객체를 가비지 컬렉션 대상에서 제외
+    QTimer.singleShot(0, freeze_startup_objects)
     exit_code = app.exec_()  # Execute event loop
     sys.exit(exit_code)
 
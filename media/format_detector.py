@@ -9,6 +9,22 @@ class FormatDetector:
     정적/애니메이션 GIF와 WEBP를 구분하는 기능을 제공합니다.
     """
     
+    # 비디오로 재생하는 파일 확장자 (점 제외)
+    VIDEO_EXTENSIONS = ('mp4', 'avi', 'mov', 'qt', 'mkv', 'wmv', 'flv', 'webm', 'ts', 'mpg', 'mpeg', 'vob', 'm2ts', 'm4v', '3gp')
+    
+    @staticmethod
+    def is_video_path(file_path):
+        """
+        파일을 열지 않고 확장자만으로 비디오 파일인지 확인합니다.
+        
+        Args:
+            file_path (str): 확인할 파일 경로
+            
+        Returns:
+            bool: 비디오 파일이면 True
+        """
+        return os.path.splitext(file_path.lower())[1][1:] in FormatDetector.VIDEO_EXTENSIONS
+    
     @staticmethod
     def detect_media_format(image_path):
         """파일 형식을 감지하고 적절한 형식을 반환합니다."""
@@ -42,7 +58,7 @@ class FormatDetector:
         ext = ext[1:]  # 점(.) 제거
         
         # 기본 미디어 타입 분류
-        if ext in ['mp4', 'avi', 'mov', 'qt', 'mkv', 'wmv', 'flv', 'webm', 'ts', 'mpg', 'mpeg', 'vob', 'm2ts', 'm4v', '3gp']:
+        if ext in FormatDetector.VIDEO_EXTENSIONS:
             return 'video'
         elif ext in ['mp3', 'wav', 'flac', 'aac', 'ogg', 'm4a', 'wma', 'aiff', 'alac']:
             return 'audio'
@@ -6,11 +6,59 @@
 """
 
 from PyQt5.QtWidgets import QLabel, QApplication
-from PyQt5.QtGui import QMovie, QImageReader, QPixmap, QImage, QTransform
+from PyQt5.QtGui import QImageReader, QPixmap, QImage, QTransform
 from PyQt5.QtCore import Qt, QTimer, QSize, QObject, pyqtSignal
 import os
 import weakref
 
+from media.loaders.frame_engine import AnimationFrameEngine
+from media.handlers.animation_player import AnimationPlayer
+from core.memory.disposal_queue import get_disposal_queue
+
+
+class ParkedAnimation:
+    """
+    다른 파일로 이동할 때 gif_cache에 보관하는 애니메이션 상태 클래스
+
+    디코딩된 프레임을 가진 프레임 엔진과 재생 위치를 함께 보관해서
+    같은 파일로 돌아오면 처음부터 다시 디코딩하지 않고 이어서 재생합니다.
+    """
+
+    def __init__(self, frame_engine, frame_number, compact):
+        """
+        Args:
+            frame_engine: 디코딩을 쉬고 있는 AnimationFrameEngine
+            frame_number (int): 보관할 때 표시 중이던 프레임 번호
+            compact (bool): 프레임을 색상표 형식으로 보관하는지 여부
+        """
+        self.frame_engine = frame_engine
+        self.frame_number = frame_number
+        self.compact = compact
+        self.file_stamp = self.get_file_stamp(frame_engine.file_path)
+
+    @staticmethod
+    def get_file_stamp(file_path):
+        """파일이 바뀌었는지 확인하기 위한 (수정 시각, 크기)를 반환합니다."""
+        try:
+            stat = os.stat(file_path)
+            return (stat.st_mtime, stat.st_size)
+        except OSError:
+            return None
+
+    def is_valid_for(self, file_path, compact):
+        """보관한 뒤 파일이 바뀌지 않았고 같은 설정으로 다시 사용할 수 있는지 확인합니다."""
+        return (self.frame_engine is not None and not self.frame_engine.stopped and
+                self.compact == compact and
+                self.file_stamp is not None and self.file_stamp == self.get_file_stamp(file_path))
+
+    def dispose(self):
+        """캐시에서 밀려날 때 디코딩 스레드를 멈추고 프레임 메모리를 해제합니다."""
+        if self.frame_engine is not None:
+            self.frame_engine.stop()
+            get_disposal_queue().dispose(self.frame_engine)
+            self.frame_engine = None
+
+
 class AnimationHandler(QObject):
     """
     GIF 및 WEBP 애니메이션을 처리하는 클래스
@@ -18,6 +66,9 @@ class AnimationHandler(QObject):
     
     # 재생 상태 변경 시그널 추가
     playback_state_changed = pyqtSignal(bool)  # True: 재생 중, False: 일시정지
+
+    # GIF 프레임을 색상표(Indexed8) 형식으로 보관할지 여부 (메모리 1/4, 256색을 넘는 프레임은 색이 줄어듦)
+    compact_gif_frames = False
     
     def __init__(self, image_label, parent=None):
         """
@@ -30,12 +81,13 @@ class AnimationHandler(QObject):
         super(AnimationHandler, self).__init__(parent)
         self.image_label = image_label
         self.parent = parent
-        self.current_movie = None
-        self.animation_timer = None
+        self.frame_engine = None  # 현재 애니메이션의 프레임 엔진 (메모리 한도 내에서 프레임 보관)
+        self.player = None  # 프레임마다의 지연 시간에 맞춰 재생하는 플레이어
+        self.current_file_path = None
         self.timers = []  # 타이머 관리 리스트
         self.current_rotation = 0
+        self.compact = False  # 현재 애니메이션이 프레임을 색상표 형식으로 보관하는지 여부
         self.is_dragging = False  # 슬라이더 드래그 상태
-        self.current_frame_changed_handler = None  # 프레임 변경 핸들러 함수 저장
     
     def show_gif(self, image_path):
         """GIF 애니메이션을 표시합니다."""
@@ -70,10 +122,6 @@ class AnimationHandler(QObject):
             str: Media type ('gif_animation' or 'gif_image')
                  미디어 타입 ('gif_animation' 또는 'gif_image')
         """
-        # Initialize previous handler reference
-        # 이전 핸들러 참조 초기화
-        self.current_frame_changed_handler = None
-        
         # Calculate file size (in MB)
         # 파일 크기 계산 (MB 단위)
         size_mb = 0
@@ -112,35 +160,9 @@ class AnimationHandler(QObject):
             if frame_count > 1:
                 media_type = 'gif_animation'
                 
-                # Load GIF using QMovie
-                # QMovie로 GIF 로드
-                self.current_movie = QMovie(file_path)
-                self.current_movie.setCacheMode(QMovie.CacheAll)
-                self.current_movie.jumpToFrame(0)
-                
-                # Handle rotation
-                # 회전 처리
-                if self.current_rotation != 0:
-                    # Set transformation matrix for rotation
-                    # 회전을 위한 변환 행렬 설정
-                    transform = QTransform().rotate(self.current_rotation)
-                    
-                    # Store the function to apply rotation on frame change as a class attribute
-                    # 프레임 변경 시 회전을 적용하는 함수를 클래스 속성으로 저장
-                    self.current_frame_changed_handler = lambda frame_number: self._handle_rotated_frame(frame_number, transform)
-                    
-                    # Connect rotation function to frame changed event
-                    # 프레임 변경 이벤트에 회전 함수 연결
-                    self.current_movie.frameChanged.connect(self.current_frame_changed_handler)
-                    self.current_movie.start()
-                    # Debug message removed: Rotation applied debug message was omitted
-                    # 디버깅 메시지 제거됨: 회전 적용 디버깅 메시지 삭제됨
-                else:
-                    # General processing when there is no rotation
-                    # 회전이 없는 경우 일반적인 처리
-                    self.scale_animation()
-                    self.image_label.setMovie(self.current_movie)
-                    self.current_movie.start()
+                # Load GIF using the frame engine (bounded frame memory)
+                # 프레임 엔진으로 GIF 로드 (메모리 한도 내에서 프레임 보관)
+                self._start_animation(file_path, media_type)
                 
                 # Set slider and timer
                 # 슬라이더 설정 및 타이머 설정
@@ -148,16 +170,16 @@ class AnimationHandler(QObject):
                     # Set slider range
                     # 슬라이더 범위 설정
                     self.parent.playback_slider.setRange(0, frame_count - 1)
-                    self.parent.playback_slider.setValue(0)
+                    self.parent.playback_slider.setValue(self.current_frame_number())
                     
                     # Connect slider signals
                     # 슬라이더 시그널 연결
                     if hasattr(self.parent, 'disconnect_all_slider_signals'):
                         self.parent.disconnect_all_slider_signals()
                     
-                    # Set animation timer
-                    # 애니메이션 타이머 설정
-                    self._setup_animation_timer(file_path)
+                    # Connect slider to frame seeking (slider position is pushed by the player)
+                    # 슬라이더를 프레임 이동에 연결 (슬라이더 위치는 플레이어가 알려줌)
+                    self._connect_animation_slider()
                     
                     # Update play button status
                     # 재생 버튼 상태 업데이트
@@ -198,9 +220,6 @@ class AnimationHandler(QObject):
         Returns:
             str: 미디어 타입 ('webp_animation' 또는 'webp_image')
         """
-        # 이전 핸들러 참조 초기화
-        self.current_frame_changed_handler = None
-        
         # 파일 크기 계산 (MB 단위)
         size_mb = 0
         try:
@@ -227,40 +246,21 @@ class AnimationHandler(QObject):
             if frame_count > 1:
                 media_type = 'webp_animation'
                 
-                # QMovie로 WEBP 로드
-                self.current_movie = QMovie(file_path)
-                self.current_movie.setCacheMode(QMovie.CacheAll)
-                self.current_movie.jumpToFrame(0)
-                
-                # 회전 처리
-                if self.current_rotation != 0:
-                    # 회전을 위한 변환 행렬 설정
-                    transform = QTransform().rotate(self.current_rotation)
-                    
-                    # 프레임 변경 시 회전을 적용하는 함수를 클래스 속성으로 저장
-                    self.current_frame_changed_handler = lambda frame_number: self._handle_rotated_frame(frame_number, transform)
-                    
-                    # Connect rotation function to frame change event
-                    self.current_movie.frameChanged.connect(self.current_frame_changed_handler)
-                    self.current_movie.start()
-                else:
-                    # 회전이 없는 경우 일반적인 처리
-                    self.scale_animation()
-                    self.image_label.setMovie(self.current_movie)
-                    self.current_movie.start()
+                # 프레임 엔진으로 WEBP 로드 (메모리 한도 내에서 프레임 보관)
+                self._start_animation(file_path, media_type)
                 
                 # 슬라이더 설정 및 타이머 설정
                 if self.parent:
                     # 슬라이더 범위 설정
                     self.parent.playback_slider.setRange(0, frame_count - 1)
-                    self.parent.playback_slider.setValue(0)
+                    self.parent.playback_slider.setValue(self.current_frame_number())
                     
                     # 슬라이더 시그널 연결
                     if hasattr(self.parent, 'disconnect_all_slider_signals'):
                         self.parent.disconnect_all_slider_signals()
                     
-                    # 애니메이션 타이머 설정
-                    self._setup_animation_timer(file_path)
+                    # 슬라이더를 프레임 이동에 연결 (슬라이더 위치는 플레이어가 알려줌)
+                    self._connect_animation_slider()
                     
                     # 재생 버튼 상태 업데이트
                     if hasattr(self.parent, 'play_button'):
@@ -286,50 +286,138 @@ class AnimationHandler(QObject):
         
         return media_type
     
+    def _start_animation(self, file_path, media_type):
+        """
+        프레임 엔진을 만들고 첫 프레임부터 재생을 시작합니다.
+        gif_cache에 보관해둔 같은 파일의 애니메이션이 있으면 그 엔진과 위치에서 이어서 재생합니다.
+
+        Args:
+            file_path (str): 애니메이션 파일 경로
+            media_type (str): 미디어 타입 ('gif_animation' 또는 'webp_animation')
+        """
+        self.current_file_path = file_path
+
+        # GIF 프레임은 색상표 형식으로 보관할 수 있음 (compact_gif_frames 설정 시)
+        compact = self.compact_gif_frames and media_type == 'gif_animation'
+        self.compact = compact
+        start_frame = 0
+        parked = self._take_parked_animation(file_path, compact)
+        if parked:
+            self.frame_engine = parked.frame_engine
+            start_frame = parked.frame_number
+            self.frame_engine.resume()
+        else:
+            self.frame_engine = AnimationFrameEngine(file_path, compact=compact, parent=self)
+        self.player = AnimationPlayer(self.frame_engine, self._display_frame, self)
+        self.player.frame_changed.connect(self._on_frame_changed)
+        self.frame_engine.start()
+
+        if hasattr(self.image_label, 'current_media_type'):
+            self.image_label.current_media_type = media_type
+        self._update_display_settings()
+        self.player.seek(start_frame)
+        self.player.play()
+
+    def _get_gif_cache(self):
+        """애니메이션 상태를 보관할 캐시(viewer.gif_cache)를 반환합니다."""
+        return getattr(self.parent, 'gif_cache', None) if self.parent else None
+
+    def _take_parked_animation(self, file_path, compact):
+        """
+        gif_cache에 보관해둔 애니메이션 상태를 꺼냅니다.
+
+        Returns:
+            ParkedAnimation 또는 None (보관된 상태가 없거나 파일이 바뀐 경우)
+        """
+        gif_cache = self._get_gif_cache()
+        if gif_cache is None or not isinstance(gif_cache.get(file_path), ParkedAnimation):
+            return None
+        parked = gif_cache.pop(file_path)
+        if not parked.is_valid_for(file_path, compact):
+            parked.dispose()
+            return None
+        return parked
+
+    def _park_animation(self):
+        """
+        현재 애니메이션의 프레임 엔진과 재생 위치를 gif_cache에 보관합니다.
+        캐시의 개수/메모리 한도를 넘으면 오래된 항목부터 정리됩니다.
+
+        Returns:
+            bool: 보관했는지 여부 (False면 호출한 쪽에서 엔진을 정리)
+        """
+        gif_cache = self._get_gif_cache()
+        if gif_cache is None or not self.current_file_path or self.frame_engine.stopped:
+            return False
+        parked = ParkedAnimation(self.frame_engine, self.current_frame_number(), self.compact)
+        if parked.file_stamp is None:
+            return False
+        self.frame_engine.park()
+        gif_cache.put(self.current_file_path, parked, self.frame_engine.memory_usage_mb())
+        return True
+
+    def _display_frame(self, image):
+        """
+        프레임 엔진이 미리 회전/크기 조정해둔 프레임을 레이블에 표시합니다.
+        GUI 스레드에서는 변환 없이 그리기만 합니다.
+        """
+        if self.image_label:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+
+    def _on_frame_changed(self, frame_number):
+        """플레이어가 새 프레임을 표시하면 슬라이더와 프레임 표시를 갱신합니다."""
+        if not self.parent or self.is_dragging or getattr(self.parent, 'is_slider_dragging', False):
+            return
+        if hasattr(self.parent, 'playback_slider'):
+            # 슬라이더 값 변경이 다시 프레임 이동(seek)으로 이어지지 않도록 시그널 차단
+            slider = self.parent.playback_slider
+            slider.blockSignals(True)
+            slider.setValue(frame_number)
+            slider.blockSignals(False)
+        # 현재 프레임 / 총 프레임 표시 업데이트
+        if hasattr(self.parent, 'time_label'):
+            self.parent.time_label.setText(f"{frame_number + 1} / {self.frame_engine.frame_count}")
+
+    def _update_display_settings(self):
+        """현재 회전 각도와 레이블 크기를 프레임 엔진에 알립니다."""
+        if self.frame_engine and self.image_label:
+            label_size = self.image_label.size()
+            self.frame_engine.set_display(self.current_rotation, label_size.width(), label_size.height())
+
+    def current_frame_number(self):
+        """현재 표시 중인 프레임 번호를 반환합니다."""
+        return self.player.current_frame if self.player else 0
+
+    def frame_count(self):
+        """현재 애니메이션의 총 프레임 수를 반환합니다."""
+        return self.frame_engine.frame_count if self.frame_engine else 0
+
+    def set_paused(self, paused):
+        """
+        애니메이션을 일시정지하거나 다시 재생합니다.
+
+        Args:
+            paused (bool): True면 일시정지, False면 재생
+        """
+        if not self.player:
+            return
+        if paused:
+            self.player.pause()
+        else:
+            self.player.play()
+
     def scale_animation(self):
         """
-        애니메이션 크기를 조정합니다. QMovie 객체가 이미지 라벨 크기에 맞게 스케일링됩니다.
+        애니메이션 크기(또는 회전 각도)를 다시 적용합니다.
+        프레임 엔진이 새 설정으로 프레임을 다시 만들고, 현재 프레임이 준비되면 표시합니다.
         현재 프레임과 재생 상태를 유지합니다.
         """
-        if not self.current_movie:
+        if not self.frame_engine or not self.image_label:
             return False
-            
+
         try:
-            # 현재 재생 상태 저장
-            was_running = (self.current_movie.state() == QMovie.Running)
-            
-            # 현재 프레임 번호 저장
-            current_frame = self.current_movie.currentFrameNumber()
-            
-            # 원본 크기와 표시 영역 크기 정보
-            original_size = QSize(self.current_movie.currentImage().width(), self.current_movie.currentImage().height())
-            if not self.image_label:
-                return False
-                
-            label_size = self.image_label.size()
-            
-            # 높이가 0인 경우 예외 처리 (0으로 나누기 방지)
-            if original_size.height() == 0:
-                original_size.setHeight(1)
-                
-            # 화면 비율에 맞게 새 크기 계산
-            if label_size.width() / label_size.height() > original_size.width() / original_size.height():
-                # 세로 맞춤 (세로 기준으로 가로 계산)
-                new_height = label_size.height()
-                new_width = int(new_height * (original_size.width() / original_size.height()))
-            else:
-                # 가로 맞춤 (가로 기준으로 세로 계산)
-                new_width = label_size.width()
-                new_height = int(new_width * (original_size.height() / original_size.width()))
-            
-            # 애니메이션 크기 조정 및 원래 프레임으로 복원
-            self.current_movie.setScaledSize(QSize(new_width, new_height))
-            self.current_movie.jumpToFrame(current_frame)
-            
-            # 원래 재생 상태로 복원
-            if was_running and self.current_movie.state() != QMovie.Running:
-                self.current_movie.start()
-                
+            self._update_display_settings()
+            self.player.refresh()
             return True
         except Exception as e:
             return False
@@ -344,12 +432,15 @@ class AnimationHandler(QObject):
         Returns:
             bool: 성공 여부
         """
-        if hasattr(self, 'current_movie') and self.current_movie:
+        if self.player:
             try:
-                self.current_movie.jumpToFrame(frame_number)
+                if frame_number == self.player.current_frame and self.player.pending_frame is None:
+                    return True
+                self.player.seek(frame_number)
                 return True
             except Exception as e:
                 return False
+        return False
     
     def _slider_pressed(self):
         """슬라이더 드래그 시작 시 호출"""
@@ -358,7 +449,7 @@ class AnimationHandler(QObject):
     def _slider_released(self):
         """슬라이더 드래그 종료 시 호출"""
         self.is_dragging = False
-        if not self.current_movie:
+        if not self.frame_engine:
             return
             
         # 현재 슬라이더 값으로 프레임 이동
@@ -373,26 +464,25 @@ class AnimationHandler(QObject):
         Returns:
             bool: 현재 재생 상태 (True: 재생 중, False: 일시정지)
         """
-        if hasattr(self, 'current_movie') and self.current_movie:
+        if self.player:
             try:
-                # 현재 상태 확인
-                is_paused = self.current_movie.state() != QMovie.Running
                 # 상태 토글
-                self.current_movie.setPaused(not is_paused)
+                self.set_paused(self.player.playing)
                 
                 # 상태가 변경되었음을 알리는 시그널 발생
-                is_playing = not is_paused
-                self.playback_state_changed.emit(is_playing)
-                
-                # 재생 상태 반환 (정지 상태의 반대)
-                return is_playing
+                self.playback_state_changed.emit(self.player.playing)
+                return self.player.playing
             except Exception as e:
                 pass
         return False
     
-    def cleanup(self):
+    def cleanup(self, park=True):
         """
         리소스를 정리합니다. 애니메이션을 정지하고 메모리를 해제합니다.
+
+        Args:
+            park (bool): True면 디코딩된 프레임을 gif_cache에 보관해서 다시 돌아올 때 이어서 재생
+                         (파일을 삭제/이동할 때는 False)
         """
         
         # 이미지 라벨 초기화를 명시적으로 수행
@@ -401,43 +491,12 @@ class AnimationHandler(QObject):
                 # 이미지 라벨에서 QMovie 참조 제거 (순서 중요: 먼저 setMovie(None), 그 다음 clear)
                 self.image_label.setMovie(None)
                 self.image_label.clear()
-                
-                # 이벤트 처리 강제로 수행하여 UI 갱신 (중요)
-                QApplication.processEvents()
             except Exception as e:
                 pass
                 
-        # 애니메이션 타이머 별도 정리 (첫번째로 정리해야 함)
-        if hasattr(self, 'animation_timer') and self.animation_timer:
-            try:
-                if self.animation_timer.isActive():
-                    self.animation_timer.stop()
-                # Disconnect all connected slots
-                try:
-                    self.animation_timer.timeout.disconnect(self._update_slider_timer)
-                except TypeError:
-                    # Ignore exception if there are no connected slots
-                    try:
-                        self.animation_timer.timeout.disconnect()
-                    except TypeError:
-                        pass
-                    
-                # Remove from parent's timer list
-                if hasattr(self.parent, 'timers') and self.animation_timer in self.parent.timers:
-                    self.parent.timers.remove(self.animation_timer)
-                
-                # Schedule deletion
-                self.animation_timer.deleteLater()
-                # Force event processing to handle deletion request
-                QApplication.processEvents()
-                self.animation_timer = None
-            except Exception as e:
-                # Release reference even if an error occurs
-                self.animation_timer = None
-        
-        # 다른 모든 타이머 정리
+        # 타이머 정리
         for timer in self.timers:
-            if timer and timer is not self.animation_timer:  # animation_timer는 이미 처리했으므로 건너뜀
+            if timer:
                 try:
                     if timer.isActive():
                         timer.stop()
@@ -452,9 +511,7 @@ class AnimationHandler(QObject):
                     if hasattr(self.parent, 'timers') and timer in self.parent.timers:
                         self.parent.timers.remove(timer)
                     
-                    timer.deleteLater()
-                    # 각 타이머마다 이벤트 처리
-                    QApplication.processEvents()
+                    get_disposal_queue().dispose(timer)
                 except Exception as e:
                     pass
         
@@ -462,107 +519,22 @@ class AnimationHandler(QObject):
         self.timers.clear()
         
         # 현재 애니메이션 정리
-        if self.current_movie:
+        if self.player:
+            self.player.stop()
+            get_disposal_queue().dispose(self.player)
+            self.player = None
+        if self.frame_engine:
             try:
-                # 애니메이션 정지
-                self.current_movie.stop()
-                
-                # 이미지 라벨과의 연결 해제 (이미 위에서 처리했으므로 중복 코드 제거)
-                
-                # 저장된 프레임 변경 핸들러가 있으면 명시적으로 연결 해제
-                if hasattr(self, 'current_frame_changed_handler') and self.current_frame_changed_handler:
-                    try:
-                        # Check if the signal is still connected
-                        is_connected = False
-                        try:
-                            # Check by attempting to disconnect
-                            self.current_movie.frameChanged.disconnect(self.current_frame_changed_handler)
-                            is_connected = True
-                        except (TypeError, RuntimeError):
-                            # In case it is already disconnected or not connected
-                            pass
-                            
-                        if is_connected:
-                            pass
-                        
-                        # Release reference
-                        self.current_frame_changed_handler = None
-                    except Exception as e:
-                        pass
-                        # Still release reference
-                        self.current_frame_changed_handler = None
-                else:
-                    pass
-                
-                # Disconnect all signals connected to QMovie
-                try:
-                    pass
-                    
-                    # 각 시그널의 모든 연결을 더 안전하게 해제
-                    signal_names = {
-                        "frameChanged": self.current_movie.frameChanged,
-                        "stateChanged": self.current_movie.stateChanged,
-                        "error": self.current_movie.error,
-                        "finished": self.current_movie.finished,
-                        "started": self.current_movie.started
-                    }
-                    
-                    for name, signal in signal_names.items():
-                        try:
-                            signal.disconnect()
-                        except (TypeError, RuntimeError):
-                            # 연결된 슬롯이 없거나 이미 연결 해제됨 - 오류 메시지 출력하지 않음
-                            pass
-                    
-                    pass
-                    
-                except Exception as e:
-                    pass
-                
-                # 핸들러 참조 해제
-                self.current_frame_changed_handler = None
-                
-                # 메모리 해제 요청
-                if self.current_movie:
-                    try:
-                        self.current_movie.stop()  # 먼저 애니메이션 중지
-                        self.current_movie.deleteLater()
-                        # 이벤트 처리를 강제로 수행하여 삭제 요청 처리
-                        QApplication.processEvents()
-                    except Exception as e:
-                        pass
-                
-                # 부모 클래스에도 current_movie가 있을 수 있으므로 정리 요청
-                if self.parent and hasattr(self.parent, 'current_movie'):
-                    try:
-                        if self.parent.current_movie == self.current_movie:
-                            self.parent.current_movie = None
-                            pass
-                    except Exception as e:
-                        pass
-                
-                pass
+                # 캐시에 보관하지 못하면 디코딩 스레드 정지 및 프레임 메모리 해제
+                # (스레드가 파일을 놓을 때까지 기다리므로 바로 파일을 삭제/이동해도 안전)
+                if not (park and self._park_animation()):
+                    self.frame_engine.stop()
+                    get_disposal_queue().dispose(self.frame_engine)
             except Exception as e:
                 pass
             
             # 참조 해제
-            self.current_movie = None
-            
-            # 가비지 컬렉션 명시적 호출 - 두 번 연속 호출하여 효과 증대
-            try:
-                import gc
-                gc.collect()
-                # 이벤트 처리를 강제로 수행하여 가비지 컬렉션 결과 반영
-                QApplication.processEvents()
-                # 한번 더 수행
-                gc.collect()
-                QApplication.processEvents()
-                pass
-            except Exception as e:
-                pass
-                
-        else:
-            pass
+            self.frame_engine = None
     
     def rotate_static_image(self, file_path=None):
         """
@@ -684,88 +656,10 @@ class AnimationHandler(QObject):
         if self.parent and hasattr(self.parent, 'hide_loading_indicator'):
             self.parent.hide_loading_indicator()
     
-    def _update_slider_timer(self):
-        """애니메이션 슬라이더 업데이트 메서드 - 타이머에 의해 호출됨"""
-        try:
-            # 객체가 유효한지 확인
-            if self.current_movie and self.current_movie.state() == QMovie.Running:
-                current_frame = self.current_movie.currentFrameNumber()
-                if hasattr(self.parent, 'playback_slider'):
-                    self.parent.playback_slider.setValue(current_frame)
-                # 현재 프레임 / 총 프레임 표시 업데이트
-                if hasattr(self.parent, 'time_label'):
-                    self.parent.time_label.setText(f"{current_frame + 1} / {self.current_movie.frameCount()}")
-        except Exception as e:
-            # 오류 발생 시 타이머 중지
-            pass
-            try:
-                if hasattr(self, 'animation_timer') and self.animation_timer and self.animation_timer.isActive():
-                    self.animation_timer.stop()
-            except Exception:
-                pass
-    
-    def _setup_animation_timer(self, file_path):
-        """애니메이션 타이머 설정"""
-        if not self.parent or not self.current_movie:
+    def _connect_animation_slider(self):
+        """슬라이더 시그널을 애니메이션 프레임 이동에 연결합니다."""
+        if not self.parent or not self.frame_engine:
             return
-        
-        try:
-            # 총 프레임 수와 애니메이션 속도 가져오기
-            frame_count = self.current_movie.frameCount()
-            animation_speed = self.current_movie.speed()  # 기본 속도는 100%
-            
-            # 프레임 지연 시간 계산 (근사값)
-            reader = QImageReader(file_path)
-            if reader.supportsAnimation() and frame_count > 0:
-                # 첫 프레임 지연 시간 (밀리초)
-                delay = reader.nextImageDelay()
-                if delay <= 0:  # 유효하지 않은 경우 기본값 사용
-                    delay = 100  # 기본값 100ms (약 10fps)
-            else:
-                delay = 100  # 정보를 얻을 수 없는 경우 기본값
-            
-            # 애니메이션 속도를 고려하여 지연 시간 조정
-            timer_interval = int(delay * (100 / animation_speed))
-            
-            # 타이머 간격 범위 제한 (최소 10ms, 최대 200ms)
-            timer_interval = max(10, min(timer_interval, 200))
-        except Exception as e:
-            pass
-            timer_interval = 50  # 오류 발생 시 기본값 (50ms)
-        
-        # 이전 타이머가 있으면 정리
-        if hasattr(self, 'animation_timer') and self.animation_timer:
-            try:
-                if self.animation_timer.isActive():
-                    self.animation_timer.stop()
-                # 연결된 모든 슬롯 해제
-                try:
-                    self.animation_timer.timeout.disconnect()
-                except TypeError:
-                    # 연결된 슬롯이 없을 경우 발생하는 예외 무시
-                    pass
-                
-                self.animation_timer.deleteLater()
-                # 타이머 목록에서 제거
-                if self.animation_timer in self.timers:
-                    self.timers.remove(self.animation_timer)
-                # 부모의 타이머 목록에서도 제거
-                if hasattr(self.parent, 'timers') and self.animation_timer in self.parent.timers:
-                    self.parent.timers.remove(self.animation_timer)
-            except Exception as e:
-                pass
-        
-        # 타이머 생성 및 설정
-        self.animation_timer = QTimer(self.parent)
-        self.animation_timer.timeout.connect(self._update_slider_timer)
-        self.animation_timer.start(timer_interval)
-        
-        # 타이머 관리 리스트에 추가
-        self.timers.append(self.animation_timer)
-        
-        # 부모 객체의 타이머 관리 리스트에도 추가
-        if hasattr(self.parent, 'timers'):
-            self.parent.timers.append(self.animation_timer)
             
         # 슬라이더 시그널 연결 (ClickableSlider의 메서드 사용)
         if hasattr(self.parent, 'playback_slider'):
@@ -783,54 +677,9 @@ class AnimationHandler(QObject):
         Returns:
             bool: 재생 중이면 True, 일시정지 또는 정지 상태면 False
         """
-        if not self.current_movie:
-            return False
-            
-        try:
-            # QMovie.Running 상태이면 재생 중
-            return self.current_movie.state() == QMovie.Running
-        except Exception as e:
-            pass
+        if not self.player:
             return False
-    
-    def _handle_rotated_frame(self, frame_number, transform):
-        """회전된 프레임을 처리하는 메서드"""
-        if not self.image_label:
-            return
-            
-        # 현재 프레임 가져오기
-        current_pixmap = self.current_movie.currentPixmap()
-        if current_pixmap and not current_pixmap.isNull():
-            # 프레임 회전
-            rotated_pixmap = current_pixmap.transformed(transform, Qt.SmoothTransformation)
-            
-            # 화면에 맞게 크기 조절
-            label_size = self.image_label.size()
-            scaled_pixmap = rotated_pixmap.scaled(
-                label_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            # MediaDisplay의 display_pixmap 메서드 호출 (있는 경우)
-            if hasattr(self.image_label, 'display_pixmap'):
-                # 미디어 타입 감지 - current_movie의 파일명으로 판단
-                if hasattr(self, 'current_file_path'):
-                    file_path = self.current_file_path
-                    if file_path and file_path.lower().endswith('.gif'):
-                        media_type = 'gif_animation'
-                    elif file_path and file_path.lower().endswith('.webp'):
-                        media_type = 'webp_animation'
-                    else:
-                        media_type = 'animation'
-                else:
-                    media_type = 'animation'
-                
-                # 디버그 로그 없이 프레임 디스플레이
-                self.image_label.display_pixmap(scaled_pixmap, media_type)
-            else:
-                # 일반 QLabel인 경우 기존 방식으로 이미지 표시
-                self.image_label.setPixmap(scaled_pixmap)
+        return self.player.playing
     
     def scale_webp(self):
         """WEBP 애니메이션 크기 조정"""
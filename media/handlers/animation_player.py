@@ -0,0 +1,158 @@
+"""
+애니메이션 플레이어 모듈
+
+이 모듈은 프레임 엔진이 준비한 GIF/WEBP 프레임을 프레임마다의 지연 시간에 맞춰
+표시하는 재생 기능을 담당합니다. 재생 시간은 단조 시계(time.monotonic)를 기준으로
+계산하므로 타이머가 늦게 깨어나도 시간이 밀리지 않고, 많이 늦었으면 지난 프레임을 건너뜁니다.
+"""
+
+import time
+
+from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal
+
+# 너무 짧은 지연 시간으로 타이머가 계속 깨어나지 않도록 하는 최소 지연 시간 (밀리초)
+MIN_FRAME_DELAY = 10
+
+
+class AnimationPlayer(QObject):
+    """
+    프레임 엔진 기반 애니메이션 플레이어 클래스
+
+    각 프레임의 표시 종료 시각(due)을 단조 시계 기준으로 누적해서 다음 프레임을 예약합니다.
+    표시할 프레임이 아직 준비되지 않았으면 frame_ready를 기다렸다가 그 시점부터 다시 시간을 잽니다.
+
+    신호(Signals):
+        frame_changed: 새 프레임을 표시했을 때 (프레임 번호)
+    """
+    frame_changed = pyqtSignal(int)
+
+    def __init__(self, frame_engine, display_func, parent=None):
+        """
+        애니메이션 플레이어 초기화
+
+        Args:
+            frame_engine: AnimationFrameEngine 인스턴스
+            display_func: 프레임 이미지(QImage)를 화면에 표시하는 함수
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.frame_engine = frame_engine
+        self.display_func = display_func
+        self.current_frame = 0
+        self.pending_frame = None  # 디코딩을 기다리는 프레임 번호
+        self.playing = False
+        self.frame_due = 0.0  # 현재 프레임 표시가 끝나는 시각 (단조 시계, 초)
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+        self.frame_timer.timeout.connect(self._on_timer)
+
+        self.frame_engine.frame_ready.connect(self._on_frame_ready)
+
+    def frame_delay(self, frame_number):
+        """프레임의 지연 시간을 초 단위로 반환합니다."""
+        return max(self.frame_engine.get_delay(frame_number), MIN_FRAME_DELAY) / 1000.0
+
+    def play(self):
+        """재생을 시작하거나 일시정지된 위치부터 다시 재생합니다."""
+        if self.playing:
+            return
+        self.playing = True
+        if self.pending_frame is None:
+            self._schedule_from_now()
+
+    def pause(self):
+        """재생을 일시정지합니다."""
+        self.playing = False
+        self.frame_timer.stop()
+
+    def seek(self, frame_number):
+        """
+        특정 프레임으로 이동합니다. 재생 중이면 그 프레임부터 다시 시간을 잽니다.
+
+        Args:
+            frame_number (int): 이동할 프레임 번호
+        """
+        self.frame_timer.stop()
+        if self._show(frame_number) and self.playing:
+            self._schedule_from_now()
+
+    def refresh(self):
+        """표시 설정이 바뀐 뒤 현재 프레임을 다시 표시합니다 (준비되지 않았으면 기다림)."""
+        image = self.frame_engine.get_display_frame(self.current_frame)
+        if image is not None:
+            self.display_func(image)
+        elif self.pending_frame is None:
+            self.pending_frame = self.current_frame
+
+    def stop(self):
+        """재생을 멈추고 프레임 엔진과의 연결을 해제합니다."""
+        self.pause()
+        self.pending_frame = None
+        try:
+            self.frame_engine.frame_ready.disconnect(self._on_frame_ready)
+        except (TypeError, RuntimeError):
+            pass
+
+    def _show(self, frame_number):
+        """
+        프레임을 표시합니다.
+
+        Returns:
+            bool: 바로 표시했는지 여부 (False면 디코딩을 기다림)
+        """
+        frame_number %= self.frame_engine.frame_count
+        self.frame_engine.set_position(frame_number)
+        image = self.frame_engine.get_display_frame(frame_number)
+        if image is None:
+            self.pending_frame = frame_number
+            return False
+
+        self.pending_frame = None
+        self.current_frame = frame_number
+        self.display_func(image)
+        self.frame_changed.emit(frame_number)
+        return True
+
+    def _schedule_from_now(self):
+        """현재 프레임 표시 시간을 지금부터 다시 잽니다."""
+        self.frame_due = time.monotonic() + self.frame_delay(self.current_frame)
+        self._schedule()
+
+    def _schedule(self):
+        """현재 프레임 표시가 끝나는 시각에 타이머를 맞춥니다."""
+        remaining_ms = (self.frame_due - time.monotonic()) * 1000.0
+        self.frame_timer.start(max(0, int(remaining_ms)))
+
+    def _on_timer(self):
+        """다음 프레임 표시 시각이 되면 호출됩니다. 늦었으면 지난 프레임은 건너뜁니다."""
+        if not self.playing:
+            return
+
+        now = time.monotonic()
+        frame_count = self.frame_engine.frame_count
+        next_frame = (self.current_frame + 1) % frame_count
+        due = self.frame_due
+
+        # 다음 프레임의 표시 시간까지 이미 지났으면 그 프레임은 건너뜀 (최대 한 바퀴)
+        for _ in range(frame_count - 1):
+            next_due = due + self.frame_delay(next_frame)
+            if next_due > now:
+                break
+            due = next_due
+            next_frame = (next_frame + 1) % frame_count
+
+        if not self._show(next_frame):
+            return  # frame_ready에서 이어서 재생
+
+        self.frame_due = due + self.frame_delay(next_frame)
+        self._schedule()
+
+    def _on_frame_ready(self, frame_number):
+        """기다리던 프레임이 준비되면 표시합니다."""
+        if frame_number != self.pending_frame:
+            return
+        if self._show(frame_number) and self.playing:
+            # 디코딩을 기다린 시간은 재생 시간에서 빼고 이 프레임부터 다시 잼
+            self._schedule_from_now()
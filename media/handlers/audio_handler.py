@@ -6,10 +6,14 @@ AudioHandler 클래스를 제공합니다.
 """
 
 import os
+import time
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QLabel
 
 from media.handlers.base_handler import MediaHandler
+from media.handlers.mpv_events import MpvPropertyBridge, wait_for_idle
+from media.loaders.media_probe import get_media_info, QUICK_MAX_MOOV_BYTES
+from media.loaders.waveform import WaveformThread, load_waveform, is_waveform_available
 from core.utils.path_utils import get_app_directory
 
 # MPV DLL 경로 설정 (mpv 모듈 import 전에 필수)
@@ -23,12 +27,23 @@ if 'mpv' not in globals():
             # Windows에서는 os.add_dll_directory()가 더 확실한 방법
             if hasattr(os, 'add_dll_directory'):  # Python 3.8 이상에서만 사용 가능
                 os.add_dll_directory(mpv_path)
-        # MPV 모듈 import
-        import mpv
+        # MPV 모듈은 플레이어를 처음 만들 때 실제로 불러옴 (없으면 None)
+        from mpv_wrapper import mpv
     except ImportError as e:
         # 오류가 발생해도 모듈 정의는 필요
         mpv = None
 
+# 오디오 플레이어를 만들 때 한 번만 적용하는 mpv 옵션
+# (로컬 파일만 재생하므로 ytdl 훅과 스크립트를 끄고, 키 입력은 앱에서 처리)
+AUDIO_MPV_OPTIONS = {
+    'ytdl': False,
+    'load_scripts': False,
+    'input_default_bindings': False,
+    'input_vo_keyboard': False,
+    'loop_file': 'inf',  # 오디오 반복 재생
+    'volume': 100,  # 볼륨 100%로 설정
+}
+
 class AudioHandler(MediaHandler):
     """
     오디오 처리를 위한 클래스
@@ -38,8 +53,10 @@ class AudioHandler(MediaHandler):
     Attributes:
         parent: 부모 위젯 (MediaSorterPAAK 클래스의 인스턴스)
         display_label: 오디오를 표시할 QLabel 위젯
-        mpv_player: libmpv 기반 오디오 플레이어
+        mpv_player: libmpv 기반 오디오 플레이어 (한 번 만들어서 파일만 바꿔가며 계속 사용)
         is_playing: 현재 재생 중인지 여부
+        last_switch_ms: 마지막 파일 전환에 걸린 시간 (loadfile 요청부터 길이 정보 수신까지, 밀리초, 로그 파일에 기록)
+        waveform_thread: 오디오 파형을 추출하는 백그라운드 스레드
     """
     
     def __init__(self, parent, display_label):
@@ -56,10 +73,30 @@ class AudioHandler(MediaHandler):
         self.mpv_player = None
         self.is_playing = False
         self.current_media_path = None
-        self.audio_timer = QTimer()
-        self.audio_timer.timeout.connect(self._update_audio_time)
+        self.mpv_events = None  # mpv 속성 알림을 GUI 스레드로 전달하는 객체
         self.audio_duration = 0
         self.audio_position = 0
+        self.load_started = None  # 파일 전환 시작 시각 (time.perf_counter)
+        self.last_switch_ms = None
+        self.waveform_thread = None
+
+    def _ensure_player(self):
+        """
+        오디오 플레이어를 처음 한 번만 만들고 속성 콜백을 등록합니다.
+        이후에는 같은 플레이어에서 loadfile로 파일만 바꿉니다.
+        
+        Returns:
+            mpv.MPV: 오디오 플레이어
+        """
+        if self.mpv_player is None:
+            self.mpv_player = mpv.MPV(**AUDIO_MPV_OPTIONS)
+            
+            # 오디오 정보를 알림으로 받기 위한 설정 (플레이어당 한 번, GUI 스레드에서 처리)
+            self.mpv_events = MpvPropertyBridge(self.mpv_player)
+            self.mpv_events.duration_changed.connect(self._on_duration_change)
+            self.mpv_events.position_changed.connect(self._on_position_change)
+            self.mpv_events.eof_reached.connect(self._on_audio_end)
+        return self.mpv_player
 
     def load(self, audio_path):
         """
@@ -80,38 +117,24 @@ class AudioHandler(MediaHandler):
             if hasattr(self.parent, 'show_loading_indicator'):
                 self.parent.show_loading_indicator()
             
-            # 기존 플레이어가 있으면 정리
-            if self.mpv_player:
-                self.unload()
-            
-            # MPV 플레이어 생성 및 설정
-            self.mpv_player = mpv.MPV(
-                log_handler=print,
-                ytdl=True,
-                input_default_bindings=True,
-                input_vo_keyboard=True
-            )
-            
-            # MPV 옵션 설정
-            self.mpv_player.loop = True  # 오디오 반복 재생
-            self.mpv_player.volume = 100  # 볼륨 100%로 설정
-            self.mpv_player.seekable = True  # seek 가능하도록 설정
+            # 플레이어는 한 번만 만들어 재사용 (mpv 초기화 비용은 처음 한 번만)
+            player = self._ensure_player()
             
-            # 오디오 파일 로드
-            self.mpv_player.play(audio_path)
-            self.mpv_player.pause = False  # 바로 재생 시작
+            # 오디오 파일 로드 (현재 파일을 새 파일로 교체)
+            self.audio_duration = 0
+            self.audio_position = 0
+            self.load_started = time.perf_counter()
+            player.loadfile(audio_path, 'replace')
+            player.pause = False  # 바로 재생 시작
             self.is_playing = True
             
-            # 오디오 정보를 가져오기 위한 콜백 설정
-            self.mpv_player.observe_property("duration", self._on_duration_change)
-            self.mpv_player.observe_property("time-pos", self._on_position_change)
-            self.mpv_player.observe_property("eof-reached", self._on_audio_end)
-            
-            # 현재 미디어 경로 저장
+            # 현재 미디어 경로 저장 (재생 위치는 mpv 알림으로 갱신)
             self.current_media_path = audio_path
             
-            # 타이머 시작
-            self.audio_timer.start(100)  # 100ms 간격으로 업데이트
+            # 파일 머리에서 읽은 길이로 슬라이더 범위를 먼저 설정 (mpv 알림이 오면 다시 맞춤)
+            info = get_media_info(audio_path, QUICK_MAX_MOOV_BYTES)  # GUI 스레드이므로 읽는 양 제한
+            if info and info.get('duration'):
+                self._update_duration_display(info['duration'])
             
             # 오디오 파일 정보 표시
             filename = os.path.basename(audio_path)
@@ -127,10 +150,6 @@ class AudioHandler(MediaHandler):
             if hasattr(self.parent, 'current_media_type'):
                 self.parent.current_media_type = 'audio'
             
-            # 타이머 객체를 부모의 타이머 목록에 추가 (parent에 timers가 있다면)
-            if hasattr(self.parent, 'timers'):
-                self.parent.timers.append(self.audio_timer)
-            
             # 이미지 정보 업데이트 (현재 미디어 인덱스/총 갯수 등)
             if hasattr(self.parent, 'update_image_info'):
                 self.parent.update_image_info()
@@ -182,11 +201,9 @@ class AudioHandler(MediaHandler):
                     self.parent.slider_released,
                     self.parent.slider_clicked
                 )
-                
-            # 지연 후 duration 다시 확인 (duration이 None인 경우를 처리)
-            if self.audio_duration is None or self.audio_duration <= 0:
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(500, self._delayed_duration_check)
+            
+            # 슬라이더 뒤에 파형 표시 (캐시에 없으면 백그라운드에서 추출)
+            self._show_waveform(audio_path)
                 
             return True
         else:
@@ -194,35 +211,34 @@ class AudioHandler(MediaHandler):
             self.parent.show_message(f"오디오 파일 로드 실패: {audio_path}")
             return False
 
-    def _delayed_duration_check(self):
-        """500ms 후 duration을 다시 확인하는 메서드"""
-        if self.mpv_player:
-            try:
-                # mpv에서 duration 직접 가져오기
-                duration = self.mpv_player.duration
-                print(f"지연 확인된 오디오 길이: {duration}초")
-                
-                if duration is not None and duration > 0:
-                    # 정상적으로 duration이 감지된 경우
-                    self._on_duration_change("duration", duration)
-                else:
-                    # 여전히 duration이 없는 경우 대체 방법 시도
-                    # 파일 크기 기반 예상 길이 (약 10MB = 10분 가정)
-                    try:
-                        import os
-                        file_size_mb = os.path.getsize(self.current_media_path) / (1024 * 1024)
-                        estimated_duration = file_size_mb * 60  # 1MB당 약 1분으로 추정
-                        estimated_duration = max(60, min(3600, estimated_duration))  # 1분에서 1시간 사이로 제한
-                        print(f"예상 오디오 길이: {estimated_duration}초 (파일 크기 기반)")
-                        self._on_duration_change("duration", estimated_duration)
-                    except Exception as e:
-                        # 모든 방법 실패 시 기본값 설정 (5분)
-                        print(f"기본 오디오 길이 300초 설정")
-                        self._on_duration_change("duration", 300)
-            except Exception as e:
-                # 오류 발생 시 기본값 설정 (5분)
-                print(f"오디오 길이 감지 오류: {e}, 기본값 300초 설정")
-                self._on_duration_change("duration", 300)
+    def _show_waveform(self, audio_path):
+        """
+        캐시된 파형을 슬라이더에 표시하고, 없으면 백그라운드 추출을 요청합니다.
+        
+        Args:
+            audio_path: 오디오 파일 경로
+        """
+        if not is_waveform_available() or not hasattr(self.parent, 'playback_slider'):
+            return
+        waveform = load_waveform(audio_path)
+        if waveform is not None:
+            self.parent.playback_slider.set_waveform(waveform)
+            return
+        if self.waveform_thread is None:
+            self.waveform_thread = WaveformThread()
+            self.waveform_thread.waveform_ready.connect(self._on_waveform_ready)
+            self.waveform_thread.start(WaveformThread.LowPriority)
+        self.waveform_thread.request(audio_path)
+
+    def _on_waveform_ready(self, audio_path):
+        """
+        백그라운드에서 파형 추출이 끝났을 때 호출됩니다. (GUI 스레드)
+        
+        Args:
+            audio_path: 파형이 추출된 오디오 경로
+        """
+        if audio_path == self.current_media_path and hasattr(self.parent, 'playback_slider'):
+            self.parent.playback_slider.set_waveform(load_waveform(audio_path))
 
     def stop_audio(self):
         """
@@ -237,28 +253,12 @@ class AudioHandler(MediaHandler):
         현재 로드된 오디오를 언로드합니다.
         MediaHandler의 추상 메서드를 구현합니다.
         """
-        # MPV 플레이어 정지 (플레이어가 존재하는 경우)
+        # MPV 플레이어 정지 (플레이어는 다음 파일을 위해 남겨둠)
         if self.mpv_player:
             try:
-                # 플레이어가 재생 중인지 확인
-                if self.mpv_player.playback_time is not None:
-                    self.mpv_player.stop()  # 재생 중지
-                    # mpv 속성 초기화
-                    self.mpv_player.loop = False
-                    self.mpv_player.mute = False
+                self.mpv_player.command('stop')  # 재생 중지
             except Exception as e:
                 pass
-            
-            # mpv 플레이어 객체 정리
-            try:
-                self.mpv_player.terminate()
-                self.mpv_player = None
-            except Exception as e:
-                pass
-        
-        # 오디오 타이머 정지
-        if self.audio_timer.isActive():
-            self.audio_timer.stop()
         
         # 표시 레이블 초기화
         if self.display_label:
@@ -270,29 +270,39 @@ class AudioHandler(MediaHandler):
         self.current_media_path = None
         self.is_playing = False
 
-    def _update_audio_time(self):
-        """
-        오디오 재생 시간을 업데이트합니다.
-        """
-        if self.mpv_player:
-            self.audio_position = self.mpv_player.playback_time
-            self.audio_duration = self.mpv_player.duration
-
-    def _on_duration_change(self, name, value):
+    def _on_duration_change(self, value):
         """
-        오디오 재생 시간이 변경될 때 호출되는 콜백 함수
+        오디오 전체 길이가 변경될 때 호출됩니다. (GUI 스레드)
         
         Args:
-            name: 속성 이름
-            value: 변경된 값 (재생 시간)
+            value: 변경된 값 (전체 길이, 초)
         """
         # value가 None이면 무시
         if value is None:
             print("오디오 길이가 None으로 감지됨, 업데이트 건너뜀")
             return
             
+        # 파일 전환 시간 측정 (새 파일의 길이 정보를 처음 받은 시점까지)
+        if self.load_started is not None:
+            self.last_switch_ms = (time.perf_counter() - self.load_started) * 1000
+            self.load_started = None
+            # 로그 파일에 기록 (콘솔에는 출력하지 않음)
+            if hasattr(self.parent, 'logger'):
+                self.parent.logger.debug(
+                    f"Audio switch took {self.last_switch_ms:.1f} ms: "
+                    f"{os.path.basename(self.current_media_path or '')}"
+                )
+        
+        self._update_duration_display(value)
+
+    def _update_duration_display(self, value):
+        """
+        오디오 전체 길이를 저장하고 슬라이더 범위와 시간 표시를 맞춥니다.
+        
+        Args:
+            value: 전체 길이 (초)
+        """
         self.audio_duration = value
-        print(f"오디오 총 길이: {value}초")
         
         # 만약 부모에 슬라이더와 시간 레이블이 있다면 업데이트
         if hasattr(self.parent, 'playback_slider') and value is not None:
@@ -306,16 +316,19 @@ class AudioHandler(MediaHandler):
             current_time = self.format_time(self.audio_position or 0)
             self.parent.time_label.setText(f"{current_time} / {formatted_duration}")
 
-    def _on_position_change(self, name, value):
+    def _on_position_change(self, value):
         """
-        오디오 재생 위치가 변경될 때 호출되는 콜백 함수
+        오디오 재생 위치가 변경될 때 호출됩니다. (GUI 스레드, 화면 주사율 이하로 제한됨)
         
         Args:
-            name: 속성 이름
-            value: 변경된 값 (재생 위치)
+            value: 변경된 값 (재생 위치, 초)
         """
         self.audio_position = value
         
+        # 오디오를 재생 중이 아니면 (다른 파일로 이동함) UI 업데이트 건너뜀
+        if not self.current_media_path:
+            return
+        
         # 드래그 중이면 슬라이더 업데이트 건너뜀 (슬라이더가 드래그 중일 때만 체크)
         if hasattr(self.parent, 'is_slider_dragging') and self.parent.is_slider_dragging:
             return
@@ -338,13 +351,12 @@ class AudioHandler(MediaHandler):
                 self.parent.playback_slider.setValue(slider_value)
                 self.parent.playback_slider.blockSignals(False)
 
-    def _on_audio_end(self, name, value):
+    def _on_audio_end(self, value):
         """
-        오디오 재생이 끝났을 때 호출되는 콜백 함수
+        오디오 재생이 끝났을 때 호출됩니다. (GUI 스레드)
         
         Args:
-            name: 속성 이름
-            value: 변경된 값
+            value: 변경된 값 (오디오 종료 상태)
         """
         # 오디오가 끝났고, 반복 재생이 꺼져 있으면 재생 정지
         if value and not self.mpv_player.loop:
@@ -404,6 +416,33 @@ class AudioHandler(MediaHandler):
         오디오 리소스를 정리합니다.
         """
         self.unload()
+    
+    def release_file(self, file_path=None):
+        """
+        파일을 삭제하거나 이동하기 전에 플레이어가 파일을 닫을 때까지 기다립니다.
+        
+        Args:
+            file_path: 삭제/이동할 파일 경로
+        """
+        self.unload()
+        if self.mpv_player:
+            wait_for_idle(self.mpv_player)
+        # 파형 추출용 플레이어도 그 파일을 열고 있을 수 있으므로 취소하고 닫힐 때까지 기다림
+        if self.waveform_thread is not None and file_path:
+            self.waveform_thread.cancel(file_path)
+    
+    def shutdown(self):
+        """프로그램 종료 시 재사용하던 오디오 플레이어를 완전히 종료합니다."""
+        self.unload()
+        if self.waveform_thread is not None:
+            self.waveform_thread.stop()
+            self.waveform_thread = None
+        if self.mpv_player:
+            try:
+                self.mpv_player.terminate()
+            except Exception as e:
+                pass
+            self.mpv_player = None
         
     def seek(self, position):
         """
@@ -7,24 +7,41 @@ ImageHandler 클래스를 제공합니다.
 
 import os
 import time
-from PyQt5.QtGui import QPixmap, QImage, QTransform
+from PyQt5.QtGui import QPixmap, QImage
 from PyQt5.QtCore import Qt, QSize
 from PIL import Image
 from io import BytesIO
 
-# RAW 이미지 처리를 위한 라이브러리 추가
-import rawpy
-import numpy as np
+# RAW 이미지 처리를 위한 라이브러리 (RAW 파일을 처음 열 때 실제로 불러옴)
+from core.utils.lazy_import import lazy_import
+rawpy = lazy_import('rawpy')
+np = lazy_import('numpy')
 
-# AVIF 이미지 처리를 위한 플러그인 등록
-try:
-    from pillow_avif import register_avif_opener
-    register_avif_opener()
-    AVIF_SUPPORT = True
-except ImportError:
-    AVIF_SUPPORT = False
+# AVIF 플러그인 등록 여부 (AVIF 파일을 처음 열 때 등록)
+AVIF_SUPPORT = None
+
+
+def ensure_avif_support():
+    """
+    AVIF 플러그인을 처음 한 번만 등록합니다.
+    
+    Returns:
+        bool: AVIF 지원 여부
+    """
+    global AVIF_SUPPORT
+    if AVIF_SUPPORT is None:
+        try:
+            from pillow_avif import register_avif_opener
+            register_avif_opener()
+            AVIF_SUPPORT = True
+        except ImportError:
+            AVIF_SUPPORT = False
+    return AVIF_SUPPORT
 
 from media.handlers.base_handler import MediaHandler
+from core.utils.image_utils import rotate_pixmap, rotated_size, read_exif_transform, ImagePyramid
+from media.loaders.tiled_image import is_huge_image
+from media.loaders.color_management import convert_to_srgb, load_color_managed_pixmap
 
 # 지원되는 모든 RAW 파일 확장자 목록 (전역 상수로 정의)
 RAW_EXTENSIONS = [
@@ -64,8 +81,8 @@ class ImageHandler(MediaHandler):
         parent: 부모 위젯 (MediaSorterPAAK 클래스의 인스턴스)
         display_label: 이미지를 표시할 QLabel 위젯
         current_pixmap: 현재 로드된 이미지의 QPixmap 객체
-        original_pixmap: 원본 크기의 QPixmap 객체 (크기 조정 전)
-        _plain_original_pixmap: 회전 적용 전의 완전한 원본 이미지 (회전 재적용 시 사용)
+        original_pixmap: 회전이 반영된 원본 크기의 QPixmap 객체 (필요할 때만 만들어짐)
+        _plain_original_pixmap: 회전 적용 전의 완전한 원본 이미지 (화면 표시는 항상 이 이미지에서 만듦)
         rotation_applied: 회전 적용 여부
         use_full_window: 전체 윈도우 영역 사용 플래그
     """
@@ -80,11 +97,98 @@ class ImageHandler(MediaHandler):
         """
         super().__init__(parent, display_label)
         self.current_pixmap = None
-        self.original_pixmap = None
-        self._plain_original_pixmap = None  # 회전 적용 전의 완전한 원본 이미지 (회전 재적용 시 사용)
+        self._plain_original_pixmap = None  # 회전 적용 전의 완전한 원본 이미지
+        self._pyramid = None  # 원본의 여러 해상도 단계 (ImagePyramid)
+        self._rotated_original = None  # ((회전 각도, 반전 여부), 회전된 원본 크기 이미지) - 요청될 때만 만듦
+        self.exif_transform = (0, False)  # 현재 파일의 EXIF 방향 (회전 각도, 좌우 반전 여부)
         self.rotation_applied = False  # 회전 적용 여부
         self.use_full_window = False  # 전체 윈도우 영역 사용 플래그
     
+    @property
+    def original_pixmap(self):
+        """
+        회전이 반영된 원본 크기 이미지를 반환합니다.
+        
+        화면 표시는 축소한 뒤에 회전하므로 원본 크기 회전은 이 속성을 읽을 때만
+        한 번 수행하고, 같은 각도에서는 다시 계산하지 않습니다.
+        """
+        plain = self._plain_original_pixmap
+        transform = self._display_transform()
+        if plain is None or transform == (0, False):
+            return plain
+        if self._rotated_original is None or self._rotated_original[0] != transform:
+            self._rotated_original = (transform, rotate_pixmap(plain, *transform))
+        return self._rotated_original[1]
+    
+    @original_pixmap.setter
+    def original_pixmap(self, pixmap):
+        """회전 전 원본 이미지를 설정합니다. (회전된 원본과 축소 단계는 다시 만들어짐)"""
+        self._plain_original_pixmap = pixmap
+        self._rotated_original = None
+        self._pyramid = ImagePyramid(pixmap) if pixmap is not None else None
+    
+    def _current_rotation(self):
+        """현재 사용자 회전 각도 (0, 90, 180, 270)"""
+        return getattr(self.parent, 'current_rotation', 0) % 360
+    
+    def _display_transform(self):
+        """
+        화면에 표시할 때 적용할 변환 (EXIF 방향 + 사용자 회전)
+        
+        Returns:
+            tuple: (회전 각도, 좌우 반전 여부)
+        """
+        exif_angle, mirrored = self.exif_transform
+        return (exif_angle + self._current_rotation()) % 360, mirrored
+    
+    def _update_exif_transform(self, image_path):
+        """파일의 EXIF 방향 정보를 가져옵니다. (회전 관리자의 저장소가 파일별로 기억)"""
+        store = getattr(getattr(self.parent, 'rotation_manager', None), 'orientation_store', None)
+        if store is not None:
+            self.exif_transform = store.get_exif_transform(image_path)
+        else:
+            self.exif_transform = read_exif_transform(image_path)
+    
+    def _scaled_for_display(self, width, height, transformation_mode):
+        """
+        회전 전 원본을 화면 크기로 먼저 축소한 뒤, 축소된 이미지만 회전합니다.
+        축소는 원본 대신 목표 크기에 가장 가까운 피라미드 단계에서 시작합니다.
+        
+        Args:
+            width: 표시 영역 너비
+            height: 표시 영역 높이
+            transformation_mode: 크기 조정 방식
+            
+        Returns:
+            QPixmap: 회전과 크기 조정이 적용된 이미지
+        """
+        angle, mirrored = self._display_transform()
+        # 90/270도 회전이면 회전 후 영역에 맞도록 가로/세로를 바꿔서 축소
+        target_width, target_height = rotated_size(width, height, angle)
+        if self._pyramid is None:
+            self._pyramid = ImagePyramid(self._plain_original_pixmap)
+        scaled = self._pyramid.scaled(target_width, target_height, transformation_mode)
+        return rotate_pixmap(scaled, angle, mirrored)
+    
+    def _live_resize_pixmap(self, width, height):
+        """
+        창 크기를 바꾸는 동안 MediaDisplay가 요청하는 임시 이미지를 만듭니다.
+        빠른 변환을 사용하고, 크기 변경이 끝나면 resize()가 부드러운 변환으로 다시 그립니다.
+        """
+        if not self._plain_original_pixmap:
+            return None
+        return self._scaled_for_display(width, height, Qt.FastTransformation)
+    
+    def _show_pixmap(self, pixmap):
+        """화면 크기에 맞춘 이미지를 라벨에 표시합니다."""
+        # MediaDisplay의 display_pixmap 메서드 호출 (있는 경우)
+        if hasattr(self.display_label, 'display_pixmap'):
+            self.display_label.display_pixmap(pixmap, 'image', self._live_resize_pixmap)
+        else:
+            # 일반 QLabel인 경우 기존 방식으로 이미지 표시
+            self.display_label.setPixmap(pixmap)
+            self.display_label.repaint()
+    
     def load_static_image(self, image_path, format_type, file_ext):
         """일반 이미지와 PSD 이미지를 로드하고 표시합니다."""
         if format_type == 'psd':
@@ -139,7 +243,10 @@ class ImageHandler(MediaHandler):
             
             # 회전 적용 상태 초기화 (이미지가 새로 로드되므로)
             self.rotation_applied = False
-            self._plain_original_pixmap = None  # 완전한 원본 초기화
+            self.original_pixmap = None  # 완전한 원본 초기화
+            
+            # EXIF 방향은 디코딩한 원본이 아니라 화면 크기로 줄인 이미지에 함께 적용
+            self._update_exif_transform(image_path)
             
             # 이미지 크기 확인
             file_size_bytes = os.path.getsize(image_path)
@@ -172,6 +279,9 @@ class ImageHandler(MediaHandler):
                         if file_size_mb > 30:
                             pil_image.thumbnail((pil_image.width // 2, pil_image.height // 2), Image.Resampling.LANCZOS)
                         
+                        # 내장 ICC 프로파일을 sRGB로 변환 (프로파일이 없으면 그대로)
+                        pil_image = convert_to_srgb(pil_image)
+                        
                         # JP2 전용 안전 변환 방식 (PNG로 변환 후 QImage 생성)
                         img_data = BytesIO()
                         pil_image.save(img_data, format='PNG')
@@ -199,6 +309,10 @@ class ImageHandler(MediaHandler):
                         pass
                     return
             
+            # 아주 큰 이미지는 통째로 디코딩하지 않고 타일 방식으로 표시
+            if self._show_tiled_if_huge(image_path):
+                return
+            
             # 일반 이미지 파일 처리 (표준 라이브러리로 처리 가능한 이미지)
             if file_ext in normal_img_extensions:
                 try:
@@ -206,8 +320,8 @@ class ImageHandler(MediaHandler):
                     if hasattr(self.parent, 'show_loading_indicator'):
                         self.parent.show_loading_indicator()
                     
-                    # 직접 QPixmap으로 로드 시도 (가장 빠른 방법)
-                    pixmap = QPixmap(image_path)
+                    # 직접 Qt로 로드 시도 (가장 빠른 방법, 내장 ICC 프로파일은 sRGB로 변환)
+                    pixmap = load_color_managed_pixmap(image_path)
                     
                     # QPixmap 로드 성공 여부 확인
                     if not pixmap.isNull():
@@ -226,6 +340,9 @@ class ImageHandler(MediaHandler):
                         if file_size_mb > 30:
                             pil_image.thumbnail((pil_image.width // 2, pil_image.height // 2), Image.Resampling.LANCZOS)
                         
+                        # 내장 ICC 프로파일을 sRGB로 변환 (프로파일이 없으면 그대로)
+                        pil_image = convert_to_srgb(pil_image)
+                        
                         # PIL 이미지를 QPixmap으로 효율적 변환
                         if pil_image.mode == 'RGB':
                             # RGB 모드는 직접 변환 (BytesIO 사용 안 함)
@@ -270,10 +387,14 @@ class ImageHandler(MediaHandler):
                     if hasattr(self.parent, 'show_message'):
                         pass
                     
-                    # Load AVIF image using PIL
+                    # Register the AVIF plugin on first use, then load the AVIF image using PIL
+                    ensure_avif_support()
                     with Image.open(image_path) as pil_image:
                         # Output image metadata (for debugging purposes)
                         
+                        # Convert the embedded ICC profile to sRGB (no-op when untagged)
+                        pil_image = convert_to_srgb(pil_image)
+                        
                         # Convert to RGBA mode (preserve transparency)
                         if pil_image.mode != 'RGBA':
                             pil_image = pil_image.convert('RGBA')
@@ -316,6 +437,10 @@ class ImageHandler(MediaHandler):
                     if hasattr(self.parent, 'show_message'):
                         pass
                     
+                    # rawpy가 설치되지 않았으면 아래 ImportError 처리로 넘어감
+                    if rawpy is None:
+                        raise ImportError("rawpy is not installed")
+
                     # Load RAW file using rawpy library  // rawpy 라이브러리를 사용하여 RAW 파일 로드
                     with rawpy.imread(image_path) as raw:
                         if hasattr(self.parent, 'show_message'):
@@ -367,22 +492,18 @@ class ImageHandler(MediaHandler):
                         if qimg.isNull():
                             raise ValueError("RAW image conversion failed")
                         
-                        # QImage의 깊은 복사본 생성 (원본 데이터에 대한 참조 제거)
-                        qimg_copy = qimg.copy()
+                        # 픽스맵 기본 형식으로 한 번만 변환 (새 버퍼가 만들어져 NumPy 배열 참조가 끊기고,
+                        # 이후 QPixmap.fromImage는 같은 형식이라 다시 복사하지 않음)
+                        qimg = qimg.convertToFormat(QImage.Format_RGB32)
                         
                         # 메모리 정리
                         del rgb  # NumPy 배열 명시적 해제
                         
                         # QPixmap으로 변환
-                        pixmap = QPixmap.fromImage(qimg_copy)
+                        pixmap = QPixmap.fromImage(qimg)
                         
                         # QImage 객체 해제 (명시적 메모리 관리)
                         del qimg
-                        del qimg_copy
-                        
-                        # 가비지 컬렉션 요청 (선택적)
-                        import gc
-                        gc.collect()
                         
                         print(f"RAW image conversion complete, displaying: {os.path.basename(image_path)}")
                         
@@ -401,6 +522,7 @@ class ImageHandler(MediaHandler):
                     # rawpy가 없을 경우 PIL 폴백 사용
                     try:
                         with Image.open(image_path) as pil_image:
+                            pil_image = convert_to_srgb(pil_image)
                             img_data = BytesIO()
                             pil_image.save(img_data, format='PNG')
                             qimg = QImage()
@@ -439,6 +561,9 @@ class ImageHandler(MediaHandler):
                         # 이미지 메타데이터 출력 (디버깅 용도)
                         pass
                         
+                        # 내장 ICC 프로파일을 sRGB로 변환 (프로파일이 없으면 그대로)
+                        pil_image = convert_to_srgb(pil_image)
+                        
                         # QImage로 변환
                         img_data = BytesIO()
                         pil_image.save(img_data, format='PNG')
@@ -467,7 +592,7 @@ class ImageHandler(MediaHandler):
                     raise Exception(f"HEIC/HEIF image processing error: {e}")
             
             # 기본 이미지 로드 방식 (위의 모든 특수 처리가 적용되지 않은 경우)
-            pixmap = QPixmap(image_path)
+            pixmap = load_color_managed_pixmap(image_path)
             
             if pixmap.isNull():
                 # QPixmap으로 직접 로드 실패 시 PIL 시도
@@ -478,6 +603,9 @@ class ImageHandler(MediaHandler):
                         if file_size_mb > 30:
                             pil_image.thumbnail((pil_image.width // 2, pil_image.height // 2), Image.Resampling.LANCZOS)
                         
+                        # 내장 ICC 프로파일을 sRGB로 변환 (프로파일이 없으면 그대로)
+                        pil_image = convert_to_srgb(pil_image)
+                        
                         # PIL 이미지를 QPixmap으로 효율적 변환
                         if pil_image.mode == 'RGB':
                             # RGB 모드는 직접 변환 (BytesIO 사용 안 함)
@@ -520,6 +648,29 @@ class ImageHandler(MediaHandler):
             #      self.parent.image_label.clear()
             pass # 일단 최상위 except는 그대로 둡니다. 가장 안쪽의 포맷별 로딩 실패 시 처리가 우선입니다.
     
+    def _show_tiled_if_huge(self, image_path):
+        """
+        아주 큰 이미지면 보이는 영역만 디코딩하는 타일 방식으로 표시합니다.
+        
+        Args:
+            image_path: 이미지 파일 경로
+            
+        Returns:
+            bool: 타일 방식으로 표시했는지 여부
+        """
+        if not hasattr(self.display_label, 'show_tiled_image') or not is_huge_image(image_path):
+            return False
+        
+        # 타일 모드에서는 원본 픽스맵을 만들지 않음 (크기 조정/회전 대상 아님)
+        self.original_pixmap = None
+        self.current_pixmap = None
+        self.current_media_path = image_path
+        self.display_label.show_tiled_image(image_path)
+        
+        if hasattr(self.parent, 'hide_loading_indicator'):
+            self.parent.hide_loading_indicator()
+        return True
+    
     def unload(self):
         """현재 로드된 이미지를 언로드합니다."""
         self.current_pixmap = None
@@ -528,7 +679,7 @@ class ImageHandler(MediaHandler):
     
     def _resize_and_display(self):
         """이미지 크기를 조정하고 화면에 표시합니다."""
-        if not self.original_pixmap or not self.display_label:
+        if not self._plain_original_pixmap or not self.display_label:
             return
         
         # 회전 상태 확인
@@ -553,51 +704,31 @@ class ImageHandler(MediaHandler):
         if hasattr(self.parent, 'ui_state_manager'):
             ui_is_hidden = not self.parent.ui_state_manager.get_ui_visibility('controls') or not self.parent.ui_state_manager.get_ui_visibility('title_bar')
         
-        # 사용할 이미지: 이미 display_image에서 회전이 적용된 original_pixmap 사용
-        pixmap_to_scale = self.original_pixmap
-        
-        # 이미지 크기 조정
+        # 이미지 크기 조정 (회전 전 원본을 축소한 뒤 축소된 이미지만 회전)
         if is_raw_file and ui_is_hidden:
             # RAW 파일이고 UI가 숨겨진 경우, 실제 윈도우 크기에 맞게 조정
-            self.current_pixmap = pixmap_to_scale.scaled(
+            self.current_pixmap = self._scaled_for_display(
                 actual_width,
                 actual_height,
-                Qt.KeepAspectRatio,
                 Qt.SmoothTransformation
             )
         else:
             # 일반적인 케이스: 이미지 크기 조정 (AspectRatioMode는 비율 유지)
-            self.current_pixmap = pixmap_to_scale.scaled(
-                label_size, 
-                Qt.KeepAspectRatio, 
+            self.current_pixmap = self._scaled_for_display(
+                label_size.width(),
+                label_size.height(),
                 Qt.SmoothTransformation
             )
         
-        # MediaDisplay의 display_pixmap 메서드 호출 (있는 경우)
-        if hasattr(self.display_label, 'display_pixmap'):
-            self.display_label.display_pixmap(self.current_pixmap, 'image')
-        else:
-            # 일반 QLabel인 경우 기존 방식으로 이미지 표시
-            self.display_label.setPixmap(self.current_pixmap)
-            self.display_label.repaint()
+        self._show_pixmap(self.current_pixmap)
         
         # RAW 파일인 경우 강제 업데이트 적용
+        # (processEvents로 이벤트 루프에 다시 들어가면 폐기 큐가 표시 도중에 실행되므로 다시 표시만 함)
         if is_raw_file:
-            # 강제 업데이트를 위한 이벤트 처리
-            try:
-                from PyQt5.QtWidgets import QApplication
-                QApplication.instance().processEvents()
-            except Exception:
-                pass
-            
             # 실제 화면 크기에 맞게 추가 스케일링 (강제)
             if ui_is_hidden and self.current_pixmap:
                 # 이미지 다시 표시 - 윈도우 전체 크기 사용
-                if hasattr(self.display_label, 'display_pixmap'):
-                    self.display_label.display_pixmap(self.current_pixmap, 'image')
-                else:
-                    self.display_label.setPixmap(self.current_pixmap)
-                    self.display_label.repaint()
+                self._show_pixmap(self.current_pixmap)
         
         # 이미지 정보 업데이트
         if hasattr(self.parent, 'update_image_info'):
@@ -605,7 +736,7 @@ class ImageHandler(MediaHandler):
     
     def resize(self):
         """창 크기가 변경되었을 때 이미지 크기를 조정합니다."""
-        if not self.original_pixmap or not self.display_label:
+        if not self._plain_original_pixmap or not self.display_label:
             return
         
         # 전체 화면 모드에서는 속도를 위해 SmoothTransformation 대신 FastTransformation 사용
@@ -618,19 +749,14 @@ class ImageHandler(MediaHandler):
             window_width = self.parent.width()
             window_height = self.parent.height()
             
-            self.current_pixmap = self.original_pixmap.scaled(
+            self.current_pixmap = self._scaled_for_display(
                 window_width,
                 window_height,
-                Qt.KeepAspectRatio,
                 transformation_mode
             )
             
             # 이미지 직접 표시 (최적화)
-            if hasattr(self.display_label, 'display_pixmap'):
-                self.display_label.display_pixmap(self.current_pixmap, 'image')
-            else:
-                self.display_label.setPixmap(self.current_pixmap)
-                self.display_label.repaint()
+            self._show_pixmap(self.current_pixmap)
         else:
             # 일반적인 리사이징 (라벨 크기에 맞춤) - UI 숨김/표시에 필요한 부분
             self._resize_and_display()
@@ -642,8 +768,12 @@ class ImageHandler(MediaHandler):
         Returns:
             QSize: 원본 이미지 크기
         """
-        if self.original_pixmap:
-            return self.original_pixmap.size()
+        if self._plain_original_pixmap:
+            # 원본 크기 회전 없이 회전 후 크기만 계산
+            width, height = rotated_size(self._plain_original_pixmap.width(),
+                                         self._plain_original_pixmap.height(),
+                                         self._display_transform()[0])
+            return QSize(width, height)
         return QSize(0, 0)
         
     def get_current_size(self):
@@ -692,20 +822,17 @@ class ImageHandler(MediaHandler):
 
     def prepare_image_for_display(self, image, size_mb):
         """
-        이미지 변환(회전, 크기 조정)을 처리하는 메서드
+        이미지 크기 조정을 처리하는 메서드
+        회전은 display_image에서 축소된 이미지에 한 번만 적용하므로 여기서는 하지 않습니다.
         
         Args:
             image: 표시할 QPixmap 이미지
             size_mb: 이미지 크기 (MB)
             
         Returns:
-            QPixmap: 크기 조정 및 회전이 적용된 이미지
+            QPixmap: 크기 조정된 이미지 (회전 전)
         """
-        # 회전 각도가 0이 아니면 이미지 회전 적용 (원본 이미지에 직접 적용)
-        display_image = image  # 기본적으로 원본 이미지 사용
-        if hasattr(self.parent, 'current_rotation') and self.parent.current_rotation != 0:
-            transform = QTransform().rotate(self.parent.current_rotation)
-            display_image = image.transformed(transform, Qt.SmoothTransformation)
+        display_image = image
         
         # 이미지 크기에 따라 스케일링 방식 결정
         # 작은 이미지는 고품질 변환, 큰 이미지는 빠른 변환 사용
@@ -742,36 +869,21 @@ class ImageHandler(MediaHandler):
         return scaled_pixmap
     
     def display_image(self, pixmap, image_path, size_mb):
-        """이미지를 표시합니다."""
+        """
+        이미지를 표시합니다.
+        
+        전달받은 원본 크기 이미지는 복사하지 않고 그대로 참조합니다. (캐시 항목과 같은 버퍼 공유)
+        원본은 수정하지 않고, 회전/축소는 항상 새 이미지(화면 크기 또는 피라미드 단계)로 만듭니다.
+        """
         # 경로와 원본 이미지 저장
         self.current_media_path = image_path
         
-        # 원본 이미지 저장 (회전 적용 전에 항상 원본 보존)
+        # 원본 이미지 저장 (회전 적용 전의 원본을 참조로 보관)
         if self._plain_original_pixmap is None:
-            self._plain_original_pixmap = pixmap.copy()  # 완전한 원본 복사
+            self.original_pixmap = pixmap
         
-        # 회전 적용이 필요한 경우
-        current_rotation = getattr(self.parent, 'current_rotation', 0)
-        if current_rotation != 0:
-            try:
-                # Transform 객체 생성 및 회전 설정
-                transform = QTransform()
-                transform.rotate(current_rotation)
-                
-                # 회전 적용 (항상 원본에서 회전)
-                rotated_pixmap = self._plain_original_pixmap.transformed(transform, Qt.SmoothTransformation)
-                
-                # 회전된 이미지로 원본 이미지 대체
-                self.original_pixmap = rotated_pixmap
-                
-                # 회전 적용 상태 표시
-                self.rotation_applied = True
-            except Exception as e:
-                self.parent.show_message(f"image rotation error: {e}")
-        else:
-            # 회전이 없는 경우 원본 사용
-            self.original_pixmap = self._plain_original_pixmap.copy()
-            self.rotation_applied = False
+        # 회전(EXIF 방향 포함)은 화면 크기로 축소한 이미지에만 적용 (원본 크기 회전은 필요할 때까지 미룸)
+        self.rotation_applied = self._display_transform() != (0, False)
         
         # 이미지 크기 조정 및 표시
         self._resize_and_display()
@@ -0,0 +1,129 @@
+"""
+mpv 속성 변경 알림 모듈
+
+mpv의 속성 콜백(time-pos, duration, eof-reached)은 mpv 스레드에서 호출됩니다.
+이 모듈은 그 알림을 Qt 시그널로 바꿔 GUI 스레드에 전달하므로, 핸들러가 타이머로
+플레이어 속성을 주기적으로 읽지 않아도 슬라이더와 시간 표시를 갱신할 수 있습니다.
+재생 위치 알림은 화면 주사율보다 자주 전달하지 않습니다.
+"""
+
+import threading
+import time
+
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+# 화면 주사율을 알 수 없을 때 사용할 기본값 (Hz)
+DEFAULT_REFRESH_RATE = 60.0
+
+# 정지 후 플레이어가 파일을 닫을 때까지 기다리는 최대 시간 (초)
+RELEASE_TIMEOUT = 1.0
+
+
+def wait_for_idle(player, timeout=RELEASE_TIMEOUT):
+    """
+    'stop' 명령 뒤 플레이어가 파일을 모두 닫고 대기 상태가 될 때까지 기다립니다.
+    (파일을 삭제/이동하기 직전에만 사용)
+
+    Args:
+        player: mpv 플레이어
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        bool: 대기 상태가 되었는지 여부
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if player.idle_active:
+                return True
+        except Exception as e:
+            return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+
+
+class MpvPropertyBridge(QObject):
+    """
+    mpv 속성 콜백을 GUI 스레드의 Qt 시그널로 전달하는 클래스
+
+    재생 위치는 mpv 스레드에서 최신 값만 저장해두고, GUI 스레드에 전달이 예약되지 않은
+    경우에만 한 번 예약합니다. 전달 간격이 화면 주사율보다 짧으면 남은 시간만큼 기다렸다가
+    그 시점의 최신 값을 전달합니다.
+
+    신호(Signals):
+        position_changed: 재생 위치 (초, 없으면 None)
+        duration_changed: 전체 길이 (초, 없으면 None)
+        eof_reached: 재생이 끝났는지 여부
+        playback_restarted: 파일 열기 또는 이동(seek)이 끝나고 재생이 다시 시작됨
+    """
+    position_changed = pyqtSignal(object)
+    duration_changed = pyqtSignal(object)
+    eof_reached = pyqtSignal(object)
+    playback_restarted = pyqtSignal()
+    _position_queued = pyqtSignal()  # mpv 스레드 -> GUI 스레드 전달용
+
+    def __init__(self, player, parent=None):
+        """
+        mpv 속성 콜백을 등록합니다. (플레이어당 한 번)
+
+        Args:
+            player: mpv.MPV 인스턴스
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.latest_position = None
+        self.position_pending = False  # GUI 스레드 전달이 예약되어 있는지 여부
+        self.last_delivery = 0.0
+
+        screen = QApplication.primaryScreen() if QApplication.instance() else None
+        refresh_rate = screen.refreshRate() if screen else 0
+        self.min_interval = 1.0 / (refresh_rate if refresh_rate and refresh_rate > 0 else DEFAULT_REFRESH_RATE)
+
+        self.throttle_timer = QTimer(self)
+        self.throttle_timer.setSingleShot(True)
+        self.throttle_timer.timeout.connect(self._deliver_position)
+        self._position_queued.connect(self._deliver_position, Qt.QueuedConnection)
+
+        player.observe_property("time-pos", self._on_time_pos)
+        player.observe_property("duration", self._on_duration)
+        player.observe_property("eof-reached", self._on_eof_reached)
+        player.event_callback('playback-restart')(self._on_playback_restart)
+
+    def _on_time_pos(self, name, value):
+        """재생 위치 콜백 (mpv 스레드) - 최신 값만 저장하고 필요할 때만 전달을 예약합니다."""
+        with self.lock:
+            self.latest_position = value
+            if self.position_pending:
+                return
+            self.position_pending = True
+        self._position_queued.emit()
+
+    def _on_duration(self, name, value):
+        """전체 길이 콜백 (mpv 스레드)"""
+        self.duration_changed.emit(value)
+
+    def _on_eof_reached(self, name, value):
+        """재생 종료 콜백 (mpv 스레드)"""
+        self.eof_reached.emit(value)
+
+    def _on_playback_restart(self, event):
+        """이동(seek) 완료 이벤트 (mpv 스레드)"""
+        self.playback_restarted.emit()
+
+    def _deliver_position(self):
+        """저장된 최신 재생 위치를 GUI 스레드에서 전달합니다."""
+        remaining = self.last_delivery + self.min_interval - time.monotonic()
+        if remaining > 0:
+            # 화면 갱신 간격보다 짧으면 남은 시간 뒤에 그때의 최신 값을 전달
+            if not self.throttle_timer.isActive():
+                self.throttle_timer.start(max(1, int(remaining * 1000)))
+            return
+
+        with self.lock:
+            value = self.latest_position
+            self.position_pending = False
+        self.last_delivery = time.monotonic()
+        self.position_changed.emit(value)
@@ -9,7 +9,7 @@ import os
 import time
 from PyQt5.QtGui import QPixmap, QImage, QTransform
 from PyQt5.QtCore import Qt, QSize
-from PIL import Image, ImageCms
+from PIL import Image
 from io import BytesIO
 
 from media.handlers.base_handler import MediaHandler
@@ -8,9 +8,17 @@ VideoHandler 클래스를 제공합니다.
 import os
 import time
 from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import QLabel
 
 from media.handlers.base_handler import MediaHandler
+from media.format_detector import FormatDetector
+from media.handlers.mpv_events import MpvPropertyBridge, wait_for_idle
+from media.loaders.preview_cache import get_preview_cache
+from media.loaders.media_probe import get_media_info, QUICK_MAX_MOOV_BYTES
+from media.loaders.video_preview import (
+    VideoPreviewThread, POSTER_SUFFIX, SPRITE_SUFFIX, PREVIEW_INFO_SUFFIX
+)
 from core.utils.path_utils import get_app_directory
 
 # MPV DLL 경로 설정 (mpv 모듈 import 전에 필수)
@@ -24,12 +32,33 @@ if 'mpv' not in globals():
             # Windows에서는 os.add_dll_directory()가 더 확실한 방법
             if hasattr(os, 'add_dll_directory'):  # Python 3.8 이상에서만 사용 가능
                 os.add_dll_directory(mpv_path)
-        # MPV 모듈 import
-        import mpv
+        # MPV 모듈은 플레이어를 처음 만들 때 실제로 불러옴 (없으면 None)
+        from mpv_wrapper import mpv
     except ImportError as e:
         # 오류가 발생해도 모듈 정의는 필요
         mpv = None
 
+# 이동 완료 알림이 오지 않을 때 다음 드래그 이동을 보내기까지 기다리는 최대 시간 (밀리초)
+SCRUB_SEEK_TIMEOUT = 500
+
+# 비디오 플레이어를 만들 때 한 번만 적용하는 mpv 옵션
+# (로컬 파일만 재생하므로 ytdl 훅과 스크립트를 끄고, 키 입력은 앱에서 처리)
+VIDEO_MPV_OPTIONS = {
+    'ytdl': False,
+    'load_scripts': False,
+    'input_default_bindings': False,
+    'input_vo_keyboard': False,
+    'hwdec': 'no',  # 하드웨어 가속 비활성화
+    'loop_file': 'inf',  # 비디오 반복 재생
+    'volume': 100,  # 볼륨 100%로 설정
+    # 재생 목록의 다음 비디오를 미리 열고, 앞부분을 미리 읽어둠 (인접 비디오로 바로 전환)
+    'prefetch_playlist': True,
+    'cache': True,
+    'demuxer_readahead_secs': 10,
+    'demuxer_max_bytes': '64MiB',
+    'demuxer_max_back_bytes': '16MiB',
+}
+
 class VideoHandler(MediaHandler):
     """
     비디오 처리를 위한 클래스
@@ -39,8 +68,10 @@ class VideoHandler(MediaHandler):
     Attributes:
         parent: 부모 위젯 (MediaSorterPAAK 클래스의 인스턴스)
         display_label: 비디오를 표시할 QLabel 위젯
-        mpv_player: libmpv 기반 비디오 플레이어
+        mpv_player: libmpv 기반 비디오 플레이어 (한 번 만들어서 파일만 바꿔가며 계속 사용)
         is_playing: 현재 재생 중인지 여부
+        last_switch_ms: 마지막 파일 전환에 걸린 시간 (loadfile 요청부터 길이 정보 수신까지, 밀리초, 로그 파일에 기록)
+        preview_thread: 포스터 프레임과 슬라이더 미리보기를 만드는 백그라운드 스레드
     """
     
     def __init__(self, parent, display_label):
@@ -54,10 +85,49 @@ class VideoHandler(MediaHandler):
         super().__init__(parent, display_label)
         self.mpv_player = None
         self.is_playing = False
-        self.video_timer = QTimer()
-        self.video_timer.timeout.connect(self._update_video_time)
+        self.mpv_events = None  # mpv 속성 알림을 GUI 스레드로 전달하는 객체
         self.video_duration = 0
         self.video_position = 0
+        self.load_started = None  # 파일 전환 시작 시각 (time.perf_counter)
+        self.last_switch_ms = None
+        self.load_prefetched = False  # 마지막 전환이 미리 열어둔 재생 목록 항목을 사용했는지 여부
+        self.prefetch_path = None  # mpv 재생 목록에 미리 올려둔 다음 비디오 경로
+        self.last_index = None  # 탐색 방향을 알기 위한 이전 파일 인덱스
+        self.stop_pending = False  # 정지를 이벤트 루프 한 바퀴 뒤로 미뤘는지 여부
+        
+        # 포스터 프레임/슬라이더 미리보기 (미리보기 캐시에서 읽음)
+        self.preview_thread = None
+        self.preview_info = None  # 현재 비디오의 스프라이트 정보 (개수, 크기, 길이)
+        self.preview_sprite = None  # 현재 비디오의 스프라이트 시트 (QImage)
+        
+        # 슬라이더 드래그 중 이동 요청 합치기 (한 번에 하나의 키프레임 이동만 진행)
+        self.scrub_target = None  # 아직 보내지 않은 가장 최근 이동 위치 (초)
+        self.scrub_in_flight = False  # mpv가 처리 중인 드래그 이동이 있는지 여부
+        self.scrub_timer = QTimer()
+        self.scrub_timer.setSingleShot(True)
+        self.scrub_timer.timeout.connect(self._on_scrub_seek_done)
+
+    def _ensure_player(self):
+        """
+        비디오 플레이어를 처음 한 번만 만들고 속성 콜백을 등록합니다.
+        이후에는 같은 플레이어에서 loadfile로 파일만 바꿉니다.
+        
+        Returns:
+            mpv.MPV: 비디오 플레이어
+        """
+        if self.mpv_player is None:
+            self.mpv_player = mpv.MPV(
+                wid=str(int(self.display_label.winId())),
+                **VIDEO_MPV_OPTIONS
+            )
+            
+            # 비디오 정보를 알림으로 받기 위한 설정 (플레이어당 한 번, GUI 스레드에서 처리)
+            self.mpv_events = MpvPropertyBridge(self.mpv_player)
+            self.mpv_events.duration_changed.connect(self._on_duration_change)
+            self.mpv_events.position_changed.connect(self._on_position_change)
+            self.mpv_events.eof_reached.connect(self._on_video_end)
+            self.mpv_events.playback_restarted.connect(self._on_scrub_seek_done)
+        return self.mpv_player
 
     def load(self, video_path):
         """
@@ -81,44 +151,40 @@ class VideoHandler(MediaHandler):
         self.parent.show_loading_indicator()
         
         try:
-            # 기존 플레이어가 있으면 정리
-            if self.mpv_player:
-                self.unload()
-            
-            # MPV 플레이어 생성 및 설정
-            self.mpv_player = mpv.MPV(
-                wid=str(int(self.display_label.winId())),
-                log_handler=print,
-                ytdl=True,
-                input_default_bindings=True, 
-                input_vo_keyboard=True,
-                hwdec='no'  # 하드웨어 가속 비활성화
-            )
-            
-            # MPV 옵션 설정
-            self.mpv_player.loop = True  # 비디오 반복 재생
-            self.mpv_player.volume = 100  # 볼륨 100%로 설정
-            self.mpv_player.seekable = True  # seek 가능하도록 설정
+            # 플레이어는 한 번만 만들어 재사용 (mpv 초기화 비용은 처음 한 번만)
+            player = self._ensure_player()
             
             # 회전 각도 설정 (parent에 current_rotation이 있다면)
             if hasattr(self.parent, 'current_rotation'):
-                self.mpv_player['video-rotate'] = str(self.parent.current_rotation)
+                player['video-rotate'] = str(self.parent.current_rotation)
             
-            # 비디오 파일 로드
-            self.mpv_player.play(video_path)
-            self.mpv_player.pause = True  # 일단 일시정지 상태로 시작
+            # 비디오 파일 로드 (미뤄둔 정지는 취소)
+            self.stop_pending = False
+            player.pause = True  # 일단 일시정지 상태로 시작
             self.is_playing = False
+            # 파일 머리에서 읽은 길이를 먼저 사용 (mpv 알림이 오면 그 값으로 바뀜)
+            info = get_media_info(video_path, QUICK_MAX_MOOV_BYTES)  # GUI 스레드이므로 읽는 양 제한
+            self.video_duration = (info.get('duration') or 0) if info else 0
+            self.video_position = 0
+            self.load_started = time.perf_counter()
+            self.load_prefetched = self.prefetch_path == video_path
+            if self.load_prefetched:
+                # 재생 목록에 미리 열어둔 비디오로 전환 (이미 열고 읽어둔 스트림 사용)
+                player.command('playlist-next', 'force')
+            else:
+                # 현재 파일을 새 파일로 교체
+                player.loadfile(video_path, 'replace')
             
-            # 비디오 정보를 가져오기 위한 콜백 설정
-            self.mpv_player.observe_property("duration", self._on_duration_change)
-            self.mpv_player.observe_property("time-pos", self._on_position_change)
-            self.mpv_player.observe_property("eof-reached", self._on_video_end)
+            # 탐색 방향의 다음 비디오를 재생 목록에 올려 미리 열어둠
+            self._update_prefetch_playlist(player)
             
-            # 현재 미디어 경로 저장
+            # 현재 미디어 경로 저장 (재생 위치는 mpv 알림으로 갱신)
             self.current_media_path = video_path
             
-            # 타이머 시작
-            self.video_timer.start(100)  # 100ms 간격으로 업데이트
+            # 첫 화면이 나오기 전까지 캐시된 포스터를 보여주고, 없는 미리보기는 백그라운드에서 만듦
+            self._show_poster(video_path)
+            self._load_preview_sprite(video_path)
+            self._request_previews([video_path, self.prefetch_path])
             
             # 현재 미디어 타입 설정
             self.parent.current_media_type = 'video'
@@ -143,89 +209,223 @@ class VideoHandler(MediaHandler):
             self.parent.hide_loading_indicator()  # Hide the loading indicator // 로딩 인디케이터를 숨김
             return False  # Return False on error // 오류 발생 시 False 반환
 
-    def unload(self):
+    def _find_prefetch_target(self):
+        """
+        파일 목록에서 탐색 방향으로 바로 옆에 있는 파일이 비디오이면 그 경로를 반환합니다.
+        (순환 탐색 설정은 FileNavigator의 peek 메서드가 반영)
+        
+        Returns:
+            str: 미리 열어둘 비디오 경로 또는 None
+        """
+        navigator = getattr(self.parent, 'file_navigator', None)
+        if not navigator:
+            return None
+        
+        index = navigator.get_current_index()
+        moving_backward = self.last_index is not None and index < self.last_index
+        self.last_index = index
+        
+        if moving_backward:
+            success, path = navigator.peek_previous_file()
+        else:
+            success, path = navigator.peek_next_file()
+        if success and path and path != self.current_media_path and FormatDetector.is_video_path(path):
+            return path
+        return None
+
+    def _update_prefetch_playlist(self, player):
+        """
+        mpv 재생 목록을 [현재 비디오, 다음 비디오]로 맞춥니다.
+        mpv가 다음 비디오를 미리 열어두므로 그 비디오로 이동하면 바로 전환됩니다.
+        
+        Args:
+            player: mpv 플레이어
+        """
+        try:
+            # 현재 재생 중인 항목만 남기고 재생 목록 비우기
+            player.command('playlist-clear')
+            self.prefetch_path = self._find_prefetch_target()
+            if self.prefetch_path:
+                player.loadfile(self.prefetch_path, 'append')
+        except Exception as e:
+            self.prefetch_path = None
+
+    def _show_poster(self, video_path):
+        """
+        캐시된 포스터 프레임이 있으면 mpv가 첫 화면을 그리기 전까지 표시합니다.
+        
+        Args:
+            video_path: 비디오 파일 경로
+        """
+        image = get_preview_cache().load_image(video_path, POSTER_SUFFIX)
+        if image is None:
+            return
+        try:
+            pixmap = QPixmap.fromImage(image).scaled(
+                self.display_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            self.display_label.setPixmap(pixmap)
+        except Exception as e:
+            pass
+
+    def _load_preview_sprite(self, video_path):
+        """
+        슬라이더 미리보기에 사용할 스프라이트 시트를 캐시에서 읽어 메모리에 둡니다.
+        
+        Args:
+            video_path: 비디오 파일 경로
+        """
+        cache = get_preview_cache()
+        info = cache.load_json(video_path, PREVIEW_INFO_SUFFIX)
+        sprite = cache.load_image(video_path, SPRITE_SUFFIX) if info and info.get('count') else None
+        self.preview_info = info if sprite is not None else None
+        self.preview_sprite = sprite
+
+    def _request_previews(self, paths):
+        """
+        미리보기가 없는 비디오의 포스터/스프라이트 생성을 백그라운드 스레드에 요청합니다.
+        
+        Args:
+            paths: 비디오 경로 목록 (먼저 만들 순서)
+        """
+        if self.preview_thread is None:
+            self.preview_thread = VideoPreviewThread()
+            self.preview_thread.preview_ready.connect(self._on_preview_ready)
+            self.preview_thread.start()
+        self.preview_thread.request(paths)
+
+    def _on_preview_ready(self, video_path):
+        """
+        백그라운드에서 미리보기가 만들어졌을 때 호출됩니다. (GUI 스레드)
+        
+        Args:
+            video_path: 미리보기가 만들어진 비디오 경로
+        """
+        if video_path == self.current_media_path:
+            self._load_preview_sprite(video_path)
+
+    def preview_at(self, value):
+        """
+        슬라이더 값 위치의 미리보기 화면을 반환합니다. (슬라이더 미리보기 제공 함수)
+        
+        Args:
+            value: 슬라이더 값 (밀리초 단위)
+            
+        Returns:
+            QPixmap: 미리보기 화면 또는 None
+        """
+        info, sprite = self.preview_info, self.preview_sprite
+        if not info or sprite is None or not info.get('duration'):
+            return None
+        count = info['count']
+        index = max(0, min(count - 1, int(value / 1000.0 / info['duration'] * count)))
+        width, height = info['tile_width'], info['tile_height']
+        return QPixmap.fromImage(sprite.copy(index * width, 0, width, height))
+
+    def unload(self, release=False):
         """
         현재 로드된 비디오를 언로드합니다.
+        
+        Args:
+            release: True면 미리 열어둔 비디오까지 바로 닫고 플레이어가 파일을 놓을 때까지 기다림
+                     (파일 삭제/이동 전에 사용, False면 탐색용으로 정지를 한 바퀴 미룰 수 있음)
         """
-        # MPV 플레이어 정지 (플레이어가 존재하는 경우)
+        # MPV 플레이어 정지 (플레이어는 다음 파일을 위해 남겨둠)
         if self.mpv_player:
             try:
-                # 플레이어가 재생 중인지 확인
-                if self.mpv_player.playback_time is not None:
-                    self.mpv_player.stop()  # 재생 중지
-                    # mpv 속성 초기화
-                    self.mpv_player.loop = False
-                    self.mpv_player.mute = False
+                if release:
+                    # 현재 파일과 재생 목록에 미리 열어둔 파일을 모두 바로 닫음
+                    self.stop_pending = False
+                    self.prefetch_path = None
+                    self.mpv_player.command('stop')
+                    self.mpv_player.command('playlist-clear')
+                    wait_for_idle(self.mpv_player)
+                elif self.prefetch_path:
+                    # 바로 이어서 미리 열어둔 비디오를 불러올 수 있으므로 일시정지만 하고
+                    # 정지(재생 목록 비우기)는 이벤트 루프 한 바퀴 뒤로 미룸
+                    self.mpv_player.pause = True
+                    self.stop_pending = True
+                    QTimer.singleShot(0, self._stop_pending_playback)
+                else:
+                    self.mpv_player.command('stop')  # 재생 중지 (재생 목록도 비워짐)
             except Exception as e:
                 pass
         
-        # 비디오 타이머 정지
-        if self.video_timer.isActive():
-            self.video_timer.stop()
-        
         # 현재 미디어 경로 초기화
         self.current_media_path = None
         self.is_playing = False
+        self.preview_info = None
+        self.preview_sprite = None
 
-    def _update_video_time(self):
+    def release_file(self, file_path=None):
         """
-        비디오 재생 시간을 업데이트합니다.
+        파일을 삭제하거나 이동하기 전에 플레이어가 열어둔 파일을 바로 닫습니다.
+        
+        Args:
+            file_path: 삭제/이동할 파일 경로
         """
-        if self.mpv_player:
-            self.video_position = self.mpv_player.playback_time
-            self.video_duration = self.mpv_player.duration
+        self.unload(release=True)
+        # 미리보기용 플레이어가 그 파일을 열고 있으면 취소하고 닫을 때까지 기다림
+        if self.preview_thread is not None and file_path:
+            self.preview_thread.cancel(file_path)
 
-            # --- 추가: UI 업데이트 직접 호출 ---
-            # 타이머 콜백에서 직접 UI 업데이트 함수를 호출하여
-            # 내부 상태와 UI가 항상 동기화되도록 함
-            if self.video_position is not None and self.video_duration is not None:
-                self.update_video_playback() # 슬라이더 및 시간 레이블 업데이트
-            # --- 추가 끝 ---
+    def _stop_pending_playback(self):
+        """다른 종류의 파일로 이동했으면 미뤄둔 정지를 수행하고 미리 열어둔 비디오를 정리합니다."""
+        if not self.stop_pending:
+            return
+        self.stop_pending = False
+        self.prefetch_path = None
+        if self.mpv_player:
+            try:
+                self.mpv_player.command('stop')
+            except Exception as e:
+                pass
 
-    def _on_duration_change(self, name, value):
+    def _on_duration_change(self, value):
         """
-        비디오 재생 시간이 변경될 때 호출되는 콜백 함수
+        비디오 전체 길이가 변경될 때 호출됩니다. (GUI 스레드)
         
         Args:
-            name: 속성 이름
-            value: 변경된 값 (재생 시간)
+            value: 변경된 값 (전체 길이, 초)
         """
         self.video_duration = value
+        
+        # 파일 전환 시간 측정 (새 파일의 길이 정보를 처음 받은 시점까지)
+        if value is not None and self.load_started is not None:
+            self.last_switch_ms = (time.perf_counter() - self.load_started) * 1000
+            self.load_started = None
+            # 전환 방식별로 비교할 수 있도록 로그 파일에 기록 (콘솔에는 출력하지 않음)
+            if hasattr(self.parent, 'logger'):
+                method = 'prefetched' if self.load_prefetched else 'loadfile'
+                self.parent.logger.debug(
+                    f"Video switch took {self.last_switch_ms:.1f} ms ({method}): "
+                    f"{os.path.basename(self.current_media_path or '')}"
+                )
 
-    def _on_position_change(self, name, value):
+    def _on_position_change(self, value):
         """
-        비디오 재생 위치가 변경될 때 호출되는 콜백 함수
+        비디오 재생 위치가 변경될 때 호출됩니다. (GUI 스레드, 화면 주사율 이하로 제한됨)
         
         Args:
-            name: 속성 이름
-            value: 변경된 값 (재생 위치)
+            value: 변경된 값 (재생 위치, 초)
         """
         self.video_position = value
+        
+        # 비디오를 표시 중일 때만 슬라이더 및 시간 레이블 업데이트
+        if self.current_media_path and value is not None and self.video_duration:
+            self.update_video_playback()
 
-    def _on_video_end(self, name, value):
+    def _on_video_end(self, value):
         """
-        비디오 재생이 끝났을 때 호출되는 콜백 함수
+        비디오 재생이 끝났을 때 호출됩니다. (GUI 스레드)
         
         Args:
-            name: 속성 이름
             value: 변경된 값 (비디오 종료 상태)
         """
-        # --- 디버깅 출력 추가 ---
-        print(f"DEBUG: _on_video_end called - name: {name}, value: {value}")
-        # --- 추가 끝 ---
-
         if value:  # 종료 상태가 참(True)인 경우에만 처리
-            # --- 디버깅 출력 추가 ---
-            print(f"DEBUG: Video end detected (value is True). Stopping timer and resetting state.")
-            # --- 추가 끝 ---
             self.is_playing = False
             self.video_position = 0
             self.video_duration = 0
-            self.video_timer.stop()
-
-            # 비디오 종료 처리를 위한 on_video_end 메서드 호출
-            # self.on_video_end(name, value) # 이 부분은 MediaSorterPAAK의 on_video_end를 호출하는 것으로 보임. 중복 처리일 수 있음.
-            # 우선 주석 처리하고 MediaSorterPAAK의 핸들러만 사용하도록 유도
 
     def play(self):
         """
@@ -234,7 +434,6 @@ class VideoHandler(MediaHandler):
         if self.mpv_player:
             self.mpv_player.pause = False
             self.is_playing = True
-            self.video_timer.start(100)
 
     def pause(self):
         """
@@ -243,7 +442,6 @@ class VideoHandler(MediaHandler):
         if self.mpv_player:
             self.mpv_player.pause = True
             self.is_playing = False
-            self.video_timer.stop()
 
     def seek(self, position):
         """
@@ -260,6 +458,53 @@ class VideoHandler(MediaHandler):
             except Exception as e:
                 pass
 
+    def scrub(self, position):
+        """
+        슬라이더 드래그 중 위치를 이동합니다.
+        정확한 이동 대신 키프레임 이동을 한 번에 하나씩만 보내고,
+        진행 중인 이동이 끝나면 그 사이 요청된 위치 중 가장 최근 위치로만 이동합니다.
+        
+        Args:
+            position: 이동할 비디오 위치 (초 단위)
+        """
+        self.scrub_target = position
+        self.video_position = position
+        if not self.scrub_in_flight:
+            self._send_scrub_seek()
+
+    def finish_scrub(self, position):
+        """
+        슬라이더 드래그가 끝나면 남은 드래그 이동을 버리고 정확한 위치로 한 번 이동합니다.
+        
+        Args:
+            position: 최종 비디오 위치 (초 단위)
+        """
+        self.scrub_target = None
+        self.scrub_in_flight = False
+        self.scrub_timer.stop()
+        self.seek(position)
+
+    def _send_scrub_seek(self):
+        """가장 최근에 요청된 드래그 위치로 키프레임 이동을 보냅니다."""
+        position, self.scrub_target = self.scrub_target, None
+        if position is None or not self.mpv_player:
+            return
+        try:
+            self.mpv_player.command('seek', position, 'absolute+keyframes')
+            self.scrub_in_flight = True
+            self.scrub_timer.start(SCRUB_SEEK_TIMEOUT)
+        except Exception as e:
+            self.scrub_in_flight = False
+
+    def _on_scrub_seek_done(self):
+        """이동이 끝나면(또는 시간 초과) 기다리던 드래그 위치가 있으면 이어서 보냅니다."""
+        if not self.scrub_in_flight:
+            return
+        self.scrub_in_flight = False
+        self.scrub_timer.stop()
+        if self.scrub_target is not None:
+            self._send_scrub_seek()
+
     def get_duration(self):
         """
         비디오의 전체 재생 시간을 반환합니다.
@@ -365,10 +610,12 @@ class VideoHandler(MediaHandler):
                         self.parent.state_manager.set_state("current_image_path", video_path)  # 상태 관리자 업데이트
                     self.parent.current_media_type = 'video'
                 
-                    # 슬라이더 초기화 및 설정
+                    # 슬라이더 초기화 및 설정 (길이를 미리 알면 재생 전에 범위 설정)
                     if hasattr(self.parent, 'playback_slider'):
-                        self.parent.playback_slider.setRange(0, 0)  # 슬라이더 범위를 0으로 설정
+                        self.parent.playback_slider.setRange(0, int(self.video_duration * 1000))
                         self.parent.playback_slider.setValue(0)  # 슬라이더 초기값을 0으로 설정
+                    if hasattr(self.parent, 'time_label') and self.video_duration:
+                        self.parent.time_label.setText(f"00:00 / {self.format_time(self.video_duration)}")
                     
                     # 재생 버튼 상태 업데이트
                     if hasattr(self.parent, 'play_button'):
@@ -382,6 +629,8 @@ class VideoHandler(MediaHandler):
                             self.parent.slider_released,
                             self.parent.slider_clicked
                         )
+                        # 슬라이더에 마우스를 올리면 해당 위치의 미리보기 표시
+                        self.parent.playback_slider.set_preview_provider(self.preview_at)
                     
                     # 현재 볼륨 슬라이더 값 적용
                     if hasattr(self.parent, 'volume_slider'):
@@ -410,19 +659,6 @@ class VideoHandler(MediaHandler):
                 self.parent.show_message(f"Cannot play video: {str(e)}")
             return False 
             
-    def stop_video_timer(self):
-        """타이머를 중지하는 메서드입니다."""
-        if self.video_timer.isActive():
-            self.video_timer.stop()
-            # parent가 있고 timers 리스트가 있다면 거기서도 제거
-            if self.parent and hasattr(self.parent, 'timers') and self.video_timer in self.parent.timers:
-                self.parent.timers.remove(self.video_timer)
-                
-    def on_video_end(self, name, value):
-        """비디오가 종료될 때 호출되는 메서드입니다."""
-        # 메인 스레드에서 안전하게 타이머를 중지하기 위해 QTimer.singleShot 사용
-        QTimer.singleShot(0, self.stop_video_timer) 
-        
     def stop_video(self):
         """비디오 재생 중지 및 관련 리소스 정리"""
         self.unload()
@@ -438,6 +674,20 @@ class VideoHandler(MediaHandler):
         # 비디오 재생 중지
         self.stop_video()
         return True
+    
+    def shutdown(self):
+        """프로그램 종료 시 재사용하던 비디오 플레이어를 완전히 종료합니다."""
+        self.prefetch_path = None
+        self.unload()
+        if self.preview_thread is not None:
+            self.preview_thread.stop()
+            self.preview_thread = None
+        if self.mpv_player:
+            try:
+                self.mpv_player.terminate()
+            except Exception as e:
+                pass
+            self.mpv_player = None
             
     def restore_video_state(self, was_playing, position):
         """Restore video playback state"""
@@ -519,8 +769,7 @@ class VideoHandler(MediaHandler):
                 self.parent.previous_position = position
 
         except Exception as e:
-            if hasattr(self.parent, 'video_timer') and self.parent.video_timer.isActive():
-                self.parent.video_timer.stop()  # Stop timer
+            pass
                 
     def format_time(self, seconds):
         """
@@ -0,0 +1,194 @@
+# 애니메이션 정보 확인 모듈
+# GIF/WEBP 파일을 디코딩하지 않고 구조만 읽어서 프레임마다의 정보(지연 시간 등)를 알아내요.
+# 프레임을 실제로 디코딩하기 전에 모든 프레임의 재생 시간을 알 수 있어서
+# 재생 타이밍을 정확하게 맞출 수 있어요.
+#
+# 프레임마다 파일 안의 위치(바이트 오프셋), 그리는 영역, 처리 방법(disposal)도 기록해서
+# 중간 프레임으로 이동할 때 파일 처음부터가 아니라 가까운 키프레임(이전 프레임 없이
+# 그릴 수 있는 프레임)부터 디코딩할 수 있게 해줘요.
+
+import mmap  # 큰 파일도 메모리에 모두 읽지 않고 살펴보기 위한 기능
+import struct  # 바이너리 데이터 해석 기능
+
+# 프레임 처리 방법 (다음 프레임을 그리기 전에 이 프레임 영역을 어떻게 할지)
+DISPOSE_NONE = 0        # 그대로 둠
+DISPOSE_BACKGROUND = 2  # 배경(투명)으로 지움
+DISPOSE_PREVIOUS = 3    # 이 프레임을 그리기 전 상태로 되돌림
+
+
+class FrameInfo:
+    """
+    프레임 하나의 정보를 담는 클래스예요.
+
+    속성:
+        delay: 프레임 지연 시간 (밀리초, 정보가 없으면 0)
+        offset: 프레임 데이터가 시작하는 파일 위치 (바이트)
+        rect: 프레임이 그려지는 영역 (x, y, 너비, 높이)
+        disposal: 프레임 처리 방법 (DISPOSE_*)
+        blend: 이전 화면 위에 겹쳐 그리는지 여부 (False면 영역을 덮어씀)
+        opaque: 투명 픽셀이 없는 프레임인지 여부
+        keyframe: 이전 프레임 없이 그릴 수 있는 프레임인지 여부
+    """
+    __slots__ = ('delay', 'offset', 'rect', 'disposal', 'blend', 'opaque', 'keyframe')
+
+    def __init__(self, delay=0, offset=0, rect=(0, 0, 0, 0), disposal=DISPOSE_NONE,
+                 blend=True, opaque=False):
+        self.delay = delay
+        self.offset = offset
+        self.rect = rect
+        self.disposal = disposal
+        self.blend = blend
+        self.opaque = opaque
+        self.keyframe = False
+
+
+class AnimationInfo:
+    """
+    애니메이션 파일 구조 정보를 담는 클래스예요.
+
+    속성:
+        format: 'gif' 또는 'webp'
+        width, height: 화면(캔버스) 크기
+        header: 프레임 데이터 앞에 오는 파일 머리 부분 (바이트)
+        frames: FrameInfo 목록
+        data_end: 마지막 프레임 데이터가 끝나는 파일 위치
+    """
+
+    def __init__(self, format_name, width, height, header, frames, data_end):
+        self.format = format_name
+        self.width = width
+        self.height = height
+        self.header = header
+        self.frames = frames
+        self.data_end = data_end
+        self._mark_keyframes()
+
+    def _mark_keyframes(self):
+        """캔버스 전체를 불투명하게 덮는 프레임(과 첫 프레임)을 키프레임으로 표시해요."""
+        for index, frame in enumerate(self.frames):
+            x, y, width, height = frame.rect
+            covers_canvas = x == 0 and y == 0 and width >= self.width and height >= self.height
+            frame.keyframe = index == 0 or (covers_canvas and (frame.opaque or not frame.blend))
+
+    @property
+    def keyframes(self):
+        """키프레임 번호 목록 (오름차순)"""
+        return [index for index, frame in enumerate(self.frames) if frame.keyframe]
+
+
+def probe_animation(file_path):
+    """
+    애니메이션 파일의 프레임 정보를 읽어요.
+
+    매개변수:
+        file_path: GIF 또는 WEBP 파일 경로
+
+    반환값:
+        AnimationInfo 또는 None (지원하지 않는 형식이거나 읽을 수 없는 경우)
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:6] in (b'GIF87a', b'GIF89a'):
+                    return _probe_gif(data)
+                if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+                    return _probe_webp(data)
+    except (OSError, ValueError, struct.error, IndexError):
+        pass
+    return None
+
+
+def _skip_sub_blocks(data, pos):
+    """GIF 데이터 하위 블록(길이 + 데이터 반복, 길이 0으로 끝남)을 건너뛰어요."""
+    while True:
+        size = data[pos]
+        pos += 1
+        if size == 0:
+            return pos
+        pos += size
+
+
+def _probe_gif(data):
+    """GIF 블록 구조를 따라가며 프레임 정보를 모아요."""
+    frames = []
+    end = len(data)
+    width, height = struct.unpack_from('<HH', data, 6)
+
+    # 논리 화면 설명자 (전역 색상표가 있으면 건너뜀)
+    flags = data[10]
+    pos = 13
+    if flags & 0x80:
+        pos += 3 * (2 << (flags & 0x07))
+    header_end = pos
+
+    delay = 0
+    disposal = DISPOSE_NONE
+    transparent = False
+    frame_start = None  # 현재 프레임에 속한 첫 확장 블록 위치
+    while pos < end:
+        block = data[pos]
+        if block == 0x21:  # 확장 블록
+            if frame_start is None:
+                frame_start = pos
+            label = data[pos + 1]
+            if label == 0xF9 and data[pos + 2] >= 4:  # 그래픽 제어 확장 (지연 시간, 처리 방법)
+                packed = data[pos + 3]
+                disposal = (packed >> 2) & 0x07
+                transparent = bool(packed & 0x01)
+                delay = struct.unpack_from('<H', data, pos + 4)[0] * 10
+            pos = _skip_sub_blocks(data, pos + 2)
+        elif block == 0x2C:  # 이미지 설명자 = 프레임
+            rect = struct.unpack_from('<HHHH', data, pos + 1)
+            frames.append(FrameInfo(delay, pos if frame_start is None else frame_start, rect,
+                                    disposal if disposal in (DISPOSE_BACKGROUND, DISPOSE_PREVIOUS) else DISPOSE_NONE,
+                                    blend=True, opaque=not transparent))
+            delay = 0
+            disposal = DISPOSE_NONE
+            transparent = False
+            frame_start = None
+            image_flags = data[pos + 9]
+            pos += 10
+            if image_flags & 0x80:  # 지역 색상표
+                pos += 3 * (2 << (image_flags & 0x07))
+            pos = _skip_sub_blocks(data, pos + 1)  # LZW 최소 코드 크기 다음 이미지 데이터
+        elif block == 0x3B:  # 파일 끝
+            break
+        else:
+            break  # 손상된 파일 - 읽은 부분까지만 사용
+
+    data_end = frame_start if frame_start is not None else pos
+    return AnimationInfo('gif', width, height, bytes(data[:header_end]), frames, min(data_end, end))
+
+
+def _probe_webp(data):
+    """WEBP RIFF 청크를 따라가며 ANMF(애니메이션 프레임) 정보를 모아요."""
+    frames = []
+    end = min(len(data), 8 + struct.unpack_from('<I', data, 4)[0])
+    width = height = 0
+    header = b''
+    data_end = end
+    pos = 12
+    while pos + 8 <= end:
+        chunk_id = data[pos:pos + 4]
+        chunk_size = struct.unpack_from('<I', data, pos + 4)[0]
+        chunk_end = pos + 8 + chunk_size + (chunk_size & 1)  # 청크는 짝수 크기로 맞춰짐
+        if chunk_id == b'VP8X':
+            header += bytes(data[pos:chunk_end])
+            width = int.from_bytes(data[pos + 12:pos + 15], 'little') + 1
+            height = int.from_bytes(data[pos + 15:pos + 18], 'little') + 1
+        elif chunk_id == b'ANIM':
+            header += bytes(data[pos:chunk_end])
+        elif chunk_id == b'ANMF':
+            # X/2(3) Y/2(3) 너비-1(3) 높이-1(3) 지속 시간(3) 플래그(1)
+            x = int.from_bytes(data[pos + 8:pos + 11], 'little') * 2
+            y = int.from_bytes(data[pos + 11:pos + 14], 'little') * 2
+            frame_width = int.from_bytes(data[pos + 14:pos + 17], 'little') + 1
+            frame_height = int.from_bytes(data[pos + 17:pos + 20], 'little') + 1
+            duration = int.from_bytes(data[pos + 20:pos + 23], 'little')
+            flags = data[pos + 23]
+            frames.append(FrameInfo(duration, pos, (x, y, frame_width, frame_height),
+                                    DISPOSE_BACKGROUND if flags & 0x01 else DISPOSE_NONE,
+                                    blend=not flags & 0x02))
+            data_end = chunk_end
+        pos = chunk_end
+    return AnimationInfo('webp', width, height, header, frames, data_end)
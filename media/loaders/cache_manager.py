@@ -92,39 +92,61 @@ class LRUCache:
             if hasattr(oldest_item, 'cached_size'):
                 self.memory_usage -= oldest_item.cached_size
     
-    def _cleanup_item(self, item):
+    def pop(self, key):
         """
-        캐시 항목을 정리합니다. 특히 QMovie 객체의 경우 특별한 정리 작업을 수행합니다.
+        항목을 정리하지 않고 캐시에서 꺼내요. 꺼낸 항목은 호출한 쪽에서 계속 사용해요.
+        
+        매개변수:
+            key: 꺼낼 항목의 키
+            
+        반환값:
+            꺼낸 항목 또는 None (항목이 없을 때)
+        """
+        item = self.cache.pop(key, None)
+        if item is not None and hasattr(item, 'cached_size'):
+            self.memory_usage -= item.cached_size
+        return item
+    
+    def remove(self, key):
+        """
+        항목을 캐시에서 제거하고 리소스를 정리해요.
+        
+        매개변수:
+            key: 제거할 항목의 키
+        """
+        item = self.pop(key)
+        if item is not None:
+            self._cleanup_item(item, deferred=False)
+    
+    def _cleanup_item(self, item, deferred=True):
+        """
+        캐시 항목을 정리합니다. 특히 QMovie 객체와 보관 중인 애니메이션 상태를 해제합니다.
         
         매개변수:
             item: 정리할 캐시 항목
+            deferred: True면 폐기 큐에 맡겨 이벤트 루프가 한 바퀴 돈 뒤 해제
+                      (False면 바로 해제 - 파일을 삭제/이동하기 전처럼 즉시 놓아야 할 때)
         """
         try:
-            # QMovie 객체 확인
             from PyQt5.QtGui import QMovie
-            from PyQt5.QtWidgets import QApplication
+            from core.memory.disposal_queue import get_disposal_queue
             
             if isinstance(item, QMovie):
-                # 애니메이션 중지
+                # 애니메이션 중지 후 연결된 시그널 해제
                 item.stop()
-                
-                # 모든 시그널 연결 해제
                 try:
                     item.frameChanged.disconnect()
-                    item.stateChanged.disconnect()
-                    item.error.disconnect()
-                    item.finished.disconnect()
-                    item.started.disconnect()
-                except:
+                except TypeError:
                     pass  # 연결된 시그널이 없거나 이미 해제된 경우
-                
-                # 삭제 요청
-                item.deleteLater()
-                
-                # 이벤트 처리를 강제로 수행하여 삭제 요청 처리
-                QApplication.processEvents()
+                get_disposal_queue().dispose(item)
+            elif hasattr(item, 'dispose'):
+                # 보관 중인 애니메이션 상태 등 스스로 정리할 수 있는 항목
+                if deferred:
+                    get_disposal_queue().dispose(item)
+                else:
+                    item.dispose()
         except Exception as e:
-            pass    
+            pass
     
     def __len__(self):
         """
@@ -135,50 +157,11 @@ class LRUCache:
     def clear(self):
         """
         캐시의 모든 항목을 제거하고 메모리 사용량을 0으로 초기화해요.
-        특별히 QMovie 객체를 포함하는 항목의 경우 리소스를 확실히 정리합니다.
+        QMovie 객체나 보관 중인 애니메이션 상태는 바로 정리해요.
         """
-        # 항목을 제거하기 전에 QMovie 객체가 있는지 확인하고 정리
-        try:
-            from PyQt5.QtGui import QMovie
-            from PyQt5.QtWidgets import QApplication
-            
-            # 캐시에 있는 모든 항목을 순회하며 QMovie 객체 확인
-            for key, item in list(self.cache.items()):
-                # QMovie 객체인 경우 리소스 정리
-                if isinstance(item, QMovie):
-                    try:
-                        # 애니메이션 중지
-                        item.stop()
-                        
-                        # 모든 시그널 연결 해제
-                        try:
-                            item.frameChanged.disconnect()
-                            item.stateChanged.disconnect()
-                            item.error.disconnect()
-                            item.finished.disconnect()
-                            item.started.disconnect()
-                        except:
-                            pass  # 연결된 시그널이 없거나 이미 해제된 경우
-                        
-                        # 삭제 요청
-                        item.deleteLater()
-                        
-                        # 이벤트 처리를 강제로 수행하여 삭제 요청 처리
-                        QApplication.processEvents()
-                    except Exception as e:
-                        pass
-        except Exception as e:
-            pass
-        
-        # 메모리 정리를 위한 가비지 컬렉션 호출
-        try:
-            import gc
-            gc.collect()
-            # 이벤트 처리
-            QApplication.processEvents()
-        except:
-            pass
+        for item in list(self.cache.values()):
+            self._cleanup_item(item, deferred=False)
             
         # 모든 항목 제거
         self.cache.clear()
-        self.memory_usage = 0
\ No newline at end of file
+        self.memory_usage = 0
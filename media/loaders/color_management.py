@@ -0,0 +1,151 @@
+# 색 관리 모듈
+# 이미지에 들어 있는 ICC 프로파일(Adobe RGB, Display P3 등)을 화면용 sRGB로 바꿔줘요.
+#
+# 프로파일마다 색 변환을 한 번만 만들고, 프로파일 내용의 해시를 키로 저장해서 계속 재사용해요.
+# 변환은 가능한 한 이미지 메모리에 바로(in-place) 적용하고,
+# 프로파일이 없거나 이미 sRGB인 이미지는 아무 작업도 하지 않아요.
+
+import hashlib  # 프로파일 해시 계산
+import threading  # 변환 캐시 보호 (로더 스레드에서도 사용)
+from io import BytesIO  # 프로파일 바이트를 파일처럼 읽기
+
+from PyQt5.QtGui import QImage, QPixmap  # Qt 이미지 형식
+
+from core.utils.lazy_import import lazy_import
+
+# ICC 프로파일 처리 (LittleCMS를 불러오므로 프로파일이 있는 이미지를 처음 열 때 임포트)
+ImageCms = lazy_import('PIL.ImageCms')
+
+try:
+    from PyQt5.QtGui import QColorSpace  # Qt 5.14 이상에서만 제공
+except ImportError:
+    QColorSpace = None
+
+# 프로파일 해시 -> 변환 (None이면 변환할 필요 없음)
+_pil_transforms = {}
+_qt_transforms = {}
+_lock = threading.Lock()
+_srgb_profile = None
+
+
+def _profile_key(profile_bytes, *extra):
+    """프로파일 내용으로 캐시 키를 만들어요."""
+    return (hashlib.sha1(profile_bytes).hexdigest(),) + extra
+
+
+def _get_srgb_profile():
+    """sRGB 프로파일 (한 번만 만듦)"""
+    global _srgb_profile
+    if _srgb_profile is None:
+        _srgb_profile = ImageCms.ImageCmsProfile(ImageCms.createProfile('sRGB'))
+    return _srgb_profile
+
+
+def _get_pil_transform(profile_bytes, in_mode, out_mode):
+    """
+    프로파일에서 sRGB로 가는 PIL 색 변환을 반환해요. 처음 한 번만 만들어요.
+
+    반환값:
+        ImageCms 변환 또는 None (sRGB 프로파일이거나 만들 수 없는 경우)
+    """
+    key = _profile_key(profile_bytes, in_mode, out_mode)
+    with _lock:
+        if key in _pil_transforms:
+            return _pil_transforms[key]
+
+    transform = None
+    try:
+        profile = ImageCms.ImageCmsProfile(BytesIO(profile_bytes))
+        description = ImageCms.getProfileDescription(profile).strip().lower()
+        # 이미 sRGB인 RGB 이미지는 변환하지 않음
+        if not (in_mode == out_mode and description.startswith('srgb')):
+            transform = ImageCms.buildTransform(profile, _get_srgb_profile(), in_mode, out_mode)
+    except (ImageCms.PyCMSError, OSError, ValueError) as e:
+        print(f"Failed to build color transform: {str(e)}")
+
+    with _lock:
+        _pil_transforms[key] = transform
+    return transform
+
+
+def convert_to_srgb(image):
+    """
+    PIL 이미지를 sRGB로 바꿔요. RGB/RGBA 이미지는 제자리에서 변환해요.
+
+    매개변수:
+        image: PIL 이미지
+
+    반환값:
+        sRGB PIL 이미지 (프로파일이 없거나 이미 sRGB면 같은 이미지)
+    """
+    profile_bytes = image.info.get('icc_profile')
+    if not profile_bytes:
+        return image
+
+    if image.mode in ('RGB', 'RGBA'):
+        in_mode = out_mode = image.mode
+    elif image.mode == 'CMYK':
+        in_mode, out_mode = 'CMYK', 'RGB'
+    else:
+        return image
+
+    transform = _get_pil_transform(profile_bytes, in_mode, out_mode)
+    if transform is None:
+        return image
+    try:
+        if in_mode == out_mode:
+            ImageCms.applyTransform(image, transform, inPlace=True)
+        else:
+            image = ImageCms.applyTransform(image, transform)
+    except (ImageCms.PyCMSError, ValueError) as e:
+        print(f"Failed to apply color transform: {str(e)}")
+        return image
+    # PNG로 다시 저장할 때 원래 프로파일이 따라가지 않도록 제거
+    image.info.pop('icc_profile', None)
+    return image
+
+
+def convert_qimage_to_srgb(image):
+    """
+    Qt가 읽은 이미지의 색 공간을 sRGB로 바꿔요. (제자리 변환)
+
+    매개변수:
+        image: QImage
+
+    반환값:
+        같은 QImage (색 공간 정보가 없거나 이미 sRGB면 그대로)
+    """
+    if QColorSpace is None or image.isNull():
+        return image
+    color_space = image.colorSpace()
+    srgb = QColorSpace(QColorSpace.SRgb)
+    if not color_space.isValid() or color_space == srgb:
+        return image
+
+    key = _profile_key(bytes(color_space.iccProfile()))
+    with _lock:
+        transform = _qt_transforms.get(key)
+    if transform is None:
+        transform = color_space.transformationToColorSpace(srgb)
+        with _lock:
+            _qt_transforms[key] = transform
+    image.applyColorTransform(transform)
+    image.setColorSpace(srgb)
+    return image
+
+
+def load_color_managed_pixmap(file_path):
+    """
+    파일을 읽어 sRGB로 맞춘 QPixmap을 만들어요.
+    QPixmap(경로)는 색 공간 정보를 버리기 때문에 QImage로 읽어서 변환한 뒤 바꿔요.
+
+    매개변수:
+        file_path: 이미지 파일 경로
+
+    반환값:
+        QPixmap (읽지 못하면 빈 QPixmap)
+    """
+    image = QImage(file_path)
+    if image.isNull():
+        return QPixmap()
+    return QPixmap.fromImage(convert_qimage_to_srgb(image))
@@ -0,0 +1,610 @@
+# 애니메이션 프레임 엔진 모듈
+# GIF/WEBP 애니메이션의 프레임을 별도의 스레드에서 미리 디코딩해두는 기능을 제공해요.
+# QMovie의 CacheAll 모드는 모든 프레임을 원본 크기로 기억해서 프레임이 많은
+# 애니메이션은 수 GB까지 메모리를 차지해요. 이 엔진은 재생 위치 앞쪽의 일정 구간만
+# 정해진 메모리 한도 안에서 기억하고, 지나간 프레임은 지워서 메모리 사용량을 일정하게 유지해요.
+# 화면에 표시할 프레임(회전 + 화면 크기 조정)도 같은 스레드에서 프레임마다 한 번만 만들어두므로
+# GUI 스레드는 만들어진 프레임을 그리기만 하면 돼요.
+# 멀리 떨어진 프레임으로 이동할 때는 파일 구조 색인(키프레임 위치)과 주기적으로 남겨둔
+# 완성 프레임(스냅샷) 중 가장 가까운 곳부터 디코딩해서 이동 시간이 일정하게 유지돼요.
+
+import bisect  # 정렬된 키프레임 목록에서 가까운 키프레임 찾기
+import struct  # WEBP 파일 머리 부분 만들기
+import threading  # 디코딩 스레드와 재생 위치를 주고받기 위한 동기화 도구
+from collections import OrderedDict  # 디코딩된 프레임을 순서대로 보관하는 자료형
+
+from PyQt5.QtCore import Qt, QThread, QObject, QIODevice, QRect, pyqtSignal  # 스레드 생성과 신호 전달 기능
+from PyQt5.QtGui import QImage, QImageReader, QTransform, QPainter  # 프레임 디코딩과 회전 기능
+
+from media.loaders.animation_probe import (  # 디코딩 없이 프레임 정보 읽기
+    probe_animation, DISPOSE_BACKGROUND, DISPOSE_PREVIOUS
+)
+
+# 애니메이션 하나가 사용할 수 있는 최대 프레임 메모리 (바이트)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 화면 표시용(회전/크기 조정된) 프레임이 사용할 수 있는 최대 메모리 (바이트)
+DEFAULT_DISPLAY_MAX_BYTES = 64 * 1024 * 1024
+
+# 메모리 한도와 관계없이 미리 디코딩해둘 최소 프레임 수
+MIN_WINDOW_FRAMES = 2
+
+# 프레임 지연 시간 정보가 없을 때 사용할 기본값 (밀리초)
+DEFAULT_FRAME_DELAY = 100
+
+# 이동용 스냅샷(완성 프레임)이 사용할 수 있는 최대 메모리 (바이트)
+DEFAULT_SNAPSHOT_MAX_BYTES = 32 * 1024 * 1024
+
+# 스냅샷을 남기는 최소 프레임 간격
+MIN_SNAPSHOT_INTERVAL = 8
+
+# 디코더를 새로 여는 비용 (프레임 수로 환산) - 이보다 가까우면 이어서 디코딩
+RESTART_COST = 2
+
+# 합성 GIF 맨 앞에 넣는 1x1 투명 프레임 (Qt가 첫 프레임 전에 캔버스를 투명하게 채우도록 함)
+_GIF_BLANK_FRAME = (b'\x21\xf9\x04\x05\x00\x00\x00\x00'              # 그래픽 제어 확장: 투명색 0번
+                    b'\x2c\x00\x00\x00\x00\x01\x00\x01\x00\x00'    # 이미지 설명자: (0, 0) 1x1
+                    b'\x02\x02\x44\x01\x00')                          # 0번 색 픽셀 하나 (LZW)
+
+
+def _image_bytes(image):
+    """QImage가 차지하는 메모리 크기(바이트)를 계산해요."""
+    return image.bytesPerLine() * image.height()
+
+
+def _render_display_frame(image, rotation, width, height):
+    """
+    원본 프레임을 회전하고 표시 영역 크기에 맞게 조정해요.
+
+    매개변수:
+        image: 원본 프레임 (QImage)
+        rotation: 회전 각도
+        width, height: 표시 영역 크기
+
+    반환값:
+        QImage: 화면에 바로 그릴 수 있는 프레임 (ARGB32_Premultiplied)
+    """
+    if rotation:
+        # 90도 단위 회전은 픽셀 위치만 바뀌므로 화질 손실이 없음
+        image = image.transformed(QTransform().rotate(rotation), Qt.SmoothTransformation)
+    image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # 그리기(blit) 때 추가 변환이 없도록 화면 출력에 가장 빠른 형식으로 변환
+    return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+
+def _clear_rect(image, rect):
+    """이미지의 영역을 투명하게 지워요."""
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode_Source)
+    painter.fillRect(QRect(*rect), Qt.transparent)
+    painter.end()
+
+
+class _SpliceDevice(QIODevice):
+    """
+    머리 부분(바이트) + 파일의 일부 구간 + 꼬리 부분(바이트)을 하나로 이어서 보여주는 읽기 전용 장치예요.
+    파일 전체를 메모리에 올리지 않고 중간 프레임부터 시작하는 애니메이션 파일을 만들 때 사용해요.
+    """
+
+    def __init__(self, prefix, file_path, start, end, suffix=b''):
+        super().__init__()
+        self._file = open(file_path, 'rb')
+        # (시작 위치, 끝 위치, 데이터 또는 파일 오프셋)
+        self._segments = []
+        position = 0
+        for data in (prefix, (start, end), suffix):
+            length = data[1] - data[0] if isinstance(data, tuple) else len(data)
+            if length > 0:
+                self._segments.append((position, position + length, data))
+                position += length
+        self._size = position
+        self._offset = 0
+
+    def isSequential(self):
+        return False
+
+    def size(self):
+        return self._size
+
+    def seek(self, pos):
+        self._offset = pos
+        return super().seek(pos)
+
+    def readData(self, max_size):
+        chunks = []
+        remaining = min(max_size, self._size - self._offset)
+        for seg_start, seg_end, data in self._segments:
+            if remaining <= 0:
+                break
+            if self._offset >= seg_end or self._offset < seg_start:
+                continue
+            length = min(remaining, seg_end - self._offset)
+            inner = self._offset - seg_start
+            if isinstance(data, tuple):
+                self._file.seek(data[0] + inner)
+                chunk = self._file.read(length)
+            else:
+                chunk = data[inner:inner + length]
+            chunks.append(chunk)
+            self._offset += len(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+
+    def writeData(self, data):
+        return -1
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class _FrameSource:
+    """
+    프레임을 차례로 만들어내는 디코더예요.
+
+    start_index가 0이면 파일을 처음부터 읽고, 아니면 파일 머리 부분 뒤에 start_index 프레임부터의
+    데이터를 이어 붙인 애니메이션을 읽어요. base(스냅샷)가 있으면 읽은 프레임을 base 위에 합성해요.
+    키프레임부터 시작할 때는 이전 프레임이 필요 없으므로 base 없이 읽어요.
+    """
+
+    def __init__(self, file_path, start_index=0, base=None, info=None):
+        self.next_index = start_index
+        self.base = base
+        self.info = info
+        self.device = None
+
+        if start_index == 0 and base is None:
+            self.reader = QImageReader(file_path)
+            return
+
+        frames = info.frames
+        start = frames[start_index].offset
+        if info.format == 'gif':
+            prefix = info.header + _GIF_BLANK_FRAME
+            self.device = _SpliceDevice(prefix, file_path, start, info.data_end, b'\x3b')
+        else:
+            riff_size = 4 + len(info.header) + (info.data_end - start)
+            prefix = b'RIFF' + struct.pack('<I', riff_size) + b'WEBP' + info.header
+            self.device = _SpliceDevice(prefix, file_path, start, info.data_end)
+        self.device.open(QIODevice.ReadOnly | QIODevice.Unbuffered)
+        self.reader = QImageReader(self.device, info.format.encode('ascii'))
+        if info.format == 'gif':
+            self.reader.read()  # 앞에 넣은 투명 프레임 건너뛰기
+
+    def read(self):
+        """
+        다음 프레임을 읽어요.
+
+        반환값:
+            (QImage, 지연 시간) 또는 None (더 읽을 프레임이 없는 경우)
+        """
+        image = self.reader.read()
+        if image.isNull():
+            return None
+        index = self.next_index
+        self.next_index += 1
+        delay = self.reader.nextImageDelay()
+
+        if self.base is not None:
+            frame = self.info.frames[index] if index < len(self.info.frames) else None
+            if frame is not None and not frame.blend:
+                _clear_rect(self.base, frame.rect)  # 덮어쓰는 프레임 영역은 스냅샷에서 지움
+            canvas = self.base.copy()
+            painter = QPainter(canvas)
+            painter.drawImage(0, 0, image)
+            painter.end()
+            image = canvas
+            if frame is not None and frame.disposal == DISPOSE_BACKGROUND:
+                _clear_rect(self.base, frame.rect)  # 다음 프레임부터는 지워진 영역
+        return image, delay
+
+    def close(self):
+        """파일을 닫아요. (경로로 연 리더도 지워서 파일 핸들을 놓음)"""
+        self.reader = None
+        if self.device is not None:
+            self.device.close()
+            self.device = None
+
+
+class FrameDecodeThread(QThread):
+    """
+    애니메이션 프레임을 순서대로 디코딩하는 백그라운드 스레드예요.
+
+    GIF/WEBP는 이전 프레임 위에 다음 프레임을 덧그리는 방식이라 중간 프레임부터
+    바로 읽을 수 없어요. 그래서 한 번 연 디코더로 앞에서부터 차례로 읽고,
+    필요한 프레임이 이미 지나갔거나 멀리 떨어진 경우에만 가장 가까운 키프레임이나
+    스냅샷에서 디코더를 새로 열어요.
+    """
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+
+    def run(self):
+        """엔진이 요청한 구간의 프레임을 디코딩해요."""
+        engine = self.engine
+        source = None  # 현재 디코더 (_FrameSource)
+
+        # 디코딩 전에 파일 구조만 읽어서 모든 프레임의 지연 시간과 위치를 미리 채움
+        # (보관 후 다시 시작할 때는 이미 읽은 색인을 그대로 사용)
+        if engine.animation_info is None:
+            engine._apply_probe(probe_animation(engine.file_path))
+
+        while True:
+            with engine.condition:
+                # 보관(park)되면 스레드를 끝내고 파일을 닫음 (다시 볼 때 resume()으로 새로 시작)
+                while not engine.stopped and not engine.parked:
+                    job = engine._next_job()
+                    if job is not None:
+                        break
+                    engine.condition.wait()
+                if engine.stopped or engine.parked:
+                    break
+                action, target = job
+                if action == 'render':
+                    source_image = engine.frames[target]
+                    display_key = engine.display_key
+                else:
+                    # 이어서 디코딩할지, 가까운 키프레임/스냅샷에서 새로 시작할지 결정
+                    start = engine._choose_start(target, source.next_index if source else None)
+
+            if action == 'render':
+                # 화면 표시용 프레임 만들기 (잠금 없이 수행)
+                rotation, width, height = display_key
+                image = _render_display_frame(source_image, rotation, width, height)
+                with engine.condition:
+                    if engine.stopped or engine.parked:
+                        break
+                    # 만드는 동안 표시 설정이나 재생 위치가 바뀌었으면 버림
+                    if engine.display_key != display_key or not engine._in_display_window(target):
+                        continue
+                    engine.display_frames[target] = image
+                    engine.display_bytes += _image_bytes(image)
+                engine.frame_ready.emit(target)
+                continue
+
+            if start is not None:
+                if source is not None:
+                    source.close()
+                start_index, base = start
+                source = _FrameSource(engine.file_path, start_index, base, engine.animation_info)
+
+            index = source.next_index
+            result = source.read()
+            if result is None:
+                with engine.condition:
+                    if index == 0:
+                        engine.stopped = True  # 첫 프레임도 읽을 수 없는 파일
+                    elif index < engine.frame_count:
+                        engine.frame_count = index  # 실제 프레임 수가 더 적은 파일
+                        engine._evict_outside_window()
+                source.close()
+                source = None
+                continue
+
+            image, delay = result
+            if engine.compact:
+                # 256색 이하 프레임은 색상표 방식으로 보관 (메모리 1/4)
+                image = image.convertToFormat(QImage.Format_Indexed8, Qt.AvoidDither)
+
+            with engine.condition:
+                if engine.stopped:
+                    break
+                engine.delays[index] = delay if delay > 0 else DEFAULT_FRAME_DELAY
+                engine._keep_snapshot(index, image)
+                # 지나가는 길에 읽은 프레임은 재생 구간 안에 있을 때만 보관
+                if index not in engine.frames and engine._in_window(index):
+                    engine.frames[index] = image
+                    engine.memory_bytes += _image_bytes(image)
+
+        if source is not None:
+            source.close()
+
+
+class AnimationFrameEngine(QObject):
+    """
+    메모리 한도가 있는 애니메이션 프레임 엔진 클래스예요.
+
+    재생 위치(position)부터 앞쪽으로 window 개의 프레임을 링 버퍼처럼 보관해요.
+    window는 메모리 한도 / 프레임 크기로 정해지고, 모든 프레임이 한도 안에 들어가는
+    작은 애니메이션은 한 번 디코딩한 프레임을 계속 재사용해요.
+
+    set_display()로 (회전 각도, 표시 영역 크기)를 알려주면 원본 프레임마다 한 번씩
+    화면 표시용 프레임을 만들어 display_frames에 보관해요. 이것도 별도의 메모리 한도
+    안에서 재생 위치 앞쪽 display_window 개만 보관해요.
+
+    신호(Signals):
+        frame_ready: 화면 표시용 프레임이 준비되었을 때 (프레임 번호)
+    """
+    frame_ready = pyqtSignal(int)
+
+    def __init__(self, file_path, max_bytes=DEFAULT_MAX_BYTES, compact=False,
+                 display_max_bytes=DEFAULT_DISPLAY_MAX_BYTES,
+                 snapshot_max_bytes=DEFAULT_SNAPSHOT_MAX_BYTES, parent=None):
+        """
+        AnimationFrameEngine 초기화
+
+        매개변수:
+            file_path: 애니메이션 파일 경로
+            max_bytes: 보관할 프레임의 최대 메모리 크기 (바이트)
+            compact: 프레임을 색상표(Indexed8) 형식으로 보관할지 여부 (GIF용)
+            display_max_bytes: 보관할 화면 표시용 프레임의 최대 메모리 크기 (바이트)
+            snapshot_max_bytes: 이동용 스냅샷의 최대 메모리 크기 (바이트)
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.display_max_bytes = display_max_bytes
+        self.snapshot_max_bytes = snapshot_max_bytes
+        self.compact = compact
+
+        reader = QImageReader(file_path)
+        self.frame_count = max(reader.imageCount(), 1)
+        self.frame_size = reader.size()
+
+        # 프레임 하나의 크기로 보관할 수 있는 프레임 수 계산
+        bytes_per_pixel = 1 if compact else 4
+        self.frame_bytes = max(self.frame_size.width() * self.frame_size.height() * bytes_per_pixel, 1)
+        self.window = max(MIN_WINDOW_FRAMES, max_bytes // self.frame_bytes)
+
+        self.frames = OrderedDict()  # 프레임 번호 -> QImage
+        self.delays = [None] * self.frame_count  # 프레임 번호 -> 지연 시간 (밀리초)
+        self.memory_bytes = 0
+        self.display_key = None  # (회전 각도, 너비, 높이)
+        self.display_frames = {}  # 프레임 번호 -> 화면 표시용 QImage
+        self.display_bytes = 0
+        self.display_window = 0
+        self.animation_info = None  # 파일 구조 색인 (AnimationInfo)
+        self.keyframes = [0]
+        self.snapshots = {}  # 프레임 번호 -> 완성 프레임 (GIF 이동용)
+        self.snapshot_bytes = 0
+        self.snapshot_interval = 0  # 0이면 스냅샷을 남기지 않음
+        self.position = 0
+        self.parked = False  # 다른 파일을 보는 동안 캐시에 보관 중인지 여부 (디코딩 쉼)
+        self.stopped = False
+        self.condition = threading.Condition()
+
+        self.decode_thread = FrameDecodeThread(self)
+
+    def start(self):
+        """프레임 디코딩을 시작해요."""
+        if not self.decode_thread.isRunning():
+            self.decode_thread.start()
+
+    def _apply_probe(self, animation_info):
+        """파일 구조에서 읽은 프레임 지연 시간과 색인을 반영해요."""
+        if animation_info is None:
+            return
+        with self.condition:
+            for index, frame in enumerate(animation_info.frames[:self.frame_count]):
+                if self.delays[index] is None and frame.delay > 0:
+                    self.delays[index] = frame.delay
+
+            # 색인의 프레임 수가 디코더와 다르면 (손상된 파일 등) 색인으로 이동하지 않음
+            if len(animation_info.frames) != self.frame_count or not animation_info.header:
+                return
+            self.animation_info = animation_info
+            self.keyframes = animation_info.keyframes
+
+            # 모든 프레임을 보관하지 못하는 GIF는 스냅샷을 한도 안에서 고르게 남김
+            # (WEBP는 Qt의 배경 처리 방식에 의존하므로 키프레임에서만 시작)
+            if animation_info.format == 'gif' and not self.keeps_all_frames():
+                snapshot_count = max(self.snapshot_max_bytes // self.frame_bytes, 1)
+                self.snapshot_interval = max(MIN_SNAPSHOT_INTERVAL, -(-self.frame_count // snapshot_count))
+
+    def _keep_snapshot(self, index, image):
+        """스냅샷 간격에 맞는 프레임이면 이동용으로 남겨둬요. (condition 잠금 상태에서 호출)"""
+        if (not self.snapshot_interval or index % self.snapshot_interval or index in self.snapshots or
+                self.animation_info.frames[index].disposal == DISPOSE_PREVIOUS):
+            return
+        if self.snapshot_bytes + _image_bytes(image) > self.snapshot_max_bytes:
+            return
+        self.snapshots[index] = image  # QImage는 복사 없이 공유됨
+        self.snapshot_bytes += _image_bytes(image)
+
+    def _choose_start(self, target, next_index):
+        """
+        target 프레임을 디코딩할 시작 위치를 골라요. (condition 잠금 상태에서 호출)
+
+        매개변수:
+            target: 디코딩할 프레임 번호
+            next_index: 현재 디코더가 다음에 읽을 프레임 번호 (디코더가 없으면 None)
+
+        반환값:
+            None (현재 디코더로 이어서 디코딩) 또는 (시작 프레임 번호, 합성 기준 이미지 또는 None)
+        """
+        continue_cost = None
+        if next_index is not None and next_index <= target < self.frame_count:
+            continue_cost = target - next_index
+            if continue_cost <= RESTART_COST:
+                return None
+
+        if self.animation_info is None:
+            return None if continue_cost is not None else (0, None)
+
+        # 가장 가까운 키프레임 (이전 프레임 없이 디코딩 가능)
+        keyframe = self.keyframes[bisect.bisect_right(self.keyframes, target) - 1]
+        best_cost, best_start = target - keyframe + RESTART_COST, (keyframe, None)
+
+        # 가장 가까운 스냅샷 또는 보관 중인 프레임 (GIF만)
+        if self.animation_info.format == 'gif':
+            frames = self.animation_info.frames
+            candidates = [index for index in list(self.snapshots) + list(self.frames)
+                          if index < target and frames[index].disposal != DISPOSE_PREVIOUS]
+            if candidates:
+                nearest = max(candidates)
+                cost = target - nearest - 1 + RESTART_COST
+                if cost < best_cost:
+                    image = self.snapshots.get(nearest)
+                    if image is None:
+                        image = self.frames[nearest]
+                    # 합성할 기준 이미지 (원본을 바꾸지 않도록 복사)
+                    base = image.convertToFormat(QImage.Format_ARGB32_Premultiplied).copy()
+                    if frames[nearest].disposal == DISPOSE_BACKGROUND:
+                        _clear_rect(base, frames[nearest].rect)
+                    best_cost, best_start = cost, (nearest + 1, base)
+
+        if continue_cost is not None and continue_cost <= best_cost:
+            return None
+        return best_start
+
+    def keeps_all_frames(self):
+        """모든 프레임을 메모리 한도 안에 보관할 수 있는지 확인해요."""
+        return self.window >= self.frame_count
+
+    def _in_window(self, index):
+        """프레임이 현재 보관 구간 안에 있는지 확인해요. (condition 잠금 상태에서 호출)"""
+        if self.keeps_all_frames():
+            return index < self.frame_count
+        return (index - self.position) % self.frame_count < self.window
+
+    def _in_display_window(self, index):
+        """화면 표시용 프레임을 보관할 구간 안에 있는지 확인해요. (condition 잠금 상태에서 호출)"""
+        if index >= self.frame_count or not self._in_window(index):
+            return False
+        return (index - self.position) % self.frame_count < self.display_window
+
+    def _next_job(self):
+        """
+        재생 순서대로 다음에 할 일을 찾아요. (condition 잠금 상태에서 호출)
+
+        반환값:
+            ('decode', 프레임 번호), ('render', 프레임 번호) 또는 None (할 일 없음)
+        """
+        if self.parked:
+            return None
+        for offset in range(min(self.window, self.frame_count)):
+            index = (self.position + offset) % self.frame_count
+            if index not in self.frames:
+                return ('decode', index)
+            if (self.display_key is not None and offset < self.display_window and
+                    index not in self.display_frames):
+                return ('render', index)
+        return None
+
+    def _evict_outside_window(self):
+        """보관 구간을 벗어난(지나간) 프레임을 지워요. (condition 잠금 상태에서 호출)"""
+        for index in [index for index in self.frames if not self._in_window(index)]:
+            self.memory_bytes -= _image_bytes(self.frames.pop(index))
+        for index in [index for index in self.display_frames if not self._in_display_window(index)]:
+            self.display_bytes -= _image_bytes(self.display_frames.pop(index))
+
+    def set_display(self, rotation, width, height):
+        """
+        화면 표시 설정(회전 각도, 표시 영역 크기)을 바꿔요.
+        설정이 바뀌면 만들어둔 화면 표시용 프레임을 버리고 새 설정으로 다시 만들어요.
+
+        매개변수:
+            rotation: 회전 각도
+            width, height: 표시 영역 크기
+        """
+        if width <= 0 or height <= 0:
+            return
+        key = (rotation % 360, width, height)
+        with self.condition:
+            if key == self.display_key:
+                return
+            self.display_key = key
+            self.display_frames.clear()
+            self.display_bytes = 0
+
+            # 화면 표시용 프레임 하나의 크기로 보관할 수 있는 프레임 수 계산
+            frame_width, frame_height = self.frame_size.width(), self.frame_size.height()
+            if key[0] in (90, 270):
+                frame_width, frame_height = frame_height, frame_width
+            scale = min(width / max(frame_width, 1), height / max(frame_height, 1))
+            frame_bytes = max(int(frame_width * scale) * int(frame_height * scale) * 4, 1)
+            self.display_window = max(MIN_WINDOW_FRAMES, self.display_max_bytes // frame_bytes)
+            self.condition.notify()
+
+    def set_position(self, index):
+        """
+        재생 위치를 알려줘요. 지나간 프레임은 지우고 앞쪽 프레임 디코딩을 요청해요.
+
+        매개변수:
+            index: 현재 재생 중인 프레임 번호
+        """
+        with self.condition:
+            index = index % self.frame_count
+            if index == self.position and self.frames:
+                return
+            self.position = index
+            self._evict_outside_window()
+            self.condition.notify()
+
+    def get_frame(self, index):
+        """
+        디코딩된 원본 프레임을 가져와요.
+
+        매개변수:
+            index: 프레임 번호
+
+        반환값:
+            QImage 또는 None (아직 디코딩되지 않은 경우)
+        """
+        with self.condition:
+            return self.frames.get(index)
+
+    def get_display_frame(self, index):
+        """
+        화면 표시용(회전/크기 조정된) 프레임을 가져와요.
+
+        매개변수:
+            index: 프레임 번호
+
+        반환값:
+            QImage 또는 None (아직 만들어지지 않은 경우)
+        """
+        with self.condition:
+            return self.display_frames.get(index)
+
+    def get_delay(self, index):
+        """프레임의 지연 시간(밀리초)을 가져와요. 아직 모르면 기본값을 돌려줘요."""
+        with self.condition:
+            if 0 <= index < len(self.delays) and self.delays[index]:
+                return self.delays[index]
+        return DEFAULT_FRAME_DELAY
+
+    def park(self):
+        """
+        다른 파일로 이동할 때 디코딩 스레드를 끝내서 파일을 닫고 화면 표시용 프레임을 버려요.
+        디코딩된 원본 프레임과 스냅샷은 남겨두므로 다시 돌아오면 바로 이어서 재생할 수 있어요.
+        보관 중에는 스레드도 파일도 붙잡고 있지 않으므로 그 파일을 지우거나 옮길 수 있어요.
+        """
+        with self.condition:
+            self.parked = True
+            self.display_key = None
+            self.display_frames.clear()
+            self.display_bytes = 0
+            self.condition.notify()
+        if self.decode_thread.isRunning():
+            self.decode_thread.wait()
+
+    def resume(self):
+        """보관했던 엔진으로 디코딩 스레드를 다시 시작해요. (파일을 다시 열어요)"""
+        with self.condition:
+            self.parked = False
+        if not self.stopped:
+            self.start()
+
+    def memory_usage_mb(self):
+        """보관 중인 프레임(원본 + 화면 표시용 + 스냅샷)의 메모리 크기를 MB 단위로 알려줘요."""
+        with self.condition:
+            total = self.memory_bytes + self.display_bytes + self.snapshot_bytes
+        return total / (1024 * 1024)
+
+    def stop(self):
+        """디코딩 스레드를 멈추고 보관 중인 프레임을 모두 지워요."""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.decode_thread.isRunning():
+            self.decode_thread.wait()
+        with self.condition:
+            self.frames.clear()
+            self.display_frames.clear()
+            self.snapshots.clear()
+            self.memory_bytes = 0
+            self.display_bytes = 0
+            self.snapshot_bytes = 0
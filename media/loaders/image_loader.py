@@ -6,8 +6,9 @@
 import os  # 파일 경로와 크기 확인을 위한 운영체제 모듈
 from PyQt5.QtCore import QThread, pyqtSignal, QObject  # 스레드 생성과 신호 전달 기능
 from PyQt5.QtGui import QPixmap, QImageReader  # 이미지 표시와 읽기 기능
-from PIL import Image, ImageCms  # 다양한 이미지 형식 지원과 ICC 프로파일 처리
+from PIL import Image  # 다양한 이미지 형식 지원
 from io import BytesIO  # 메모리에 이미지 데이터를 저장하는 기능
+from media.loaders.color_management import convert_to_srgb, convert_qimage_to_srgb, load_color_managed_pixmap  # ICC 프로파일 처리
 
 class ImageLoader(QObject):
     """
@@ -142,9 +143,6 @@ class ImageLoaderThread(QThread):
         try:
             if self.file_type == 'psd':
                 # PSD 파일 로딩 로직
-                from PIL import Image, ImageCms
-                from io import BytesIO
-                
                 # PSD 파일을 PIL Image로 열기
                 pass
                 # print(f"PSD 파일 로딩 시작: {self.image_path}")
@@ -171,30 +169,15 @@ class ImageLoaderThread(QThread):
                     # print(f"이미지 크기 확인 실패: {e}")
                     image = Image.open(self.image_path)
                 
+                # ICC 프로파일 처리 (프로파일별 변환을 재사용, CMYK 프로파일도 모드 변환 전에 적용)
+                image = convert_to_srgb(image)
+                
                 # RGB 모드로 변환
                 if image.mode != 'RGB':
                     pass
                     # print(f"이미지 모드 변환: {image.mode} → RGB")
                     image = image.convert('RGB')
                 
-                # ICC 프로파일 처리
-                if 'icc_profile' in image.info:
-                    try:
-                        pass
-                        # print("ICC 프로파일 변환 중...")
-                        srgb_profile = ImageCms.createProfile('sRGB')
-                        icc_profile = BytesIO(image.info['icc_profile'])
-                        image = ImageCms.profileToProfile(
-                            image,
-                            ImageCms.ImageCmsProfile(icc_profile),
-                            ImageCms.ImageCmsProfile(srgb_profile),
-                            outputMode='RGB'
-                        )
-                    except Exception as icc_e:
-                        pass
-                        # print(f"ICC 프로파일 변환 실패: {icc_e}")
-                        image = image.convert('RGB')
-                
                 # 변환된 이미지를 QPixmap으로 변환
                 buffer = BytesIO()
                 pass
@@ -229,10 +212,10 @@ class ImageLoaderThread(QThread):
                     # 품질 우선순위를 속도로 설정
                     reader.setQuality(25)  # 25% 품질 (더 빠른 로딩)
                     image = reader.read()
-                    pixmap = QPixmap.fromImage(image)
+                    pixmap = QPixmap.fromImage(convert_qimage_to_srgb(image))
                 else:
-                    # 일반적인 방식으로 이미지 로드
-                    pixmap = QPixmap(self.image_path)
+                    # 일반적인 방식으로 이미지 로드 (내장 ICC 프로파일은 sRGB로 변환)
+                    pixmap = load_color_managed_pixmap(self.image_path)
             
             if not pixmap.isNull():
                 # 메모리 사용량 계산
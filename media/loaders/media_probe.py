@@ -0,0 +1,531 @@
+# 미디어 파일 정보 확인 모듈
+# 비디오/오디오 파일을 재생하지 않고 파일 머리 부분(컨테이너 구조)만 읽어서
+# 재생 시간, 화면 크기, 코덱을 알아내요.
+# 플레이어가 파일을 열기 전에 슬라이더 범위와 시간 표시를 미리 맞출 수 있고,
+# 폴더 전체를 백그라운드에서 빠르게 확인해둘 수도 있어요.
+#
+# 지원 형식: MP4/MOV(moov/mvhd/tkhd), MKV/WebM(EBML Info/Tracks),
+#            MP3(Xing/VBRI, 없으면 고정 비트레이트로 계산), FLAC(STREAMINFO), Ogg(Vorbis/Opus/FLAC)
+# 확인한 정보는 미리보기 캐시에 파일별로 저장해요.
+
+import os  # 파일 크기 확인
+import struct  # 바이너리 데이터 해석 기능
+
+from PyQt5.QtCore import QThread, pyqtSignal  # 스레드 생성과 신호 전달 기능
+
+from media.loaders.preview_cache import get_preview_cache
+
+# 캐시 파일 접미사
+PROBE_SUFFIX = '.probe.json'
+
+# 이 크기보다 큰 moov 상자는 읽지 않아요 (손상된 파일 보호)
+MAX_MOOV_BYTES = 64 * 1024 * 1024
+
+# GUI 스레드에서 파일을 열 때 읽는 moov 상자 최대 크기 (더 크면 백그라운드 확인에 맡김)
+QUICK_MAX_MOOV_BYTES = 1024 * 1024
+
+# MP3 첫 프레임을 찾을 때 살펴보는 범위
+MP3_SYNC_SEARCH_BYTES = 64 * 1024
+
+# Ogg 마지막 페이지를 찾을 때 읽는 파일 끝 부분 크기
+OGG_TAIL_BYTES = 64 * 1024
+
+# 정보를 확인할 확장자 (비디오/오디오)
+PROBE_EXTENSIONS = ('.mp4', '.m4v', '.m4a', '.mov', '.qt', '.3gp', '.mkv', '.webm',
+                    '.mp3', '.flac', '.ogg', '.oga', '.opus')
+
+
+class ProbeDeferred(Exception):
+    """정해진 크기보다 많이 읽어야 해서 확인을 미뤘을 때 발생하는 예외예요."""
+
+
+def _empty_record(container):
+    """빈 정보 기록을 만들어요."""
+    return {'container': container, 'duration': None, 'width': None, 'height': None,
+            'video_codec': None, 'audio_codec': None}
+
+
+def probe_media(file_path, max_moov_bytes=MAX_MOOV_BYTES):
+    """
+    미디어 파일의 컨테이너 구조를 읽어 정보를 알아내요.
+
+    매개변수:
+        file_path: 비디오 또는 오디오 파일 경로
+        max_moov_bytes: 읽을 moov 상자 최대 크기 (MAX_MOOV_BYTES보다 작게 주면
+                        그보다 큰 moov는 읽지 않고 ProbeDeferred 발생)
+
+    반환값:
+        정보 기록(dict: container, duration(초), width, height, video_codec, audio_codec)
+        또는 None (지원하지 않는 형식이거나 읽을 수 없는 경우)
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            head = file.read(64)
+            file_size = os.fstat(file.fileno()).st_size
+            if len(head) < 12:
+                return None
+            if head[4:8] in (b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip', b'pnot'):
+                return _probe_mp4(file, file_size, max_moov_bytes)
+            if head[:4] == b'\x1a\x45\xdf\xa3':
+                return _probe_matroska(file, file_size)
+            if head[:4] == b'OggS':
+                return _probe_ogg(file, file_size)
+
+            # ID3 태그 뒤에 오는 FLAC/MP3
+            audio_start = _skip_id3v2(head)
+            file.seek(audio_start)
+            if file.read(4) == b'fLaC':
+                return _probe_flac(file)
+            if audio_start or file_path.lower().endswith('.mp3'):
+                return _probe_mp3(file, file_size, audio_start)
+    except (OSError, ValueError, struct.error, IndexError):
+        pass
+    return None
+
+
+def get_media_info(file_path, max_moov_bytes=MAX_MOOV_BYTES):
+    """
+    미디어 파일 정보를 반환해요. 캐시에 있으면 캐시에서, 없으면 파일을 읽고 캐시에 저장해요.
+
+    GUI 스레드에서는 max_moov_bytes=QUICK_MAX_MOOV_BYTES로 불러서 읽는 양을 제한해요.
+    (제한을 넘는 파일은 캐시에 기록하지 않고 None을 반환하므로 백그라운드 확인이 나중에 읽음)
+
+    매개변수:
+        file_path: 비디오 또는 오디오 파일 경로
+        max_moov_bytes: 읽을 moov 상자 최대 크기
+
+    반환값:
+        정보 기록(dict) 또는 None
+    """
+    cache = get_preview_cache()
+    record = cache.load_json(file_path, PROBE_SUFFIX)
+    if record is not None:
+        return record if record.get('container') else None
+
+    try:
+        record = probe_media(file_path, max_moov_bytes)
+    except ProbeDeferred:
+        return None
+    # 읽지 못한 파일도 기록해서 다시 읽지 않도록 함
+    cache.save_json(file_path, PROBE_SUFFIX, record or _empty_record(None))
+    return record
+
+
+# ---------------------------------------------------------------- MP4 / MOV
+
+def _iter_boxes(data, start, end):
+    """상자(box) 목록을 (종류, 내용 시작, 내용 끝) 순서로 돌려줘요."""
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack_from('>I4s', data, pos)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from('>Q', data, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _find_box(data, start, end, kind):
+    """상자 목록에서 원하는 종류의 첫 상자를 찾아요."""
+    for box_kind, box_start, box_end in _iter_boxes(data, start, end):
+        if box_kind == kind:
+            return box_start, box_end
+    return None
+
+
+def _probe_mp4(file, file_size, max_moov_bytes=MAX_MOOV_BYTES):
+    """최상위 상자를 건너뛰며 moov를 찾아 읽어요. (mdat은 읽지 않음)"""
+    pos = 0
+    moov = None
+    while pos + 8 <= file_size:
+        file.seek(pos)
+        header = file.read(16)
+        size, kind = struct.unpack_from('>I4s', header, 0)
+        header_size = 8
+        if size == 1:
+            size = struct.unpack_from('>Q', header, 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = file_size - pos
+        if size < header_size:
+            break
+        if kind == b'moov':
+            if size > MAX_MOOV_BYTES:
+                break
+            if size > max_moov_bytes:
+                raise ProbeDeferred(f"moov box is {size} bytes")
+            file.seek(pos + header_size)
+            moov = file.read(size - header_size)
+            break
+        pos += size
+    if moov is None:
+        return None
+
+    record = _empty_record('mp4')
+    mvhd = _find_box(moov, 0, len(moov), b'mvhd')
+    if mvhd:
+        start = mvhd[0]
+        if moov[start] == 1:
+            timescale, duration = struct.unpack_from('>IQ', moov, start + 20)
+        else:
+            timescale, duration = struct.unpack_from('>II', moov, start + 12)
+        if timescale:
+            record['duration'] = duration / timescale
+
+    for kind, start, end in _iter_boxes(moov, 0, len(moov)):
+        if kind == b'trak':
+            _probe_mp4_track(moov, start, end, record)
+    return record
+
+
+def _probe_mp4_track(data, start, end, record):
+    """트랙(trak) 하나의 종류, 코덱, 화면 크기를 기록해요."""
+    handler = codec = None
+    mdia = _find_box(data, start, end, b'mdia')
+    if mdia:
+        hdlr = _find_box(data, mdia[0], mdia[1], b'hdlr')
+        if hdlr:
+            handler = data[hdlr[0] + 8:hdlr[0] + 12]
+        minf = _find_box(data, mdia[0], mdia[1], b'minf')
+        stbl = minf and _find_box(data, minf[0], minf[1], b'stbl')
+        stsd = stbl and _find_box(data, stbl[0], stbl[1], b'stsd')
+        if stsd and stsd[0] + 16 <= stsd[1]:
+            # 버전/플래그(4) + 항목 수(4) 다음 첫 항목의 종류가 코덱
+            codec = data[stsd[0] + 12:stsd[0] + 16].decode('latin-1').strip()
+
+    if handler == b'vide' and record['video_codec'] is None:
+        record['video_codec'] = codec
+        tkhd = _find_box(data, start, end, b'tkhd')
+        if tkhd:
+            offset = tkhd[0] + (88 if data[tkhd[0]] == 1 else 76)
+            a, b = struct.unpack_from('>ii', data, offset - 36)  # 변환 행렬의 첫 두 값
+            width, height = struct.unpack_from('>II', data, offset)
+            width, height = width >> 16, height >> 16  # 16.16 고정소수점
+            if a == 0 and b != 0:
+                width, height = height, width  # 90/270도 회전된 비디오
+            record['width'], record['height'] = width, height
+    elif handler == b'soun' and record['audio_codec'] is None:
+        record['audio_codec'] = codec
+
+
+# ---------------------------------------------------------------- MKV / WebM
+
+EBML_SEGMENT = 0x18538067
+EBML_INFO = 0x1549A966
+EBML_TRACKS = 0x1654AE6B
+EBML_CLUSTER = 0x1F43B675
+EBML_TIMECODE_SCALE = 0x2AD7B1
+EBML_DURATION = 0x4489
+EBML_TRACK_ENTRY = 0xAE
+EBML_TRACK_TYPE = 0x83
+EBML_CODEC_ID = 0x86
+EBML_VIDEO = 0xE0
+EBML_PIXEL_WIDTH = 0xB0
+EBML_PIXEL_HEIGHT = 0xBA
+
+
+def _read_vint(file, keep_marker):
+    """EBML 가변 길이 정수를 읽어요. (ID는 표시 비트를 남기고, 크기는 표시 비트를 지움)"""
+    first = file.read(1)
+    if not first:
+        raise ValueError("unexpected end of file")
+    value = first[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not value & mask:
+        length += 1
+        mask >>= 1
+    if length > 8:
+        raise ValueError("invalid EBML number")
+    unknown = value & (mask - 1) == mask - 1  # 모든 비트가 1이면 크기를 알 수 없음
+    if not keep_marker:
+        value &= mask - 1
+    for byte in file.read(length - 1):
+        value = (value << 8) | byte
+        unknown = unknown and byte == 0xFF
+    return value, (unknown and not keep_marker)
+
+
+def _read_element(file):
+    """EBML 요소의 (ID, 크기, 크기 불명 여부)를 읽어요."""
+    element_id, _ = _read_vint(file, True)
+    size, unknown = _read_vint(file, False)
+    return element_id, size, unknown
+
+
+def _iter_elements(file, end):
+    """현재 위치부터 end까지의 하위 요소를 (ID, 내용 시작, 내용 끝) 순서로 돌려줘요."""
+    while file.tell() < end:
+        element_id, size, unknown = _read_element(file)
+        start = file.tell()
+        element_end = end if unknown else min(start + size, end)
+        yield element_id, start, element_end
+        file.seek(element_end)
+
+
+def _read_uint(file, start, end):
+    file.seek(start)
+    return int.from_bytes(file.read(end - start), 'big')
+
+
+def _probe_matroska(file, file_size):
+    """Segment 안의 Info와 Tracks를 읽어요. 클러스터(실제 영상 데이터)에 닿으면 멈춰요."""
+    record = _empty_record('matroska')
+    file.seek(0)
+    for element_id, start, end in _iter_elements(file, file_size):
+        if element_id == EBML_SEGMENT:
+            file.seek(start)
+            _probe_matroska_segment(file, end, record)
+            break
+    return record
+
+
+def _probe_matroska_segment(file, segment_end, record):
+    """Segment의 최상위 요소를 살펴봐요."""
+    found_info = found_tracks = False
+    for element_id, start, end in _iter_elements(file, segment_end):
+        if element_id == EBML_INFO:
+            _probe_matroska_info(file, start, end, record)
+            found_info = True
+        elif element_id == EBML_TRACKS:
+            _probe_matroska_tracks(file, start, end, record)
+            found_tracks = True
+        elif element_id == EBML_CLUSTER:
+            break
+        if found_info and found_tracks:
+            break
+
+
+def _probe_matroska_info(file, start, end, record):
+    """Info 요소에서 재생 시간을 읽어요."""
+    timecode_scale = 1000000  # 기본값: 1 밀리초 (나노초 단위)
+    duration = None
+    file.seek(start)
+    for element_id, child_start, child_end in _iter_elements(file, end):
+        if element_id == EBML_TIMECODE_SCALE:
+            timecode_scale = _read_uint(file, child_start, child_end)
+        elif element_id == EBML_DURATION:
+            file.seek(child_start)
+            raw = file.read(child_end - child_start)
+            duration = struct.unpack('>f' if len(raw) == 4 else '>d', raw)[0]
+    if duration is not None:
+        record['duration'] = duration * timecode_scale / 1e9
+
+
+def _probe_matroska_tracks(file, start, end, record):
+    """Tracks 요소에서 첫 비디오/오디오 트랙의 코덱과 화면 크기를 읽어요."""
+    file.seek(start)
+    for element_id, entry_start, entry_end in _iter_elements(file, end):
+        if element_id != EBML_TRACK_ENTRY:
+            continue
+        track_type = codec = width = height = None
+        file.seek(entry_start)
+        for child_id, child_start, child_end in _iter_elements(file, entry_end):
+            if child_id == EBML_TRACK_TYPE:
+                track_type = _read_uint(file, child_start, child_end)
+            elif child_id == EBML_CODEC_ID:
+                file.seek(child_start)
+                codec = file.read(child_end - child_start).rstrip(b'\x00').decode('ascii', 'replace')
+            elif child_id == EBML_VIDEO:
+                file.seek(child_start)
+                for video_id, video_start, video_end in _iter_elements(file, child_end):
+                    if video_id == EBML_PIXEL_WIDTH:
+                        width = _read_uint(file, video_start, video_end)
+                    elif video_id == EBML_PIXEL_HEIGHT:
+                        height = _read_uint(file, video_start, video_end)
+        if track_type == 1 and record['video_codec'] is None:
+            record['video_codec'] = codec
+            record['width'], record['height'] = width, height
+        elif track_type == 2 and record['audio_codec'] is None:
+            record['audio_codec'] = codec
+
+
+# ---------------------------------------------------------------- MP3
+
+# MPEG 버전별 샘플링 주파수 (버전 비트 값 -> 목록)
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# 비트레이트 표 (kbps) - (MPEG-1 여부, 레이어)
+MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+def _skip_id3v2(head):
+    """ID3v2 태그가 있으면 태그 다음 위치를 반환해요."""
+    if head[:3] != b'ID3' or len(head) < 10:
+        return 0
+    size = (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 | (head[9] & 0x7F)
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _parse_mp3_header(header):
+    """MPEG 오디오 프레임 머리(4바이트)를 해석해요. 올바르지 않으면 None."""
+    value = struct.unpack('>I', header)[0]
+    if value >> 21 != 0x7FF:
+        return None
+    version = (value >> 19) & 0x03
+    layer = 4 - ((value >> 17) & 0x03)
+    bitrate_index = (value >> 12) & 0x0F
+    rate_index = (value >> 10) & 0x03
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    if layer == 1:
+        samples = 384
+    elif layer == 2 or mpeg1:
+        samples = 1152
+    else:
+        samples = 576
+    return {
+        'mpeg1': mpeg1,
+        'layer': layer,
+        'bitrate': MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000,
+        'sample_rate': MP3_SAMPLE_RATES[version][rate_index],
+        'mono': (value >> 6) & 0x03 == 3,
+        'samples': samples,
+    }
+
+
+def _probe_mp3(file, file_size, audio_start):
+    """첫 프레임의 Xing/Info 또는 VBRI 머리에서 전체 프레임 수를 읽어요."""
+    file.seek(audio_start)
+    data = file.read(MP3_SYNC_SEARCH_BYTES)
+    pos = data.find(b'\xff')
+    frame = None
+    while 0 <= pos <= len(data) - 4:
+        frame = _parse_mp3_header(data[pos:pos + 4])
+        if frame:
+            break
+        pos = data.find(b'\xff', pos + 1)
+    if not frame:
+        return None
+
+    record = _empty_record('mp3')
+    record['audio_codec'] = f"mp{frame['layer']}"
+
+    # Xing/Info 머리 위치 (사이드 정보 크기는 버전과 채널 수에 따라 다름)
+    if frame['mpeg1']:
+        side_info = 17 if frame['mono'] else 32
+    else:
+        side_info = 9 if frame['mono'] else 17
+    frames = None
+    xing = pos + 4 + side_info
+    if data[xing:xing + 4] in (b'Xing', b'Info'):
+        flags = struct.unpack_from('>I', data, xing + 4)[0]
+        if flags & 0x01:
+            frames = struct.unpack_from('>I', data, xing + 8)[0]
+    elif data[pos + 36:pos + 40] == b'VBRI':
+        frames = struct.unpack_from('>I', data, pos + 36 + 14)[0]
+
+    if frames:
+        record['duration'] = frames * frame['samples'] / frame['sample_rate']
+    else:
+        # 고정 비트레이트: 오디오 데이터 크기로 계산 (끝의 ID3v1 태그 제외)
+        audio_bytes = file_size - audio_start - pos
+        file.seek(max(0, file_size - 128))
+        if file.read(3) == b'TAG':
+            audio_bytes -= 128
+        record['duration'] = audio_bytes * 8 / frame['bitrate']
+    return record
+
+
+# ---------------------------------------------------------------- FLAC
+
+def _parse_streaminfo(data):
+    """STREAMINFO 블록(34바이트)에서 (샘플링 주파수, 전체 샘플 수)를 읽어요."""
+    value = struct.unpack_from('>Q', data, 10)[0]
+    sample_rate = value >> 44
+    total_samples = value & 0xFFFFFFFFF
+    return sample_rate, total_samples
+
+
+def _probe_flac(file):
+    """'fLaC' 다음에 오는 첫 메타데이터 블록(STREAMINFO)을 읽어요."""
+    block_header = file.read(4)
+    if block_header[0] & 0x7F != 0:
+        return None
+    sample_rate, total_samples = _parse_streaminfo(file.read(34))
+    record = _empty_record('flac')
+    record['audio_codec'] = 'flac'
+    if sample_rate and total_samples:
+        record['duration'] = total_samples / sample_rate
+    return record
+
+
+# ---------------------------------------------------------------- Ogg
+
+def _probe_ogg(file, file_size):
+    """첫 페이지의 코덱 머리와 마지막 페이지의 위치(granule)로 재생 시간을 계산해요."""
+    file.seek(0)
+    segments = file.read(27)[26]  # 페이지 머리 다음의 구간 길이 표 크기
+    file.seek(27 + segments)
+    packet = file.read(64)
+
+    record = _empty_record('ogg')
+    sample_rate = 0
+    pre_skip = 0
+    if packet[:7] == b'\x01vorbis':
+        record['audio_codec'] = 'vorbis'
+        sample_rate = struct.unpack_from('<I', packet, 12)[0]
+    elif packet[:8] == b'OpusHead':
+        record['audio_codec'] = 'opus'
+        pre_skip = struct.unpack_from('<H', packet, 10)[0]
+        sample_rate = 48000  # Opus 위치 값은 항상 48kHz 기준
+    elif packet[:5] == b'\x7fFLAC':
+        # Ogg FLAC: 매핑 머리(9) + 'fLaC'(4) + 블록 머리(4) 다음이 STREAMINFO
+        record['audio_codec'] = 'flac'
+        sample_rate, _ = _parse_streaminfo(packet[17:51])
+    else:
+        return record
+
+    # 파일 끝에서 마지막 페이지를 찾아 위치 값 읽기
+    file.seek(max(0, file_size - OGG_TAIL_BYTES))
+    tail = file.read()
+    last = tail.rfind(b'OggS')
+    if last >= 0 and last + 14 <= len(tail) and sample_rate:
+        granule = struct.unpack_from('<q', tail, last + 6)[0]
+        if granule > 0:
+            record['duration'] = max(0, granule - pre_skip) / sample_rate
+    return record
+
+
+# ---------------------------------------------------------------- 백그라운드 확인
+
+class MediaProbeThread(QThread):
+    """
+    폴더의 비디오/오디오 파일 정보를 백그라운드에서 미리 확인해 캐시에 저장하는 스레드예요.
+
+    신호(Signals):
+        probe_finished: 모든 파일 확인이 끝났을 때 발생 (확인한 파일 수)
+    """
+    probe_finished = pyqtSignal(int)
+
+    def __init__(self, file_paths, parent=None):
+        super().__init__(parent)
+        self.file_paths = [path for path in file_paths
+                           if os.path.splitext(path)[1].lower() in PROBE_EXTENSIONS]
+
+    def run(self):
+        """파일을 하나씩 확인해요. 중단 요청이 오면 바로 멈춰요."""
+        count = 0
+        for path in self.file_paths:
+            if self.isInterruptionRequested():
+                return
+            try:
+                get_media_info(path)
+                count += 1
+            except Exception as e:
+                pass
+        self.probe_finished.emit(count)
@@ -0,0 +1,323 @@
+# 미리보기 캐시 모듈
+# 비디오 포스터 프레임, 슬라이더 미리보기 스프라이트처럼 파일마다 한 번만 만들면 되는 자료를
+# 사용자 데이터 폴더에 저장해두고 다음에 그 파일을 열 때 바로 꺼내 쓰게 해줘요.
+#
+# 캐시 키는 (파일 경로, 크기, 수정 시간)으로 만들기 때문에 파일이 바뀌면 자동으로 새로 만들어요.
+# 자주 쓰는 이미지는 메모리에도 조금 남겨둬서 디스크를 다시 읽지 않아요.
+# 디스크 캐시가 최대 크기를 넘으면 백그라운드에서 가장 오래 안 쓴 자료부터 지워요.
+# (캐시 파일을 읽을 때마다 수정 시간을 지금으로 바꿔서 마지막 사용 시간으로 써요)
+
+import os  # 파일 경로와 정보 확인
+import json  # 정보 파일 저장
+import hashlib  # 캐시 키 계산
+import threading  # 메모리 캐시 보호 (백그라운드 스레드에서도 사용)
+from collections import OrderedDict  # 최근 사용 순서 관리
+
+from PyQt5.QtGui import QImage  # 스레드에서도 다룰 수 있는 이미지 형식
+
+from core.utils.path_utils import get_user_data_directory
+
+# 미리보기 캐시를 저장할 폴더 이름 (사용자 데이터 폴더 아래)
+PREVIEW_CACHE_DIRNAME = "preview_cache"
+
+# 메모리에 남겨둘 이미지 개수
+MEMORY_CACHE_ITEMS = 16
+
+# 디스크 캐시 최대 크기 (바이트)
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+# 정리할 때 최대 크기의 이 비율까지 줄여요 (저장할 때마다 정리하지 않도록)
+TRIM_TARGET_RATIO = 0.9
+
+
+class PreviewCache:
+    """
+    파일별 미리보기 자료를 디스크와 메모리에 저장하는 클래스예요.
+
+    같은 파일에 여러 종류의 자료를 저장할 수 있도록 자료마다 접미사(suffix)를 붙여요.
+    (예: '.poster.jpg', '.sprite.jpg', '.preview.json')
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=MAX_CACHE_BYTES):
+        """
+        미리보기 캐시 초기화
+
+        매개변수:
+            cache_dir: 캐시 폴더 (없으면 사용자 데이터 폴더 아래 preview_cache)
+            max_bytes: 디스크 캐시 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir or os.path.join(get_user_data_directory(), PREVIEW_CACHE_DIRNAME)
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()  # (캐시 키, 접미사) -> QImage
+        self.lock = threading.Lock()
+        self.total_bytes = None  # 디스크 캐시 전체 크기 (처음 정리할 때 계산, 모르면 None)
+        self.trim_thread = None  # 디스크 캐시를 정리하는 스레드
+
+    def file_key(self, file_path):
+        """
+        파일의 캐시 키를 계산해요. 파일 크기나 수정 시간이 바뀌면 키도 바뀌어요.
+
+        매개변수:
+            file_path: 원본 파일 경로
+
+        반환값:
+            캐시 키 문자열 또는 None (파일 정보를 읽을 수 없는 경우)
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        path = os.path.normcase(os.path.abspath(file_path))
+        identity = f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def get_path(self, file_path, suffix, create_dir=False):
+        """
+        파일 자료를 저장할 캐시 파일 경로를 반환해요.
+
+        매개변수:
+            file_path: 원본 파일 경로
+            suffix: 자료 종류를 나타내는 접미사
+            create_dir: 캐시 폴더가 없으면 만들지 여부 (저장할 때 사용)
+
+        반환값:
+            캐시 파일 경로 또는 None
+        """
+        key = self.file_key(file_path)
+        if key is None:
+            return None
+        folder = os.path.join(self.cache_dir, key[:2])
+        if create_dir:
+            try:
+                os.makedirs(folder, exist_ok=True)
+            except OSError:
+                return None
+        return os.path.join(folder, key + suffix)
+
+    def has(self, file_path, suffix):
+        """캐시 파일이 이미 있는지 확인해요."""
+        path = self.get_path(file_path, suffix)
+        return path is not None and os.path.exists(path)
+
+    def _touch(self, path):
+        """캐시 파일의 수정 시간을 지금으로 바꿔서 최근에 쓴 자료로 표시해요."""
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _replace(self, temp_path, path):
+        """임시 파일을 캐시 파일로 바꿔치기하고, 늘어난 크기를 반영해요."""
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        os.replace(temp_path, path)
+        try:
+            added = os.path.getsize(path) - old_size
+        except OSError:
+            added = 0
+        with self.lock:
+            if self.total_bytes is not None:
+                self.total_bytes += added
+            if self.total_bytes is None or self.total_bytes > self.max_bytes:
+                self._start_trim()
+
+    def _start_trim(self):
+        """디스크 캐시 정리를 백그라운드에서 시작해요. (self.lock을 잡은 상태에서 불러요)"""
+        if self.trim_thread is not None and self.trim_thread.is_alive():
+            return
+        self.trim_thread = threading.Thread(target=self.trim, name="PreviewCacheTrim", daemon=True)
+        self.trim_thread.start()
+
+    def trim(self):
+        """
+        디스크 캐시 전체 크기를 계산하고, 최대 크기를 넘으면 가장 오래 안 쓴 자료부터 지워요.
+
+        반환값:
+            정리 후 디스크 캐시 전체 크기 (바이트)
+        """
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as folders:
+                for folder in folders:
+                    if not folder.is_dir():
+                        continue
+                    with os.scandir(folder.path) as files:
+                        for entry in files:
+                            if entry.name.endswith('.tmp'):
+                                continue
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                continue
+                            entries.append((stat.st_mtime_ns, stat.st_size, entry.path, entry.name))
+        except OSError:
+            pass
+
+        total = sum(size for _, size, _, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * TRIM_TARGET_RATIO
+            evicted = set()
+            for _, size, path, name in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                evicted.add(name)
+            with self.lock:
+                for memory_key in list(self.images):
+                    if memory_key[0] + memory_key[1] in evicted:
+                        del self.images[memory_key]
+
+        with self.lock:
+            self.total_bytes = total
+        return total
+
+    def load_json(self, file_path, suffix):
+        """
+        저장된 정보(JSON)를 읽어요.
+
+        반환값:
+            저장된 값 또는 None (없거나 읽을 수 없는 경우)
+        """
+        path = self.get_path(file_path, suffix)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return data
+
+    def save_json(self, file_path, suffix, data):
+        """
+        정보(JSON)를 저장해요. 임시 파일에 쓴 뒤 바꿔치기해서 반쯤 쓰인 파일이 남지 않아요.
+
+        반환값:
+            저장 성공 여부
+        """
+        path = self.get_path(file_path, suffix, create_dir=True)
+        if path is None:
+            return False
+        try:
+            temp_path = path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False)
+            self._replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"Failed to save preview cache: {str(e)}")
+            return False
+
+    def load_bytes(self, file_path, suffix):
+        """
+        저장된 바이너리 자료를 읽어요.
+
+        반환값:
+            bytes 또는 None (없거나 읽을 수 없는 경우)
+        """
+        path = self.get_path(file_path, suffix)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        self._touch(path)
+        return data
+
+    def save_bytes(self, file_path, suffix, data):
+        """
+        바이너리 자료를 저장해요. (임시 파일에 쓴 뒤 바꿔치기)
+
+        반환값:
+            저장 성공 여부
+        """
+        path = self.get_path(file_path, suffix, create_dir=True)
+        if path is None:
+            return False
+        try:
+            temp_path = path + ".tmp"
+            with open(temp_path, 'wb') as file:
+                file.write(data)
+            self._replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"Failed to save preview cache: {str(e)}")
+            return False
+
+    def save_pil_image(self, file_path, suffix, image, format='JPEG', **options):
+        """
+        PIL 이미지를 캐시에 저장해요. (백그라운드 스레드에서 사용)
+
+        반환값:
+            저장 성공 여부
+        """
+        path = self.get_path(file_path, suffix, create_dir=True)
+        if path is None:
+            return False
+        try:
+            temp_path = path + ".tmp"
+            image.save(temp_path, format, **options)
+            self._replace(temp_path, path)
+        except (OSError, ValueError) as e:
+            print(f"Failed to save preview cache: {str(e)}")
+            return False
+        with self.lock:
+            # 같은 키로 메모리에 남아 있던 이전 이미지는 버림
+            self.images.pop((os.path.basename(path)[:-len(suffix)], suffix), None)
+        return True
+
+    def load_image(self, file_path, suffix):
+        """
+        저장된 이미지를 읽어요. 최근에 읽은 이미지는 메모리에서 바로 반환해요.
+
+        반환값:
+            QImage 또는 None
+        """
+        key = self.file_key(file_path)
+        if key is None:
+            return None
+        memory_key = (key, suffix)
+        with self.lock:
+            image = self.images.get(memory_key)
+            if image is not None:
+                self.images.move_to_end(memory_key)
+                return image
+
+        path = os.path.join(self.cache_dir, key[:2], key + suffix)
+        if not os.path.exists(path):
+            return None
+        image = QImage(path)
+        if image.isNull():
+            return None
+        self._touch(path)
+
+        with self.lock:
+            self.images[memory_key] = image
+            while len(self.images) > MEMORY_CACHE_ITEMS:
+                self.images.popitem(last=False)
+        return image
+
+
+_preview_cache = None
+
+
+def get_preview_cache():
+    """
+    애플리케이션 전체에서 함께 사용하는 미리보기 캐시를 반환해요.
+
+    반환값:
+        PreviewCache 객체
+    """
+    global _preview_cache
+    if _preview_cache is None:
+        _preview_cache = PreviewCache()
+    return _preview_cache
@@ -0,0 +1,442 @@
+# 타일 이미지 모듈
+# 20000×20000 픽셀이 넘는 스캔 이미지처럼 너무 커서 통째로 디코딩하면 안 되는 이미지를
+# 화면에 보이는 부분만, 필요한 해상도 단계로 잘라서(타일) 디코딩해요.
+#
+# 비압축으로 저장된 파일(비압축 TIFF, BMP)은 보이는 영역에 걸친 줄만 파일에서 직접 읽고,
+# 개요(overview) 이미지도 몇 줄씩 읽어서 줄여가며 만들어요.
+# 압축된 파일(PNG, 압축 TIFF 등)은 부분 디코딩이 안 되므로 통째로 디코딩해도 되는 크기
+# (Image.MAX_IMAGE_PIXELS 이하)일 때만 한 번 디코딩해서 개요 이미지만 남기고, 그보다 크면 열지 않아요.
+# 디코딩한 타일은 화면 크기에 비례하는 LRU 캐시에만 보관하기 때문에
+# 메모리 사용량은 이미지 크기가 아니라 화면 크기를 따라가요.
+
+import os  # 파일 경로 확인
+import math  # 단계 계산
+import threading  # 요청 대기열 보호
+from collections import OrderedDict, namedtuple  # 최근 사용 순서 관리, 조각 정보
+
+from PyQt5.QtCore import QThread, pyqtSignal  # 스레드 생성과 신호 전달 기능
+from PyQt5.QtGui import QImage  # 스레드에서도 다룰 수 있는 이미지 형식
+
+from PIL import Image, BmpImagePlugin, PngImagePlugin, TiffImagePlugin
+
+from media.loaders.color_management import convert_to_srgb
+
+# 타일 한 변의 크기 (화면 픽셀)
+TILE_SIZE = 256
+
+# 이보다 픽셀 수가 많은 이미지는 타일 방식으로 표시 (약 8000×8000)
+TILED_IMAGE_MIN_PIXELS = 64 * 1024 * 1024
+
+# 타일 방식으로도 열지 않는 크기 (약 65000×65000, 손상되거나 조작된 파일 머리 방지)
+TILED_IMAGE_MAX_PIXELS = 4 * 1024 * 1024 * 1024
+
+# 타일 방식으로 열 수 있는 확장자와 형식별 이미지 클래스
+TILED_IMAGE_OPENERS = {
+    '.tif': TiffImagePlugin.TiffImageFile,
+    '.tiff': TiffImagePlugin.TiffImageFile,
+    '.png': PngImagePlugin.PngImageFile,
+    '.bmp': BmpImagePlugin.BmpImageFile,
+}
+TILED_IMAGE_EXTENSIONS = list(TILED_IMAGE_OPENERS)
+
+# 개요 이미지의 긴 변 최대 크기 (이보다 작아질 때까지 절반씩 줄임)
+OVERVIEW_MAX_SIZE = 2048
+
+# 한 번에 읽어서 줄이는 최소 줄 수
+BAND_MIN_ROWS = 64
+
+# 파일에서 직접 읽을 수 있는 비압축 픽셀 형식과 픽셀 하나의 바이트 수
+RAW_PIXEL_BYTES = {
+    'L': 1, 'LA': 2,
+    'RGB': 3, 'BGR': 3,
+    'RGBA': 4, 'RGBa': 4, 'RGBX': 4, 'BGRA': 4, 'BGRX': 4, 'CMYK': 4,
+}
+
+# 비압축 조각 하나 (영역, 파일 위치, 픽셀 형식, 한 줄의 바이트 수, 줄 방향, 픽셀 바이트 수)
+RawPiece = namedtuple('RawPiece', ['extents', 'offset', 'rawmode', 'stride', 'ystep', 'pixel_bytes'])
+
+
+class TiledImageCancelled(Exception):
+    """타일 이미지를 읽는 도중 취소됐을 때 발생하는 예외예요."""
+
+
+def is_huge_image(file_path):
+    """
+    타일 방식으로 열어야 할 만큼 큰 이미지인지 확인해요. (파일 머리만 읽음)
+
+    매개변수:
+        file_path: 이미지 파일 경로
+
+    반환값:
+        bool: 타일 방식 대상 여부
+    """
+    if os.path.splitext(file_path)[1].lower() not in TILED_IMAGE_OPENERS:
+        return False
+    try:
+        with _open_image(file_path, None) as image:
+            width, height = image.size
+    except Exception:
+        return False
+    return width * height >= TILED_IMAGE_MIN_PIXELS
+
+
+def _open_image(file_path, max_pixels):
+    """
+    파일 머리만 읽어서 이미지를 열어요. (픽셀은 아직 디코딩하지 않음)
+
+    Image.open()은 전역 값 Image.MAX_IMAGE_PIXELS로 압축 폭탄 검사를 하는데,
+    다른 스레드도 함께 쓰는 값이라 바꾸지 않고 형식별 클래스로 직접 연 뒤 max_pixels로 검사해요.
+
+    매개변수:
+        file_path: 이미지 파일 경로
+        max_pixels: 허용하는 최대 픽셀 수 (None이면 검사하지 않음)
+
+    반환값:
+        PIL 이미지 (사용 후 close() 필요)
+    """
+    opener = TILED_IMAGE_OPENERS.get(os.path.splitext(file_path)[1].lower())
+    if opener is None:
+        raise ValueError(f"Unsupported image type: {file_path}")
+    image = opener(file_path)
+    width, height = image.size
+    if max_pixels is not None and width * height > max_pixels:
+        image.close()
+        raise Image.DecompressionBombError(
+            f"Image size ({width}x{height} pixels) exceeds limit of {max_pixels} pixels"
+        )
+    return image
+
+
+def _to_qimage(image):
+    """PIL 이미지를 QImage로 바꿔요. (스레드에서 사용 가능한 형식)"""
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    data = image.tobytes()
+    qimage = QImage(data, image.width, image.height, image.width * 4, QImage.Format_RGBA8888)
+    return qimage.copy()  # data 버퍼와 분리
+
+
+class TiledImageSource:
+    """
+    큰 이미지에서 원하는 영역을 원하는 단계로 읽어주는 클래스예요.
+
+    단계(level) L은 원본을 2^L 배 줄인 해상도예요. (0이 원본)
+
+    속성:
+        width, height: 원본 크기
+        tiled: 파일에서 필요한 줄만 직접 읽을 수 있는지 여부 (비압축 파일)
+        overview: 원본을 overview_factor 배 줄인 PIL 이미지
+        min_level: 타일로 읽을 수 있는 가장 세밀한 단계
+        overview_level: 개요 이미지에 해당하는 단계
+    """
+
+    def __init__(self, file_path, is_cancelled=None):
+        """
+        매개변수:
+            file_path: 이미지 파일 경로
+            is_cancelled: 읽기를 그만둘지 알려주는 함수 (True를 반환하면 TiledImageCancelled 발생)
+        """
+        self.file_path = file_path
+        self.is_cancelled = is_cancelled
+        image = _open_image(file_path, TILED_IMAGE_MAX_PIXELS)
+        try:
+            self.width, self.height = image.size
+            self.mode = image.mode
+            self.icc_profile = image.info.get('icc_profile')
+            self.pieces = self._raw_pieces(image)
+            self.tiled = self.pieces is not None
+
+            # 개요 이미지 배율 (2의 거듭제곱)
+            self.overview_level = max(0, math.ceil(math.log2(max(self.width, self.height) / OVERVIEW_MAX_SIZE)))
+            self.overview_factor = 1 << self.overview_level
+
+            if self.tiled:
+                # 몇 줄씩 읽어서 줄인 뒤 붙임 (원본 전체를 한 번에 올리지 않음)
+                self.overview = self._read_reduced((0, 0, self.width, self.height), self.overview_factor)
+                self.min_level = 0
+            else:
+                # 부분 디코딩이 안 되는 형식은 통째로 디코딩해도 되는 크기만 열어서 개요 이미지만 남김
+                limit = Image.MAX_IMAGE_PIXELS
+                if limit is not None and self.width * self.height > limit:
+                    raise Image.DecompressionBombError(
+                        f"Compressed image is too large to decode ({self.width}x{self.height} pixels, "
+                        f"limit {limit} pixels)"
+                    )
+                self._check_cancelled()
+                image.load()
+                self.overview = self._normalize(image).reduce(self.overview_factor)
+                self.min_level = self.overview_level
+            self.overview = self._to_srgb(self.overview)
+        finally:
+            image.close()
+
+    def _check_cancelled(self):
+        """취소 요청이 있으면 TiledImageCancelled를 발생시켜요."""
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise TiledImageCancelled(self.file_path)
+
+    def _raw_pieces(self, image):
+        """
+        파일에서 줄 단위로 직접 읽을 수 있는 비압축 조각 목록을 만들어요.
+
+        반환값:
+            RawPiece 목록 또는 None (압축됐거나 팔레트 이미지처럼 직접 읽을 수 없는 경우)
+        """
+        # 팔레트 이미지는 조각마다 팔레트를 다시 붙여야 해서 제외
+        if self.mode in ('P', 'PA'):
+            return None
+        pieces = []
+        for tile in image.tile:
+            codec_name, extents, offset, args = tile[:4]
+            if isinstance(args, str):
+                args = (args,)
+            if codec_name != 'raw' or not args:
+                return None
+            rawmode = args[0]
+            pixel_bytes = RAW_PIXEL_BYTES.get(rawmode)
+            if pixel_bytes is None:
+                return None
+            stride = (args[1] if len(args) > 1 else 0) or (extents[2] - extents[0]) * pixel_bytes
+            ystep = args[2] if len(args) > 2 else 1
+            pieces.append(RawPiece(tuple(extents), offset, rawmode, stride, ystep, pixel_bytes))
+        return pieces or None
+
+    def _to_srgb(self, image):
+        """원본의 ICC 프로파일을 적용해 sRGB로 바꿔요. (프로파일별 변환은 재사용)"""
+        if not self.icc_profile:
+            return image
+        image.info['icc_profile'] = self.icc_profile
+        return convert_to_srgb(image)
+
+    def _display_mode(self):
+        """화면 표시용 색상 모드 (투명도가 있으면 RGBA)"""
+        return 'RGBA' if 'A' in self.mode or self.mode == 'P' else 'RGB'
+
+    def _normalize(self, image):
+        """화면 표시용 색상 모드로 바꿔요."""
+        mode = self._display_mode()
+        return image if image.mode == mode else image.convert(mode)
+
+    def _read_piece(self, fp, piece, box):
+        """
+        비압축 조각에서 영역 하나를 파일에서 직접 읽어요. (영역에 걸친 줄의 필요한 부분만 읽음)
+
+        매개변수:
+            fp: 열려 있는 이미지 파일
+            piece: RawPiece
+            box: 읽을 영역 (원본 좌표, 조각 안쪽)
+
+        반환값:
+            영역 크기의 PIL 이미지 (표시용 색상 모드)
+        """
+        x0, y0, x1, y1 = piece.extents
+        column = (box[0] - x0) * piece.pixel_bytes
+        row_bytes = (box[2] - box[0]) * piece.pixel_bytes
+        rows = []
+        for y in range(box[1], box[3]):
+            row = y - y0
+            if piece.ystep < 0:
+                # 아래에서 위로 저장된 파일 (BMP)
+                row = y1 - y0 - 1 - row
+            fp.seek(piece.offset + row * piece.stride + column)
+            rows.append(fp.read(row_bytes))
+        region = Image.frombytes(self.mode, (box[2] - box[0], box[3] - box[1]), b"".join(rows),
+                                 'raw', piece.rawmode, row_bytes, 1)
+        return self._normalize(region)
+
+    def _read_region(self, fp, box):
+        """영역 하나를 원본 해상도로 읽어요. (영역에 걸친 조각만 읽음)"""
+        region = Image.new(self._display_mode(), (box[2] - box[0], box[3] - box[1]))
+        for piece in self.pieces:
+            x0, y0, x1, y1 = piece.extents
+            overlap = (max(x0, box[0]), max(y0, box[1]), min(x1, box[2]), min(y1, box[3]))
+            if overlap[0] >= overlap[2] or overlap[1] >= overlap[3]:
+                continue
+            region.paste(self._read_piece(fp, piece, overlap), (overlap[0] - box[0], overlap[1] - box[1]))
+        return region
+
+    def _read_reduced(self, box, factor):
+        """
+        영역 하나를 factor 배 줄여서 읽어요.
+        몇 줄씩 읽어서 바로 줄이기 때문에 영역 전체를 원본 해상도로 올리지 않아요.
+
+        매개변수:
+            box: 읽을 영역 (원본 좌표)
+            factor: 줄이는 배율 (2의 거듭제곱)
+
+        반환값:
+            줄인 PIL 이미지 (표시용 색상 모드)
+        """
+        band_rows = factor * max(1, BAND_MIN_ROWS // factor)
+        result = Image.new(self._display_mode(), (math.ceil((box[2] - box[0]) / factor),
+                                                  math.ceil((box[3] - box[1]) / factor)))
+        with open(self.file_path, 'rb') as fp:
+            for top in range(box[1], box[3], band_rows):
+                self._check_cancelled()
+                band = self._read_region(fp, (box[0], top, box[2], min(box[3], top + band_rows)))
+                if factor > 1:
+                    band = band.reduce(factor)
+                result.paste(band, (0, (top - box[1]) // factor))
+        return result
+
+    def tile_count(self, level):
+        """단계별 가로/세로 타일 개수"""
+        span = TILE_SIZE << level
+        return math.ceil(self.width / span), math.ceil(self.height / span)
+
+    def read_tile(self, level, tx, ty):
+        """
+        타일 하나를 읽어요.
+
+        매개변수:
+            level: 단계 (min_level 이상)
+            tx, ty: 그 단계에서의 타일 위치
+
+        반환값:
+            QImage (타일 크기 이하) 또는 None (범위 밖)
+        """
+        span = TILE_SIZE << level
+        box = (tx * span, ty * span, min(self.width, (tx + 1) * span), min(self.height, (ty + 1) * span))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return None
+
+        if level >= self.overview_level or not self.tiled:
+            # 개요 이미지에서 잘라냄
+            size = (max(1, math.ceil((box[2] - box[0]) / (1 << level))),
+                    max(1, math.ceil((box[3] - box[1]) / (1 << level))))
+            factor = self.overview_factor
+            overview_box = (box[0] // factor, box[1] // factor,
+                            max(box[0] // factor + 1, math.ceil(box[2] / factor)),
+                            max(box[1] // factor + 1, math.ceil(box[3] / factor)))
+            region = self.overview.crop(overview_box)
+            return _to_qimage(region.resize(size, Image.Resampling.BOX))
+
+        # 보이는 영역에 걸친 줄만 읽음
+        return _to_qimage(self._to_srgb(self._read_reduced(box, 1 << level)))
+
+
+class TileCache:
+    """
+    디코딩한 타일을 최근 사용 순서로 보관하는 캐시예요. (여러 스레드에서 사용)
+
+    보관 개수는 화면 크기에 맞춰 set_capacity()로 정해요.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.tiles = OrderedDict()  # (단계, tx, ty) -> QImage
+        self.lock = threading.Lock()
+
+    def set_capacity(self, capacity):
+        """보관할 타일 개수를 바꿔요."""
+        with self.lock:
+            self.capacity = max(1, capacity)
+            while len(self.tiles) > self.capacity:
+                self.tiles.popitem(last=False)
+
+    def get(self, key):
+        """타일을 반환해요. (없으면 None)"""
+        with self.lock:
+            tile = self.tiles.get(key)
+            if tile is not None:
+                self.tiles.move_to_end(key)
+            return tile
+
+    def has(self, key):
+        with self.lock:
+            return key in self.tiles
+
+    def put(self, key, tile):
+        """타일을 저장해요. 가장 오래 쓰지 않은 타일부터 버려요."""
+        with self.lock:
+            self.tiles[key] = tile
+            self.tiles.move_to_end(key)
+            while len(self.tiles) > self.capacity:
+                self.tiles.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.tiles.clear()
+
+
+class TileLoaderThread(QThread):
+    """
+    큰 이미지를 열고 요청받은 타일을 백그라운드에서 디코딩하는 스레드예요.
+
+    요청할 때마다 대기열을 통째로 바꾸기 때문에 화면에서 벗어난 예전 요청은 버려져요.
+    (화면에 보이는 타일이 먼저, 이동 방향의 미리 읽을 타일이 그다음)
+
+    신호(Signals):
+        source_ready: 이미지를 열고 개요 이미지를 만들었을 때 발생
+        source_failed: 이미지를 열지 못했을 때 발생 (오류 메시지)
+        tile_ready: 타일을 캐시에 저장했을 때 발생 (단계, tx, ty)
+    """
+    source_ready = pyqtSignal()
+    source_failed = pyqtSignal(str)
+    tile_ready = pyqtSignal(int, int, int)
+
+    def __init__(self, file_path, cache, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.cache = cache
+        self.source = None
+        self.overview = None  # 개요 이미지 (QImage)
+        self.pending = []
+        self.condition = threading.Condition()
+        self.running = True
+
+    def request(self, keys):
+        """
+        타일 디코딩을 요청해요. 이전 요청 중 아직 처리하지 않은 것은 버려요.
+
+        매개변수:
+            keys: (단계, tx, ty) 목록 (먼저 처리할 순서)
+        """
+        with self.condition:
+            self.pending = [key for key in keys if not self.cache.has(key)]
+            self.condition.notify()
+
+    def is_stopped(self):
+        """stop()이 호출됐는지 여부 (읽는 도중에도 확인해서 바로 멈춤)"""
+        return not self.running
+
+    def stop(self):
+        """스레드를 멈춰요. (개요 이미지를 만드는 중이어도 다음 몇 줄을 읽기 전에 멈춤)"""
+        with self.condition:
+            self.running = False
+            self.pending = []
+            self.condition.notify()
+        self.wait()
+
+    def run(self):
+        try:
+            self.source = TiledImageSource(self.file_path, self.is_stopped)
+            self.overview = _to_qimage(self.source.overview)
+        except TiledImageCancelled:
+            return
+        except Exception as e:
+            self.source_failed.emit(str(e))
+            return
+        if not self.running:
+            return
+        self.source_ready.emit()
+
+        while True:
+            with self.condition:
+                while self.running and not self.pending:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                key = self.pending.pop(0)
+            if self.cache.has(key):
+                continue
+            try:
+                tile = self.source.read_tile(*key)
+            except TiledImageCancelled:
+                return
+            except Exception as e:
+                print(f"Failed to decode tile {key}: {str(e)}")
+                continue
+            if tile is not None:
+                self.cache.put(key, tile)
+                self.tile_ready.emit(*key)
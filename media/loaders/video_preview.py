@@ -0,0 +1,212 @@
+# 비디오 미리보기 생성 모듈
+# 화면에 보이지 않는 별도의 mpv 플레이어로 비디오를 열어서
+# 포스터 프레임(첫 화면)과 슬라이더 미리보기용 작은 화면 여러 장(스프라이트 시트)을 만들어요.
+# 만든 결과는 미리보기 캐시에 저장해서 다음에 그 비디오로 이동하면 바로 보여줄 수 있어요.
+#
+# 재생용 플레이어와는 별개의 스레드와 플레이어를 쓰기 때문에 재생을 멈추게 하지 않아요.
+
+import os  # 경로 비교
+import threading  # 작업 대기열과 이동 완료 알림
+import time  # 대기 시간 계산
+
+from PyQt5.QtCore import QThread, pyqtSignal  # 스레드 생성과 신호 전달 기능
+
+from media.loaders.preview_cache import get_preview_cache
+from core.utils.lazy_import import lazy_import
+
+# mpv는 미리보기를 처음 만들 때 불러와요 (DLL 경로는 main.py 또는 video_handler에서 먼저 설정돼요)
+mpv = lazy_import('mpv')
+
+# 캐시 파일 접미사
+POSTER_SUFFIX = '.poster.jpg'
+SPRITE_SUFFIX = '.sprite.jpg'
+PREVIEW_INFO_SUFFIX = '.preview.json'
+
+PREVIEW_TILE_COUNT = 20  # 스프라이트 시트에 들어가는 작은 화면 수
+PREVIEW_TILE_HEIGHT = 90  # 작은 화면 하나의 높이 (픽셀)
+POSTER_MAX_SIZE = 1280  # 포스터 프레임 긴 변의 최대 길이 (픽셀)
+JPEG_QUALITY = 85
+SEEK_TIMEOUT = 5.0  # 파일 열기/이동 완료를 기다리는 최대 시간 (초)
+
+# 미리보기용 플레이어 옵션 (화면/소리 출력 없이 디코딩만 함)
+PREVIEW_MPV_OPTIONS = {
+    'vo': 'null',
+    'ao': 'null',
+    'aid': 'no',
+    'sid': 'no',
+    'pause': True,
+    'hwdec': 'no',
+    'hr_seek': 'no',  # 키프레임으로만 이동 (빠름)
+    'ytdl': False,
+    'load_scripts': False,
+    'input_default_bindings': False,
+}
+
+
+class VideoPreviewThread(QThread):
+    """
+    비디오 미리보기를 백그라운드에서 만드는 스레드예요.
+
+    request()로 받은 경로를 순서대로 처리하고, 새 요청이 오면 아직 시작하지 않은
+    요청을 새 목록으로 바꿔요. (현재 비디오가 항상 먼저 처리돼요)
+
+    신호(Signals):
+        preview_ready: 미리보기를 캐시에 저장했을 때 발생 (비디오 경로)
+    """
+    preview_ready = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending = []
+        self.condition = threading.Condition()
+        self.running = True
+        self.current_path = None  # 지금 미리보기를 만들고 있는 비디오 경로
+        self.cancelled_path = None  # 만드는 중에 취소된 비디오 경로
+        self.player = None
+        self.restarted = threading.Event()  # 파일 열기/이동이 끝나 화면이 준비됐는지 여부
+
+    def request(self, paths):
+        """
+        미리보기를 만들 비디오 목록을 설정해요. 이미 캐시에 있는 비디오는 건너뛰어요.
+
+        매개변수:
+            paths: 비디오 경로 목록 (먼저 처리할 순서)
+        """
+        cache = get_preview_cache()
+        wanted = []
+        for path in paths:
+            if path and path not in wanted and not cache.has(path, PREVIEW_INFO_SUFFIX):
+                wanted.append(path)
+        with self.condition:
+            self.pending = wanted
+            self.condition.notify_all()
+
+    def cancel(self, path):
+        """
+        비디오의 미리보기 만들기를 취소하고, 만드는 중이었으면 파일을 닫을 때까지 기다려요.
+        (그 비디오를 지우거나 옮기기 전에 불러요)
+
+        매개변수:
+            path: 비디오 경로
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        with self.condition:
+            self.pending = [item for item in self.pending
+                            if os.path.normcase(os.path.abspath(item)) != key]
+            if self.current_path is None or os.path.normcase(os.path.abspath(self.current_path)) != key:
+                return
+            self.cancelled_path = self.current_path
+            self.restarted.set()  # 열기/이동 완료를 기다리는 중이면 바로 깨움
+            deadline = time.monotonic() + SEEK_TIMEOUT
+            while self.current_path is not None and self.current_path == self.cancelled_path:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+
+    def stop(self):
+        """스레드를 멈추고 미리보기용 플레이어를 종료해요."""
+        with self.condition:
+            self.running = False
+            self.pending = []
+            self.condition.notify_all()
+        self.restarted.set()
+        self.wait()
+
+    def run(self):
+        """대기열의 비디오를 하나씩 처리해요."""
+        if mpv is None:
+            return
+        try:
+            while True:
+                with self.condition:
+                    while self.running and not self.pending:
+                        self.condition.wait()
+                    if not self.running:
+                        break
+                    path = self.pending.pop(0)
+                    self.current_path = path
+                    self.cancelled_path = None
+                try:
+                    if self._generate(path):
+                        self.preview_ready.emit(path)
+                except Exception as e:
+                    print(f"Failed to create video preview: {str(e)}")
+                finally:
+                    # 파일을 닫은 뒤 (_generate의 stop) 취소를 기다리는 쪽에 알림
+                    with self.condition:
+                        self.current_path = None
+                        self.condition.notify_all()
+        finally:
+            if self.player is not None:
+                try:
+                    self.player.terminate()
+                except Exception as e:
+                    pass
+                self.player = None
+
+    def _ensure_player(self):
+        """미리보기용 플레이어를 처음 한 번만 만들어요."""
+        if self.player is None:
+            self.player = mpv.MPV(**PREVIEW_MPV_OPTIONS)
+            self.player.event_callback('playback-restart')(lambda event: self.restarted.set())
+        return self.player
+
+    def _wait_restart(self):
+        """파일 열기 또는 이동이 끝날 때까지 기다려요. (멈추거나 취소되면 False)"""
+        deadline = time.monotonic() + SEEK_TIMEOUT
+        while not self.restarted.wait(0.05):
+            if not self._is_active() or time.monotonic() >= deadline:
+                return False
+        return self._is_active()
+
+    def _is_active(self):
+        """지금 만드는 미리보기를 계속 만들어도 되는지 확인해요."""
+        return self.running and self.cancelled_path is None
+
+    def _generate(self, path):
+        """
+        비디오 하나의 포스터 프레임과 스프라이트 시트를 만들어 캐시에 저장해요.
+
+        반환값:
+            저장 성공 여부
+        """
+        from PIL import Image  # 스크린샷(screenshot-raw)을 다룰 때만 필요
+
+        cache = get_preview_cache()
+        player = self._ensure_player()
+        try:
+            self.restarted.clear()
+            player.loadfile(path, 'replace')
+            if not self._wait_restart():
+                return False
+
+            duration = player.duration or 0
+            poster = player.screenshot_raw('video').convert('RGB')
+            tile_width = max(1, round(poster.width * PREVIEW_TILE_HEIGHT / max(1, poster.height)))
+
+            info = {'duration': duration, 'count': 0,
+                    'tile_width': tile_width, 'tile_height': PREVIEW_TILE_HEIGHT}
+
+            if duration > 0:
+                sprite = Image.new('RGB', (tile_width * PREVIEW_TILE_COUNT, PREVIEW_TILE_HEIGHT))
+                for index in range(PREVIEW_TILE_COUNT):
+                    # 각 구간의 가운데 위치로 키프레임 이동
+                    self.restarted.clear()
+                    player.command('seek', duration * (index + 0.5) / PREVIEW_TILE_COUNT, 'absolute+keyframes')
+                    if not self._wait_restart():
+                        return False
+                    tile = player.screenshot_raw('video').convert('RGB')
+                    tile = tile.resize((tile_width, PREVIEW_TILE_HEIGHT), Image.BILINEAR)
+                    sprite.paste(tile, (index * tile_width, 0))
+                if cache.save_pil_image(path, SPRITE_SUFFIX, sprite, 'JPEG', quality=JPEG_QUALITY):
+                    info['count'] = PREVIEW_TILE_COUNT
+
+            poster.thumbnail((POSTER_MAX_SIZE, POSTER_MAX_SIZE), Image.BILINEAR)
+            cache.save_pil_image(path, POSTER_SUFFIX, poster, 'JPEG', quality=JPEG_QUALITY)
+            return cache.save_json(path, PREVIEW_INFO_SUFFIX, info)
+        finally:
+            try:
+                player.command('stop')
+            except Exception as e:
+                pass
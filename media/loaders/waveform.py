@@ -0,0 +1,305 @@
+# 오디오 파형 모듈
+# 오디오 파일을 한 번만 끝까지 디코딩해서 구간(bucket)마다 가장 작은 값과 가장 큰 값(peak)을 구해요.
+# 여러 해상도(구간 크기를 두 배씩 늘린 단계)로 미리보기 캐시에 저장해두기 때문에
+# 다음에 같은 파일을 열면 디코딩 없이 바로 슬라이더 뒤에 파형을 그릴 수 있어요.
+#
+# 디코딩은 화면/소리 출력이 없는 별도의 mpv 플레이어가 PCM 파일로 내보내고,
+# 구간 계산은 NumPy로 한꺼번에 처리해요. NumPy가 없으면 파형 기능만 꺼져요.
+
+import io  # 압축된 파형 자료를 메모리에서 읽고 쓰기
+import os  # 임시 파일 정리
+import tempfile  # 디코딩 결과를 잠시 저장할 임시 파일
+import threading  # 디코딩 완료 알림
+import time  # 취소 대기 시간 계산
+
+from PyQt5.QtCore import QThread, pyqtSignal  # 스레드 생성과 신호 전달 기능
+
+from media.loaders.preview_cache import get_preview_cache
+from core.utils.lazy_import import lazy_import
+
+# NumPy와 mpv는 파형을 처음 다룰 때 불러와요 (없으면 None)
+np = lazy_import('numpy')
+mpv = lazy_import('mpv')  # DLL 경로는 main.py 또는 audio_handler에서 먼저 설정돼요
+
+# 캐시 파일 접미사
+WAVEFORM_SUFFIX = '.peaks.npz'
+WAVEFORM_FAILED_SUFFIX = '.peaks.failed.json'  # 파형을 만들지 못한 파일 표시 (다시 시도하지 않음)
+
+WAVEFORM_SAMPLE_RATE = 8000  # 파형용으로 디코딩할 때의 샘플링 주파수 (모노)
+WAVEFORM_BUCKET_SAMPLES = 256  # 가장 세밀한 단계의 구간 크기 (샘플 수, 약 32ms)
+WAVEFORM_MIN_BUCKETS = 256  # 이보다 구간 수가 적어지면 더 거친 단계를 만들지 않음
+DECODE_TIMEOUT = 600.0  # 디코딩을 기다리는 최대 시간 (초)
+CANCEL_TIMEOUT = 2.0  # 취소한 디코딩이 파일을 닫을 때까지 기다리는 최대 시간 (초)
+
+# 파형 추출용 플레이어 옵션 (재생 속도와 관계없이 최대한 빨리 PCM으로 디코딩)
+WAVEFORM_MPV_OPTIONS = {
+    'vo': 'null',
+    'vid': 'no',
+    'sid': 'no',
+    'ao': 'pcm',
+    'ao_pcm_waveheader': False,  # 머리 없는 순수 PCM
+    'audio_format': 's16',
+    'audio_channels': 'mono',
+    'audio_samplerate': WAVEFORM_SAMPLE_RATE,
+    'untimed': True,
+    'ytdl': False,
+    'load_scripts': False,
+    'input_default_bindings': False,
+}
+
+
+def is_waveform_available():
+    """파형 기능에 필요한 NumPy와 mpv가 있는지 확인해요."""
+    return np is not None and mpv is not None
+
+
+class WaveformPeaks:
+    """
+    여러 해상도의 파형 정보를 담는 클래스예요.
+
+    속성:
+        levels: 단계별 (최솟값 배열, 최댓값 배열) 목록 (int8, 0번이 가장 세밀함)
+    """
+
+    def __init__(self, levels):
+        self.levels = levels
+
+    @classmethod
+    def from_samples(cls, samples):
+        """
+        16비트 샘플 배열에서 단계별 최솟값/최댓값을 계산해요.
+
+        매개변수:
+            samples: int16 NumPy 배열 (모노)
+        """
+        count = len(samples) // WAVEFORM_BUCKET_SAMPLES
+        if count == 0:
+            return cls([])
+        buckets = samples[:count * WAVEFORM_BUCKET_SAMPLES].reshape(count, WAVEFORM_BUCKET_SAMPLES)
+        # 16비트 값을 8비트로 줄여 저장 (그리기에는 충분한 정밀도)
+        mins = (buckets.min(axis=1) >> 8).astype(np.int8)
+        maxs = (buckets.max(axis=1) >> 8).astype(np.int8)
+        levels = [(mins, maxs)]
+        while len(mins) > WAVEFORM_MIN_BUCKETS:
+            # 이웃한 두 구간을 합쳐서 다음 단계를 만듦
+            if len(mins) % 2:
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+            mins = mins.reshape(-1, 2).min(axis=1)
+            maxs = maxs.reshape(-1, 2).max(axis=1)
+            levels.append((mins, maxs))
+        return cls(levels)
+
+    def to_bytes(self):
+        """캐시에 저장할 압축 자료를 만들어요."""
+        arrays = {}
+        for index, (mins, maxs) in enumerate(self.levels):
+            arrays[f'min{index}'] = mins
+            arrays[f'max{index}'] = maxs
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """캐시에서 읽은 압축 자료로 파형 정보를 만들어요."""
+        with np.load(io.BytesIO(data)) as arrays:
+            levels = []
+            index = 0
+            while f'min{index}' in arrays:
+                levels.append((arrays[f'min{index}'], arrays[f'max{index}']))
+                index += 1
+        return cls(levels)
+
+    def columns(self, width):
+        """
+        화면 너비(픽셀)에 맞춘 열마다의 최솟값/최댓값을 계산해요.
+
+        매개변수:
+            width: 열 개수 (픽셀)
+
+        반환값:
+            (최솟값 목록, 최댓값 목록) - -1.0 ~ 1.0 범위, 자료가 없으면 None
+        """
+        if not self.levels or width <= 0:
+            return None
+        # 열 수보다 구간이 많은 단계 중 가장 거친 단계 선택 (계산량 최소)
+        mins, maxs = self.levels[0]
+        for level_mins, level_maxs in self.levels:
+            if len(level_mins) < width:
+                break
+            mins, maxs = level_mins, level_maxs
+        starts = np.minimum((np.arange(width) * len(mins)) // width, len(mins) - 1)
+        column_mins = np.minimum.reduceat(mins, starts) / 128.0
+        column_maxs = np.maximum.reduceat(maxs, starts) / 128.0
+        return column_mins.tolist(), column_maxs.tolist()
+
+
+def load_waveform(file_path):
+    """
+    캐시에 저장된 파형 정보를 읽어요.
+
+    반환값:
+        WaveformPeaks 또는 None (없거나 NumPy가 없는 경우)
+    """
+    if np is None:
+        return None
+    data = get_preview_cache().load_bytes(file_path, WAVEFORM_SUFFIX)
+    if data is None:
+        return None
+    try:
+        return WaveformPeaks.from_bytes(data)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class WaveformThread(QThread):
+    """
+    오디오 파형을 백그라운드에서 추출해서 캐시에 저장하는 스레드예요.
+    재생용 플레이어와 별개의 플레이어로 디코딩하므로 재생을 방해하지 않아요.
+
+    신호(Signals):
+        waveform_ready: 파형을 캐시에 저장했을 때 발생 (오디오 경로)
+    """
+    waveform_ready = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending = []
+        self.condition = threading.Condition()
+        self.running = True
+        self.current_path = None  # 지금 파형을 추출하고 있는 오디오 경로
+        self.cancelled_path = None  # 추출 중에 취소된 오디오 경로
+        self.decode_done = threading.Event()
+
+    def request(self, file_path):
+        """
+        파형 추출을 요청해요. 아직 시작하지 않은 이전 요청은 버려요.
+        이미 파형이 있거나 예전에 추출하지 못한 파일은 요청하지 않아요.
+
+        매개변수:
+            file_path: 오디오 파일 경로
+        """
+        if not is_waveform_available():
+            return
+        cache = get_preview_cache()
+        if cache.has(file_path, WAVEFORM_SUFFIX) or cache.has(file_path, WAVEFORM_FAILED_SUFFIX):
+            return
+        with self.condition:
+            self.pending = [file_path]
+            self.condition.notify()
+
+    def cancel(self, path):
+        """
+        오디오의 파형 추출을 취소하고, 추출 중이었으면 파일을 닫을 때까지 기다려요.
+        (그 오디오를 지우거나 옮기기 전에 불러요)
+
+        매개변수:
+            path: 오디오 경로
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        with self.condition:
+            self.pending = [item for item in self.pending
+                            if os.path.normcase(os.path.abspath(item)) != key]
+            if self.current_path is None or os.path.normcase(os.path.abspath(self.current_path)) != key:
+                return
+            self.cancelled_path = self.current_path
+            self.decode_done.set()  # 디코딩을 기다리는 중이면 바로 깨움
+            deadline = time.monotonic() + CANCEL_TIMEOUT
+            while self.current_path is not None and self.current_path == self.cancelled_path:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+
+    def stop(self):
+        """스레드를 멈춰요. 진행 중인 디코딩도 중단해요."""
+        with self.condition:
+            self.running = False
+            self.pending = []
+            self.condition.notify_all()
+        self.decode_done.set()
+        self.wait()
+
+    def _is_active(self):
+        """지금 추출하는 파형을 계속 만들어도 되는지 확인해요."""
+        return self.running and self.cancelled_path is None
+
+    def run(self):
+        """대기열의 오디오를 하나씩 처리해요."""
+        while True:
+            with self.condition:
+                while self.running and not self.pending:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                path = self.pending.pop(0)
+                self.current_path = path
+                self.cancelled_path = None
+            try:
+                peaks = self._extract(path)
+                if not self._is_active():
+                    continue
+                if peaks is not None and peaks.levels:
+                    if get_preview_cache().save_bytes(path, WAVEFORM_SUFFIX, peaks.to_bytes()):
+                        self.waveform_ready.emit(path)
+                else:
+                    self._mark_failed(path, "no audio decoded")
+            except Exception as e:
+                print(f"Failed to extract waveform: {str(e)}")
+                if self._is_active():
+                    self._mark_failed(path, str(e))
+            finally:
+                # 파일을 닫은 뒤 (_extract의 terminate) 취소를 기다리는 쪽에 알림
+                with self.condition:
+                    self.current_path = None
+                    self.condition.notify_all()
+
+    def _mark_failed(self, path, reason):
+        """파형을 만들지 못한 파일을 캐시에 표시해서 열 때마다 다시 디코딩하지 않게 해요."""
+        get_preview_cache().save_json(path, WAVEFORM_FAILED_SUFFIX, {'error': reason, 'time': time.time()})
+
+    def _extract(self, path):
+        """
+        오디오를 PCM 임시 파일로 디코딩한 뒤 파형 정보를 계산해요.
+
+        반환값:
+            WaveformPeaks 또는 None (중단되었거나 디코딩하지 못한 경우)
+        """
+        # stop()/cancel()이 디코딩 시작 전에 알림을 보냈어도 놓치지 않도록 먼저 지우고 확인
+        self.decode_done.clear()
+        if not self._is_active():
+            return None
+        handle, pcm_path = tempfile.mkstemp(suffix='.pcm')
+        os.close(handle)
+        player = None
+        try:
+            # 출력 파일은 오디오 출력을 만들 때 정해지므로 파일마다 플레이어를 새로 만듦
+            player = mpv.MPV(ao_pcm_file=pcm_path, **WAVEFORM_MPV_OPTIONS)
+            player.event_callback('end-file')(lambda event: self.decode_done.set())
+            player.loadfile(path, 'replace')
+            finished = self.decode_done.wait(DECODE_TIMEOUT)
+            player.terminate()
+            player = None
+            if not self._is_active():
+                return None
+            if not finished:
+                raise TimeoutError(f"decoding took longer than {DECODE_TIMEOUT:.0f}s")
+
+            if os.path.getsize(pcm_path) < 2:
+                return None
+            samples = np.memmap(pcm_path, dtype='<i2', mode='r')
+            try:
+                return WaveformPeaks.from_samples(samples)
+            finally:
+                del samples
+        finally:
+            if player is not None:
+                try:
+                    player.terminate()
+                except Exception as e:
+                    pass
+            try:
+                os.remove(pcm_path)
+            except OSError:
+                pass
@@ -6,16 +6,29 @@ import os
 import sys
 import platform
 
-def configure_mpv_path():
+from core.startup_profiler import startup_profiler
+from core.utils.lazy_import import lazy_import
+
+def configure_mpv_path(verbose=None):
     """
     MPV DLL 파일 경로를 환경 변수에 설정
+    
+    Args:
+        verbose: 진행 상황을 콘솔에 출력할지 여부 (None이면 시작 보고서(--import-report)를 켠 경우에만)
     """
-    print("Configuring MPV path...")
+    if verbose is None:
+        verbose = startup_profiler.is_import_report_enabled()
+    
+    def report(message):
+        if verbose:
+            print(message)
+    
+    report("Configuring MPV path...")
     
     # PyInstaller로 패키징된 경우
     if getattr(sys, 'frozen', False):
         base_path = os.path.dirname(sys.executable)
-        print(f"Running in packaged mode, base path: {base_path}")
+        report(f"Running in packaged mode, base path: {base_path}")
         
         # 시스템별 라이브러리 파일명
         if platform.system() == 'Windows':
@@ -23,14 +36,14 @@ def configure_mpv_path():
             
             # 현재 실행 파일 경로를 PATH에 추가
             os.environ["PATH"] = base_path + os.pathsep + os.environ["PATH"]
-            print(f"Updated PATH: {os.environ['PATH']}")
+            report(f"Updated PATH: {os.environ['PATH']}")
             
             # 모든 가능한 DLL 파일 검색
             for dll in dll_names:
                 dll_path = os.path.join(base_path, dll)
                 if os.path.exists(dll_path):
                     os.environ["MPV_DYLIB_PATH"] = dll_path
-                    print(f"Found MPV DLL: {dll_path}")
+                    report(f"Found MPV DLL: {dll_path}")
                     return True
         
         elif platform.system() == 'Darwin':  # macOS
@@ -45,28 +58,15 @@ def configure_mpv_path():
                 os.environ["MPV_DYLIB_PATH"] = lib_path
                 return True
     
-    print("MPV library not found in package, using system paths")
+    report("MPV library not found in package, using system paths")
     return False
 
 # MPV 모듈을 임포트하기 전에 경로 설정
 configure_mpv_path()
 
-# 실제 MPV 모듈 임포트
-try:
-    import mpv
-    print("MPV module imported successfully")
-except Exception as e:
-    print(f"Error importing MPV: {e}")
-    # 객체를 생성할 수 없을 경우 더미 클래스 제공
-    class DummyMPV:
-        def __init__(self, *args, **kwargs):
-            print("WARNING: Using dummy MPV implementation")
-            self.dummy = True
-        
-        def __getattr__(self, name):
-            return lambda *args, **kwargs: None
-    
-    mpv.MPV = DummyMPV
+# 실제 MPV 모듈은 처음 사용할 때 임포트 (libmpv 로드는 플레이어를 처음 만들 때 일어남)
+# 설치되지 않았으면 None
+mpv = lazy_import('mpv')
 
 # mpv 모듈 재내보내기
 __all__ = ['mpv'] 
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+테스트 공통 설정
+
+저장소 루트를 모듈 검색 경로에 추가해서 테스트에서 core, media 등의 패키지를 불러올 수 있게 합니다.
+화면이 없는 환경에서도 Qt 위젯을 만들 수 있도록 offscreen 플랫폼을 사용합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """테스트 전체에서 함께 사용하는 QApplication"""
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
@@ -0,0 +1,162 @@
+"""
+중복 파일 확인(DedupIndex)과 중복 처리된 복사/이동 결과 테스트
+
+크기와 부분 해시가 같은 큰 파일의 전체 해시는 GUI 스레드에서 계산하지 않고
+DuplicateCheckThread로 미루는지, 대상 폴더에 같은 파일이 있어 건너뛴 이동이
+실패가 아닌 "중복으로 건너뜀" 결과로 전달되는지 확인합니다.
+"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from file import dedup_index
+from file import operations as operations_module
+from file.dedup_index import DedupIndex, DuplicateCheckDeferred, DuplicateCheckThread
+from file.operations import (
+    FileOperations, DEDUP_SKIP, RESULT_DONE, RESULT_PENDING, RESULT_SKIPPED_DUPLICATE
+)
+
+LARGE_BYTES = 4096
+
+
+class FakeViewer:
+    """메시지만 기록하는 뷰어"""
+
+    def __init__(self, current_image_path=None):
+        self.messages = []
+        self.current_image_path = current_image_path
+
+    def show_message(self, message):
+        self.messages.append(message)
+
+
+@pytest.fixture(autouse=True)
+def user_data(tmp_path, monkeypatch):
+    """사용자 데이터 폴더를 임시 폴더로 바꾸고, 큰 파일 기준을 작게 만듭니다."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setattr(dedup_index, 'QUICK_FULL_HASH_MAX_BYTES', LARGE_BYTES)
+    monkeypatch.setattr(operations_module, 'QUICK_FULL_HASH_MAX_BYTES', LARGE_BYTES)
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(data)
+    return path
+
+
+def _large(tail):
+    """앞/뒤 부분 해시 범위 밖(가운데)만 다른 큰 파일 내용"""
+    middle = dedup_index.PARTIAL_HASH_BYTES
+    return b'a' * middle + tail + b'z' * middle
+
+
+def _run(thread, qapp):
+    """스레드를 실행하고 결과 시그널을 받아 반환합니다."""
+    received = []
+    thread.hashed.connect(received.append)
+    thread.start()
+    deadline = time.monotonic() + 5.0
+    while not received and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    thread.wait()
+    return received[0]
+
+
+def test_small_duplicate_is_found_directly(tmp_path):
+    source = _write(str(tmp_path / "in" / "a.jpg"), b"same content")
+    target = str(tmp_path / "out")
+    _write(os.path.join(target, "copy.jpg"), b"same content")
+    _write(os.path.join(target, "other.jpg"), b"diff content")
+
+    index = DedupIndex()
+
+    found = index.find_duplicate(source, target, dedup_index.QUICK_FULL_HASH_MAX_BYTES)
+    assert found == os.path.join(target, "copy.jpg")
+
+
+def test_large_candidate_is_hashed_off_thread(tmp_path, qapp):
+    source = _write(str(tmp_path / "in" / "clip.mp4"), _large(b"1"))
+    target = str(tmp_path / "out")
+    same = _write(os.path.join(target, "same.mp4"), _large(b"1"))
+    _write(os.path.join(target, "near.mp4"), _large(b"2"))
+    index = DedupIndex()
+
+    with pytest.raises(DuplicateCheckDeferred) as deferred:
+        index.find_duplicate(source, target, dedup_index.QUICK_FULL_HASH_MAX_BYTES)
+    assert deferred.value.paths[0] == source
+    assert sorted(deferred.value.paths[1:]) == sorted([same, os.path.join(target, "near.mp4")])
+
+    index.store_full_hashes(_run(DuplicateCheckThread(deferred.value.paths), qapp))
+
+    # 해시가 저장된 뒤에는 GUI 스레드에서 바로 비교됨
+    assert index.find_duplicate(source, target, dedup_index.QUICK_FULL_HASH_MAX_BYTES) == same
+
+
+def test_cancelled_check_sends_nothing(tmp_path):
+    path = _write(str(tmp_path / "in" / "clip.mp4"), _large(b"1"))
+    thread = DuplicateCheckThread([path])
+    received = []
+    thread.hashed.connect(received.append)
+    # 파일 이동/삭제 전 중단 요청을 받은 상태
+    thread.isInterruptionRequested = lambda: True
+
+    thread.run()
+
+    assert received == []
+
+
+def test_move_onto_duplicate_is_reported_as_skipped(tmp_path):
+    source = _write(str(tmp_path / "in" / "a.jpg"), b"same content")
+    target = str(tmp_path / "out")
+    duplicate = _write(os.path.join(target, "a.jpg"), b"same content")
+    operations = FileOperations(FakeViewer(source))
+    operations.dedup_mode = DEDUP_SKIP
+
+    result, path = operations.move_file_to_folder(source, target)
+
+    assert result == RESULT_SKIPPED_DUPLICATE
+    assert path == duplicate
+    assert os.path.exists(source)
+
+
+def test_large_copy_waits_for_background_check(tmp_path, qapp):
+    source = _write(str(tmp_path / "in" / "clip.mp4"), _large(b"1"))
+    target = str(tmp_path / "out")
+    duplicate = _write(os.path.join(target, "clip.mp4"), _large(b"1"))
+    operations = FileOperations(FakeViewer(source))
+    operations.dedup_mode = DEDUP_SKIP
+    finished = []
+
+    result, _ = operations.copy_file_to_folder(source, target, on_finished=lambda *args: finished.append(args))
+
+    assert result == RESULT_PENDING
+    deadline = time.monotonic() + 5.0
+    while not finished and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    assert finished == [(source, RESULT_SKIPPED_DUPLICATE, duplicate)]
+    assert sorted(os.listdir(target)) == ["clip.mp4"]
+    assert not operations.duplicate_checks
+
+
+def test_large_copy_without_duplicate_is_copied(tmp_path, qapp):
+    source = _write(str(tmp_path / "in" / "clip.mp4"), _large(b"1"))
+    target = str(tmp_path / "out")
+    _write(os.path.join(target, "near.mp4"), _large(b"2"))
+    operations = FileOperations(FakeViewer(source))
+    operations.dedup_mode = DEDUP_SKIP
+    finished = []
+
+    operations.copy_file_to_folder(source, target, on_finished=lambda *args: finished.append(args))
+    deadline = time.monotonic() + 5.0
+    while not finished and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+
+    assert finished == [(source, RESULT_DONE, os.path.join(target, "clip.mp4"))]
@@ -0,0 +1,179 @@
+"""
+리소스 폐기 큐(DisposalQueue) 테스트
+
+폐기 중에 새 리소스가 예약되거나 drain()이 다시 호출되어도
+각 리소스가 한 번씩만 폐기되고 큐가 재진입 없이 비워지는지,
+이미지를 표시하는 도중에는 폐기 큐가 실행되지 않는지 확인합니다.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from core.memory import disposal_queue as disposal_module
+from core.memory.disposal_queue import DisposalQueue
+
+
+class FakeResource:
+    """dispose()가 호출되면 기록하고, 필요하면 폐기 중에 다른 작업을 수행하는 리소스"""
+
+    def __init__(self, log, name, on_dispose=None):
+        self.log = log
+        self.name = name
+        self.on_dispose = on_dispose
+
+    def dispose(self):
+        self.log.append(self.name)
+        if self.on_dispose is not None:
+            self.on_dispose()
+
+
+class FakeApplication:
+    """이벤트 루프 유무를 바꾸기 위한 QCoreApplication 대체 객체"""
+
+    running = False
+
+    @classmethod
+    def instance(cls):
+        return object() if cls.running else None
+
+
+class FakeTimer:
+    """QTimer.singleShot으로 예약된 함수를 모아두었다가 직접 실행하는 대체 객체"""
+
+    scheduled = []
+
+    @classmethod
+    def singleShot(cls, msec, callback):
+        cls.scheduled.append(callback)
+
+    @classmethod
+    def run_next_turn(cls):
+        """이벤트 루프 한 바퀴: 지금까지 예약된 함수만 실행"""
+        callbacks, cls.scheduled = cls.scheduled, []
+        for callback in callbacks:
+            callback()
+
+
+@pytest.fixture
+def fake_loop(monkeypatch):
+    """이벤트 루프를 흉내 내는 환경 (running 값으로 루프 유무 선택)"""
+    FakeApplication.running = False
+    FakeTimer.scheduled = []
+    monkeypatch.setattr(disposal_module, "QCoreApplication", FakeApplication)
+    monkeypatch.setattr(disposal_module, "QTimer", FakeTimer)
+    return FakeApplication
+
+
+def test_enqueue_during_drain_without_event_loop(fake_loop):
+    queue = DisposalQueue()
+    log = []
+    second = FakeResource(log, "second")
+    first = FakeResource(log, "first", lambda: queue.dispose(second))
+
+    queue.dispose(first)
+
+    assert log == ["first", "second"]
+    assert queue.pending == []
+    assert not queue.draining
+
+
+def test_enqueue_during_drain_is_deferred_to_next_turn(fake_loop):
+    fake_loop.running = True
+    queue = DisposalQueue()
+    log = []
+    second = FakeResource(log, "second")
+    first = FakeResource(log, "first", lambda: queue.dispose(second))
+
+    queue.dispose(first)
+    queue.dispose(FakeResource(log, "batched"))
+    assert log == []
+    assert len(FakeTimer.scheduled) == 1  # 한 바퀴에 한 번만 예약
+
+    FakeTimer.run_next_turn()
+    assert log == ["first", "batched"]
+    assert queue.pending == [second]
+    assert len(FakeTimer.scheduled) == 1
+
+    FakeTimer.run_next_turn()
+    assert log == ["first", "batched", "second"]
+    assert queue.pending == []
+    assert FakeTimer.scheduled == []
+
+
+def test_nested_drain_call_does_not_reenter(fake_loop):
+    fake_loop.running = True
+    queue = DisposalQueue()
+    log = []
+    draining_seen = []
+
+    def nested_drain():
+        draining_seen.append(queue.draining)
+        queue.drain()
+
+    queue.dispose(FakeResource(log, "first", nested_drain))
+    queue.dispose(FakeResource(log, "second"))
+    FakeTimer.run_next_turn()
+
+    assert log == ["first", "second"]
+    assert draining_seen == [True]
+    assert queue.pending == []
+    assert not queue.draining
+
+
+def test_failing_resource_does_not_block_queue(fake_loop):
+    queue = DisposalQueue()
+    log = []
+
+    def fail():
+        raise RuntimeError("dispose failed")
+
+    queue.pending.append(FakeResource(log, "broken", fail))
+    queue.dispose(FakeResource(log, "after"))
+
+    assert log == ["broken", "after"]
+    assert not queue.draining
+
+
+def test_show_image_does_not_drain_disposals(qapp, tmp_path, monkeypatch):
+    main = pytest.importorskip("main")
+    from PIL import Image
+    from core.memory import get_disposal_queue
+
+    # 전체화면에서 5MB가 넘는 이미지 (예전에는 이 경우 processEvents()를 호출함)
+    image_path = str(tmp_path / "large.bmp")
+    Image.new('RGB', (1400, 1400), (40, 80, 120)).save(image_path)
+    viewer = main.MediaSorterPAAK()
+    monkeypatch.setattr(viewer, "isFullScreen", lambda: True)
+
+    queue = get_disposal_queue()
+    queue.drain()
+    inside_show_image = []
+    disposed_inside = []
+    log = []
+    original_dispose_now = queue._dispose_now
+
+    def record_dispose_now(resource):
+        if inside_show_image:
+            disposed_inside.append(resource)
+        original_dispose_now(resource)
+
+    monkeypatch.setattr(queue, "_dispose_now", record_dispose_now)
+    queue.dispose(FakeResource(log, "previous media"))
+
+    inside_show_image.append(True)
+    try:
+        viewer.show_image(image_path)
+        viewer.show_loading_indicator()
+        viewer.hide_loading_indicator()
+    finally:
+        inside_show_image.clear()
+
+    assert disposed_inside == []
+    assert log == []
+
+    # 탐색이 끝난 뒤 이벤트 루프가 한 바퀴 돌면 폐기됨
+    qapp.processEvents()
+    assert log == ["previous media"]
+    viewer.cleanup_current_media()
+    viewer.cancel_pending_loaders(None)
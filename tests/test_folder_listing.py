@@ -0,0 +1,122 @@
+"""
+폴더 목록 읽기(on_folder_listed) 테스트
+
+백그라운드에서 읽은 폴더 목록에 현재 파일이 없을 때(목록을 읽는 동안 옮겨지거나 지워진 경우)
+목록을 버리지 않고 정렬 순서상 가장 가까운 파일로 옮겨 가는지 확인합니다.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import main
+from file.navigator import FileNavigator
+
+
+class FakeStateManager:
+    def __init__(self):
+        self.state = {}
+
+    def set_state(self, key, value):
+        self.state[key] = value
+
+
+class FakeViewer:
+    """on_folder_listed에 필요한 속성만 가진 뷰어"""
+
+    on_folder_listed = main.MediaSorterPAAK.on_folder_listed
+    _sorted_position = main.MediaSorterPAAK._sorted_position
+
+    def __init__(self, current_image_path):
+        self.current_image_path = current_image_path
+        self.image_files = [current_image_path]
+        self.current_index = 0
+        self.folder_listing_thread = object()
+        self.folder_listing_pending = True
+        self.state_manager = FakeStateManager()
+        self.file_navigator = FileNavigator(self)
+        self.shown = []
+        self.probed = []
+
+    def sender(self):
+        return self.folder_listing_thread
+
+    def show_image(self, image_path):
+        self.shown.append(image_path)
+        self.current_image_path = image_path
+
+    def update_image_info(self):
+        pass
+
+    def probe_folder_media(self, files):
+        self.probed.append(files)
+
+
+def _make_files(folder, names):
+    paths = []
+    for name in names:
+        path = os.path.join(str(folder), name)
+        with open(path, 'wb') as file:
+            file.write(b"image")
+        paths.append(path)
+    return paths
+
+
+def test_listing_selects_current_file(tmp_path):
+    files = _make_files(tmp_path, ["a1.jpg", "a2.jpg", "a10.jpg"])
+    viewer = FakeViewer(files[1])
+
+    viewer.on_folder_listed(str(tmp_path), files)
+
+    assert not viewer.folder_listing_pending
+    assert viewer.file_navigator.files == files
+    assert viewer.file_navigator.current_index == 1
+    assert viewer.shown == []
+
+
+def test_moved_file_falls_back_to_nearest_neighbour(tmp_path):
+    files = _make_files(tmp_path, ["a1.jpg", "a2.jpg", "a10.jpg"])
+    viewer = FakeViewer(files[1])
+    os.remove(files[1])
+
+    viewer.on_folder_listed(str(tmp_path), files)
+
+    assert viewer.file_navigator.files == [files[0], files[2]]
+    assert viewer.current_index == 1
+    assert viewer.shown == [files[2]]
+
+
+def test_last_file_removed_falls_back_to_previous(tmp_path):
+    files = _make_files(tmp_path, ["a1.jpg", "a2.jpg", "a10.jpg"])
+    viewer = FakeViewer(files[2])
+    os.remove(files[2])
+
+    viewer.on_folder_listed(str(tmp_path), files[:2])
+
+    assert viewer.file_navigator.files == files[:2]
+    assert viewer.current_index == 1
+    assert viewer.shown == [files[1]]
+
+
+def test_file_created_after_listing_is_inserted_in_order(tmp_path):
+    files = _make_files(tmp_path, ["a1.jpg", "a2.jpg", "a10.jpg"])
+    viewer = FakeViewer(files[1])
+
+    viewer.on_folder_listed(str(tmp_path), [files[0], files[2]])
+
+    assert viewer.file_navigator.files == files
+    assert viewer.current_index == 1
+    assert viewer.shown == []
+
+
+def test_result_of_replaced_listing_is_ignored(tmp_path):
+    files = _make_files(tmp_path, ["a1.jpg", "a2.jpg"])
+    viewer = FakeViewer(files[0])
+    viewer.sender = lambda: None
+
+    viewer.on_folder_listed(str(tmp_path), files)
+
+    assert viewer.folder_listing_pending
+    assert viewer.image_files == [files[0]]
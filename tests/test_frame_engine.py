@@ -0,0 +1,266 @@
+"""
+애니메이션 프레임 엔진(AnimationFrameEngine)과 파일 구조 확인(animation_probe) 테스트
+
+GIF/WEBP 파일 구조에서 프레임 지연 시간과 처리 방법(disposal)을 읽는지,
+재생 위치가 바뀌면 보관 구간 밖의 프레임을 지우는지, 보관(park) 중에는 디코딩 스레드가 끝나고
+다시 시작(resume)하면 이어서 디코딩하는지, 멀리 떨어진 프레임으로 이동하면 가까운 키프레임부터
+디코딩해서 처음부터 디코딩한 것과 같은 화면을 만드는지 확인합니다.
+"""
+
+import struct
+import time
+from io import BytesIO
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PIL import Image, features
+
+from media.loaders.animation_probe import (
+    probe_animation, DISPOSE_NONE, DISPOSE_BACKGROUND, DISPOSE_PREVIOUS
+)
+from media.loaders.frame_engine import AnimationFrameEngine
+
+WIDTH, HEIGHT = 32, 24
+FRAME_BYTES = WIDTH * HEIGHT * 4
+
+
+def _palette_color(index):
+    """시험용 색상표의 index번 색"""
+    return (index, 255 - index, (index * 7) % 256)
+
+
+PALETTE = b''.join(bytes(_palette_color(index)) for index in range(256))
+
+
+def _gif_image_block(width, height, color_index, x=0, y=0):
+    """Pillow로 한 가지 색의 이미지 블록(이미지 설명자 + LZW 데이터)을 만들고 위치를 바꿉니다."""
+    image = Image.new('P', (width, height), color_index)
+    image.putpalette(PALETTE)
+    buffer = BytesIO()
+    image.save(buffer, 'GIF', optimize=False)
+    data = buffer.getvalue()
+    pos = 13 + 3 * (2 << (data[10] & 0x07))
+    while data[pos] == 0x21:  # 확장 블록 건너뛰기
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    block = bytearray(data[pos:-1])  # 끝 표시(0x3B) 제외
+    block[1:5] = struct.pack('<HH', x, y)
+    return bytes(block)
+
+
+def _write_gif(path, frames):
+    """
+    프레임 목록으로 GIF를 씁니다.
+
+    frames: (지연 시간(ms), 처리 방법, 투명 여부, (x, y, 너비, 높이), 색 번호) 목록
+    """
+    data = b'GIF89a' + struct.pack('<HH', WIDTH, HEIGHT) + bytes([0xF7, 0, 0]) + PALETTE
+    for delay, disposal, transparent, (x, y, width, height), color_index in frames:
+        packed = (disposal << 2) | (1 if transparent else 0)
+        data += b'\x21\xf9\x04' + bytes([packed]) + struct.pack('<H', delay // 10) + b'\xff\x00'
+        data += _gif_image_block(width, height, color_index, x, y)
+    with open(path, 'wb') as file:
+        file.write(data + b'\x3b')
+
+
+def _patch_rect(index):
+    """index번 프레임이 그리는 작은 영역"""
+    return (index * 2, index, 4, 4)
+
+
+def _scene_frames():
+    """
+    12프레임 GIF: 0번과 5번은 캔버스 전체를 덮는 키프레임, 나머지는 작은 영역만 덧그림
+    """
+    frames = []
+    for index in range(12):
+        if index in (0, 5):
+            frames.append((40, 1, False, (0, 0, WIDTH, HEIGHT), 10 + index))
+        else:
+            frames.append((40, 1, False, _patch_rect(index), 20 + index))
+    return frames
+
+
+def _expected_pixel(index, x, y):
+    """index번 프레임까지 그렸을 때 (x, y)의 색"""
+    keyframe = 5 if index >= 5 else 0
+    color_index = 10 + keyframe
+    for patch in range(keyframe + 1, index + 1):
+        px, py, width, height = _patch_rect(patch)
+        if px <= x < px + width and py <= y < py + height:
+            color_index = 20 + patch
+    return _palette_color(color_index)
+
+
+def _assert_frame(image, index):
+    """프레임 이미지가 처음부터 그린 화면과 같은지 확인합니다."""
+    assert image is not None, index
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            assert image.pixelColor(x, y).getRgb()[:3] == _expected_pixel(index, x, y), (index, x, y)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def scene_gif(tmp_path):
+    path = str(tmp_path / "scene.gif")
+    _write_gif(path, _scene_frames())
+    return path
+
+
+@pytest.fixture
+def engines():
+    """테스트가 끝나면 엔진의 디코딩 스레드를 멈춥니다."""
+    created = []
+
+    def create(*args, **kwargs):
+        engine = AnimationFrameEngine(*args, **kwargs)
+        created.append(engine)
+        return engine
+
+    yield create
+    for engine in created:
+        engine.stop()
+
+
+# ---------------------------------------------------------------- 파일 구조 확인
+
+def test_probe_gif_delays_and_disposal(tmp_path):
+    path = str(tmp_path / "disposal.gif")
+    _write_gif(path, [
+        (40, 1, False, (0, 0, WIDTH, HEIGHT), 1),
+        (70, 2, True, (4, 4, 8, 8), 2),
+        (120, 3, False, (0, 0, 8, 8), 3),
+        (30, 0, False, (0, 0, WIDTH, HEIGHT), 4),
+    ])
+
+    info = probe_animation(path)
+
+    assert info.format == 'gif'
+    assert (info.width, info.height) == (WIDTH, HEIGHT)
+    assert [frame.delay for frame in info.frames] == [40, 70, 120, 30]
+    assert [frame.disposal for frame in info.frames] == [
+        DISPOSE_NONE, DISPOSE_BACKGROUND, DISPOSE_PREVIOUS, DISPOSE_NONE]
+    assert [frame.opaque for frame in info.frames] == [True, False, True, True]
+    assert info.frames[1].rect == (4, 4, 8, 8)
+    assert info.keyframes == [0, 3]
+
+
+def _anmf_offsets(data):
+    """WEBP 파일의 ANMF 청크 위치 목록"""
+    offsets = []
+    pos = 12
+    while pos + 8 <= len(data):
+        size = struct.unpack_from('<I', data, pos + 4)[0]
+        if data[pos:pos + 4] == b'ANMF':
+            offsets.append(pos)
+        pos += 8 + size + (size & 1)
+    return offsets
+
+
+@pytest.mark.skipif(not features.check('webp'), reason="Pillow without WebP support")
+def test_probe_webp_delays_and_disposal(tmp_path):
+    path = str(tmp_path / "anim.webp")
+    images = [Image.new('RGB', (WIDTH, HEIGHT), _palette_color(index * 40)) for index in range(4)]
+    images[0].save(path, save_all=True, append_images=images[1:], duration=[40, 70, 120, 30],
+                   loop=0, lossless=True)
+    # 1번 프레임을 "배경으로 지움 + 덮어쓰기"로 표시
+    data = bytearray(open(path, 'rb').read())
+    data[_anmf_offsets(data)[1] + 23] |= 0x03
+    with open(path, 'wb') as file:
+        file.write(data)
+
+    info = probe_animation(path)
+
+    assert info.format == 'webp'
+    assert (info.width, info.height) == (WIDTH, HEIGHT)
+    assert [frame.delay for frame in info.frames] == [40, 70, 120, 30]
+    assert info.frames[1].disposal == DISPOSE_BACKGROUND
+    assert not info.frames[1].blend
+    assert info.frames[0].keyframe
+
+
+def test_probe_rejects_other_files(tmp_path):
+    path = tmp_path / "still.png"
+    Image.new('RGB', (4, 4)).save(path)
+
+    assert probe_animation(str(path)) is None
+
+
+# ---------------------------------------------------------------- 프레임 엔진
+
+def test_window_evicts_frames_behind_position(scene_gif, qapp, engines):
+    engine = engines(scene_gif, max_bytes=3 * FRAME_BYTES)
+    assert engine.window == 3
+    engine.start()
+
+    assert _wait_for(lambda: all(engine.get_frame(index) for index in range(3)))
+    assert set(engine.frames) == {0, 1, 2}
+
+    engine.set_position(6)
+
+    assert _wait_for(lambda: all(engine.get_frame(index) for index in (6, 7, 8)))
+    with engine.condition:
+        assert set(engine.frames) == {6, 7, 8}
+        assert engine.memory_bytes == sum(image.bytesPerLine() * image.height()
+                                          for image in engine.frames.values())
+    for index in (6, 7, 8):
+        _assert_frame(engine.get_frame(index), index)
+
+
+def test_seek_starts_from_nearest_keyframe(scene_gif, qapp, engines):
+    engine = engines(scene_gif, max_bytes=3 * FRAME_BYTES)
+    engine._apply_probe(probe_animation(scene_gif))
+
+    assert engine.keyframes == [0, 5]
+    with engine.condition:
+        assert engine._choose_start(8, None) == (5, None)
+        assert engine._choose_start(3, None) == (0, None)
+        # 가까운 프레임은 현재 디코더로 이어서 읽음
+        assert engine._choose_start(7, 6) is None
+
+
+def test_seek_decodes_same_frames_as_playing_from_start(scene_gif, qapp, engines):
+    engine = engines(scene_gif, max_bytes=3 * FRAME_BYTES)
+    engine.set_position(9)
+    engine.start()
+
+    assert _wait_for(lambda: all(engine.get_frame(index) for index in (9, 10, 11)))
+    for index in (9, 10, 11):
+        _assert_frame(engine.get_frame(index), index)
+    assert engine.get_delay(9) == 40
+
+
+def test_park_closes_decoder_and_resume_continues(scene_gif, qapp, engines):
+    engine = engines(scene_gif)
+    assert engine.keeps_all_frames()
+    engine.start()
+    engine.set_display(0, WIDTH * 2, HEIGHT * 2)
+    assert _wait_for(lambda: engine.get_display_frame(0) is not None)
+    assert _wait_for(lambda: len(engine.frames) == 12)
+
+    engine.park()
+
+    assert not engine.decode_thread.isRunning()
+    assert len(engine.frames) == 12  # 디코딩한 원본 프레임은 남겨둠
+    assert engine.get_display_frame(0) is None
+
+    engine.resume()
+    engine.set_display(90, HEIGHT * 2, WIDTH * 2)
+
+    assert engine.decode_thread.isRunning()
+    assert _wait_for(lambda: engine.get_display_frame(0) is not None)
+    display = engine.get_display_frame(0)
+    assert (display.width(), display.height()) == (HEIGHT * 2, WIDTH * 2)
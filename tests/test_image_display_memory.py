@@ -0,0 +1,94 @@
+"""
+이미지 표시 메모리 테스트
+
+on_image_loaded -> display_image 경로로 이미지 하나를 표시했을 때
+캐시 항목과 핸들러의 원본이 같은 버퍼를 공유하고, 원본 크기 복사본이 추가로 생기지 않는지 확인합니다.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("PIL")
+
+from PyQt5.QtGui import QPixmap, QColor
+from PyQt5.QtWidgets import QLabel
+
+import main
+from media.handlers.image_handler import ImageHandler
+from media.loaders.cache_manager import LRUCache
+
+IMAGE_WIDTH = 2000
+IMAGE_HEIGHT = 1500
+LABEL_WIDTH = 400
+LABEL_HEIGHT = 300
+
+
+class FakeViewer:
+    """on_image_loaded가 사용하는 MediaSorterPAAK 속성만 가진 뷰어"""
+
+    on_image_loaded = main.MediaSorterPAAK.on_image_loaded
+    handle_image_caching = main.MediaSorterPAAK.handle_image_caching
+    display_image = main.MediaSorterPAAK.display_image
+    cleanup_image_loader = main.MediaSorterPAAK.cleanup_image_loader
+
+    def __init__(self, image_path):
+        self.current_image_path = image_path
+        self.current_rotation = 0
+        self.image_cache = LRUCache(10)
+        self.psd_cache = LRUCache(3)
+        self.gif_cache = LRUCache(3)
+        self.loader_threads = {}
+
+    def hide_loading_indicator(self):
+        pass
+
+    def isFullScreen(self):
+        return False
+
+    def width(self):
+        return LABEL_WIDTH
+
+    def height(self):
+        return LABEL_HEIGHT
+
+
+def _full_resolution_buffers(pixmaps):
+    """원본 크기 픽스맵의 서로 다른 버퍼(cacheKey) 집합"""
+    return {pixmap.cacheKey() for pixmap in pixmaps
+            if pixmap is not None and pixmap.width() == IMAGE_WIDTH and pixmap.height() == IMAGE_HEIGHT}
+
+
+def test_displayed_image_shares_one_full_resolution_buffer(qapp):
+    path = "photo.jpg"
+    viewer = FakeViewer(path)
+    label = QLabel()
+    label.resize(LABEL_WIDTH, LABEL_HEIGHT)
+    viewer.image_handler = ImageHandler(viewer, label)
+
+    pixmap = QPixmap(IMAGE_WIDTH, IMAGE_HEIGHT)
+    pixmap.fill(QColor(30, 60, 90))
+
+    viewer.on_image_loaded(path, pixmap, 12.0)
+
+    handler = viewer.image_handler
+    cached = viewer.image_cache.get(path)
+    assert cached is not None
+    assert cached.cacheKey() == pixmap.cacheKey()
+    assert handler._plain_original_pixmap.cacheKey() == cached.cacheKey()
+    # 회전이 없으면 원본 속성도 같은 버퍼
+    assert handler.original_pixmap.cacheKey() == cached.cacheKey()
+
+    # 화면에는 표시 영역 크기로 줄인 이미지만 만들어짐
+    shown = handler.current_pixmap
+    assert shown.width() <= LABEL_WIDTH and shown.height() <= LABEL_HEIGHT
+    assert label.pixmap().cacheKey() == shown.cacheKey()
+
+    # 원본 크기 버퍼는 하나뿐 (캐시, 핸들러 원본, 피라미드 0단계가 공유)
+    candidates = [cached, handler._plain_original_pixmap, handler.current_pixmap, label.pixmap()]
+    candidates += handler._pyramid.levels
+    assert handler._rotated_original is None
+    assert _full_resolution_buffers(candidates) == {pixmap.cacheKey()}
+
+    # 피라미드의 다른 단계는 모두 원본보다 작음
+    for level in handler._pyramid.levels[1:]:
+        assert level.width() < IMAGE_WIDTH and level.height() < IMAGE_HEIGHT
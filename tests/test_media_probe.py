@@ -0,0 +1,170 @@
+"""
+미디어 파일 정보 확인(media_probe) 테스트
+
+손으로 만든 작은 FLAC, MP4(90도 회전된 avc1), 고정 비트레이트 MP3, VBR(Xing) MP3,
+중간에 잘린 MKV 파일의 재생 시간, 화면 크기, 코덱을 파일 머리만으로 읽는지 확인합니다.
+"""
+
+import struct
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from media.loaders import preview_cache as preview_cache_module
+from media.loaders.media_probe import get_media_info, probe_media, PROBE_SUFFIX
+from media.loaders.preview_cache import PreviewCache
+
+
+# ---------------------------------------------------------------- 파일 만들기
+
+def _box(kind, *children):
+    payload = b''.join(children)
+    return struct.pack('>I4s', 8 + len(payload), kind) + payload
+
+
+def _mp4_track(handler, codec, tkhd_payload):
+    stsd = _box(b'stsd', b'\0' * 4, struct.pack('>I', 1), struct.pack('>I4s', 86, codec), b'\0' * 78)
+    return _box(b'trak',
+                _box(b'tkhd', tkhd_payload),
+                _box(b'mdia',
+                     _box(b'hdlr', b'\0' * 8, handler, b'\0' * 12, b'Handler\0'),
+                     _box(b'minf', _box(b'stbl', stsd))))
+
+
+def _mp4_bytes(moov_padding=0):
+    """mdat 뒤에 moov가 있는 MP4 (1920×1080을 90도 회전, 12.5초)"""
+    mvhd = _box(b'mvhd', b'\0' * 12, struct.pack('>II', 1000, 12500), b'\0' * 80)
+    rotate_90 = struct.pack('>9i', 0, 0x10000, 0, -0x10000, 0, 0, 0, 0, 0x40000000)
+    video_tkhd = b'\0' * 40 + rotate_90 + struct.pack('>II', 1920 << 16, 1080 << 16)
+    audio_tkhd = b'\0' * 84
+    moov = _box(b'moov', mvhd,
+                _mp4_track(b'vide', b'avc1', video_tkhd),
+                _mp4_track(b'soun', b'mp4a', audio_tkhd),
+                _box(b'free', b'\0' * moov_padding))
+    return _box(b'ftyp', b'isom\0\0\0\x01isomavc1') + _box(b'mdat', b'\0' * 4096) + moov
+
+
+def _flac_bytes(sample_rate=44100, seconds=3, id3=False):
+    value = (sample_rate << 44) | (1 << 41) | (15 << 36) | (sample_rate * seconds)
+    streaminfo = b'\0' * 10 + struct.pack('>Q', value) + b'\0' * 16
+    data = b'fLaC' + bytes([0x80, 0, 0, 34]) + streaminfo
+    if id3:
+        data = b'ID3\x04\0\0' + bytes([0, 0, 0, 20]) + b'\0' * 20 + data
+    return data
+
+
+MP3_HEADER = b'\xff\xfb\x90\x00'  # MPEG-1 Layer III, 128kbps, 44.1kHz, 스테레오
+MP3_FRAME_BYTES = 417
+
+
+def _mp3_cbr_bytes(frames):
+    frame = MP3_HEADER + b'\0' * (MP3_FRAME_BYTES - 4)
+    return frame * frames + b'TAG' + b'\0' * 125
+
+
+def _mp3_xing_bytes(frames):
+    first = bytearray(MP3_HEADER + b'\0' * (MP3_FRAME_BYTES - 4))
+    first[36:48] = b'Xing' + struct.pack('>II', 1, frames)
+    return bytes(first) + (MP3_HEADER + b'\0' * (MP3_FRAME_BYTES - 4)) * 3
+
+
+def _ebml(element_id, payload):
+    """EBML 요소 (크기는 8바이트로 표시)"""
+    return element_id + b'\x01' + len(payload).to_bytes(7, 'big') + payload
+
+
+def _mkv_truncated_bytes():
+    """크기를 모르는 Segment 안에 Info와 Tracks가 있고, 첫 클러스터 중간에서 잘린 WebM"""
+    header = _ebml(b'\x1a\x45\xdf\xa3', _ebml(b'\x42\x82', b'webm'))
+    info = _ebml(b'\x15\x49\xa9\x66',
+                 _ebml(b'\x2a\xd7\xb1', (1000000).to_bytes(3, 'big'))
+                 + _ebml(b'\x44\x89', struct.pack('>d', 5000.0)))
+    video = _ebml(b'\xe0', _ebml(b'\xb0', (640).to_bytes(2, 'big')) + _ebml(b'\xba', (360).to_bytes(2, 'big')))
+    tracks = _ebml(b'\x16\x54\xae\x6b',
+                   _ebml(b'\xae', _ebml(b'\x83', b'\x01') + _ebml(b'\x86', b'V_VP9') + video)
+                   + _ebml(b'\xae', _ebml(b'\x83', b'\x02') + _ebml(b'\x86', b'A_OPUS')))
+    cluster = _ebml(b'\x1f\x43\xb6\x75', b'\0' * 1000)[:40]
+    segment = b'\x18\x53\x80\x67' + b'\x01\xff\xff\xff\xff\xff\xff\xff'
+    return header + segment + info + tracks + cluster
+
+
+def _write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+# ---------------------------------------------------------------- 테스트
+
+def test_flac_duration(tmp_path):
+    record = probe_media(_write(tmp_path, "song.flac", _flac_bytes()))
+
+    assert record['container'] == 'flac'
+    assert record['audio_codec'] == 'flac'
+    assert record['duration'] == pytest.approx(3.0)
+
+
+def test_flac_after_id3_tag(tmp_path):
+    record = probe_media(_write(tmp_path, "tagged.flac", _flac_bytes(48000, 2, id3=True)))
+
+    assert record['container'] == 'flac'
+    assert record['duration'] == pytest.approx(2.0)
+
+
+def test_mp4_rotated_avc1_after_mdat(tmp_path):
+    record = probe_media(_write(tmp_path, "clip.mp4", _mp4_bytes()))
+
+    assert record['container'] == 'mp4'
+    assert record['duration'] == pytest.approx(12.5)
+    assert record['video_codec'] == 'avc1'
+    assert record['audio_codec'] == 'mp4a'
+    assert (record['width'], record['height']) == (1080, 1920)
+
+
+def test_mp3_constant_bitrate(tmp_path):
+    record = probe_media(_write(tmp_path, "song.mp3", _mp3_cbr_bytes(100)))
+
+    assert record['container'] == 'mp3'
+    assert record['audio_codec'] == 'mp3'
+    assert record['duration'] == pytest.approx(100 * MP3_FRAME_BYTES * 8 / 128000)
+
+
+def test_mp3_xing_frame_count(tmp_path):
+    record = probe_media(_write(tmp_path, "vbr.mp3", _mp3_xing_bytes(1000)))
+
+    assert record['duration'] == pytest.approx(1000 * 1152 / 44100)
+
+
+def test_truncated_matroska(tmp_path):
+    record = probe_media(_write(tmp_path, "cut.webm", _mkv_truncated_bytes()))
+
+    assert record['container'] == 'matroska'
+    assert record['duration'] == pytest.approx(5.0)
+    assert record['video_codec'] == 'V_VP9'
+    assert record['audio_codec'] == 'A_OPUS'
+    assert (record['width'], record['height']) == (640, 360)
+
+
+def test_unknown_file_is_not_probed(tmp_path):
+    assert probe_media(_write(tmp_path, "notes.txt", b"just some text here")) is None
+
+
+@pytest.fixture
+def preview_cache(tmp_path, monkeypatch):
+    cache = PreviewCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(preview_cache_module, '_preview_cache', cache)
+    return cache
+
+
+def test_quick_probe_defers_large_moov(tmp_path, preview_cache):
+    path = _write(tmp_path, "long.mp4", _mp4_bytes(moov_padding=8192))
+
+    # GUI 스레드 제한보다 큰 moov는 읽지 않고, 실패로 기록하지도 않음
+    assert get_media_info(path, max_moov_bytes=4096) is None
+    assert not preview_cache.has(path, PROBE_SUFFIX)
+
+    # 백그라운드 확인(제한 없음)은 읽어서 캐시에 저장
+    record = get_media_info(path)
+    assert record['duration'] == pytest.approx(12.5)
+    assert get_media_info(path, max_moov_bytes=4096) == record
@@ -0,0 +1,60 @@
+"""
+파일별 회전 상태 저장소(OrientationStore) 테스트
+
+파일을 이동하거나 삭제했을 때 저장된 회전 각도가 새 경로로 옮겨지거나 지워지는지 확인합니다.
+"""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from features.rotation.orientation_store import OrientationStore
+
+
+def _saved_angles(store):
+    with open(store.store_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def test_move_rekeys_saved_angle(tmp_path):
+    store = OrientationStore(str(tmp_path / "orientations.json"))
+    old_path = str(tmp_path / "a" / "photo.jpg")
+    new_path = str(tmp_path / "b" / "photo.jpg")
+    store.set(old_path, 90)
+
+    store.move(old_path, new_path)
+
+    assert store.get(old_path) == 0
+    assert store.get(new_path) == 90
+    assert list(_saved_angles(store).values()) == [90]
+
+    # 실행 취소로 되돌린 경우
+    store.move(new_path, old_path)
+    assert store.get(old_path) == 90
+    assert OrientationStore(store.store_path).get(old_path) == 90
+
+
+def test_move_clears_stale_entry_at_target(tmp_path):
+    store = OrientationStore(str(tmp_path / "orientations.json"))
+    old_path = str(tmp_path / "photo.jpg")
+    new_path = str(tmp_path / "target" / "photo.jpg")
+    store.set(new_path, 180)
+
+    store.move(old_path, new_path)
+
+    assert store.get(new_path) == 0
+
+
+def test_remove_drops_saved_angle(tmp_path):
+    store = OrientationStore(str(tmp_path / "orientations.json"))
+    path = str(tmp_path / "photo.jpg")
+    store.set(path, 270)
+
+    store.remove(path)
+
+    assert store.get(path) == 0
+    assert _saved_angles(store) == {}
+    assert not os.path.exists(store.store_path + ".tmp")
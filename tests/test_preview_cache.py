@@ -0,0 +1,166 @@
+"""
+미리보기 캐시(PreviewCache)와 비디오 미리보기 취소 테스트
+
+디스크 캐시가 최대 크기를 넘으면 가장 오래 안 쓴 자료부터 지우는지,
+비디오를 옮기거나 지우기 전에 그 비디오의 미리보기 만들기를 취소하면
+미리보기용 플레이어가 파일을 닫고 캐시에 아무것도 남기지 않는지 확인합니다.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from media.loaders import preview_cache as preview_cache_module
+from media.loaders import video_preview
+from media.loaders.preview_cache import PreviewCache
+from media.loaders.video_preview import PREVIEW_INFO_SUFFIX, VideoPreviewThread
+from file.operations import FileOperations
+
+ITEM_BYTES = 1000
+
+
+def _source_files(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"video{index}.mp4"
+        path.write_bytes(b"video %d" % index)
+        paths.append(str(path))
+    return paths
+
+
+def _save_aged(cache, paths):
+    """자료를 저장하고 앞의 것일수록 오래 전에 쓴 것으로 만듭니다."""
+    now = time.time()
+    for age, path in enumerate(reversed(paths)):
+        assert cache.save_bytes(path, '.peaks', b'x' * ITEM_BYTES)
+        stamp = now - 1000 * (age + 1)
+        os.utime(cache.get_path(path, '.peaks'), (stamp, stamp))
+
+
+def test_trim_evicts_least_recently_used(tmp_path):
+    # 저장하는 동안에는 자동 정리가 시작되지 않게 함
+    cache = PreviewCache(str(tmp_path / "cache"), max_bytes=10 * ITEM_BYTES)
+    cache.total_bytes = 0
+    paths = _source_files(tmp_path, 4)
+    _save_aged(cache, paths)
+    cache.max_bytes = 3 * ITEM_BYTES
+
+    # 가장 오래된 자료를 읽으면 최근에 쓴 자료가 됨
+    assert cache.load_bytes(paths[0], '.peaks') is not None
+
+    assert cache.trim() <= 3 * ITEM_BYTES * preview_cache_module.TRIM_TARGET_RATIO
+    assert [cache.has(path, '.peaks') for path in paths] == [True, False, False, True]
+    assert cache.total_bytes == 2 * ITEM_BYTES
+
+
+def test_save_over_limit_trims_in_background(tmp_path):
+    cache = PreviewCache(str(tmp_path / "cache"), max_bytes=int(2.5 * ITEM_BYTES))
+    paths = _source_files(tmp_path, 3)
+
+    for path in paths:
+        cache.save_bytes(path, '.peaks', b'x' * ITEM_BYTES)
+        if cache.trim_thread is not None:
+            cache.trim_thread.join(5.0)
+
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.has(paths[-1], '.peaks')
+
+
+class FakePlayer:
+    """파일을 열어도 화면이 준비되지 않는(열기가 끝나지 않는) 가짜 미리보기 플레이어"""
+
+    def __init__(self, module):
+        self.module = module
+        self.commands = []
+
+    def event_callback(self, name):
+        return lambda callback: callback
+
+    def loadfile(self, path, mode):
+        self.module.loaded.set()
+
+    def command(self, *args):
+        self.commands.append(args)
+
+    def terminate(self):
+        pass
+
+
+class FakeMpvModule:
+    """mpv 모듈 대신 쓰는 객체"""
+
+    def __init__(self):
+        self.players = []
+        self.loaded = threading.Event()
+
+    def MPV(self, **options):
+        player = FakePlayer(self)
+        self.players.append(player)
+        return player
+
+
+@pytest.fixture
+def preview_thread(tmp_path, monkeypatch, qapp):
+    """가짜 mpv와 임시 미리보기 캐시를 쓰는 미리보기 스레드"""
+    module = FakeMpvModule()
+    monkeypatch.setattr(video_preview, 'mpv', module)
+    monkeypatch.setattr(preview_cache_module, '_preview_cache', PreviewCache(str(tmp_path / "cache")))
+    thread = VideoPreviewThread()
+    thread.fake_mpv = module
+    thread.start()
+    yield thread
+    thread.stop()
+
+
+def test_cancel_closes_video_being_previewed(tmp_path, preview_thread):
+    path, other = _source_files(tmp_path, 2)
+    preview_thread.request([path, other])
+    assert preview_thread.fake_mpv.loaded.wait(2.0)
+
+    started = time.monotonic()
+    preview_thread.cancel(path)
+
+    assert time.monotonic() - started < 1.0
+    assert ('stop',) in preview_thread.fake_mpv.players[0].commands
+    assert not preview_cache_module.get_preview_cache().has(path, PREVIEW_INFO_SUFFIX)
+
+
+def test_cancel_removes_waiting_video(tmp_path, preview_thread):
+    path, other = _source_files(tmp_path, 2)
+    preview_thread.request([path, other])
+    assert preview_thread.fake_mpv.loaded.wait(2.0)
+
+    preview_thread.cancel(other)
+
+    assert preview_thread.pending == []
+
+
+class FakeVideoHandler:
+    def __init__(self):
+        self.released = []
+
+    def release_file(self, file_path=None):
+        self.released.append(file_path)
+
+
+class FakeViewer:
+    def __init__(self):
+        self.video_handler = FakeVideoHandler()
+        self.current_image_path = None
+
+    def show_message(self, message):
+        pass
+
+
+def test_move_or_delete_releases_video_first(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    viewer = FakeViewer()
+    path = _source_files(tmp_path, 1)[0]
+
+    FileOperations(viewer)._cleanup_resources_for_file(path)
+
+    assert viewer.video_handler.released == [path]
@@ -0,0 +1,158 @@
+"""
+시작 성능 테스트
+
+main을 불러와도 코덱과 디버깅 모듈이 임포트되지 않는지, 창이 시작 시간 예산 안에 보이는지 확인합니다.
+sys.modules가 깨끗한 상태에서 확인해야 하므로 새 파이썬 프로세스에서 main을 불러옵니다.
+설치되지 않은 코덱 모듈은 빈 모듈로 대신해서(임포트할 수는 있게 해서) 미리 임포트하면 드러나게 합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from conftest import ROOT_DIR
+from core.startup_profiler import (
+    IMPORT_REPORT_ARG, IMPORT_REPORT_ENV, STARTUP_BUDGET_SECONDS, StartupProfiler
+)
+from core.utils.lazy_import import lazy_import
+from mpv_wrapper import configure_mpv_path
+
+# 선택 설치 코덱 모듈 (설치되지 않았으면 새 프로세스에서 빈 모듈로 대신함)
+OPTIONAL_MODULES = ('mpv', 'rawpy', 'numpy', 'cv2', 'pillow_avif')
+
+# 처음 사용할 때까지 불러오지 않아야 하는 모듈
+DEFERRED_MODULES = OPTIONAL_MODULES + (
+    'PIL.ImageCms',
+    'core.debug', 'core.debug.qmovie_debugger', 'core.debug.memory_profiler',
+)
+
+STARTUP_SCRIPT = """
+import importlib.abc, importlib.machinery, importlib.util, json, sys
+
+
+class StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    \"\"\"설치되지 않은 모듈을 빈 모듈로 찾아줌 (임포트하면 sys.modules에 남음)\"\"\"
+
+    def __init__(self, names):
+        self.names = names
+
+    def find_spec(self, name, path=None, target=None):
+        if name in self.names:
+            return importlib.machinery.ModuleSpec(name, self)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        pass
+
+
+stubbed = [name for name in OPTIONAL_MODULES if importlib.util.find_spec(name) is None]
+sys.meta_path.append(StubFinder(stubbed))
+
+import main
+loaded_after_import = [name for name in DEFERRED_MODULES if name in sys.modules]
+from PyQt5.QtWidgets import QApplication
+from core.startup_profiler import startup_profiler
+app = QApplication(sys.argv[:1])
+viewer = main.MediaSorterPAAK()
+viewer.show()
+app.processEvents()
+visible_time = startup_profiler.mark_window_visible()
+print(json.dumps({
+    'stubbed': stubbed,
+    'loaded_after_import': loaded_after_import,
+    'loaded_after_show': [name for name in DEFERRED_MODULES if name in sys.modules],
+    'visible_time': visible_time,
+    'within_budget': startup_profiler.is_within_budget(),
+}))
+"""
+
+
+@pytest.fixture(scope="module")
+def startup_result():
+    """새 프로세스에서 main을 불러오고 창을 띄운 결과"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.pop(IMPORT_REPORT_ENV, None)
+    script = "OPTIONAL_MODULES = %r\nDEFERRED_MODULES = %r\n%s" % (
+        OPTIONAL_MODULES, DEFERRED_MODULES, STARTUP_SCRIPT)
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT_DIR, env=env,
+        capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+    lines = completed.stdout.strip().splitlines()
+    result = json.loads(lines[-1])
+    result['console'] = "\n".join(lines[:-1])
+    return result
+
+
+def test_import_main_defers_codecs_and_debug_modules(startup_result):
+    assert startup_result['loaded_after_import'] == []
+
+
+def test_showing_window_defers_codecs_and_debug_modules(startup_result):
+    assert startup_result['loaded_after_show'] == []
+
+
+def test_startup_does_not_print_mpv_path_setup(startup_result):
+    assert "Current PATH" not in startup_result['console']
+    assert "Configuring MPV path" not in startup_result['console']
+
+
+def test_window_visible_within_budget(startup_result):
+    assert startup_result['within_budget'], startup_result['visible_time']
+    assert startup_result['visible_time'] <= STARTUP_BUDGET_SECONDS
+
+
+def test_mark_window_visible_is_silent_without_report(monkeypatch, capsys):
+    monkeypatch.delenv(IMPORT_REPORT_ENV, raising=False)
+    monkeypatch.setattr(sys, "argv", [sys.argv[0]])
+    profiler = StartupProfiler()
+
+    profiler.mark_window_visible()
+
+    assert capsys.readouterr().out == ""
+
+
+def test_mark_window_visible_reports_when_enabled(monkeypatch, capsys):
+    monkeypatch.delenv(IMPORT_REPORT_ENV, raising=False)
+    monkeypatch.setattr(sys, "argv", [sys.argv[0], IMPORT_REPORT_ARG])
+    profiler = StartupProfiler()
+
+    profiler.mark_window_visible()
+
+    assert "Startup time" in capsys.readouterr().out
+
+
+def test_configure_mpv_path_is_silent_without_report(monkeypatch, capsys):
+    monkeypatch.delenv(IMPORT_REPORT_ENV, raising=False)
+    monkeypatch.setattr(sys, "argv", [sys.argv[0]])
+
+    configure_mpv_path()
+
+    assert capsys.readouterr().out == ""
+
+
+def test_configure_mpv_path_reports_when_enabled(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", [sys.argv[0], IMPORT_REPORT_ARG])
+
+    configure_mpv_path()
+
+    assert "Configuring MPV path" in capsys.readouterr().out
+
+
+def test_lazy_import_registers_module_on_first_use():
+    sys.modules.pop('tabnanny', None)
+    module = lazy_import('tabnanny')
+
+    assert 'tabnanny' not in sys.modules
+    assert callable(module.check)
+    assert 'tabnanny' in sys.modules
+    assert lazy_import('not_an_installed_module_xyz') is None
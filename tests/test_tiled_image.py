@@ -0,0 +1,181 @@
+"""
+타일 이미지(TiledImageSource) 테스트
+
+비압축 파일은 필요한 줄만 읽어서 원본과 같은 타일을 만드는지,
+압축 파일은 제한 안에서만 한 번 디코딩하는지,
+Pillow 전역 압축 폭탄 제한(Image.MAX_IMAGE_PIXELS)을 건드리지 않는지 확인합니다.
+"""
+
+import struct
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PIL import Image
+
+from media.loaders import tiled_image
+from media.loaders.tiled_image import (
+    TILE_SIZE, TiledImageCancelled, TiledImageSource, is_huge_image
+)
+
+
+def _pattern_image(width, height, mode='RGB'):
+    """위치마다 색이 다른 시험용 이미지"""
+    image = Image.new(mode, (width, height))
+    image.putdata([
+        tuple(((x * 7 + y * 3) % 256, (x * 5) % 256, (y * 11) % 256, 255)[:len(mode)])
+        for y in range(height) for x in range(width)
+    ])
+    return image
+
+
+def _write_striped_tiff(path, image, rows_per_strip):
+    """
+    조각(스트립)마다 따로 저장된 비압축 RGB TIFF를 씁니다.
+    조각을 파일에 거꾸로 저장해서 Pillow가 조각을 하나로 합치지 않게 합니다.
+    """
+    width, height = image.size
+    strips = [image.crop((0, top, width, min(height, top + rows_per_strip))).tobytes()
+              for top in range(0, height, rows_per_strip)]
+    entries_count = 9
+    ifd_size = 2 + entries_count * 12 + 4
+    offsets_at = 8 + ifd_size
+    counts_at = offsets_at + 4 * len(strips)
+    bits_at = counts_at + 4 * len(strips)
+    data_at = bits_at + 6
+    offsets = []
+    position = data_at
+    for strip in reversed(strips):
+        offsets.insert(0, position)
+        position += len(strip)
+
+    def entry(tag, field_type, count, value):
+        return struct.pack('<HHII', tag, field_type, count, value)
+
+    header = b'II' + struct.pack('<HI', 42, 8)
+    ifd = struct.pack('<H', entries_count) + b''.join([
+        entry(256, 4, 1, width),
+        entry(257, 4, 1, height),
+        entry(258, 3, 3, bits_at),
+        entry(259, 3, 1, 1),
+        entry(262, 3, 1, 2),
+        entry(273, 4, len(strips), offsets_at),
+        entry(277, 3, 1, 3),
+        entry(278, 4, 1, rows_per_strip),
+        entry(279, 4, len(strips), counts_at),
+    ]) + struct.pack('<I', 0)
+    tables = (struct.pack('<%dI' % len(strips), *offsets)
+              + struct.pack('<%dI' % len(strips), *[len(strip) for strip in strips])
+              + struct.pack('<3H', 8, 8, 8))
+    with open(path, 'wb') as file:
+        file.write(header + ifd + tables + b''.join(reversed(strips)))
+
+
+def _tile_pixels(qimage):
+    """QImage 타일을 RGB PIL 이미지로 바꿉니다."""
+    data = bytes(qimage.constBits().asarray(qimage.byteCount()))
+    return Image.frombytes('RGBA', (qimage.width(), qimage.height()), data,
+                           'raw', 'RGBA', qimage.bytesPerLine()).convert('RGB')
+
+
+@pytest.fixture
+def small_overview(monkeypatch):
+    """작은 시험용 이미지에서도 원본 단계 타일을 파일에서 읽도록 개요 이미지를 작게 만듭니다."""
+    monkeypatch.setattr(tiled_image, 'OVERVIEW_MAX_SIZE', 128)
+
+
+def test_read_tile_matches_full_decode_on_multi_strip_tiff(tmp_path, qapp, small_overview):
+    image = _pattern_image(600, 520)
+    path = str(tmp_path / "striped.tif")
+    _write_striped_tiff(path, image, rows_per_strip=48)
+    with Image.open(path) as opened:
+        assert len(opened.tile) > 1
+        full = opened.convert('RGB')
+
+    source = TiledImageSource(path)
+
+    assert source.tiled
+    assert source.min_level == 0
+    columns, rows = source.tile_count(0)
+    for ty in range(rows):
+        for tx in range(columns):
+            box = (tx * TILE_SIZE, ty * TILE_SIZE,
+                   min(600, (tx + 1) * TILE_SIZE), min(520, (ty + 1) * TILE_SIZE))
+            tile = _tile_pixels(source.read_tile(0, tx, ty))
+            assert tile.tobytes() == full.crop(box).tobytes(), (tx, ty)
+
+    # 줄인 단계도 원본을 같은 배율로 줄인 것과 같음
+    tile = _tile_pixels(source.read_tile(1, 0, 0))
+    assert tile.tobytes() == full.crop((0, 0, 512, 512)).reduce(2).tobytes()
+
+
+def test_read_tile_matches_full_decode_on_bottom_up_bmp(tmp_path, qapp, small_overview):
+    image = _pattern_image(300, 280)
+    path = str(tmp_path / "scan.bmp")
+    image.save(path)
+
+    source = TiledImageSource(path)
+
+    assert source.tiled
+    tile = _tile_pixels(source.read_tile(0, 1, 1))
+    assert tile.tobytes() == image.crop((256, 256, 300, 280)).tobytes()
+
+
+@pytest.mark.parametrize("file_name, save_options", [
+    ("scan.png", {}),
+    ("scan.tif", {"compression": "tiff_lzw"}),
+])
+def test_compressed_single_strip_falls_back_to_overview(tmp_path, qapp, small_overview,
+                                                         file_name, save_options):
+    image = _pattern_image(600, 520)
+    path = str(tmp_path / file_name)
+    image.save(path, **save_options)
+
+    source = TiledImageSource(path)
+
+    assert not source.tiled
+    assert source.min_level == source.overview_level == 3
+    assert source.overview.size == (75, 65)
+    tile = source.read_tile(3, 0, 0)
+    assert (tile.width(), tile.height()) == (75, 65)
+
+
+def test_compressed_image_over_pillow_limit_is_refused(tmp_path, qapp, monkeypatch):
+    path = str(tmp_path / "scan.png")
+    _pattern_image(120, 100).save(path)
+    monkeypatch.setattr(Image, 'MAX_IMAGE_PIXELS', 100 * 100)
+
+    with pytest.raises(Image.DecompressionBombError):
+        TiledImageSource(path)
+
+
+def test_cancel_stops_building_the_overview(tmp_path, qapp, small_overview):
+    path = str(tmp_path / "striped.tif")
+    _write_striped_tiff(path, _pattern_image(300, 400), rows_per_strip=32)
+    checks = []
+
+    def is_cancelled():
+        checks.append(True)
+        return len(checks) > 1
+
+    with pytest.raises(TiledImageCancelled):
+        TiledImageSource(path, is_cancelled)
+    assert len(checks) == 2
+
+
+def test_pillow_pixel_limit_is_never_changed(tmp_path, qapp):
+    # 머리에는 20000×20000이라고 적혀 있지만 픽셀은 없는 BMP (Image.open이면 압축 폭탄으로 거부)
+    path = str(tmp_path / "huge.bmp")
+    width = height = 20000
+    with open(path, 'wb') as file:
+        file.write(b'BM' + struct.pack('<IHHI', 54 + width * height * 3, 0, 0, 54))
+        file.write(struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0, 0, 0, 0, 0, 0))
+    limit = Image.MAX_IMAGE_PIXELS
+
+    assert is_huge_image(path)
+    # 머리만 있고 픽셀 자료가 없으니 개요 이미지를 만들다 실패
+    with pytest.raises(ValueError):
+        TiledImageSource(path)
+
+    assert Image.MAX_IMAGE_PIXELS == limit
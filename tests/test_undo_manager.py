@@ -0,0 +1,149 @@
+"""
+실행 취소 관리자(UndoManager) 테스트
+
+실행 취소에 실패한 작업(휴지통에서 복원하지 못한 삭제 포함)은 기록과 디스크 저널에 남아
+다시 시도할 수 있고, 성공했거나 더 이상 취소할 수 없는 작업만 저널에서 지워지는지 확인합니다.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from file.undo_journal import UndoJournal
+from file.undo_manager import UndoManager
+
+
+class FakeViewer:
+    """메시지만 기록하는 뷰어 (파일 목록 없음)"""
+
+    def __init__(self):
+        self.messages = []
+
+    def show_message(self, message):
+        self.messages.append(message)
+
+
+@pytest.fixture
+def undo_manager(tmp_path, monkeypatch):
+    """사용자 데이터 폴더를 임시 폴더로 바꾼 UndoManager"""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    manager = UndoManager(FakeViewer())
+    yield manager
+    manager.close()
+
+
+def _saved_action_ids(manager):
+    """디스크 저널을 다시 읽었을 때 남아 있는 작업 id 목록"""
+    manager.journal.flush()
+    return [action['id'] for action in UndoJournal(manager.journal.journal_path).get_actions()]
+
+
+def _moved_file(tmp_path, manager):
+    """파일을 옮기고 이동 작업으로 기록합니다."""
+    original_path = str(tmp_path / "photo.jpg")
+    new_path = str(tmp_path / "sorted" / "photo.jpg")
+    os.makedirs(os.path.dirname(new_path))
+    with open(new_path, 'wb') as file:
+        file.write(b"moved")
+    op_id = manager.begin_operation(UndoManager.ACTION_MOVE, original_path=original_path, new_path=new_path)
+    manager.track_moved_file(original_path, new_path, True, op_id)
+    return original_path, new_path
+
+
+def test_failed_undo_stays_in_history_and_journal(tmp_path, undo_manager):
+    original_path, new_path = _moved_file(tmp_path, undo_manager)
+    action_id = undo_manager.actions[0]['id']
+    with open(original_path, 'wb') as file:
+        file.write(b"conflict")
+
+    success, _ = undo_manager.undo_last_action()
+
+    assert not success
+    assert [action['id'] for action in undo_manager.actions] == [action_id]
+    assert _saved_action_ids(undo_manager) == [action_id]
+
+    # 충돌이 없어지면 다시 시도해서 성공하고, 그때 저널에서 지워짐
+    os.remove(original_path)
+    success, restored_path = undo_manager.undo_last_action()
+
+    assert success
+    assert restored_path == original_path
+    assert os.path.exists(original_path)
+    assert not undo_manager.actions
+    assert _saved_action_ids(undo_manager) == []
+
+
+def test_undo_of_vanished_file_is_dropped(tmp_path, undo_manager):
+    _, new_path = _moved_file(tmp_path, undo_manager)
+    os.remove(new_path)
+
+    success, _ = undo_manager.undo_last_action()
+
+    assert not success
+    assert not undo_manager.actions
+    assert _saved_action_ids(undo_manager) == []
+
+
+def test_undo_actions_stops_at_first_failure(tmp_path, undo_manager):
+    original_path, _ = _moved_file(tmp_path, undo_manager)
+    with open(original_path, 'wb') as file:
+        file.write(b"conflict")
+
+    succeeded, _ = undo_manager.undo_actions(5)
+
+    assert succeeded == 0
+    assert len(undo_manager.actions) == 1
+
+
+def _deleted_file(tmp_path, manager, indexed):
+    """파일을 지운 것처럼 휴지통 폴더로 옮기고 삭제 작업으로 기록합니다."""
+    original_path = str(tmp_path / "clip.mp4")
+    trashed_path = str(tmp_path / "trash" / "clip.mp4")
+    os.makedirs(os.path.dirname(trashed_path))
+    with open(trashed_path, 'wb') as file:
+        file.write(b"trashed")
+    if indexed:
+        manager.trash_index.entries[manager.trash_index._key(original_path)] = [
+            {'trashed_path': trashed_path, 'info_path': trashed_path + ".trashinfo"}
+        ]
+    op_id = manager.begin_operation(UndoManager.ACTION_DELETE, path=original_path)
+    manager.track_deleted_file(original_path, True, op_id)
+    return original_path, trashed_path
+
+
+def test_undo_delete_restores_indexed_file(tmp_path, undo_manager):
+    original_path, trashed_path = _deleted_file(tmp_path, undo_manager, indexed=True)
+
+    success, restored_path = undo_manager.undo_last_action()
+
+    assert success
+    assert restored_path == original_path
+    assert os.path.exists(original_path)
+    assert not os.path.exists(trashed_path)
+    assert not undo_manager.trash_index.has_entry(original_path)
+
+
+def test_undo_delete_without_index_entry_fails_and_stays(tmp_path, undo_manager):
+    original_path, trashed_path = _deleted_file(tmp_path, undo_manager, indexed=False)
+
+    success, _ = undo_manager.undo_last_action()
+
+    assert not success
+    assert not os.path.exists(original_path)
+    assert len(undo_manager.actions) == 1
+    assert len(_saved_action_ids(undo_manager)) == 1
+
+
+def test_failed_index_restore_keeps_entry(tmp_path, undo_manager, monkeypatch):
+    original_path, trashed_path = _deleted_file(tmp_path, undo_manager, indexed=True)
+
+    def fail_rename(source, destination):
+        raise PermissionError("file in use")
+
+    monkeypatch.setattr(os, "rename", fail_rename)
+
+    assert not undo_manager.trash_index.restore(original_path)
+    assert undo_manager.trash_index.has_entry(original_path)
+    assert os.path.exists(trashed_path)
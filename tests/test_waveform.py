@@ -0,0 +1,140 @@
+"""
+파형 추출 스레드(WaveformThread) 테스트
+
+mpv 대신 가짜 플레이어를 써서, 파일을 옮기거나 지우기 전 취소하면 파형용 플레이어가 닫히는지,
+멈출 때 디코딩 시간 제한만큼 기다리지 않는지, 추출에 실패한 파일은 다시 시도하지 않는지 확인합니다.
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from media.loaders import preview_cache as preview_cache_module
+from media.loaders import waveform
+from media.loaders.preview_cache import PreviewCache
+from media.loaders.waveform import WaveformThread, WAVEFORM_FAILED_SUFFIX
+
+
+class FakePlayer:
+    """loadfile 후 끝나지 않거나(hang) 바로 끝나는(empty) 가짜 mpv 플레이어"""
+
+    def __init__(self, module, **options):
+        self.module = module
+        self.callbacks = {}
+        self.terminated = threading.Event()
+        module.players.append(self)
+
+    def event_callback(self, name):
+        def register(callback):
+            self.callbacks[name] = callback
+            return callback
+        return register
+
+    def loadfile(self, path, mode):
+        self.module.loaded.set()
+        if self.module.behaviour == 'empty':
+            self.callbacks['end-file'](None)
+
+    def terminate(self):
+        self.terminated.set()
+
+
+class FakeMpvModule:
+    """mpv 모듈 대신 쓰는 객체"""
+
+    def __init__(self, behaviour):
+        self.behaviour = behaviour
+        self.players = []
+        self.loaded = threading.Event()
+
+    def MPV(self, **options):
+        return FakePlayer(self, **options)
+
+
+@pytest.fixture
+def fake_mpv(tmp_path, monkeypatch):
+    """가짜 mpv와 임시 미리보기 캐시를 사용하게 합니다."""
+    def install(behaviour):
+        module = FakeMpvModule(behaviour)
+        monkeypatch.setattr(waveform, 'mpv', module)
+        monkeypatch.setattr(waveform, 'np', object())
+        return module
+
+    monkeypatch.setattr(preview_cache_module, '_preview_cache', PreviewCache(str(tmp_path / "cache")))
+    return install
+
+
+@pytest.fixture
+def audio_path(tmp_path):
+    path = tmp_path / "song.mp3"
+    path.write_bytes(b"not really audio")
+    return str(path)
+
+
+@pytest.fixture
+def waveform_thread(qapp):
+    thread = WaveformThread()
+    thread.start()
+    yield thread
+    thread.stop()
+
+
+def test_cancel_closes_waveform_player_before_file_operation(fake_mpv, audio_path, waveform_thread):
+    module = fake_mpv('hang')
+    waveform_thread.request(audio_path)
+    assert module.loaded.wait(2.0)
+
+    started = time.monotonic()
+    waveform_thread.cancel(audio_path)
+
+    assert time.monotonic() - started < 1.0
+    assert module.players[0].terminated.is_set()
+    assert waveform_thread.current_path is None
+    # 취소는 실패가 아니므로 다음에 다시 추출할 수 있음
+    assert not preview_cache_module.get_preview_cache().has(audio_path, WAVEFORM_FAILED_SUFFIX)
+
+
+def test_stop_during_decode_returns_quickly(fake_mpv, audio_path, qapp):
+    module = fake_mpv('hang')
+    thread = WaveformThread()
+    thread.start()
+    thread.request(audio_path)
+    assert module.loaded.wait(2.0)
+
+    started = time.monotonic()
+    thread.stop()
+
+    assert time.monotonic() - started < 1.0
+    assert module.players[0].terminated.is_set()
+
+
+def test_stop_before_decode_starts_does_not_block(fake_mpv, audio_path, qapp, monkeypatch):
+    module = fake_mpv('hang')
+    thread = WaveformThread()
+    # stop()의 알림이 디코딩 시작 직전에 도착한 상황
+    thread.decode_done.set()
+    thread.running = False
+    monkeypatch.setattr(waveform, 'DECODE_TIMEOUT', 30.0)
+
+    started = time.monotonic()
+    assert thread._extract(audio_path) is None
+
+    assert time.monotonic() - started < 1.0
+    assert module.players == []
+
+
+def test_failed_extraction_is_not_retried(fake_mpv, audio_path, waveform_thread):
+    module = fake_mpv('empty')
+    cache = preview_cache_module.get_preview_cache()
+    waveform_thread.request(audio_path)
+    deadline = time.monotonic() + 2.0
+    while not cache.has(audio_path, WAVEFORM_FAILED_SUFFIX) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cache.has(audio_path, WAVEFORM_FAILED_SUFFIX)
+    waveform_thread.request(audio_path)
+    assert waveform_thread.pending == []
+    assert len(module.players) == 1
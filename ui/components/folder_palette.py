@@ -0,0 +1,209 @@
+"""
+폴더 팔레트 모듈
+
+이 모듈은 기준 폴더의 하위 폴더를 이름으로 빠르게 찾아 복사/이동할 수 있는
+빠른 검색 팔레트를 제공합니다. 폴더 버튼(15개 x 줄 수)에 다 들어가지 않는
+수백 개의 대상 폴더도 몇 글자 입력으로 선택할 수 있습니다.
+"""
+
+import os
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal
+
+# 한 번에 보여줄 최대 결과 수
+MAX_RESULTS = 50
+
+# 항목 데이터 역할 (폴더 경로, 들여쓰기 깊이)
+PATH_ROLE = Qt.UserRole
+DEPTH_ROLE = Qt.UserRole + 1
+
+
+class FolderPalette(QDialog):
+    """
+    폴더 빠른 검색 팔레트 클래스예요.
+
+    검색어를 입력하면 FolderIndex의 검색 색인으로 바로 결과를 보여줘요.
+        Enter       : 선택한 폴더로 복사
+        Shift+Enter : 선택한 폴더로 이동
+        → / Tab     : 선택한 폴더의 하위 폴더 펼치기 (필요할 때만 읽음)
+        ←           : 펼친 하위 폴더 접기
+        Esc         : 닫기
+
+    신호(Signals):
+        copy_requested: 복사할 대상 폴더 경로
+        move_requested: 이동할 대상 폴더 경로
+    """
+    copy_requested = pyqtSignal(str)
+    move_requested = pyqtSignal(str)
+
+    def __init__(self, folder_index, parent=None):
+        """
+        폴더 팔레트 초기화
+
+        매개변수:
+            folder_index: FolderIndex 인스턴스
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.folder_index = folder_index
+        self.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
+        self.setMinimumWidth(420)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.setSpacing(4)
+
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText("Search folders...  (Enter: copy, Shift+Enter: move, →: expand)")
+        self.search_input.textChanged.connect(self.update_results)
+        self.search_input.installEventFilter(self)
+        layout.addWidget(self.search_input)
+
+        self.result_list = QListWidget(self)
+        self.result_list.setUniformItemSizes(True)  # 항목 높이 계산 생략 (빠른 갱신)
+        self.result_list.itemActivated.connect(lambda item: self._activate(item, move=False))
+        self.result_list.installEventFilter(self)
+        layout.addWidget(self.result_list)
+
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #2c3e50;
+                border: 1px solid #34495e;
+            }
+            QLineEdit {
+                background-color: #34495e;
+                color: #ecf0f1;
+                border: none;
+                padding: 6px;
+                font-size: 10pt;
+            }
+            QListWidget {
+                background-color: #2c3e50;
+                color: #ecf0f1;
+                border: none;
+                font-size: 9pt;
+            }
+            QListWidget::item:selected {
+                background-color: rgba(41, 128, 185, 0.9);
+            }
+        """)
+
+    def open_palette(self):
+        """검색어를 비우고 부모 창 가운데 위쪽에 팔레트를 엽니다."""
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self.update_results("")
+
+        parent = self.parentWidget()
+        if parent is not None:
+            width = max(self.minimumWidth(), parent.width() // 3)
+            height = max(240, parent.height() // 2)
+            self.resize(width, height)
+            top_left = parent.mapToGlobal(parent.rect().topLeft())
+            self.move(top_left.x() + (parent.width() - width) // 2, top_left.y() + parent.height() // 8)
+
+        self.show()
+        self.search_input.setFocus()
+
+    def update_results(self, text):
+        """검색어에 맞는 폴더 목록으로 결과를 갱신합니다."""
+        paths = self.folder_index.search(text, MAX_RESULTS)
+
+        self.result_list.setUpdatesEnabled(False)
+        self.result_list.clear()
+        for path in paths:
+            self._add_item(path, 0)
+        self.result_list.setUpdatesEnabled(True)
+
+        if self.result_list.count():
+            self.result_list.setCurrentRow(0)
+
+    def _add_item(self, path, depth, row=None):
+        """결과 목록에 폴더 항목을 추가합니다."""
+        name = os.path.basename(path)
+        # 기준 폴더 바로 아래가 아닌 폴더는 상위 폴더 이름을 함께 표시
+        parent_folder = os.path.dirname(path)
+        if depth == 0 and parent_folder != self.folder_index.base_folder:
+            name = f"{os.path.basename(parent_folder)}{os.sep}{name}"
+
+        item = QListWidgetItem("    " * depth + name)
+        item.setToolTip(path)
+        item.setData(PATH_ROLE, path)
+        item.setData(DEPTH_ROLE, depth)
+        if row is None:
+            self.result_list.addItem(item)
+        else:
+            self.result_list.insertItem(row, item)
+        return item
+
+    def _expand(self, item):
+        """선택한 폴더의 하위 폴더를 바로 아래에 펼칩니다."""
+        row = self.result_list.row(item)
+        depth = item.data(DEPTH_ROLE)
+        next_item = self.result_list.item(row + 1)
+        if next_item is not None and next_item.data(DEPTH_ROLE) > depth:
+            return  # 이미 펼쳐짐
+
+        children = self.folder_index.get_children(item.data(PATH_ROLE))
+        for offset, child in enumerate(children, start=1):
+            self._add_item(child, depth + 1, row + offset)
+
+    def _collapse(self, item):
+        """선택한 폴더(또는 상위 폴더)의 펼친 하위 폴더를 접습니다."""
+        row = self.result_list.row(item)
+        depth = item.data(DEPTH_ROLE)
+
+        # 하위 항목에서 누르면 상위 폴더로 이동해서 접기
+        next_item = self.result_list.item(row + 1)
+        if (next_item is None or next_item.data(DEPTH_ROLE) <= depth) and depth > 0:
+            while row > 0 and self.result_list.item(row).data(DEPTH_ROLE) >= depth:
+                row -= 1
+            depth = self.result_list.item(row).data(DEPTH_ROLE)
+            self.result_list.setCurrentRow(row)
+
+        while True:
+            next_item = self.result_list.item(row + 1)
+            if next_item is None or next_item.data(DEPTH_ROLE) <= depth:
+                break
+            self.result_list.takeItem(row + 1)
+
+    def _activate(self, item, move):
+        """선택한 폴더로 복사 또는 이동을 요청하고 팔레트를 닫습니다."""
+        if item is None:
+            return
+        folder_path = item.data(PATH_ROLE)
+        self.hide()
+        if move:
+            self.move_requested.emit(folder_path)
+        else:
+            self.copy_requested.emit(folder_path)
+
+    def eventFilter(self, obj, event):
+        """검색 입력창과 결과 목록의 키 입력을 처리합니다."""
+        if event.type() == QEvent.KeyPress:
+            key = event.key()
+            item = self.result_list.currentItem()
+
+            if key in (Qt.Key_Return, Qt.Key_Enter):
+                self._activate(item, move=bool(event.modifiers() & Qt.ShiftModifier))
+                return True
+            elif key == Qt.Key_Escape:
+                self.hide()
+                return True
+            elif key in (Qt.Key_Down, Qt.Key_Up, Qt.Key_PageDown, Qt.Key_PageUp) and obj is self.search_input:
+                # 입력창에서 위/아래 키로 결과 목록 이동
+                self.result_list.keyPressEvent(event)
+                return True
+            elif item is not None and (key == Qt.Key_Tab or
+                                       (key == Qt.Key_Right and (obj is self.result_list or
+                                        self.search_input.cursorPosition() == len(self.search_input.text())))):
+                self._expand(item)
+                return True
+            elif item is not None and key == Qt.Key_Left and (obj is self.result_list or
+                                                               self.search_input.cursorPosition() == 0):
+                self._collapse(item)
+                return True
+
+        return super().eventFilter(obj, event)
@@ -0,0 +1,336 @@
+"""
+이미지 뷰포트 모듈
+
+이 모듈은 아주 큰 이미지를 타일 단위로 확대/이동하며 볼 수 있는
+MediaDisplay 확장 클래스를 제공합니다.
+"""
+
+import math
+
+from PyQt5.QtCore import Qt, QRectF, QPointF, QSize
+from PyQt5.QtGui import QPainter, QColor
+
+from ui.components.media_display import MediaDisplay
+from media.loaders.tiled_image import TileCache, TileLoaderThread, TILE_SIZE
+
+# 확대/축소 한 단계의 배율 (Ctrl + 휠)
+ZOOM_STEP = 1.25
+
+# 원본 픽셀 하나를 화면에서 최대 몇 배까지 키울지
+MAX_ZOOM = 8.0
+
+# 화면을 덮는 타일 수의 몇 배까지 캐시에 보관할지 (확대/축소 이전 단계와 미리 읽은 타일 몫)
+TILE_CACHE_SCREENS = 3
+
+
+class ImageViewport(MediaDisplay):
+    """
+    타일 방식 이미지 표시를 지원하는 MediaDisplay
+
+    일반 미디어는 MediaDisplay와 똑같이 표시하고,
+    show_tiled_image()로 큰 이미지를 열면 화면에 보이는 타일만 디코딩해서 그립니다.
+
+    타일 모드 조작:
+        Ctrl + 휠: 마우스 위치를 중심으로 확대/축소 (휠만 돌리면 기존처럼 파일 이동)
+        왼쪽 버튼 끌기: 이미지 이동
+    """
+
+    def __init__(self, parent=None):
+        """
+        ImageViewport 초기화
+
+        Args:
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+
+        self.tile_cache = TileCache()
+        self.tile_loader = None  # 현재 이미지의 TileLoaderThread
+        self.tiled_path = None  # 타일 모드로 표시 중인 이미지 경로
+        self.tiled_source = None  # 이미지를 연 뒤 받는 TiledImageSource
+        self.overview = None  # 타일이 준비되기 전 대신 그릴 개요 이미지 (QImage)
+
+        self.zoom = 1.0  # 화면 픽셀 / 원본 픽셀
+        self.center = QPointF(0, 0)  # 화면 중앙에 오는 원본 좌표
+        self.fit_to_view = True  # 창 크기에 맞춘 상태인지 (창 크기가 바뀌면 다시 맞춤)
+        self.pan_origin = None  # 끌기 시작 위치
+        self.pan_direction = (0, 0)  # 마지막 이동 방향 (미리 읽기에 사용)
+
+    def is_tiled(self):
+        """타일 모드로 표시 중인지 여부"""
+        return self.tiled_path is not None
+
+    def show_tiled_image(self, image_path):
+        """
+        큰 이미지를 타일 모드로 표시합니다. 개요 이미지가 준비되면 바로 그려집니다.
+
+        Args:
+            image_path: 이미지 파일 경로
+        """
+        self.clear_media()
+        self.tiled_path = image_path
+        self.current_media_type = 'tiled_image'
+        self.tile_loader = TileLoaderThread(image_path, self.tile_cache)
+        self.tile_loader.source_ready.connect(self._on_source_ready)
+        self.tile_loader.source_failed.connect(self._on_source_failed)
+        self.tile_loader.tile_ready.connect(self._on_tile_ready)
+        self.tile_loader.start()
+
+    def stop_tiled_image(self):
+        """타일 모드를 끝내고 디코딩 스레드와 캐시를 정리합니다."""
+        if self.tile_loader is not None:
+            # 이미 끝난 요청의 시그널이 새 이미지에 섞이지 않도록 연결 해제
+            try:
+                self.tile_loader.source_ready.disconnect()
+                self.tile_loader.source_failed.disconnect()
+                self.tile_loader.tile_ready.disconnect()
+            except TypeError:
+                pass
+            self.tile_loader.stop()
+            self.tile_loader = None
+        self.tile_cache.clear()
+        self.tiled_path = None
+        self.tiled_source = None
+        self.overview = None
+        self.pan_origin = None
+        self.pan_direction = (0, 0)
+
+    def clear_media(self):
+        """
+        현재 표시 중인 모든 미디어를 지웁니다. (타일 모드 포함)
+        """
+        self.stop_tiled_image()
+        super().clear_media()
+
+    def display_pixmap(self, pixmap, media_type='image', resize_provider=None):
+        """일반 이미지를 표시하면 타일 모드는 끝납니다."""
+        if self.is_tiled():
+            self.stop_tiled_image()
+        return super().display_pixmap(pixmap, media_type, resize_provider)
+
+    def _on_source_ready(self):
+        """이미지를 열었을 때 창 크기에 맞춰 표시합니다."""
+        if self.tile_loader is None:
+            return
+        self.tiled_source = self.tile_loader.source
+        self.overview = self.tile_loader.overview
+        self.fit_to_view = True
+        self._fit()
+        self._update_cache_capacity()
+        self._request_tiles()
+        self.update()
+
+    def _on_source_failed(self, error_message):
+        """이미지를 열지 못하면 타일 모드를 끝냅니다."""
+        print(f"Failed to open tiled image: {error_message}")
+        self.stop_tiled_image()
+        self.update()
+
+    def _on_tile_ready(self, level, tx, ty):
+        """타일이 준비되면 다시 그립니다."""
+        if self.tiled_source is not None and level == self._current_level():
+            self.update()
+
+    def _fit_zoom(self):
+        """이미지 전체가 화면에 들어오는 배율"""
+        source = self.tiled_source
+        return min(max(1, self.width()) / source.width, max(1, self.height()) / source.height)
+
+    def _fit(self):
+        """이미지 전체가 보이도록 배율과 중심을 맞춥니다."""
+        self.zoom = self._fit_zoom()
+        self.center = QPointF(self.tiled_source.width / 2, self.tiled_source.height / 2)
+
+    def _current_level(self):
+        """현재 배율에 맞는 타일 단계 (화면 픽셀보다 거칠지 않은 가장 작은 단계)"""
+        source = self.tiled_source
+        level = int(math.floor(math.log2(1 / self.zoom))) if self.zoom < 1 else 0
+        return max(source.min_level, level)
+
+    def _update_cache_capacity(self):
+        """화면을 덮는 타일 수에 맞춰 캐시 크기를 정합니다. (메모리는 화면 크기에 비례)"""
+        columns = math.ceil(self.width() / TILE_SIZE) + 2
+        rows = math.ceil(self.height() / TILE_SIZE) + 2
+        self.tile_cache.set_capacity(columns * rows * TILE_CACHE_SCREENS)
+
+    def _visible_source_rect(self):
+        """화면에 보이는 원본 영역"""
+        width = self.width() / self.zoom
+        height = self.height() / self.zoom
+        return QRectF(self.center.x() - width / 2, self.center.y() - height / 2, width, height)
+
+    def _tile_range(self, level, rect):
+        """원본 영역에 걸친 타일 범위 (x 시작, x 끝, y 시작, y 끝 - 끝은 포함하지 않음)"""
+        span = TILE_SIZE << level
+        columns, rows = self.tiled_source.tile_count(level)
+        return (max(0, int(rect.left() // span)), min(columns, int(math.ceil(rect.right() / span))),
+                max(0, int(rect.top() // span)), min(rows, int(math.ceil(rect.bottom() / span))))
+
+    def _request_tiles(self):
+        """보이는 타일을 먼저, 이동 방향으로 한 줄 앞의 타일을 그다음으로 요청합니다."""
+        if self.tile_loader is None or self.tiled_source is None:
+            return
+        level = self._current_level()
+        rect = self._visible_source_rect()
+        x0, x1, y0, y1 = self._tile_range(level, rect)
+
+        # 화면 중앙에서 가까운 타일부터
+        center_x = (x0 + x1) / 2
+        center_y = (y0 + y1) / 2
+        visible = [(level, tx, ty) for ty in range(y0, y1) for tx in range(x0, x1)]
+        visible.sort(key=lambda key: abs(key[1] + 0.5 - center_x) + abs(key[2] + 0.5 - center_y))
+
+        # 이동 방향으로 화면 한 칸 바깥 타일 미리 읽기
+        prefetch = []
+        dx, dy = self.pan_direction
+        columns, rows = self.tiled_source.tile_count(level)
+        if dx:
+            tx = x1 if dx > 0 else x0 - 1
+            if 0 <= tx < columns:
+                prefetch.extend((level, tx, ty) for ty in range(y0, y1))
+        if dy:
+            ty = y1 if dy > 0 else y0 - 1
+            if 0 <= ty < rows:
+                prefetch.extend((level, tx, ty) for tx in range(x0, x1))
+
+        self.tile_loader.request(visible + prefetch)
+
+    def _clamp_center(self):
+        """이미지가 화면 밖으로 완전히 벗어나지 않도록 중심을 제한합니다."""
+        source = self.tiled_source
+        half_width = self.width() / self.zoom / 2
+        half_height = self.height() / self.zoom / 2
+        # 이미지가 화면보다 작으면 가운데 고정
+        x = source.width / 2 if half_width * 2 >= source.width else \
+            min(max(self.center.x(), half_width), source.width - half_width)
+        y = source.height / 2 if half_height * 2 >= source.height else \
+            min(max(self.center.y(), half_height), source.height - half_height)
+        self.center = QPointF(x, y)
+
+    def zoom_at(self, factor, position):
+        """
+        화면 위치를 고정한 채로 확대/축소합니다.
+
+        Args:
+            factor: 배율 변화 (1보다 크면 확대)
+            position: 고정할 화면 좌표 (QPointF)
+        """
+        if self.tiled_source is None:
+            return
+        old_zoom = self.zoom
+        new_zoom = min(MAX_ZOOM, max(self._fit_zoom(), old_zoom * factor))
+        if new_zoom == old_zoom:
+            return
+        # 마우스 아래의 원본 좌표가 그대로 마우스 아래에 남도록 중심 이동
+        offset = QPointF(position.x() - self.width() / 2, position.y() - self.height() / 2)
+        anchor = self.center + offset / old_zoom
+        self.zoom = new_zoom
+        self.center = anchor - offset / new_zoom
+        self.fit_to_view = new_zoom <= self._fit_zoom()
+        self._clamp_center()
+        self._request_tiles()
+        self.update()
+
+    def paintEvent(self, event):
+        """타일 모드에서는 개요 이미지 위에 준비된 타일을 그립니다."""
+        if not self.is_tiled():
+            super().paintEvent(event)
+            return
+
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        if self.tiled_source is None or self.overview is None:
+            painter.end()
+            return
+
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, self.zoom < 1)
+        source = self.tiled_source
+        rect = self._visible_source_rect()
+
+        def to_screen(x, y, width, height):
+            return QRectF((x - rect.left()) * self.zoom, (y - rect.top()) * self.zoom,
+                          width * self.zoom, height * self.zoom)
+
+        # 1. 개요 이미지 (아직 타일이 없는 곳을 대신 채움)
+        scale_x = self.overview.width() / source.width
+        scale_y = self.overview.height() / source.height
+        visible = rect.intersected(QRectF(0, 0, source.width, source.height))
+        painter.drawImage(
+            to_screen(visible.left(), visible.top(), visible.width(), visible.height()),
+            self.overview,
+            QRectF(visible.left() * scale_x, visible.top() * scale_y,
+                   visible.width() * scale_x, visible.height() * scale_y)
+        )
+
+        # 2. 현재 단계의 타일
+        level = self._current_level()
+        span = TILE_SIZE << level
+        x0, x1, y0, y1 = self._tile_range(level, rect)
+        for ty in range(y0, y1):
+            for tx in range(x0, x1):
+                tile = self.tile_cache.get((level, tx, ty))
+                if tile is None:
+                    continue
+                width = min(span, source.width - tx * span)
+                height = min(span, source.height - ty * span)
+                painter.drawImage(to_screen(tx * span, ty * span, width, height), tile)
+        painter.end()
+
+    def resizeEvent(self, event):
+        """창 크기가 바뀌면 맞춤 상태를 유지하고 캐시 크기를 다시 정합니다."""
+        if not self.is_tiled():
+            super().resizeEvent(event)
+            return
+        if self.tiled_source is not None:
+            if self.fit_to_view:
+                self._fit()
+            else:
+                self._clamp_center()
+            self._update_cache_capacity()
+            self._request_tiles()
+
+    def wheelEvent(self, event):
+        """타일 모드에서 Ctrl + 휠은 확대/축소, 그 외에는 기존처럼 파일 이동"""
+        if self.is_tiled() and event.modifiers() & Qt.ControlModifier:
+            event.accept()
+            steps = event.angleDelta().y() / 120
+            self.zoom_at(ZOOM_STEP ** steps, QPointF(event.pos()))
+            return
+        super().wheelEvent(event)
+
+    def mousePressEvent(self, event):
+        """타일 모드에서 확대된 상태면 왼쪽 버튼으로 끌어서 이동합니다."""
+        if self.is_tiled() and event.button() == Qt.LeftButton and not self.fit_to_view:
+            event.accept()
+            self.pan_origin = event.pos()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """끌기 중이면 이미지를 이동합니다."""
+        if self.pan_origin is not None and self.tiled_source is not None:
+            event.accept()
+            delta = event.pos() - self.pan_origin
+            self.pan_origin = event.pos()
+            # 화면을 오른쪽으로 끌면 왼쪽 부분이 드러나므로 이동 방향은 반대
+            self.pan_direction = (-delta.x(), -delta.y())
+            self.center = self.center - QPointF(delta) / self.zoom
+            self._clamp_center()
+            self._request_tiles()
+            self.update()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """끌기를 끝냅니다."""
+        if self.pan_origin is not None and event.button() == Qt.LeftButton:
+            event.accept()
+            self.pan_origin = None
+            return
+        super().mouseReleaseEvent(event)
+
+    def get_preferred_size(self):
+        """타일 모드에서는 원본 크기를 권장 크기로 반환합니다."""
+        if self.tiled_source is not None:
+            return QSize(self.tiled_source.width, self.tiled_source.height)
+        return super().get_preferred_size()
@@ -55,6 +55,11 @@ class MediaDisplay(QLabel):
         # 크기 조절 모드 설정
         self.scaling_mode = Qt.KeepAspectRatio
         self.transformation_mode = Qt.SmoothTransformation
+        
+        # 크기 변경 시 다시 줄일 원본 (이미 줄인 픽스맵을 반복해서 줄이면 화질이 떨어짐)
+        self.source_pixmap = None
+        # 크기 변경 시 새 크기에 맞는 이미지를 만들어주는 함수 (width, height) -> QPixmap
+        self.resize_provider = None
     
     def clear_media(self):
         """
@@ -66,20 +71,21 @@ class MediaDisplay(QLabel):
         
         # 레이블 콘텐츠 초기화
         self.clear()
+        self.source_pixmap = None
+        self.resize_provider = None
         
         # 현재 미디어 타입 초기화
         self.current_media_type = None
-        
-        # 메모리 정리를 위한 추가 처리
-        QApplication.processEvents()
     
-    def display_pixmap(self, pixmap, media_type='image'):
+    def display_pixmap(self, pixmap, media_type='image', resize_provider=None):
         """
         QPixmap을 표시합니다. 필요시 크기 조절을 적용합니다.
         
         Args:
             pixmap (QPixmap): 표시할 픽스맵 객체
             media_type (str): 미디어 타입 ('image', 'psd' 등)
+            resize_provider: 크기 변경 시 새 크기의 이미지를 만들어주는 함수 (width, height) -> QPixmap
+                             (없으면 전달된 pixmap을 다시 줄임)
         
         Returns:
             bool: 성공적으로 표시되었는지 여부
@@ -108,6 +114,10 @@ class MediaDisplay(QLabel):
             pass
             # print(f"MediaDisplay: 이미지 표시 시 현재 회전 각도 = {parent_app.current_rotation}°")
         
+        # 크기 변경 시 사용할 원본 기억
+        self.source_pixmap = pixmap
+        self.resize_provider = resize_provider
+        
         # 레이블에 이미지 설정
         self.setPixmap(scaled_pixmap)
         # 화면 즉시 갱신을 위한 강제 업데이트
@@ -160,8 +170,14 @@ class MediaDisplay(QLabel):
         
         # 이미지 표시 중일 때 크기 조절
         if self.current_media_type == 'image' or self.current_media_type == 'psd':
-            if self.pixmap() is not None and not self.pixmap().isNull():
-                self.setPixmap(self.scale_pixmap_to_label(self.pixmap()))
+            if self.resize_provider is not None:
+                # 핸들러가 가진 여러 해상도 단계에서 빠르게 다시 만듦 (크기 변경이 끝나면 부드럽게 다시 그려짐)
+                pixmap = self.resize_provider(self.width(), self.height())
+                if pixmap is not None and not pixmap.isNull():
+                    self.setPixmap(pixmap)
+            elif self.source_pixmap is not None and not self.source_pixmap.isNull():
+                # 이미 줄인 픽스맵이 아니라 전달받은 원본에서 다시 줄임
+                self.setPixmap(self.scale_pixmap_to_label(self.source_pixmap))
     
     # 마우스 이벤트 처리 메서드들
     def mouseDoubleClickEvent(self, event):
@@ -5,8 +5,9 @@
 비디오나 애니메이션의 재생 위치를 조절할 때 유용합니다.
 """
 
-from PyQt5.QtWidgets import QSlider, QStyle, QStyleOptionSlider  # 슬라이더 관련 위젯
-from PyQt5.QtCore import Qt, pyqtSignal  # Qt 기본 기능과 신호 전달
+from PyQt5.QtWidgets import QSlider, QStyle, QStyleOptionSlider, QLabel  # 슬라이더 관련 위젯
+from PyQt5.QtCore import Qt, QPoint, QLine, pyqtSignal  # Qt 기본 기능과 신호 전달
+from PyQt5.QtGui import QPainter, QColor, QRegion  # 파형 그리기
 
 class ClickableSlider(QSlider):
     """
@@ -27,6 +28,126 @@ class ClickableSlider(QSlider):
         """
         super().__init__(*args, **kwargs)  # 부모 클래스 초기화 (QSlider 기본 기능 상속)
         self.is_dragging = False  # 드래그 상태 추적 변수 (마우스 누름+이동 상태 확인용)
+        self.preview_provider = None  # 슬라이더 값 -> 미리보기 QPixmap(또는 None)을 반환하는 함수
+        self.preview_label = None  # 마우스 위치 위에 띄우는 미리보기 창
+        self.waveform = None  # 슬라이더 뒤에 그릴 오디오 파형 (WaveformPeaks)
+        self.waveform_lines = None  # (그릴 영역, 선 목록) - 크기가 바뀔 때만 다시 계산
+        
+    def set_waveform(self, waveform):
+        """
+        슬라이더 뒤에 그릴 오디오 파형을 설정해요.
+        
+        매개변수:
+            waveform: WaveformPeaks 객체 (None이면 파형을 지움)
+        """
+        self.waveform = waveform
+        self.waveform_lines = None
+        self.update()
+    
+    def paintEvent(self, event):
+        """슬라이더를 그린 뒤 파형이 있으면 반투명하게 겹쳐 그려요."""
+        super().paintEvent(event)
+        if self.waveform is not None:
+            self._paint_waveform()
+    
+    def _paint_waveform(self):
+        """슬라이더 값 범위와 같은 가로 위치에 열마다 최솟값~최댓값 선을 그려요."""
+        handle_rect = self.handleRect()
+        option = QStyleOptionSlider()
+        self.initStyleOption(option)
+        groove_rect = self.style().subControlRect(
+            QStyle.CC_Slider, option, QStyle.SC_SliderGroove, self
+        )
+        # 핸들 중심이 움직이는 범위 = 값 범위
+        left = groove_rect.x() + handle_rect.width() // 2
+        width = groove_rect.width() - handle_rect.width()
+        area = (left, width, self.height())
+        
+        if self.waveform_lines is None or self.waveform_lines[0] != area:
+            columns = self.waveform.columns(width)
+            if columns is None:
+                return
+            center = self.height() / 2
+            half = self.height() / 2 - 1
+            lines = [QLine(left + x, int(center - high * half), left + x, int(center - low * half))
+                     for x, (low, high) in enumerate(zip(*columns))]
+            self.waveform_lines = (area, lines)
+        
+        painter = QPainter(self)
+        # 핸들은 가리지 않도록 핸들 영역을 빼고 그림
+        painter.setClipRegion(QRegion(self.rect()).subtracted(QRegion(handle_rect)))
+        painter.setPen(QColor(255, 255, 255, 90))
+        painter.drawLines(self.waveform_lines[1])
+        painter.end()
+        
+    def set_preview_provider(self, provider):
+        """
+        마우스를 올린 위치의 미리보기를 제공하는 함수를 설정해요.
+        
+        매개변수:
+            provider: 슬라이더 값을 받아 QPixmap(없으면 None)을 반환하는 함수 (None이면 미리보기 끔)
+        """
+        self.preview_provider = provider
+        self.setMouseTracking(provider is not None)
+        if provider is None:
+            self.hide_preview()
+    
+    def hide_preview(self):
+        """미리보기 창을 숨겨요."""
+        if self.preview_label is not None:
+            self.preview_label.hide()
+    
+    def _show_preview(self, x):
+        """마우스 x 위치에 해당하는 미리보기를 슬라이더 위에 띄워요."""
+        value = self._value_at(x)
+        pixmap = self.preview_provider(value) if value is not None else None
+        if pixmap is None or pixmap.isNull():
+            self.hide_preview()
+            return
+        
+        if self.preview_label is None:
+            # 포커스를 빼앗지 않는 테두리 없는 작은 창
+            self.preview_label = QLabel(None, Qt.ToolTip | Qt.FramelessWindowHint)
+            self.preview_label.setAttribute(Qt.WA_ShowWithoutActivating)
+            self.preview_label.setStyleSheet("border: 1px solid rgba(255, 255, 255, 120); background: black;")
+        self.preview_label.setPixmap(pixmap)
+        self.preview_label.adjustSize()
+        
+        # 마우스 위치 위쪽 가운데에 표시
+        size = self.preview_label.size()
+        top_left = self.mapToGlobal(QPoint(x - size.width() // 2, -size.height() - 6))
+        self.preview_label.move(top_left)
+        self.preview_label.show()
+    
+    def _value_at(self, x):
+        """슬라이더 안의 x 위치에 해당하는 값을 계산해요. (범위가 없으면 None)"""
+        option = QStyleOptionSlider()
+        self.initStyleOption(option)
+        groove_rect = self.style().subControlRect(
+            QStyle.CC_Slider, option, QStyle.SC_SliderGroove, self
+        )
+        handle_rect = self.style().subControlRect(
+            QStyle.CC_Slider, option, QStyle.SC_SliderHandle, self
+        )
+        effective_length = groove_rect.width() - handle_rect.width()
+        value_range = self.maximum() - self.minimum()
+        if value_range <= 0 or effective_length <= 0:
+            return None
+        effective_pos = max(0, min(x - groove_rect.x(), effective_length))
+        value = self.minimum() + (effective_pos * value_range) / effective_length
+        if self.invertedAppearance():
+            value = self.maximum() - value + self.minimum()
+        return int(value)
+    
+    def leaveEvent(self, event):
+        """마우스가 슬라이더를 벗어나면 미리보기를 숨겨요."""
+        self.hide_preview()
+        super().leaveEvent(event)
+    
+    def hideEvent(self, event):
+        """슬라이더가 숨겨지면 미리보기도 숨겨요."""
+        self.hide_preview()
+        super().hideEvent(event)
         
     def disconnect_all_signals(self):
         """슬라이더의 모든 신호 연결을 해제합니다."""
@@ -53,6 +174,11 @@ class ClickableSlider(QSlider):
             self.clicked.disconnect()
         except (TypeError, RuntimeError):
             pass  # 연결된 슬롯이 없으면 무시
+        
+        # 이전 미디어의 미리보기와 파형도 해제
+        self.set_preview_provider(None)
+        if self.waveform is not None:
+            self.set_waveform(None)
     
     def connect_to_video_control(self, value_changed_slot, pressed_slot, released_slot, clicked_slot):
         """비디오 컨트롤에 필요한 모든 신호를 연결합니다."""
@@ -162,6 +288,10 @@ class ClickableSlider(QSlider):
         매개변수:
             event: 마우스 이벤트 정보
         """
+        # 미리보기가 설정되어 있으면 마우스 위치의 미리보기 표시 (드래그 중에도)
+        if self.preview_provider is not None:
+            self._show_preview(event.pos().x())
+        
         # 마우스 왼쪽 버튼을 누른 상태에서 드래그 중인 경우
         if self.is_dragging and event.buttons() & Qt.LeftButton:
             # 드래그 위치에 따라 슬라이더 값 계산 및 설정
@@ -215,7 +345,12 @@ class ClickableSlider(QSlider):
             event: 마우스 이벤트 정보
         """
         if event.button() == Qt.LeftButton:
+            was_dragging = self.is_dragging and not self.isSliderDown()
             self.is_dragging = False  # 드래그 상태 해제 (마우스 버튼 뗌)
+            if was_dragging:
+                # 슬라이더 바(핸들이 아닌 곳)를 드래그한 경우 sliderReleased가 없으므로
+                # 최종 위치를 한 번 더 알려서 정확한 위치로 이동하게 함
+                self.clicked.emit(self.value())
         super().mouseReleaseEvent(event)  # 부모 클래스의 이벤트 처리기 호출
 
     def handleRect(self):
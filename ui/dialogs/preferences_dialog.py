@@ -7,11 +7,13 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QTableWidget, QTableWidgetItem, 
                             QHeaderView, QFrame, QStackedWidget, QWidget, QComboBox,
-                            QSpinBox, QSpacerItem, QSizePolicy, QRadioButton, QButtonGroup, QGroupBox)
+                            QSpinBox, QSpacerItem, QSizePolicy, QRadioButton, QButtonGroup, QGroupBox,
+                            QCheckBox)
 from PyQt5.QtCore import Qt, QEvent
 from PyQt5.QtGui import QIcon, QKeySequence
 
 from core.config_manager import load_settings, save_settings
+from file.operations import DEDUP_OFF, DEDUP_SKIP, DEDUP_LINK, FILE_SETTINGS_FILENAME
 
 from events.handlers.keyboard_handler import KeyInputEdit
 from events.handlers.mouse_input import MouseButtonWidget
@@ -108,7 +110,8 @@ class PreferencesDialog(QDialog):
             "toggle_mute": Qt.Key_M,                           # M: 음소거 전환
             "delete_image": Qt.Key_Delete,                     # Delete: 이미지 삭제
             "toggle_fullscreen": Qt.ControlModifier | Qt.Key_Return,  # Ctrl+Enter: 전체화면 전환
-            "toggle_maximize_state": Qt.Key_Return             # Enter: 최대화 전환
+            "toggle_maximize_state": Qt.Key_Return,            # Enter: 최대화 전환
+            "folder_palette": Qt.Key_F                         # F: 폴더 빠른 검색
         }
         
         # 기본 마우스 설정 정의
@@ -156,7 +159,8 @@ class PreferencesDialog(QDialog):
             "toggle_mute": "Toggle Mute",
             "delete_image": "Delete Image",
             "toggle_fullscreen": "Toggle Fullscreen",
-            "toggle_maximize_state": "Toggle Maximize"
+            "toggle_maximize_state": "Toggle Maximize",
+            "folder_palette": "Folder Palette"
         }
         
         # 마우스 버튼 이름 매핑
@@ -510,6 +514,35 @@ class PreferencesDialog(QDialog):
         general_layout.addWidget(button_rows_groupbox) # general_layout에 추가
         # --- 폴더 버튼 줄 수 설정 끝 ---
 
+        # 같은 내용의 파일이 대상 폴더에 있을 때 복사/이동 처리 방법
+        file_settings = load_settings(FILE_SETTINGS_FILENAME)
+        dedup_groupbox = QGroupBox("Duplicate Files")
+        dedup_layout = QVBoxLayout()
+
+        dedup_mode_layout = QHBoxLayout()
+        dedup_mode_layout.addWidget(QLabel("When the target folder has an identical file:"))
+        self.dedup_mode_combo = QComboBox()
+        self.dedup_mode_combo.addItem("Always copy/move (no check)", DEDUP_OFF)
+        self.dedup_mode_combo.addItem("Skip identical files", DEDUP_SKIP)
+        self.dedup_mode_combo.addItem("Hard-link identical copies", DEDUP_LINK)
+        index = self.dedup_mode_combo.findData(file_settings.get("dedup_mode", DEDUP_OFF))
+        self.dedup_mode_combo.setCurrentIndex(max(index, 0))
+        dedup_mode_layout.addWidget(self.dedup_mode_combo)
+        dedup_layout.addLayout(dedup_mode_layout)
+
+        self.trash_duplicates_check = QCheckBox(
+            "When moving, send the source to the trash if the file already exists (can be undone)")
+        self.trash_duplicates_check.setChecked(bool(file_settings.get("trash_moved_duplicates", False)))
+        dedup_layout.addWidget(self.trash_duplicates_check)
+
+        # 중복 검사를 끄면 이동 처리 옵션도 의미가 없음
+        self.dedup_mode_combo.currentIndexChanged.connect(
+            lambda _: self.trash_duplicates_check.setEnabled(self.get_selected_dedup_mode() != DEDUP_OFF))
+        self.trash_duplicates_check.setEnabled(self.get_selected_dedup_mode() != DEDUP_OFF)
+
+        dedup_groupbox.setLayout(dedup_layout)
+        general_layout.addWidget(dedup_groupbox)
+
         general_layout.addStretch(1) # 그룹박스 아래에 여유 공간 추가
 
         # --- 추가: 일반 설정 페이지용 버튼 ---
@@ -742,7 +775,8 @@ class PreferencesDialog(QDialog):
             "toggle_mute": Qt.Key_M,
             "delete_image": Qt.Key_Delete,
             "toggle_fullscreen": Qt.ControlModifier | Qt.Key_Return,
-            "toggle_maximize_state": Qt.Key_Return
+            "toggle_maximize_state": Qt.Key_Return,
+            "folder_palette": Qt.Key_F
         }
         
         # 모든 키 설정을 기본값으로 업데이트
@@ -972,4 +1006,12 @@ class PreferencesDialog(QDialog):
             return int(self.button_rows_combo.currentText())
         except (ValueError, AttributeError):
             # 오류 발생 시 기본값 반환 (예: 5)
-            return 5 # 기본값은 메인 창의 설정과 일치시키는 것이 좋음 
\ No newline at end of file
+            return 5 # 기본값은 메인 창의 설정과 일치시키는 것이 좋음 
+
+    def get_selected_dedup_mode(self):
+        """선택된 중복 파일 처리 모드를 반환합니다."""
+        return self.dedup_mode_combo.currentData() or DEDUP_OFF
+
+    def get_trash_moved_duplicates(self):
+        """이동할 때 같은 내용의 원본을 휴지통으로 보낼지 여부를 반환합니다."""
+        return self.trash_duplicates_check.isChecked()
@@ -588,8 +588,11 @@ class ControlsLayout(QWidget):
         if self.parent.current_media_type == 'video':
             # 슬라이더 값을 초 단위로 변환 (value는 밀리초 단위)
             seconds = value / 1000.0  # 밀리초를 초 단위로 변환
-            print(f"비디오 seek 초 단위: {seconds}")
-            self.parent.video_handler.seek(seconds)
+            if self.parent.playback_slider.is_dragging:
+                # 슬라이더 바를 누른 채 드래그 중이면 키프레임 이동으로 합침
+                self.parent.video_handler.scrub(seconds)
+            else:
+                self.parent.video_handler.seek(seconds)
         # 오디오 처리
         elif self.parent.current_media_type == 'audio':
             # 슬라이더 값을 초 단위로 변환 (value는 밀리초 단위)
@@ -618,7 +621,8 @@ class ControlsLayout(QWidget):
             try:
                 value = self.parent.playback_slider.value()
                 seconds = value / 1000.0  # 밀리초를 초 단위로 변환
-                self.parent.video_handler.seek(seconds)
+                # 드래그 중 키프레임 이동 후 최종 위치로 정확하게 한 번 이동
+                self.parent.video_handler.finish_scrub(seconds)
             except Exception as e:
                 pass
         
@@ -648,8 +652,8 @@ class ControlsLayout(QWidget):
                 
                 # 미디어 타입에 따른 분기 처리
                 if self.parent.current_media_type == 'video':
-                    # Use the VideoHandler's seek function to move to the precise position
-                    self.parent.video_handler.seek(seconds)
+                    # Coalesced keyframe seek while dragging (exact seek follows on release)
+                    self.parent.video_handler.scrub(seconds)
                 elif self.parent.current_media_type == 'audio':
                     # 오디오 핸들러에 직접 seek 메서드 호출
                     if hasattr(self.parent, 'audio_handler') and self.parent.audio_handler: